@@ -0,0 +1,47 @@
+"""Add frame_stats aggregate table and backfill it from goes_frames.
+
+Revision ID: q130_frame_stats
+Revises: p120_fk_ondelete_set_null
+Create Date: 2026-10-18
+
+``frame_stats`` holds per (satellite, sector, band, day) counts and byte
+totals so the dashboard/stats endpoints no longer aggregate the whole
+``goes_frames`` table on every poll. The backfill uses ``date()``, which
+both PostgreSQL and SQLite provide.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "q130_frame_stats"
+down_revision = "p120_fk_ondelete_set_null"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "frame_stats",
+        sa.Column("satellite", sa.String(20), primary_key=True),
+        sa.Column("sector", sa.String(20), primary_key=True),
+        sa.Column("band", sa.String(10), primary_key=True),
+        sa.Column("day", sa.Date, primary_key=True),
+        sa.Column("frame_count", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("total_size", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("oldest_capture", sa.DateTime, nullable=True),
+        sa.Column("newest_capture", sa.DateTime, nullable=True),
+    )
+    op.execute(
+        """
+        INSERT INTO frame_stats
+            (satellite, sector, band, day, frame_count, total_size, oldest_capture, newest_capture)
+        SELECT satellite, sector, band, date(capture_time), count(id), coalesce(sum(file_size), 0),
+               min(capture_time), max(capture_time)
+        FROM goes_frames
+        GROUP BY satellite, sector, band, date(capture_time)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("frame_stats")
@@ -0,0 +1,29 @@
+"""Add animations.params_hash for reusing identical animation requests.
+
+Revision ID: r140_animation_params_hash
+Revises: q130_frame_stats
+Create Date: 2026-10-18
+
+``params_hash`` is the canonical hash of an animation's parameters and
+source frames. Creating an animation with a hash that matches a completed
+or in-progress one links to that output or job instead of rendering it
+again. Existing rows keep a NULL hash and are never matched.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "r140_animation_params_hash"
+down_revision = "q130_frame_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("animations", sa.Column("params_hash", sa.String(64), nullable=True))
+    op.create_index("ix_animations_params_hash", "animations", ["params_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_animations_params_hash", table_name="animations")
+    op.drop_column("animations", "params_hash")
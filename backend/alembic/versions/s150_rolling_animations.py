@@ -0,0 +1,55 @@
+"""Add rolling_animations for incrementally updated HLS loops.
+
+Revision ID: s150_rolling_animations
+Revises: r140_animation_params_hash
+Create Date: 2026-10-18
+
+A rolling animation is a "last N hours" loop for one satellite, sector and
+band. Each refresh encodes only the frames newer than ``last_capture_time``
+into new fMP4 segments. Segments that slide out of the window are dropped
+from the HLS playlist.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "s150_rolling_animations"
+down_revision = "r140_animation_params_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rolling_animations",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("satellite", sa.String(20), nullable=False),
+        sa.Column("sector", sa.String(20), nullable=False),
+        sa.Column("band", sa.String(10), nullable=False),
+        sa.Column("window_hours", sa.Integer, nullable=False, server_default="6"),
+        sa.Column("fps", sa.Integer, server_default="10"),
+        sa.Column("quality", sa.String(10), server_default="medium"),
+        sa.Column("resolution", sa.String(10), server_default="full"),
+        sa.Column("scale", sa.String(10), server_default="100%"),
+        sa.Column("overlay", sa.JSON, nullable=True),
+        sa.Column(
+            "crop_preset_id",
+            sa.String(36),
+            sa.ForeignKey("crop_presets.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("is_active", sa.Boolean, server_default=sa.true()),
+        sa.Column("last_capture_time", sa.DateTime, nullable=True),
+        sa.Column("segment_count", sa.Integer, server_default="0"),
+        sa.Column("duration_seconds", sa.Float, server_default="0"),
+        sa.Column("error", sa.Text, server_default=""),
+        sa.Column("created_at", sa.DateTime, nullable=True),
+        sa.Column("updated_at", sa.DateTime, nullable=True),
+    )
+    op.create_index("ix_rolling_animations_sat_sector_band", "rolling_animations", ["satellite", "sector", "band"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rolling_animations_sat_sector_band", table_name="rolling_animations")
+    op.drop_table("rolling_animations")
@@ -0,0 +1,26 @@
+"""Add animations.preview_path for draft previews.
+
+Revision ID: t160_animation_preview_path
+Revises: s150_rolling_animations
+Create Date: 2026-10-18
+
+``preview_path`` points at a quick low-resolution draft encode that is
+playable while the full animation is still rendering. It is cleared, and
+the draft file deleted, once the job finishes.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "t160_animation_preview_path"
+down_revision = "s150_rolling_animations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("animations", sa.Column("preview_path", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("animations", "preview_path")
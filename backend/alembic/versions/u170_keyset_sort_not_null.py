@@ -0,0 +1,41 @@
+"""Make keyset pagination sort columns NOT NULL.
+
+Revision ID: u170_keyset_sort_not_null
+Revises: t160_animation_preview_path
+Create Date: 2026-10-19
+
+Keyset pagination seeks on ``(sort column, id)``. A NULL sort value never
+compares ``<`` or ``>`` anything, so every sort column must be NOT NULL for
+the seek to use the column's index directly. All four columns already had
+a Python-side default; this backfills any NULLs left by raw inserts and
+adds the constraint. ``batch_alter_table`` keeps it working on SQLite.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "u170_keyset_sort_not_null"
+down_revision = "t160_animation_preview_path"
+branch_labels = None
+depends_on = None
+
+# (table, column, type, backfill expression for existing NULLs)
+_COLUMNS = (
+    ("jobs", "created_at", sa.DateTime(), "CURRENT_TIMESTAMP"),
+    ("images", "uploaded_at", sa.DateTime(), "CURRENT_TIMESTAMP"),
+    ("goes_frames", "created_at", sa.DateTime(), "capture_time"),
+    ("goes_frames", "file_size", sa.BigInteger(), "0"),
+)
+
+
+def upgrade() -> None:
+    for table, column, type_, backfill in _COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = {backfill} WHERE {column} IS NULL")  # noqa: S608 — constant identifiers
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=type_, nullable=False)
+
+
+def downgrade() -> None:
+    for table, column, type_, _backfill in reversed(_COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=type_, nullable=True)
@@ -51,9 +51,13 @@ CELERY_TASK_ROUTES: dict[str, dict[str, str]] = {
     "process_images": {"queue": CELERY_QUEUE_PROCESS},
     "create_video": {"queue": CELERY_QUEUE_PROCESS},
     "generate_composite": {"queue": CELERY_QUEUE_PROCESS},
+    "generate_composites_batch": {"queue": CELERY_QUEUE_PROCESS},
     "generate_animation": {"queue": CELERY_QUEUE_PROCESS},
+    "update_rolling_animation": {"queue": CELERY_QUEUE_PROCESS},
+    "generate_frame_tiles": {"queue": CELERY_QUEUE_PROCESS},
     # Cleanup queue — beat-scheduled maintenance
     "run_cleanup": {"queue": CELERY_QUEUE_CLEANUP},
+    "rebuild_frame_stats": {"queue": CELERY_QUEUE_CLEANUP},
     # Default queue — everything else (beat-scheduled dispatch, etc.)
     "check_schedules": {"queue": CELERY_QUEUE_DEFAULT},
 }
@@ -70,6 +74,7 @@ celery_app = Celery(
         "app.tasks.scheduling_tasks",
         "app.tasks.animation_tasks",
         "app.tasks.himawari_fetch_task",
+        "app.tasks.tile_tasks",
     ],
 )
 
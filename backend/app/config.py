@@ -38,6 +38,11 @@ class Settings(BaseSettings):
     goes_default_satellite: str = "GOES-19"
     goes_default_sector: str = "CONUS"
     goes_default_band: str = "C02"
+    # Keep float32 CMI next to fetched frames for composites (see app.services.cmi_store)
+    goes_cmi_store: bool = False
+
+    # Rendered animation frames reused across jobs (see app.services.render_cache)
+    render_cache_max_bytes: int = 4 * 1024 * 1024 * 1024
 
     @model_validator(mode="after")
     def derive_paths(self):
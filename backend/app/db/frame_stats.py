@@ -0,0 +1,223 @@
+"""Incrementally maintained per-day frame statistics.
+
+The dashboard, storage breakdown and cleanup views used to run full-table
+``GROUP BY`` / ``SUM(file_size)`` aggregates over ``goes_frames`` on every
+poll. Instead, ``frame_stats`` keeps one row per
+``(satellite, sector, band, day)`` with the frame count, byte total and
+oldest/newest capture time, and the stats endpoints read that in
+O(buckets).
+
+Keeping it in step:
+
+* ORM inserts/deletes of :class:`GoesFrame` are picked up by an
+  ``after_flush`` session listener and applied in the same transaction.
+  :func:`install_frame_stats_listener` registers it (idempotent).
+* Core bulk statements (``insert(GoesFrame)`` / ``delete(GoesFrame)``)
+  bypass the ORM, so those call sites pass the affected rows to
+  :func:`record_frames_added` / :func:`record_frames_removed` themselves
+  before committing.
+* :func:`rebuild_frame_stats` recomputes the whole table from
+  ``goes_frames`` — exposed as the ``rebuild_frame_stats`` Celery task for
+  drift repair after manual DB surgery.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from typing import Any, NamedTuple
+
+from sqlalchemy import BigInteger, case, cast, delete, event, func, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from .models import FrameStat, GoesFrame
+
+logger = logging.getLogger(__name__)
+
+
+def sum_as_int(column: Any) -> ColumnElement[int]:
+    """``SUM(column)`` as an integer.
+
+    PostgreSQL sums ``bigint`` columns as ``numeric``, which asyncpg returns
+    as ``Decimal``; that serialises as a string in cached responses.
+    """
+    return cast(func.sum(column), BigInteger)
+
+
+class FrameRow(NamedTuple):
+    """The columns of a ``goes_frames`` row that the aggregates depend on."""
+
+    satellite: str
+    sector: str
+    band: str
+    capture_time: datetime
+    file_size: int | None
+
+
+class _Bucket:
+    __slots__ = ("count", "size", "oldest", "newest")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.size = 0
+        self.oldest: datetime | None = None
+        self.newest: datetime | None = None
+
+    def add(self, row: FrameRow) -> None:
+        self.count += 1
+        self.size += row.file_size or 0
+        if self.oldest is None or row.capture_time < self.oldest:
+            self.oldest = row.capture_time
+        if self.newest is None or row.capture_time > self.newest:
+            self.newest = row.capture_time
+
+
+def _group(rows: Iterable[FrameRow]) -> dict[tuple[str, str, str, date], _Bucket]:
+    buckets: dict[tuple[str, str, str, date], _Bucket] = {}
+    for row in rows:
+        key = (row.satellite, row.sector, row.band, row.capture_time.date())
+        buckets.setdefault(key, _Bucket()).add(row)
+    return buckets
+
+
+def _upsert(conn: Connection) -> Any:
+    """Return the dialect's ``INSERT`` construct that supports ``ON CONFLICT``."""
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(FrameStat)
+
+
+def record_frames_added(conn: Connection, rows: Iterable[FrameRow]) -> None:
+    """Add *rows* to their day buckets, creating buckets as needed."""
+    buckets = _group(rows)
+    if not buckets:
+        return
+    stmt = _upsert(conn).values(
+        [
+            {
+                "satellite": sat,
+                "sector": sector,
+                "band": band,
+                "day": day,
+                "frame_count": b.count,
+                "total_size": b.size,
+                "oldest_capture": b.oldest,
+                "newest_capture": b.newest,
+            }
+            for (sat, sector, band, day), b in buckets.items()
+        ]
+    )
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["satellite", "sector", "band", "day"],
+        set_={
+            "frame_count": FrameStat.frame_count + excluded.frame_count,
+            "total_size": FrameStat.total_size + excluded.total_size,
+            "oldest_capture": case(
+                (excluded.oldest_capture < FrameStat.oldest_capture, excluded.oldest_capture),
+                else_=FrameStat.oldest_capture,
+            ),
+            "newest_capture": case(
+                (excluded.newest_capture > FrameStat.newest_capture, excluded.newest_capture),
+                else_=FrameStat.newest_capture,
+            ),
+        },
+    )
+    conn.execute(stmt)
+
+
+def record_frames_removed(conn: Connection, rows: Iterable[FrameRow]) -> None:
+    """Subtract *rows* from their day buckets.
+
+    Must run after the ``goes_frames`` rows are gone: the oldest/newest
+    capture of each touched bucket is re-read from the remaining frames,
+    an indexed range scan over one day of one product.
+    """
+    for (sat, sector, band, day), b in _group(rows).items():
+        key_filter = (
+            FrameStat.satellite == sat,
+            FrameStat.sector == sector,
+            FrameStat.band == band,
+            FrameStat.day == day,
+        )
+        day_start = datetime.combine(day, time.min)
+        bounds = (
+            select(func.min(GoesFrame.capture_time), func.max(GoesFrame.capture_time))
+            .where(
+                GoesFrame.satellite == sat,
+                GoesFrame.sector == sector,
+                GoesFrame.band == band,
+                GoesFrame.capture_time >= day_start,
+                GoesFrame.capture_time < day_start + timedelta(days=1),
+            )
+            .subquery()
+        )
+        conn.execute(
+            update(FrameStat)
+            .where(*key_filter)
+            .values(
+                frame_count=FrameStat.frame_count - b.count,
+                total_size=FrameStat.total_size - b.size,
+                oldest_capture=select(bounds.c[0]).scalar_subquery(),
+                newest_capture=select(bounds.c[1]).scalar_subquery(),
+            )
+        )
+        conn.execute(delete(FrameStat).where(*key_filter, FrameStat.frame_count <= 0))
+
+
+def rebuild_frame_stats(conn: Connection) -> int:
+    """Recompute ``frame_stats`` from ``goes_frames``. Returns the bucket count."""
+    day = func.date(GoesFrame.capture_time)
+    conn.execute(delete(FrameStat))
+    result = conn.execute(
+        insert(FrameStat).from_select(
+            [
+                "satellite",
+                "sector",
+                "band",
+                "day",
+                "frame_count",
+                "total_size",
+                "oldest_capture",
+                "newest_capture",
+            ],
+            select(
+                GoesFrame.satellite,
+                GoesFrame.sector,
+                GoesFrame.band,
+                day,
+                func.count(GoesFrame.id),
+                func.coalesce(func.sum(GoesFrame.file_size), 0),
+                func.min(GoesFrame.capture_time),
+                func.max(GoesFrame.capture_time),
+            ).group_by(GoesFrame.satellite, GoesFrame.sector, GoesFrame.band, day),
+        )
+    )
+    return result.rowcount or 0
+
+
+def _frame_row(frame: GoesFrame) -> FrameRow:
+    return FrameRow(frame.satellite, frame.sector, frame.band, frame.capture_time, frame.file_size)
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    added = [_frame_row(obj) for obj in session.new if isinstance(obj, GoesFrame)]
+    removed = [_frame_row(obj) for obj in session.deleted if isinstance(obj, GoesFrame)]
+    if not added and not removed:
+        return
+    conn = session.connection()
+    if added:
+        record_frames_added(conn, added)
+    if removed:
+        record_frames_removed(conn, removed)
+
+
+def install_frame_stats_listener() -> None:
+    """Keep ``frame_stats`` in step with ORM flushes on every session. Idempotent."""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
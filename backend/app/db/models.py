@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -44,7 +45,7 @@ class Job(Base):
     output_path = Column(Text, default="")
     error = Column(Text, default="")
     task_id = Column(String(255), nullable=True, index=True)
-    created_at = Column(DateTime, default=utcnow, index=True)
+    created_at = Column(DateTime, nullable=False, default=utcnow, index=True)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
@@ -73,7 +74,7 @@ class Image(Base):
     channel = Column(String(10), nullable=True)
     captured_at = Column(DateTime, nullable=True)
     source = Column(String(20), default="local")
-    uploaded_at = Column(DateTime, default=utcnow, index=True)
+    uploaded_at = Column(DateTime, nullable=False, default=utcnow, index=True)
 
 
 class Preset(Base):
@@ -97,12 +98,12 @@ class GoesFrame(Base):
     band = Column(String(10), nullable=False, index=True)
     capture_time = Column(DateTime, nullable=False, index=True)
     file_path = Column(Text, nullable=False)
-    file_size = Column(BigInteger, default=0)
+    file_size = Column(BigInteger, nullable=False, default=0)
     width = Column(Integer, nullable=True)
     height = Column(Integer, nullable=True)
     thumbnail_path = Column(Text, nullable=True)
     source_job_id = Column(String(36), ForeignKey(JOBS_ID_FK, ondelete=_FK_SET_NULL), nullable=True)
-    created_at = Column(DateTime, default=utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
 
     source_job = relationship("Job", foreign_keys=[source_job_id])
     tags = relationship("Tag", secondary="frame_tags", back_populates="frames")
@@ -116,6 +117,21 @@ class GoesFrame(Base):
     )
 
 
+class FrameStat(Base):
+    """Per-day frame counts and sizes, maintained by :mod:`app.db.frame_stats`."""
+
+    __tablename__ = "frame_stats"
+
+    satellite = Column(String(20), primary_key=True)
+    sector = Column(String(20), primary_key=True)
+    band = Column(String(10), primary_key=True)
+    day = Column(Date, primary_key=True)
+    frame_count = Column(BigInteger, nullable=False, default=0)
+    total_size = Column(BigInteger, nullable=False, default=0)
+    oldest_capture = Column(DateTime, nullable=True)
+    newest_capture = Column(DateTime, nullable=True)
+
+
 class Collection(Base):
     __tablename__ = "collections"
 
@@ -181,17 +197,50 @@ class Animation(Base):
     false_color = Column(Boolean, default=False)
     scale = Column(String(10), default="100%")
     output_path = Column(Text, nullable=True)
+    # Low-resolution draft encode, playable while the full output renders; cleared on completion.
+    preview_path = Column(Text, nullable=True)
     file_size = Column(BigInteger, default=0)
     duration_seconds = Column(Float, default=0.0)
     created_at = Column(DateTime, default=utcnow, index=True)
     completed_at = Column(DateTime, nullable=True)
     error = Column(Text, default="")
     job_id = Column(String(36), ForeignKey(JOBS_ID_FK, ondelete=_FK_SET_NULL), nullable=True)
+    # Canonical hash of the parameters and source frames; identical requests share one output.
+    params_hash = Column(String(64), nullable=True, index=True)
 
     crop_preset = relationship("CropPreset", foreign_keys=[crop_preset_id])
     job = relationship("Job", foreign_keys=[job_id])
 
 
+class RollingAnimation(Base):
+    """A "last N hours" loop kept current as segmented HLS (see ``services.rolling``)."""
+
+    __tablename__ = "rolling_animations"
+
+    id = Column(String(36), primary_key=True, default=gen_uuid)
+    name = Column(String(200), nullable=False)
+    satellite = Column(String(20), nullable=False)
+    sector = Column(String(20), nullable=False)
+    band = Column(String(10), nullable=False)
+    window_hours = Column(Integer, nullable=False, default=6)
+    fps = Column(Integer, default=10)
+    quality = Column(String(10), default="medium")
+    resolution = Column(String(10), default="full")
+    scale = Column(String(10), default="100%")
+    overlay = Column(JSON, nullable=True)
+    crop_preset_id = Column(String(36), ForeignKey("crop_presets.id", ondelete=_FK_SET_NULL), nullable=True)
+    is_active = Column(Boolean, default=True)
+    # Newest frame already encoded; refreshes only encode frames after it.
+    last_capture_time = Column(DateTime, nullable=True)
+    segment_count = Column(Integer, default=0)
+    duration_seconds = Column(Float, default=0.0)
+    error = Column(Text, default="")
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (Index("ix_rolling_animations_sat_sector_band", "satellite", "sector", "band"),)
+
+
 class AnimationPreset(Base):
     __tablename__ = "animation_presets"
 
@@ -343,3 +392,10 @@ class ErrorLog(Base):
     # Privacy: IP stored for abuse detection; consider periodic purge policy
     client_ip = Column(String(45), nullable=True)
     created_at = Column(DateTime, default=utcnow, index=True)
+
+
+# Registered here so every process that maps GoesFrame — API and Celery
+# workers alike — keeps the frame_stats aggregates in step.
+from .frame_stats import install_frame_stats_listener  # noqa: E402
+
+install_frame_stats_listener()
@@ -47,6 +47,7 @@ from .routers import (
     jobs,
     notifications,
     presets,
+    rolling_animations,
     scheduling,
     share,
     stats,
@@ -256,6 +257,7 @@ app.include_router(goes_catalog.router)
 app.include_router(goes_fetch.router)
 app.include_router(goes_browse.router)
 app.include_router(animations.router)
+app.include_router(rolling_animations.router)
 app.include_router(goes_frames.router)
 app.include_router(goes_collections.router)
 app.include_router(goes_tags.router)
@@ -143,6 +143,7 @@ class AnimationResponse(BaseModel):
     false_color: bool = False
     scale: str = "100%"
     output_path: str | None = None
+    preview_path: str | None = None
     file_size: int = 0
     duration_seconds: float = 0.0
     created_at: datetime | None = None
@@ -238,6 +239,57 @@ class FrameRangePreview(BaseModel):
     last_thumbnail: str | None = None
 
 
+# --- Rolling animation schemas ---
+
+
+class RollingAnimationCreate(BaseModel):
+    """Request schema for a "last N hours" loop kept current as frames arrive."""
+
+    name: str = Field("Rolling Animation", min_length=1, max_length=200)
+    satellite: str
+    sector: str
+    band: str
+    window_hours: int = Field(6, ge=1, le=72)
+    fps: int = Field(10, ge=1, le=60)
+    quality: str = Field("medium", pattern=PATTERN_QUALITY)
+    resolution: str = Field("full", pattern=PATTERN_RESOLUTION)
+    scale: str = Field("100%", pattern=PATTERN_SCALE)
+    overlay: OverlaySettings | None = None
+    crop_preset_id: str | None = None
+
+    @model_validator(mode="after")
+    def validate_triple(self):
+        _validate_satellite_sector_band(self.satellite, self.sector, self.band)
+        return self
+
+
+class RollingAnimationResponse(BaseModel):
+    """Response schema for a rolling animation and its current HLS playlist."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    satellite: str
+    sector: str
+    band: str
+    window_hours: int
+    fps: int
+    quality: str
+    resolution: str = "full"
+    scale: str = "100%"
+    overlay: dict | None = None
+    crop_preset_id: str | None = None
+    is_active: bool = True
+    last_capture_time: datetime | None = None
+    segment_count: int = 0
+    duration_seconds: float = 0.0
+    error: str = ""
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    playlist_url: str | None = None
+
+
 # --- Animation Preset schemas ---
 
 
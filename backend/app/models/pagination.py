@@ -8,9 +8,15 @@ T = TypeVar("T")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Generic paginated response wrapper with items, total count, and page info."""
+    """Generic paginated response wrapper with items, total count, and page info.
+
+    ``total`` is ``None`` when the caller opted out of the exact count
+    (``include_total=false``). ``next_cursor`` is set by keyset-paginated
+    endpoints and is ``None`` on the last page.
+    """
 
     items: list[T]
-    total: int
+    total: int | None
     page: int
     limit: int
+    next_cursor: str | None = None
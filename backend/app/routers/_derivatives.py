@@ -0,0 +1,63 @@
+"""Shared ``/…/derivative`` response for frame and composite images.
+
+See :mod:`app.services.derivatives` for the render and disk cache.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import Query, Request
+from fastapi.responses import FileResponse, Response
+
+from ..errors import ValidationError
+from ..services.derivatives import (
+    DERIVATIVE_FORMATS,
+    MAX_DERIVATIVE_SIZE,
+    DerivativeSpec,
+    derivative_cache,
+    parse_crop,
+)
+
+WidthParam = Annotated[int | None, Query(ge=1, le=MAX_DERIVATIVE_SIZE)]
+HeightParam = Annotated[int | None, Query(ge=1, le=MAX_DERIVATIVE_SIZE)]
+CropParam = Annotated[str | None, Query(description="Source-pixel crop box as x,y,w,h")]
+FormatParam = Annotated[str, Query(pattern="^(png|jpeg|webp)$")]
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if *etag* is listed in the request's ``If-None-Match``."""
+    return etag in [t.strip() for t in request.headers.get("if-none-match", "").split(",")]
+
+
+async def derivative_response(
+    request: Request,
+    source: Path,
+    *,
+    width: int | None,
+    height: int | None,
+    crop: str | None,
+    fmt: str,
+) -> Response:
+    """Serve (rendering on a cache miss) a derivative of *source*.
+
+    The cache key is content-addressed, so it is used directly as a strong
+    ETag and a matching ``If-None-Match`` short-circuits with a 304.
+    """
+    try:
+        spec = DerivativeSpec(width, height, parse_crop(crop), fmt)
+    except ValueError as exc:
+        raise ValidationError(f"Invalid crop: {exc}", error="invalid_crop", status_code=400) from exc
+
+    try:
+        path, key = await derivative_cache.get(source, spec)
+    except ValueError as exc:
+        raise ValidationError(str(exc), error="derivative_failed") from exc
+
+    etag = f'"{key}"'
+    headers = {"Cache-Control": "public, max-age=86400", "ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    _, media_type = DERIVATIVE_FORMATS[fmt]
+    return FileResponse(str(path), media_type=media_type, headers=headers)
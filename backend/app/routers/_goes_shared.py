@@ -41,12 +41,31 @@ for _cfg in SATELLITE_REGISTRY.values():
 #                   C05 (Snow/Ice 1.61µm) — the daytime fire RGB (NOAA quick-guide).
 #     Previously shared C07/C06/C02 with natural_color which was a typo; fire-
 #     detection should use C07/C06/C05.
+#
+# Recipes whose channels are band differences carry an ``rgb`` entry: one
+# band-math line per channel (syntax in ``app.services.band_math``). The
+# others stack their first three bands. ``rgb`` ranges are in the stored
+# 8-bit band scale. ``rgb_cmi`` is the same recipe in brightness
+# temperature (K) with the quick-guide ranges. It is used when every band
+# has a float32 CMI sidecar (``app.services.cmi_store``).
+# - Dust/Ash:  C15-C13, C14-C11 (gamma 2.5), C13
+# - Airmass:   C08-C10, C12-C13, C08 inverted
 COMPOSITE_RECIPES = {
     "true_color": {"name": "True Color", "bands": ["C02", "C03", "C01"]},
     "natural_color": {"name": "Natural Color", "bands": ["C03", "C02", "C01"]},
     "fire_detection": {"name": "Fire Detection", "bands": ["C07", "C06", "C05"]},
-    "dust_ash": {"name": "Dust/Ash", "bands": ["C15", "C14", "C13", "C11"]},
+    "dust_ash": {
+        "name": "Dust/Ash",
+        "bands": ["C15", "C14", "C13", "C11"],
+        "rgb": ("C15 - C13", "C14 - C11 | auto | 2.5", "C13"),
+        "rgb_cmi": ("C15 - C13 | -6.7, 2.6", "C14 - C11 | -0.5, 20 | 2.5", "C13 | 261.2, 288.7"),
+    },
     "day_cloud_phase": {"name": "Day Cloud Phase", "bands": ["C13", "C02", "C05"]},
-    "airmass": {"name": "Airmass", "bands": ["C08", "C10", "C12", "C13"]},
+    "airmass": {
+        "name": "Airmass",
+        "bands": ["C08", "C10", "C12", "C13"],
+        "rgb": ("C08 - C10", "C12 - C13", "C08 | 255, 0"),
+        "rgb_cmi": ("C08 - C10 | -26.2, 0.6", "C12 - C13 | -43.2, 6.7", "C08 | 243.9, 208.5"),
+    },
     "himawari_true_color": {"name": "Himawari True Color", "bands": ["B03", "B02", "B01"]},
 }
@@ -0,0 +1,96 @@
+"""Keyset (cursor) pagination helpers shared by list/export endpoints.
+
+``OFFSET n`` makes the database walk and discard ``n`` rows before it can
+return a page, so deep pages get linearly slower as a table grows. Keyset
+pagination remembers the ``(sort value, id)`` of the last row served and
+seeks past it instead — an index whose trailing column is the sort column
+(e.g. ``ix_goes_frames_sat_sector_band_capture`` for filtered
+``capture_time`` listings) satisfies the seek directly, whatever the depth.
+
+The cursor is opaque to clients: URL-safe base64 of a small JSON array.
+
+A NULL sort value compares neither ``<`` nor ``>`` anything, so a NULL on
+a page boundary would silently end paging. Sort columns must therefore be
+NOT NULL; they are compared as they are, so their indexes apply.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ..errors import ValidationError
+
+_INVALID_CURSOR = "Invalid pagination cursor"
+
+
+def encode_cursor(value: Any, row_id: str) -> str:
+    """Encode the last row's sort value and id into an opaque cursor."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: InstrumentedAttribute) -> tuple[Any, str]:
+    """Decode a cursor produced by :func:`encode_cursor` for *column*.
+
+    Raises ``ValidationError`` (400) for anything that was not produced by
+    :func:`encode_cursor` — a tampered or stale cursor is a client error.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValidationError(_INVALID_CURSOR, error="invalid_cursor", status_code=400)
+    if value is None or not isinstance(row_id, str):
+        raise ValidationError(_INVALID_CURSOR, error="invalid_cursor", status_code=400)
+    return value, row_id
+
+
+def apply_keyset(
+    query: Select,
+    column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    order: str,
+    cursor: str | None,
+) -> Select:
+    """Order *query* by ``(column, id_column)`` and seek past *cursor*.
+
+    ``id_column`` breaks ties so rows sharing a sort value are neither
+    skipped nor repeated across pages. *column* must be NOT NULL.
+    """
+    if column.nullable:
+        raise TypeError(f"Keyset sort column {column.key} must be NOT NULL")
+    descending = order == "desc"
+    if cursor:
+        value, row_id = decode_cursor(cursor, column)
+        if descending:
+            query = query.where(or_(column < value, and_(column == value, id_column < row_id)))
+        else:
+            query = query.where(or_(column > value, and_(column == value, id_column > row_id)))
+    if descending:
+        return query.order_by(column.desc(), id_column.desc())
+    return query.order_by(column.asc(), id_column.asc())
+
+
+def page_with_cursor(rows: Sequence[Any], limit: int, sort_attr: str) -> tuple[list[Any], str | None]:
+    """Trim a ``limit + 1`` result to *limit* rows and build the next cursor.
+
+    Callers fetch one extra row; its presence is what tells us another
+    page exists without a separate ``COUNT``.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_attr), last.id)
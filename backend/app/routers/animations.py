@@ -1,8 +1,10 @@
 """Animation studio endpoints — crop presets, animations, presets, and batch."""
 
+import asyncio
 import hashlib
 import json as json_mod
 import logging
+import os
 import threading
 import time
 import uuid
@@ -10,6 +12,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Query
+from fastapi.responses import FileResponse
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -97,6 +100,93 @@ def _idempotency_store(key: str, animation_id: str) -> None:
         _animation_idempotency_cache[key] = (time.monotonic(), animation_id)
 
 
+# Whole-output reuse: identical parameters over unchanged source frames
+# produce an identical file, so a new request links to a completed
+# animation's output, or attaches to the job of one still rendering,
+# instead of queueing another ``generate_animation`` run.
+_REUSABLE_STATUSES = ("pending", "processing", "completed")
+_TERMINAL_STATUSES = ("completed", "failed")
+# What an attached animation mirrors from the one whose job it shares.
+_SHARED_FIELDS = (
+    "status",
+    "frame_count",
+    "output_path",
+    "preview_path",
+    "file_size",
+    "duration_seconds",
+    "completed_at",
+    "error",
+)
+
+
+async def _animation_params_hash(db: AsyncSession, frame_ids: list[str], params: dict[str, Any]) -> str:
+    """Canonical hash of the render parameters and the current state of the source frames.
+
+    Frame order is irrelevant (the task sorts by capture time). Each frame
+    contributes its path and size, and a crop preset contributes its
+    geometry, so editing either yields a new hash.
+    """
+    rows = (
+        await db.execute(
+            select(GoesFrame.id, GoesFrame.file_path, GoesFrame.file_size).where(GoesFrame.id.in_(frame_ids))
+        )
+    ).all()
+    canonical = {k: v for k, v in params.items() if k != "frame_ids"}
+    canonical["frames"] = sorted([r.id, r.file_path, r.file_size or 0] for r in rows)
+    if params.get("crop_preset_id"):
+        preset = (
+            (await db.execute(select(CropPreset).where(CropPreset.id == params["crop_preset_id"]))).scalars().first()
+        )
+        canonical["crop"] = [preset.x, preset.y, preset.width, preset.height] if preset else None
+    blob = json_mod.dumps(canonical, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _output_still_valid(output_path: str, source_paths: list[str], completed_at: datetime) -> bool:
+    """True if the output exists and no source file was modified after it was rendered."""
+    try:
+        rendered = os.stat(output_path).st_mtime
+    except OSError:
+        return False
+    cutoff = max(rendered, completed_at.replace(tzinfo=UTC).timestamp())
+    for path in source_paths:
+        try:
+            if os.stat(path).st_mtime > cutoff:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _copy_source_state(anim: Animation, source: Animation) -> None:
+    for field in _SHARED_FIELDS:
+        setattr(anim, field, getattr(source, field))
+
+
+async def _find_reusable_animation(db: AsyncSession, params_hash: str, frame_ids: list[str]) -> Animation | None:
+    """Newest in-progress or still-valid completed animation with *params_hash*."""
+    result = await db.execute(
+        select(Animation)
+        .where(Animation.params_hash == params_hash, Animation.status.in_(_REUSABLE_STATUSES))
+        .order_by(Animation.created_at.desc())
+        .limit(5)
+    )
+    source_paths: list[str] | None = None
+    for candidate in result.scalars().all():
+        if candidate.status != "completed":
+            if candidate.job_id:
+                return candidate
+            continue
+        if not candidate.output_path or not candidate.completed_at:
+            continue
+        if source_paths is None:
+            paths = await db.execute(select(GoesFrame.file_path).where(GoesFrame.id.in_(frame_ids)))
+            source_paths = [r[0] for r in paths.all()]
+        if await asyncio.to_thread(_output_still_valid, candidate.output_path, source_paths, candidate.completed_at):
+            return candidate
+    return None
+
+
 # ── Helpers ──────────────────────────────────────────
 
 
@@ -116,6 +206,7 @@ def _build_anim_response(anim: Animation) -> AnimationResponse:
         false_color=bool(anim.false_color),
         scale=anim.scale,
         output_path=anim.output_path,
+        preview_path=anim.preview_path,
         file_size=anim.file_size or 0,
         duration_seconds=anim.duration_seconds or 0,
         created_at=anim.created_at,
@@ -143,29 +234,21 @@ async def _create_animation_from_frames(
     if not frame_ids:
         raise APIError(400, "bad_request", "No frames matched the given criteria")
 
-    job_id = str(uuid.uuid4())
-    job = Job(
-        id=job_id,
-        status="pending",
-        job_type="animation",
-        params={
-            "frame_ids": frame_ids,
-            "fps": fps,
-            "format": fmt,
-            "quality": quality,
-            "resolution": resolution,
-            "loop_style": loop_style,
-            "overlay": overlay,
-            "crop_preset_id": crop_preset_id,
-            "false_color": false_color,
-            "scale": scale,
-        },
-    )
-    db.add(job)
-
-    anim_id = str(uuid.uuid4())
+    params = {
+        "frame_ids": frame_ids,
+        "fps": fps,
+        "format": fmt,
+        "quality": quality,
+        "resolution": resolution,
+        "loop_style": loop_style,
+        "overlay": overlay,
+        "crop_preset_id": crop_preset_id,
+        "false_color": false_color,
+        "scale": scale,
+    }
+    params_hash = await _animation_params_hash(db, frame_ids, params)
     anim = Animation(
-        id=anim_id,
+        id=str(uuid.uuid4()),
         name=name,
         status="pending",
         frame_count=len(frame_ids),
@@ -178,15 +261,36 @@ async def _create_animation_from_frames(
         crop_preset_id=crop_preset_id,
         false_color=bool(false_color),
         scale=scale,
-        job_id=job_id,
+        params_hash=params_hash,
     )
+
+    source = await _find_reusable_animation(db, params_hash, frame_ids)
+    if source is not None:
+        # Share the source's job (and, once it finishes, its output file).
+        _copy_source_state(anim, source)
+        anim.job_id = source.job_id
+        db.add(anim)
+        await db.commit()
+        # The job may have finished between the lookup and the commit, when
+        # this row did not exist yet for the worker to update; catch up.
+        await db.refresh(source)
+        if source.status in _TERMINAL_STATUSES and anim.status not in _TERMINAL_STATUSES:
+            _copy_source_state(anim, source)
+            await db.commit()
+        await db.refresh(anim)
+        logger.info("Animation %s reuses %s animation %s", anim.id, source.status, source.id)
+        return anim
+
+    job_id = str(uuid.uuid4())
+    db.add(Job(id=job_id, status="pending", job_type="animation", params=params))
+    anim.job_id = job_id
     db.add(anim)
     await db.commit()
     await db.refresh(anim)
 
     from ..tasks.animation_tasks import generate_animation
 
-    generate_animation.delay(job_id, anim_id)
+    generate_animation.delay(job_id, anim.id)
 
     return anim
 
@@ -476,6 +580,18 @@ async def get_animation(animation_id: str, db: DbSession) -> AnimationResponse:
     return _build_anim_response(anim)
 
 
+@router.get("/animations/{animation_id}/preview")
+async def get_animation_preview(animation_id: str, db: DbSession) -> FileResponse:
+    """Serve the draft preview while the full animation is still rendering."""
+    logger.debug("Animation preview requested: id=%s", sanitize_log(animation_id))
+    validate_uuid(animation_id, "animation_id")
+    result = await db.execute(select(Animation.preview_path).where(Animation.id == animation_id))
+    preview_path = result.scalar()
+    if not preview_path or not os.path.exists(preview_path):
+        raise APIError(404, "not_found", "No draft preview available")
+    return FileResponse(preview_path, media_type="video/mp4", headers={"Cache-Control": "no-cache"})
+
+
 @router.delete("/animations/{animation_id}")
 async def delete_animation(animation_id: str, db: DbSession) -> dict[str, Any]:
     logger.info("Deleting animation: id=%s", sanitize_log(animation_id))
@@ -485,7 +601,12 @@ async def delete_animation(animation_id: str, db: DbSession) -> dict[str, Any]:
     if not anim:
         raise APIError(404, "not_found", "Animation not found")
     if anim.output_path:
-        safe_remove(anim.output_path)
+        # Reused outputs are shared; the file goes with its last animation.
+        shared = await db.execute(
+            select(func.count(Animation.id)).where(Animation.output_path == anim.output_path, Animation.id != anim.id)
+        )
+        if not shared.scalar():
+            safe_remove(anim.output_path)
     await db.delete(anim)
     await db.commit()
     return {"deleted": animation_id}
@@ -3,11 +3,12 @@
 import logging
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, Query, Request
 from sqlalchemy import func, select
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, Response
 
 from ..db.database import DbSession
 from ..db.models import Composite, Job
@@ -15,6 +16,7 @@ from ..errors import APIError, validate_uuid
 from ..models.goes import CompositeCreateRequest, CompositeResponse
 from ..models.pagination import PaginatedResponse
 from ..utils import sanitize_log
+from ._derivatives import CropParam, FormatParam, HeightParam, WidthParam, derivative_response
 from ._goes_shared import COMPOSITE_RECIPES
 
 logger = logging.getLogger(__name__)
@@ -141,11 +143,7 @@ async def get_composite(composite_id: str, db: DbSession) -> dict[str, Any]:
     }
 
 
-# Bug #11: Dedicated composite image endpoint
-@router.get("/composites/{composite_id}/image")
-async def get_composite_image(composite_id: str, db: DbSession) -> FileResponse:
-    """Serve the composite image file."""
-    logger.debug("Composite image requested: id=%s", sanitize_log(composite_id))
+async def _get_composite_or_404(db: DbSession, composite_id: str) -> Composite:
     validate_uuid(composite_id, "composite_id")
     result = await db.execute(select(Composite).where(Composite.id == composite_id))
     c = result.scalars().first()
@@ -153,12 +151,24 @@ async def get_composite_image(composite_id: str, db: DbSession) -> FileResponse:
         raise APIError(404, "not_found", "Composite not found")
     if not c.file_path:
         raise APIError(404, "not_found", "Composite image not yet generated")
+    return c
 
-    from pathlib import Path
 
+def _composite_file_path(c: Composite) -> Path:
     file_path = Path(c.file_path)
     if not file_path.exists():
         raise APIError(404, "not_found", "Composite image file not found on disk")
+    return file_path
+
+
+# Bug #11: Dedicated composite image endpoint
+@router.get("/composites/{composite_id}/image")
+async def get_composite_image(composite_id: str, db: DbSession) -> FileResponse:
+    """Serve the composite image file."""
+    logger.debug("Composite image requested: id=%s", sanitize_log(composite_id))
+    c = await _get_composite_or_404(db, composite_id)
+
+    file_path = _composite_file_path(c)
 
     import mimetypes
 
@@ -169,3 +179,20 @@ async def get_composite_image(composite_id: str, db: DbSession) -> FileResponse:
         media_type=media_type,
         headers={"Cache-Control": "public, max-age=86400"},
     )
+
+
+@router.get("/composites/{composite_id}/derivative", response_model=None)
+async def get_composite_derivative(
+    composite_id: str,
+    request: Request,
+    db: DbSession,
+    width: WidthParam = None,
+    height: HeightParam = None,
+    crop: CropParam = None,
+    format: FormatParam = "webp",  # noqa: A002
+) -> Response:
+    """Serve a resized / cropped / re-encoded copy of the composite image."""
+    c = await _get_composite_or_404(db, composite_id)
+    return await derivative_response(
+        request, _composite_file_path(c), width=width, height=height, crop=crop, fmt=format
+    )
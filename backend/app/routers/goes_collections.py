@@ -22,6 +22,7 @@ from ..models.goes_data import (
     GoesFrameResponse,
 )
 from ..models.pagination import PaginatedResponse
+from ..services.cache import TAG_COLLECTIONS, invalidate_tags
 from ..utils import sanitize_log
 from .goes_frames import MAX_EXPORT_LIMIT, _frames_to_csv, _frames_to_json_list
 
@@ -139,6 +140,7 @@ async def delete_collection(
         raise APIError(404, "not_found", _COLLECTION_NOT_FOUND)
     await db.delete(coll)
     await db.commit()
+    await invalidate_tags(TAG_COLLECTIONS)
     return {"deleted": collection_id}
 
 
@@ -164,6 +166,7 @@ async def add_frames_to_collection(
     else:
         added = 0
     await db.commit()
+    await invalidate_tags(TAG_COLLECTIONS)
     return {"added": added}
 
 
@@ -258,4 +261,5 @@ async def remove_frames_from_collection(
         )
     )
     await db.commit()
+    await invalidate_tags(TAG_COLLECTIONS)
     return {"removed": result.rowcount}
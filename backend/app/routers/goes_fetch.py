@@ -24,7 +24,7 @@ from ..models.goes import (
     GoesFetchResponse,
 )
 from ..rate_limit import limiter
-from ..services.cache import invalidate
+from ..services.cache import TAG_JOBS, invalidate_tags
 from ..services.gap_detector import get_coverage_stats
 from ..services.goes_fetcher import SATELLITE_AVAILABILITY, SECTOR_INTERVALS
 from ..services.satellite_registry import validate_band, validate_sector
@@ -238,7 +238,7 @@ async def fetch_composite(
         logger.exception("Failed to dispatch composite task for job %s", job_id)
         raise APIError(503, "task_dispatch_failed", "Failed to enqueue task — broker may be unavailable")
 
-    await invalidate("cache:dashboard-stats*")
+    await invalidate_tags(TAG_JOBS)
 
     return GoesFetchResponse(
         job_id=job_id,
@@ -298,7 +298,7 @@ async def fetch_goes(
         logger.exception("Failed to dispatch fetch task for job %s", job_id)
         raise APIError(503, "task_dispatch_failed", "Failed to enqueue task — broker may be unavailable")
 
-    await invalidate("cache:dashboard-stats*")
+    await invalidate_tags(TAG_JOBS)
 
     response = GoesFetchResponse(
         job_id=job_id,
@@ -2,31 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
+import json
 import logging
+import re
 import uuid
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterator, Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Query, Request
-from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy import delete, func, select
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncResult
 from sqlalchemy.orm import selectinload
 
 from ..config import settings
 from ..db.database import DbSession
+from ..db.frame_stats import FrameRow, record_frames_removed, sum_as_int
 from ..db.models import (
     CollectionFrame,
     FetchSchedule,
+    FrameStat,
     FrameTag,
     GoesFrame,
     Job,
     Tag,
 )
-from ..errors import APIError, validate_uuid
+from ..errors import APIError, ValidationError, validate_uuid
 from ..models.goes_data import (
     BulkFrameDeleteRequest,
     BulkTagRequest,
@@ -35,16 +41,29 @@ from ..models.goes_data import (
     ProcessFramesRequest,
 )
 from ..models.pagination import PaginatedResponse
-from ..services.cache import get_cached, invalidate, make_cache_key
-from ..utils import safe_remove, sanitize_log
+from ..services.cache import TAG_COLLECTIONS, TAG_FRAMES, TAG_JOBS, get_cached, invalidate_tags, make_cache_key
+from ..services.cleanup import delete_frame_files
+from ..services.tiles import remove_frame_tiles
+from ..utils import sanitize_log
 from ..utils.path_validation import validate_file_path
+from ._derivatives import CropParam, FormatParam, HeightParam, WidthParam, derivative_response, etag_matches
+from ._pagination import apply_keyset, page_with_cursor
 
 logger = logging.getLogger(__name__)
 
 _FRAME_NOT_FOUND = "Frame not found"
 
+#: Upper bound on ``?limit=`` for the collection export endpoint.
 MAX_EXPORT_LIMIT = 5000
 
+#: Rows fetched per round trip when streaming ``/frames/export``.
+EXPORT_STREAM_BATCH_SIZE = 1000
+
+#: For content-addressed responses (versioned tile URLs, sprite sheets) that never change in place.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+#: For responses whose URL outlives their content: cacheable, but revalidated against the ETag.
+_REVALIDATE_CACHE_CONTROL = "no-cache"
+
 router = APIRouter(prefix="/api/satellite", tags=["satellite-frames"])
 
 
@@ -58,12 +77,16 @@ async def dashboard_stats(db: DbSession) -> dict[str, Any]:
     cache_key = make_cache_key("dashboard-stats")
 
     async def _fetch() -> dict[str, Any]:
-        total = (await db.execute(select(func.count(GoesFrame.id)))).scalar() or 0
-
         sat_rows = (
-            await db.execute(select(GoesFrame.satellite, func.count(GoesFrame.id)).group_by(GoesFrame.satellite))
+            await db.execute(
+                select(
+                    FrameStat.satellite, sum_as_int(FrameStat.frame_count), sum_as_int(FrameStat.total_size)
+                ).group_by(FrameStat.satellite)
+            )
         ).all()
         frames_by_satellite = {row[0]: row[1] for row in sat_rows}
+        storage_by_satellite = {row[0]: row[2] for row in sat_rows}
+        total = sum(frames_by_satellite.values())
 
         last_job = (
             await db.execute(
@@ -79,19 +102,8 @@ async def dashboard_stats(db: DbSession) -> dict[str, Any]:
             await db.execute(select(func.count(FetchSchedule.id)).where(FetchSchedule.is_active.is_(True)))
         ).scalar() or 0
 
-        sat_storage_rows = (
-            await db.execute(
-                select(GoesFrame.satellite, func.coalesce(func.sum(GoesFrame.file_size), 0)).group_by(
-                    GoesFrame.satellite
-                )
-            )
-        ).all()
-        storage_by_satellite = {row[0]: row[1] for row in sat_storage_rows}
-
         band_storage_rows = (
-            await db.execute(
-                select(GoesFrame.band, func.coalesce(func.sum(GoesFrame.file_size), 0)).group_by(GoesFrame.band)
-            )
+            await db.execute(select(FrameStat.band, sum_as_int(FrameStat.total_size)).group_by(FrameStat.band))
         ).all()
         storage_by_band = {row[0]: row[1] for row in band_storage_rows}
 
@@ -120,7 +132,7 @@ async def dashboard_stats(db: DbSession) -> dict[str, Any]:
             "recent_jobs": recent_jobs,
         }
 
-    return await get_cached(cache_key, ttl=120, fetch_fn=_fetch)
+    return await get_cached(cache_key, ttl=120, fetch_fn=_fetch, tags=(TAG_FRAMES, TAG_JOBS))
 
 
 # ── Quick Fetch Presets ───────────────────────────────────────────────
@@ -140,11 +152,17 @@ async def quick_fetch_options() -> list[dict[str, Any]]:
 # ── Frames ────────────────────────────────────────────────────────────
 
 
-@router.get("/frames")
-async def list_frames(
-    db: DbSession,
-    page: Annotated[int, Query(ge=1)] = 1,
-    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+_SORT_FIELDS = {
+    "capture_time": GoesFrame.capture_time,
+    "file_size": GoesFrame.file_size,
+    "satellite": GoesFrame.satellite,
+    "created_at": GoesFrame.created_at,
+}
+
+
+def _apply_frame_filters(
+    query: Select,
+    *,
     satellite: str | None = None,
     band: str | None = None,
     sector: str | None = None,
@@ -152,71 +170,90 @@ async def list_frames(
     end_date: datetime | None = None,
     collection_id: str | None = None,
     tag: str | None = None,
-    sort: Annotated[str, Query(pattern="^(capture_time|file_size|satellite|created_at)$")] = "capture_time",
-    order: Annotated[str, Query(pattern="^(asc|desc)$")] = "desc",
-) -> PaginatedResponse[GoesFrameResponse]:
-    """List GOES frames with filtering, sorting, pagination."""
-    logger.debug("Listing frames: page=%d, limit=%d", page, limit)
-    query = select(GoesFrame).options(
-        selectinload(GoesFrame.tags),
-        selectinload(GoesFrame.collections),
-    )
-    count_query = select(func.count(GoesFrame.id))
-
+) -> Select:
+    """Apply the shared /frames filter parameters to *query*."""
     if satellite:
         query = query.where(GoesFrame.satellite == satellite)
-        count_query = count_query.where(GoesFrame.satellite == satellite)
     if band:
         query = query.where(GoesFrame.band == band)
-        count_query = count_query.where(GoesFrame.band == band)
     if sector:
         query = query.where(GoesFrame.sector == sector)
-        count_query = count_query.where(GoesFrame.sector == sector)
     if start_date:
         query = query.where(GoesFrame.capture_time >= start_date)
-        count_query = count_query.where(GoesFrame.capture_time >= start_date)
     if end_date:
         query = query.where(GoesFrame.capture_time <= end_date)
-        count_query = count_query.where(GoesFrame.capture_time <= end_date)
     if collection_id:
         query = query.join(CollectionFrame, CollectionFrame.frame_id == GoesFrame.id).where(
             CollectionFrame.collection_id == collection_id
         )
-        count_query = count_query.join(CollectionFrame, CollectionFrame.frame_id == GoesFrame.id).where(
-            CollectionFrame.collection_id == collection_id
-        )
     if tag:
         query = (
             query.join(FrameTag, FrameTag.frame_id == GoesFrame.id)
             .join(Tag, Tag.id == FrameTag.tag_id)
             .where(Tag.name == tag)
         )
-        count_query = (
-            count_query.join(FrameTag, FrameTag.frame_id == GoesFrame.id)
-            .join(Tag, Tag.id == FrameTag.tag_id)
-            .where(Tag.name == tag)
-        )
+    return query
+
 
-    _SORT_FIELDS = {
-        "capture_time": GoesFrame.capture_time,
-        "file_size": GoesFrame.file_size,
-        "satellite": GoesFrame.satellite,
-        "created_at": GoesFrame.created_at,
+@router.get("/frames")
+async def list_frames(
+    db: DbSession,
+    page: Annotated[int, Query(ge=1)] = 1,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    satellite: str | None = None,
+    band: str | None = None,
+    sector: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    collection_id: str | None = None,
+    tag: str | None = None,
+    sort: Annotated[str, Query(pattern="^(capture_time|file_size|satellite|created_at)$")] = "capture_time",
+    order: Annotated[str, Query(pattern="^(asc|desc)$")] = "desc",
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> PaginatedResponse[GoesFrameResponse]:
+    """List GOES frames with filtering, sorting, pagination.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to page by
+    keyset instead of ``page`` — cost then stays flat however deep the
+    caller scrolls. ``include_total=false`` skips the ``COUNT`` query
+    (``total`` is returned as ``null``).
+    """
+    logger.debug("Listing frames: page=%d, limit=%d, cursor=%s", page, limit, cursor is not None)
+    filters = {
+        "satellite": satellite,
+        "band": band,
+        "sector": sector,
+        "start_date": start_date,
+        "end_date": end_date,
+        "collection_id": collection_id,
+        "tag": tag,
     }
+    query = _apply_frame_filters(
+        select(GoesFrame).options(
+            selectinload(GoesFrame.tags),
+            selectinload(GoesFrame.collections),
+        ),
+        **filters,
+    )
     sort_col = _SORT_FIELDS.get(sort, GoesFrame.capture_time)
-    query = query.order_by(sort_col.desc()) if order == "desc" else query.order_by(sort_col.asc())
+    query = apply_keyset(query, sort_col, GoesFrame.id, order, cursor)
+    if not cursor:
+        query = query.offset((page - 1) * limit)
 
-    total = (await db.execute(count_query)).scalar() or 0
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
-    frames = result.scalars().unique().all()
+    total = None
+    if include_total:
+        count_query = _apply_frame_filters(select(func.count(GoesFrame.id)), **filters)
+        total = (await db.execute(count_query)).scalar() or 0
+    result = await db.execute(query.limit(limit + 1))
+    frames, next_cursor = page_with_cursor(result.scalars().unique().all(), limit, sort_col.key)
 
     return PaginatedResponse(
         items=[GoesFrameResponse.model_validate(f) for f in frames],
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -226,11 +263,11 @@ async def frame_stats(db: DbSession) -> FrameStatsResponse:
     logger.debug("Frame stats requested")
     result = await db.execute(
         select(
-            GoesFrame.satellite,
-            GoesFrame.band,
-            func.count(GoesFrame.id).label("count"),
-            func.coalesce(func.sum(GoesFrame.file_size), 0).label("size"),
-        ).group_by(GoesFrame.satellite, GoesFrame.band)
+            FrameStat.satellite,
+            FrameStat.band,
+            sum_as_int(FrameStat.frame_count).label("count"),
+            sum_as_int(FrameStat.total_size).label("size"),
+        ).group_by(FrameStat.satellite, FrameStat.band)
     )
     rows = result.all()
 
@@ -259,10 +296,11 @@ async def frame_stats(db: DbSession) -> FrameStatsResponse:
     )
 
 
-def _frames_to_csv(frames: list[GoesFrame]) -> str:
+def _frames_to_csv(frames: Sequence[GoesFrame], *, header: bool = True) -> str:
     output = io.StringIO()
     writer = csv.writer(output)
-    writer.writerow(["id", "satellite", "sector", "band", "capture_time", "file_size"])
+    if header:
+        writer.writerow(["id", "satellite", "sector", "band", "capture_time", "file_size"])
     for f in frames:
         writer.writerow(
             [
@@ -277,7 +315,7 @@ def _frames_to_csv(frames: list[GoesFrame]) -> str:
     return output.getvalue()
 
 
-def _frames_to_json_list(frames: list[GoesFrame]) -> list[dict[str, Any]]:
+def _frames_to_json_list(frames: Sequence[GoesFrame]) -> list[dict[str, Any]]:
     return [
         {
             "id": f.id,
@@ -291,6 +329,24 @@ def _frames_to_json_list(frames: list[GoesFrame]) -> list[dict[str, Any]]:
     ]
 
 
+async def _stream_csv(result: AsyncResult) -> AsyncIterator[str]:
+    """Yield CSV text one server-side cursor batch at a time."""
+    yield _frames_to_csv([])
+    async for partition in result.scalars().partitions():
+        yield _frames_to_csv(partition, header=False)
+
+
+async def _stream_json(result: AsyncResult) -> AsyncIterator[str]:
+    """Yield a JSON array one server-side cursor batch at a time."""
+    yield "["
+    first = True
+    async for partition in result.scalars().partitions():
+        for item in _frames_to_json_list(partition):
+            yield ("" if first else ",") + json.dumps(item)
+            first = False
+    yield "]"
+
+
 def _resolve_export_format(explicit: str | None, accept: str) -> str:
     """Pick csv or json based on explicit ?format= or Accept header.
 
@@ -317,50 +373,137 @@ async def export_frames(
     request: Request,
     db: DbSession,
     format: Annotated[str | None, Query(pattern="^(csv|json)$")] = None,  # noqa: A002
-    limit: Annotated[int, Query(ge=1)] = 1000,
+    limit: Annotated[int | None, Query(ge=1)] = None,
     offset: Annotated[int, Query(ge=0)] = 0,
+    satellite: str | None = None,
+    band: str | None = None,
+    sector: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    collection_id: str | None = None,
+    tag: str | None = None,
 ) -> StreamingResponse:
-    """Export frame metadata as CSV or JSON with pagination.
+    """Export frame metadata as CSV or JSON.
 
     The default export format is CSV (the Browse "Export" button speaks
     CSV). Callers can override with ``?format=json`` or by sending
     ``Accept: application/json``.
+
+    Every matching row is exported unless ``limit`` is given. Rows are
+    streamed from a server-side cursor in batches of
+    ``EXPORT_STREAM_BATCH_SIZE``, so memory stays flat regardless of how
+    many frames match.
     """
     logger.info("Exporting frames")
-    if limit > MAX_EXPORT_LIMIT:
-        raise APIError(
-            400,
-            "limit_exceeded",
-            f"Export limit must not exceed {MAX_EXPORT_LIMIT}. Requested: {limit}",
-        )
-    import json as json_mod
-
     effective_format = _resolve_export_format(format, request.headers.get("accept", ""))
 
-    query = select(GoesFrame).order_by(GoesFrame.capture_time.desc()).offset(offset).limit(limit)
-    result = await db.execute(query)
-    frames = result.scalars().all()
+    query = _apply_frame_filters(
+        select(GoesFrame),
+        satellite=satellite,
+        band=band,
+        sector=sector,
+        start_date=start_date,
+        end_date=end_date,
+        collection_id=collection_id,
+        tag=tag,
+    ).order_by(GoesFrame.capture_time.desc(), GoesFrame.id.desc())
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.stream(query.execution_options(yield_per=EXPORT_STREAM_BATCH_SIZE))
 
     if effective_format == "csv":
-        csv_data = _frames_to_csv(frames)
         return StreamingResponse(
-            io.BytesIO(csv_data.encode()),
+            _stream_csv(result),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=goes_frames.csv"},
         )
 
-    items = _frames_to_json_list(frames)
-
-    async def _stream_json() -> AsyncIterator[str]:
-        yield json_mod.dumps(items)
-
     return StreamingResponse(
-        _stream_json(),
+        _stream_json(result),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=goes_frames.json"},
     )
 
 
+# ── Sprite Sheets ─────────────────────────────────────────────────────
+# Registered before /frames/{frame_id} so "sprites" isn't taken as an id.
+
+_SPRITE_ID_RE = re.compile("[0-9a-f]{24}")
+
+
+@router.get("/frames/sprites")
+async def get_frame_sprites(
+    db: DbSession,
+    satellite: str | None = None,
+    sector: str | None = None,
+    band: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    collection_id: str | None = None,
+) -> dict[str, Any]:
+    """Index of thumbnail sprite sheets for a product time range or a collection.
+
+    Each frame maps to ``(sheet, x, y)`` in a ``cell_size`` grid; sheets are
+    fetched from ``sheet_url_template``. Pass ``collection_id``, or all of
+    ``satellite``/``sector``/``band`` (optionally with a time range).
+    """
+    from ..services.sprites import MAX_SPRITE_FRAMES, SpriteFrame, build_index
+
+    if not collection_id and not (satellite and sector and band):
+        raise ValidationError(
+            "Provide collection_id or satellite, sector and band", error="invalid_query", status_code=400
+        )
+    filters = {
+        "satellite": satellite,
+        "sector": sector,
+        "band": band,
+        "start_date": start_date,
+        "end_date": end_date,
+        "collection_id": collection_id,
+    }
+
+    async def _fetch() -> dict[str, Any]:
+        query = _apply_frame_filters(
+            select(GoesFrame.id, GoesFrame.capture_time, GoesFrame.thumbnail_path, GoesFrame.file_path),
+            **filters,
+        ).order_by(GoesFrame.capture_time, GoesFrame.id)
+        rows = (await db.execute(query.limit(MAX_SPRITE_FRAMES + 1))).all()
+        if len(rows) > MAX_SPRITE_FRAMES:
+            raise ValidationError(
+                f"Query matches more than {MAX_SPRITE_FRAMES} frames; narrow the time range",
+                error="too_many_frames",
+                status_code=400,
+            )
+        index = await asyncio.to_thread(build_index, [SpriteFrame(*row) for row in rows])
+        index["sheet_url_template"] = f"/api/satellite/frames/sprites/{index['sprite_id']}/{{sheet}}.webp"
+        return index
+
+    cache_key = make_cache_key("frame-sprites", filters)
+    return await get_cached(cache_key, ttl=300, fetch_fn=_fetch, tags=(TAG_FRAMES, TAG_COLLECTIONS))
+
+
+@router.get("/frames/sprites/{sprite_id}/{sheet}.webp", response_model=None)
+async def get_frame_sprite_sheet(sprite_id: str, sheet: int, request: Request) -> Response:
+    """Serve one sprite sheet, rendering it on first request.
+
+    Sheets are content-addressed by ``sprite_id``, so they're immutable.
+    """
+    from ..services.sprites import render_sheet
+
+    if not _SPRITE_ID_RE.fullmatch(sprite_id):
+        raise APIError(404, "not_found", "Sprite sheet not found")
+    etag = f'"{sprite_id}-{sheet}"'
+    headers = {"Cache-Control": _IMMUTABLE_CACHE_CONTROL, "ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    path = await asyncio.to_thread(render_sheet, sprite_id, sheet)
+    if path is None:
+        raise APIError(404, "not_found", "Sprite sheet not found")
+    return FileResponse(str(path), media_type="image/webp", headers=headers)
+
+
 @router.get("/frames/{frame_id}")
 async def get_frame(frame_id: str, db: DbSession) -> GoesFrameResponse:
     """Get single frame detail."""
@@ -388,16 +531,17 @@ async def bulk_delete_frames(
     frames = result.scalars().all()
 
     for frame in frames:
-        for path in [frame.file_path, frame.thumbnail_path]:
-            if path:
-                safe_remove(path)
+        delete_frame_files(frame)
+        remove_frame_tiles(frame.id)
 
     # Bug #17: Delete FK references before deleting frames
     await db.execute(delete(CollectionFrame).where(CollectionFrame.frame_id.in_(payload.ids)))
     await db.execute(delete(FrameTag).where(FrameTag.frame_id.in_(payload.ids)))
     await db.execute(delete(GoesFrame).where(GoesFrame.id.in_(payload.ids)))
+    removed = [FrameRow(f.satellite, f.sector, f.band, f.capture_time, f.file_size) for f in frames]
+    await db.run_sync(lambda session: record_frames_removed(session.connection(), removed))
     await db.commit()
-    await invalidate("cache:dashboard-stats*")
+    await invalidate_tags(TAG_FRAMES)
     return {"deleted": len(frames)}
 
 
@@ -493,23 +637,17 @@ async def process_frames(
 # ── Frame Image Endpoints ─────────────────────────────────────────────
 
 
-@router.get("/frames/{frame_id}/image")
-async def get_frame_image(frame_id: str, db: DbSession) -> FileResponse:
-    """Serve the raw image file for a frame.
-
-    JTN-475 ISSUE-065: previously streamed via chunked-transfer with only
-    ``Cache-Control``. Now uses Starlette ``FileResponse`` which emits
-    ``Content-Length``, ``Last-Modified``, ``ETag``, and ``Accept-Ranges``
-    so browsers can short-circuit re-downloads with a 304 and servers can
-    serve partial content for video previews.
-    """
-    logger.debug("Frame image requested: frame_id=%s", sanitize_log(frame_id))
+async def _get_frame_or_404(db: DbSession, frame_id: str) -> GoesFrame:
     validate_uuid(frame_id, "frame_id")
     result = await db.execute(select(GoesFrame).where(GoesFrame.id == frame_id))
     frame = result.scalars().first()
     if not frame:
         raise APIError(404, "not_found", _FRAME_NOT_FOUND)
+    return frame
 
+
+def _frame_source_path(frame: GoesFrame) -> Path:
+    """Resolve and validate a frame's full-size image path; 404 if missing."""
     raw_path = frame.file_path
     if not Path(raw_path).is_absolute():
         raw_path = str(Path(settings.storage_path) / raw_path)
@@ -517,6 +655,22 @@ async def get_frame_image(frame_id: str, db: DbSession) -> FileResponse:
 
     if not file_path.exists():
         raise APIError(404, "not_found", "Frame image file not found on disk")
+    return file_path
+
+
+@router.get("/frames/{frame_id}/image")
+async def get_frame_image(frame_id: str, db: DbSession) -> FileResponse:
+    """Serve the raw image file for a frame.
+
+    JTN-475 ISSUE-065: previously streamed via chunked-transfer with only
+    ``Cache-Control``. Now uses Starlette ``FileResponse`` which emits
+    ``Content-Length``, ``Last-Modified``, ``ETag``, and ``Accept-Ranges``
+    so browsers can short-circuit re-downloads with a 304 and servers can
+    serve partial content for video previews.
+    """
+    logger.debug("Frame image requested: frame_id=%s", sanitize_log(frame_id))
+    frame = await _get_frame_or_404(db, frame_id)
+    file_path = _frame_source_path(frame)
 
     import mimetypes
 
@@ -529,6 +683,27 @@ async def get_frame_image(frame_id: str, db: DbSession) -> FileResponse:
     )
 
 
+@router.get("/frames/{frame_id}/derivative", response_model=None)
+async def get_frame_derivative(
+    frame_id: str,
+    request: Request,
+    db: DbSession,
+    width: WidthParam = None,
+    height: HeightParam = None,
+    crop: CropParam = None,
+    format: FormatParam = "webp",  # noqa: A002
+) -> Response:
+    """Serve a resized / cropped / re-encoded copy of the frame image.
+
+    Rendered once per distinct request and then served from the
+    derivative disk cache (see ``services.derivatives``).
+    """
+    frame = await _get_frame_or_404(db, frame_id)
+    return await derivative_response(
+        request, _frame_source_path(frame), width=width, height=height, crop=crop, fmt=format
+    )
+
+
 @router.get("/frames/{frame_id}/thumbnail")
 async def get_frame_thumbnail(frame_id: str, db: DbSession) -> StreamingResponse:
     """Serve the thumbnail image for a frame."""
@@ -564,3 +739,92 @@ async def get_frame_thumbnail(frame_id: str, db: DbSession) -> StreamingResponse
         media_type=media_type,
         headers={"Cache-Control": "public, max-age=86400"},
     )
+
+
+# ── Tile Pyramid ──────────────────────────────────────────────────────
+
+
+def _tile_metadata(frame: GoesFrame, source: Path) -> tuple[str, int, int]:
+    """Return ``(version, width, height)`` for the frame's source image."""
+    from ..services.tiles import tile_version
+
+    width, height = frame.width, frame.height
+    if not width or not height:
+        from ..services.thumbnail import get_image_dimensions
+
+        width, height = get_image_dimensions(str(source))
+        if not width or not height:
+            raise APIError(422, "unreadable_image", "Frame image dimensions could not be read")
+    return tile_version(source), width, height
+
+
+async def _enqueue_tile_build(frame_id: str, version: str) -> None:
+    from ..services.tiles import claim_tile_build
+
+    if await claim_tile_build(frame_id, version):
+        from ..tasks.tile_tasks import generate_frame_tiles
+
+        generate_frame_tiles.delay(frame_id)
+
+
+@router.get("/frames/{frame_id}/tiles")
+async def get_frame_tile_info(frame_id: str, db: DbSession) -> dict[str, Any]:
+    """Describe a frame's tile pyramid, queueing its build if it is not ready."""
+    from ..services.tiles import TILE_EXTENSION, TILE_SIZE, max_zoom, pyramid_dir
+
+    frame = await _get_frame_or_404(db, frame_id)
+    version, width, height = _tile_metadata(frame, _frame_source_path(frame))
+    ready = pyramid_dir(frame_id, version).is_dir()
+    if not ready:
+        await _enqueue_tile_build(frame_id, version)
+    return {
+        "frame_id": frame_id,
+        "version": version,
+        "ready": ready,
+        "tile_size": TILE_SIZE,
+        "format": TILE_EXTENSION,
+        "width": width,
+        "height": height,
+        "max_zoom": max_zoom(width, height),
+        "url_template": f"/api/satellite/frames/{frame_id}/tiles/{{z}}/{{x}}/{{y}}?v={version}",
+    }
+
+
+@router.get("/frames/{frame_id}/tiles/{z}/{x}/{y}", response_model=None)
+async def get_frame_tile(
+    frame_id: str, z: int, x: int, y: int, request: Request, db: DbSession, v: str | None = None
+) -> Response:
+    """Serve one 256-px tile of a frame's pyramid.
+
+    The ETag is derived from the source file version and tile address, so
+    it is strong. Only a URL carrying the current version as ``v`` (as in
+    the info endpoint's ``url_template``) is cacheable for a year; any
+    other URL must revalidate, since the frame's source may be replaced.
+    While the pyramid is being built the endpoint answers ``202`` with
+    ``Retry-After`` and the build is queued once (process queue).
+    """
+    from ..services.tiles import TILE_MEDIA_TYPE, max_zoom, tile_grid, tile_path
+
+    frame = await _get_frame_or_404(db, frame_id)
+    version, width, height = _tile_metadata(frame, _frame_source_path(frame))
+    if not 0 <= z <= max_zoom(width, height):
+        raise APIError(404, "not_found", "Zoom level out of range")
+    cols, rows = tile_grid(width, height, z)
+    if not (0 <= x < cols and 0 <= y < rows):
+        raise APIError(404, "not_found", "Tile out of range")
+
+    etag = f'"{version}-{z}-{x}-{y}"'
+    cache_control = _IMMUTABLE_CACHE_CONTROL if v == version else _REVALIDATE_CACHE_CONTROL
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    path = tile_path(frame_id, version, z, x, y)
+    if not path.exists():
+        await _enqueue_tile_build(frame_id, version)
+        return JSONResponse(
+            status_code=202,
+            content={"status": "pending", "detail": "Tile pyramid is being generated"},
+            headers={"Retry-After": "2", "Cache-Control": "no-store"},
+        )
+    return FileResponse(str(path), media_type=TILE_MEDIA_TYPE, headers=headers)
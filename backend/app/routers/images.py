@@ -23,6 +23,7 @@ from ..models.pagination import PaginatedResponse
 from ..rate_limit import limiter
 from ..services.storage import storage_service
 from ..utils import sanitize_log
+from ._pagination import apply_keyset, page_with_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -181,21 +182,32 @@ async def list_images(
     db: DbSession,
     page: Annotated[int, Query(ge=1)] = 1,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> PaginatedResponse[ImageResponse]:
-    """List uploaded images with pagination"""
+    """List uploaded images with pagination.
+
+    ``cursor`` (the previous page's ``next_cursor``) switches to keyset
+    paging; ``include_total=false`` skips the ``COUNT`` query.
+    """
     logger.debug("Listing images: page=%d, limit=%d", page, limit)
-    count_result = await db.execute(select(func.count()).select_from(Image))
-    total = count_result.scalar_one()
+    total = None
+    if include_total:
+        count_result = await db.execute(select(func.count()).select_from(Image))
+        total = count_result.scalar_one()
 
-    offset = (page - 1) * limit
-    result = await db.execute(select(Image).order_by(Image.uploaded_at.desc()).offset(offset).limit(limit))
-    images = result.scalars().all()
+    query = apply_keyset(select(Image), Image.uploaded_at, Image.id, "desc", cursor)
+    if not cursor:
+        query = query.offset((page - 1) * limit)
+    result = await db.execute(query.limit(limit + 1))
+    images, next_cursor = page_with_cursor(result.scalars().all(), limit, "uploaded_at")
 
     return PaginatedResponse[ImageResponse](
         items=[ImageResponse.model_validate(img) for img in images],
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..celery_app import celery_app
 from ..config import settings
 from ..db.database import DbSession
+from ..db.frame_stats import FrameRow, record_frames_removed
 from ..db.models import (
     CollectionFrame,
     GoesFrame,
@@ -34,7 +35,11 @@ from ..idempotency import (
 from ..models.job import JobCreate, JobResponse, JobUpdate
 from ..models.pagination import PaginatedResponse
 from ..rate_limit import limiter
+from ..services.cache import TAG_FRAMES, TAG_JOBS, invalidate_tags
+from ..services.cmi_store import cmi_path
+from ..services.tiles import remove_frame_tiles
 from ..utils import safe_remove, utcnow
+from ._pagination import apply_keyset, page_with_cursor
 
 # Exceptions that ``celery_app.control.revoke`` can raise when the broker is
 # unreachable, the connection drops mid-call, or Celery itself errors. A
@@ -146,12 +151,14 @@ async def _delete_job_files(db: AsyncSession, job: Job) -> int:
         if frame.thumbnail_path:
             paths_to_remove.append(frame.thumbnail_path)
         if frame.file_path:
-            paths_to_remove.append(frame.file_path)
+            paths_to_remove.extend((frame.file_path, str(cmi_path(frame.file_path))))
 
-    # Batch file removal off the event loop
-    if paths_to_remove:
+    # Batch file and tile removal off the event loop
+    if frames:
 
         def _remove_all() -> int:
+            for frame_id in frame_ids:
+                remove_frame_tiles(frame_id)
             return sum(safe_remove(p) for p in paths_to_remove)
 
         bytes_freed += await asyncio.to_thread(_remove_all)
@@ -164,6 +171,9 @@ async def _delete_job_files(db: AsyncSession, job: Job) -> int:
             chunk = frame_ids[i : i + chunk_size]
             await db.execute(CollectionFrame.__table__.delete().where(CollectionFrame.frame_id.in_(chunk)))
             await db.execute(GoesFrame.__table__.delete().where(GoesFrame.id.in_(chunk)))
+        # Core deletes bypass the frame_stats listener
+        removed = [FrameRow(f.satellite, f.sector, f.band, f.capture_time, f.file_size) for f in frames]
+        await db.run_sync(lambda session: record_frames_removed(session.connection(), removed))
 
     # Note: Image records don't have source_job_id so we can't easily
     # link them back to jobs. The frame files are already deleted above.
@@ -239,20 +249,31 @@ async def list_jobs(
     db: DbSession,
     page: Annotated[int, Query(ge=1)] = 1,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> PaginatedResponse[JobResponse]:
-    """List jobs with pagination"""
-    count_result = await db.execute(select(func.count()).select_from(Job))
-    total = count_result.scalar_one()
+    """List jobs with pagination.
 
-    offset = (page - 1) * limit
-    result = await db.execute(select(Job).order_by(Job.created_at.desc()).offset(offset).limit(limit))
-    jobs = result.scalars().all()
+    ``cursor`` (the previous page's ``next_cursor``) switches to keyset
+    paging; ``include_total=false`` skips the ``COUNT`` query.
+    """
+    total = None
+    if include_total:
+        count_result = await db.execute(select(func.count()).select_from(Job))
+        total = count_result.scalar_one()
+
+    query = apply_keyset(select(Job), Job.created_at, Job.id, "desc", cursor)
+    if not cursor:
+        query = query.offset((page - 1) * limit)
+    result = await db.execute(query.limit(limit + 1))
+    jobs, next_cursor = page_with_cursor(result.scalars().all(), limit, "created_at")
 
     return PaginatedResponse[JobResponse](
         items=[JobResponse.model_validate(j) for j in jobs],
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -381,6 +402,7 @@ async def bulk_delete_jobs(
         deleted_ids.append(job.id)
 
     await db.commit()
+    await invalidate_tags(TAG_FRAMES, TAG_JOBS)
     return {
         "deleted": deleted_ids,
         "count": len(deleted_ids),
@@ -420,6 +442,7 @@ async def delete_job(
 
     await db.delete(job)
     await db.commit()
+    await invalidate_tags(TAG_FRAMES, TAG_JOBS)
 
     return {"deleted": True, "bytes_freed": bytes_freed}
 
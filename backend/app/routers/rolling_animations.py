@@ -0,0 +1,128 @@
+"""Rolling animation endpoints — "last N hours" loops served as segmented HLS."""
+
+import logging
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Body, Query
+from fastapi.responses import FileResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.database import DbSession
+from ..db.models import CropPreset, RollingAnimation
+from ..errors import APIError, validate_uuid
+from ..models.animation import RollingAnimationCreate, RollingAnimationResponse
+from ..models.pagination import PaginatedResponse
+from ..services.rolling import PLAYLIST_NAME, SEGMENT_FILE_RE, remove_rolling_dir, rolling_dir
+from ..utils import sanitize_log
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/satellite/rolling-animations", tags=["animation-studio"])
+
+_ROLLING_NOT_FOUND = "Rolling animation not found"
+_PLAYLIST_MEDIA_TYPE = "application/vnd.apple.mpegurl"
+
+
+def _build_rolling_response(anim: RollingAnimation) -> RollingAnimationResponse:
+    response = RollingAnimationResponse.model_validate(anim)
+    if anim.segment_count:
+        response.playlist_url = f"{router.prefix}/{anim.id}/{PLAYLIST_NAME}"
+    return response
+
+
+async def _get_rolling_or_404(db: AsyncSession, rolling_id: str) -> RollingAnimation:
+    validate_uuid(rolling_id, "rolling_id")
+    result = await db.execute(select(RollingAnimation).where(RollingAnimation.id == rolling_id))
+    anim = result.scalars().first()
+    if not anim:
+        raise APIError(404, "not_found", _ROLLING_NOT_FOUND)
+    return anim
+
+
+@router.post("")
+async def create_rolling_animation(
+    payload: Annotated[RollingAnimationCreate, Body()],
+    db: DbSession,
+) -> RollingAnimationResponse:
+    logger.info(
+        "Creating rolling animation: %s/%s/%s",
+        sanitize_log(payload.satellite),
+        sanitize_log(payload.sector),
+        sanitize_log(payload.band),
+    )
+    if payload.crop_preset_id:
+        crop = await db.execute(select(CropPreset.id).where(CropPreset.id == payload.crop_preset_id))
+        if crop.first() is None:
+            raise APIError(404, "not_found", "Crop preset not found")
+
+    anim = RollingAnimation(
+        **payload.model_dump(exclude={"overlay"}),
+        overlay=payload.overlay.model_dump() if payload.overlay else None,
+    )
+    db.add(anim)
+    await db.commit()
+    await db.refresh(anim)
+
+    from ..tasks.animation_tasks import update_rolling_animation
+
+    # Initial build over the frames already in the window.
+    update_rolling_animation.delay(anim.id)
+    return _build_rolling_response(anim)
+
+
+@router.get("")
+async def list_rolling_animations(
+    db: DbSession,
+    page: Annotated[int, Query(ge=1)] = 1,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> PaginatedResponse[RollingAnimationResponse]:
+    logger.debug("Listing rolling animations")
+    count = (await db.execute(select(func.count(RollingAnimation.id)))).scalar() or 0
+    offset = (page - 1) * limit
+    result = await db.execute(
+        select(RollingAnimation).order_by(RollingAnimation.created_at.desc()).offset(offset).limit(limit)
+    )
+    items = [_build_rolling_response(anim) for anim in result.scalars().all()]
+    return PaginatedResponse(items=items, total=count, page=page, limit=limit)
+
+
+@router.get("/{rolling_id}")
+async def get_rolling_animation(rolling_id: str, db: DbSession) -> RollingAnimationResponse:
+    logger.debug("Rolling animation requested: id=%s", sanitize_log(rolling_id))
+    return _build_rolling_response(await _get_rolling_or_404(db, rolling_id))
+
+
+@router.delete("/{rolling_id}")
+async def delete_rolling_animation(rolling_id: str, db: DbSession) -> dict[str, Any]:
+    logger.info("Deleting rolling animation: id=%s", sanitize_log(rolling_id))
+    anim = await _get_rolling_or_404(db, rolling_id)
+    await db.delete(anim)
+    await db.commit()
+    remove_rolling_dir(rolling_id)
+    return {"deleted": rolling_id}
+
+
+@router.get(f"/{{rolling_id}}/{PLAYLIST_NAME}")
+async def get_rolling_playlist(rolling_id: str, db: DbSession) -> FileResponse:
+    """Serve the current playlist; it changes on every refresh, so it is never cached."""
+    await _get_rolling_or_404(db, rolling_id)
+    path = rolling_dir(rolling_id) / PLAYLIST_NAME
+    if not path.exists():
+        raise APIError(404, "not_found", "Rolling animation has no segments yet")
+    return FileResponse(str(path), media_type=_PLAYLIST_MEDIA_TYPE, headers={"Cache-Control": "no-cache"})
+
+
+@router.get("/{rolling_id}/{filename}")
+async def get_rolling_segment(rolling_id: str, filename: str) -> FileResponse:
+    """Serve an init or media segment. Segment names are never reused, so they cache forever."""
+    validate_uuid(rolling_id, "rolling_id")
+    if not SEGMENT_FILE_RE.match(filename):
+        raise APIError(404, "not_found", "Segment not found")
+    path = rolling_dir(rolling_id) / filename
+    if not path.exists():
+        raise APIError(404, "not_found", "Segment not found")
+    media_type = "video/mp4" if filename.endswith(".mp4") else "video/iso.segment"
+    return FileResponse(
+        str(path), media_type=media_type, headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
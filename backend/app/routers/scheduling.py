@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime, timedelta
@@ -13,12 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..db.database import DbSession
+from ..db.frame_stats import sum_as_int
 from ..db.models import (
     CleanupRule,
-    CollectionFrame,
     FetchPreset,
     FetchSchedule,
-    GoesFrame,
+    FrameStat,
     Job,
 )
 from ..errors import APIError
@@ -35,7 +36,9 @@ from ..models.scheduling import (
     FetchScheduleResponse,
     FetchScheduleUpdate,
 )
-from ..utils import safe_remove, sanitize_log, utcnow
+from ..services.cache import TAG_FRAMES, invalidate_tags
+from ..services.cleanup import CleanupCandidate, CleanupResult, candidates_query, run_cleanup_rules
+from ..utils import sanitize_log, utcnow
 from .scheduling_presets import DEFAULT_FETCH_PRESETS
 
 logger = logging.getLogger(__name__)
@@ -443,13 +446,13 @@ async def cleanup_storage_stats(db: DbSession) -> dict[str, Any]:
     rows = (
         await db.execute(
             select(
-                GoesFrame.satellite,
-                GoesFrame.sector,
-                func.count(GoesFrame.id).label("count"),
-                func.coalesce(func.sum(GoesFrame.file_size), 0).label("size"),
-                func.min(GoesFrame.capture_time).label("oldest"),
-                func.max(GoesFrame.capture_time).label("newest"),
-            ).group_by(GoesFrame.satellite, GoesFrame.sector)
+                FrameStat.satellite,
+                FrameStat.sector,
+                sum_as_int(FrameStat.frame_count).label("count"),
+                sum_as_int(FrameStat.total_size).label("size"),
+                func.min(FrameStat.oldest_capture).label("oldest"),
+                func.max(FrameStat.newest_capture).label("newest"),
+            ).group_by(FrameStat.satellite, FrameStat.sector)
         )
     ).all()
 
@@ -499,92 +502,42 @@ async def preview_cleanup(db: DbSession) -> CleanupPreviewResponse:
     )
 
 
-@router.post("/cleanup/run")
-async def run_cleanup_now(db: DbSession) -> CleanupRunResponse:
-    """Manually trigger cleanup."""
-    frames_to_delete = await _get_frames_to_cleanup(db)
-    freed = 0
-    for frame in frames_to_delete:
-        for path in [frame.file_path, frame.thumbnail_path]:
-            if path:
-                safe_remove(path)
-        freed += frame.file_size or 0
-        await db.delete(frame)
-    await db.commit()
-    return CleanupRunResponse(deleted_frames=len(frames_to_delete), freed_bytes=freed)
-
-
-async def _get_protected_ids(db: AsyncSession, protect_collections: bool) -> set[str]:
-    """Return IDs of frames in collections if protection is enabled."""
-    if not protect_collections:
-        return set()
-    prot = await db.execute(select(CollectionFrame.frame_id))
-    return {r[0] for r in prot.all()}
-
-
-async def _collect_age_deletions(db: AsyncSession, rule: CleanupRule, protected_ids: set[str]) -> set[str]:
-    """Find frame IDs older than max age that are not protected."""
-    cutoff = utcnow() - timedelta(days=rule.value)
-    # Bug #10: Select only IDs instead of full objects to avoid OOM
-    query = select(GoesFrame.id).where(GoesFrame.created_at < cutoff)
-    if rule.satellite:
-        query = query.where(GoesFrame.satellite == rule.satellite)
-    if protected_ids:
-        query = query.where(GoesFrame.id.notin_(protected_ids))
-    res = await db.execute(query)
-    return {r[0] for r in res.all()}
-
-
-async def _collect_storage_deletions(db: AsyncSession, rule: CleanupRule, protected_ids: set[str]) -> set[str]:
-    """Find oldest frame IDs to delete to bring storage under the limit."""
-    size_query = select(func.coalesce(func.sum(GoesFrame.file_size), 0))
-    if rule.satellite:
-        size_query = size_query.where(GoesFrame.satellite == rule.satellite)
-    total_result = await db.execute(size_query)
-    total_bytes = total_result.scalar() or 0
-    max_bytes = rule.value * 1024 * 1024 * 1024
-
-    if total_bytes <= max_bytes:
-        return set()
-
-    # Bug #10: Select only ID and file_size columns instead of full objects.
-    # Iterate without .all() to avoid creating a second copy of all rows.
-    query = select(GoesFrame.id, GoesFrame.file_size).order_by(GoesFrame.created_at.asc())
-    if rule.satellite:
-        query = query.where(GoesFrame.satellite == rule.satellite)
-    if protected_ids:
-        query = query.where(GoesFrame.id.notin_(protected_ids))
-    result = await db.execute(query)
-    excess = total_bytes - max_bytes
-    freed = 0
-    ids: set[str] = set()
-    for frame_id, file_size in result:
-        if freed >= excess:
-            break
-        ids.add(frame_id)
-        freed += file_size or 0
-    return ids
-
-
-async def _get_frames_to_cleanup(db: AsyncSession) -> list[GoesFrame]:
-    """Compute which frames should be cleaned up based on active rules."""
-    result = await db.execute(select(CleanupRule).where(CleanupRule.is_active == True))  # noqa: E712
-    rules = result.scalars().all()
-    if not rules:
-        return []
+def _run_cleanup_sync() -> CleanupResult:
+    from ..tasks.helpers import _get_sync_db
 
-    delete_ids: set[str] = set()
+    session = _get_sync_db()
+    try:
+        rules = session.query(CleanupRule).filter(CleanupRule.is_active == True).all()  # noqa: E712
+        return run_cleanup_rules(session, rules)
+    finally:
+        session.close()
 
-    for rule in rules:
-        protected_ids = await _get_protected_ids(db, rule.protect_collections)
 
-        if rule.rule_type == "max_age_days":
-            delete_ids |= await _collect_age_deletions(db, rule, protected_ids)
-        elif rule.rule_type == "max_storage_gb":
-            delete_ids |= await _collect_storage_deletions(db, rule, protected_ids)
+@router.post("/cleanup/run")
+async def run_cleanup_now() -> CleanupRunResponse:
+    """Manually trigger cleanup (same engine as the scheduled ``run_cleanup`` task).
 
-    if not delete_ids:
-        return []
+    The engine runs on a sync session in a worker thread, so its batched
+    deletes and the wait on pooled unlinks stay off the event loop.
+    """
+    result = await asyncio.to_thread(_run_cleanup_sync)
+    if result.deleted:
+        await invalidate_tags(TAG_FRAMES)
+    return CleanupRunResponse(deleted_frames=result.deleted, freed_bytes=result.freed_bytes)
 
-    result = await db.execute(select(GoesFrame).where(GoesFrame.id.in_(delete_ids)))
+
+async def _active_cleanup_rules(db: AsyncSession) -> list[CleanupRule]:
+    result = await db.execute(select(CleanupRule).where(CleanupRule.is_active == True))  # noqa: E712
     return list(result.scalars().all())
+
+
+async def _get_frames_to_cleanup(db: AsyncSession) -> list[CleanupCandidate]:
+    """Compute which frames the active rules would delete, each rule evaluated independently."""
+    candidates: dict[str, CleanupCandidate] = {}
+    for rule in await _active_cleanup_rules(db):
+        query = candidates_query(rule)
+        if query is None:
+            continue
+        for row in (await db.execute(query)).all():
+            candidates.setdefault(row[0], CleanupCandidate(*row))
+    return list(candidates.values())
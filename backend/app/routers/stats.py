@@ -2,14 +2,17 @@
 
 import logging
 import shutil
+from datetime import UTC, datetime, time, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Request
-from sqlalchemy import case, func, select
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..db.database import DbSession
-from ..db.models import GoesFrame, Image, Job
+from ..db.frame_stats import sum_as_int
+from ..db.models import FrameStat, GoesFrame, Image, Job
 from ..rate_limit import limiter
 
 logger = logging.getLogger(__name__)
@@ -47,72 +50,52 @@ async def get_stats(request: Request, db: DbSession) -> dict[str, Any]:
     }
 
 
+async def _size_since(db: AsyncSession, cutoff: datetime) -> int:
+    """Bytes of frames captured at or after *cutoff*.
+
+    Whole days after the cutoff come from ``frame_stats``; only the partial
+    day containing the cutoff is summed from ``goes_frames``, which is an
+    indexed ``capture_time`` range scan of at most one day.
+    """
+    next_midnight = datetime.combine(cutoff.date() + timedelta(days=1), time.min)
+    full_days = (
+        await db.execute(
+            select(func.coalesce(sum_as_int(FrameStat.total_size), 0)).where(FrameStat.day > cutoff.date())
+        )
+    ).scalar_one()
+    partial_day = (
+        await db.execute(
+            select(func.coalesce(func.sum(GoesFrame.file_size), 0)).where(
+                GoesFrame.capture_time >= cutoff, GoesFrame.capture_time < next_midnight
+            )
+        )
+    ).scalar_one()
+    return int(full_days) + int(partial_day)
+
+
 @router.get("/storage/breakdown")
 @limiter.limit("30/minute")
 async def storage_breakdown(request: Request, db: DbSession) -> dict[str, Any]:
     """Storage breakdown grouped by satellite, band, and age bucket."""
     logger.debug("Storage breakdown requested")
-    from datetime import UTC, datetime, timedelta
-
     now = datetime.now(UTC).replace(tzinfo=None)
 
-    # By satellite
+    # By satellite / band — read from the maintained per-day aggregates
     sat_rows = (
-        await db.execute(
-            select(GoesFrame.satellite, func.coalesce(func.sum(GoesFrame.file_size), 0)).group_by(GoesFrame.satellite)
-        )
+        await db.execute(select(FrameStat.satellite, sum_as_int(FrameStat.total_size)).group_by(FrameStat.satellite))
     ).all()
     by_satellite = {row[0]: row[1] for row in sat_rows}
 
-    # By band
     band_rows = (
-        await db.execute(
-            select(GoesFrame.band, func.coalesce(func.sum(GoesFrame.file_size), 0)).group_by(GoesFrame.band)
-        )
+        await db.execute(select(FrameStat.band, sum_as_int(FrameStat.total_size)).group_by(FrameStat.band))
     ).all()
     by_band = {row[0]: row[1] for row in band_rows}
 
-    # By age bucket (exclusive ranges, single query for consistency)
-    cutoff_24h = now - timedelta(hours=24)
-    cutoff_7d = now - timedelta(days=7)
-    cutoff_30d = now - timedelta(days=30)
-
-    age_row = (
-        await db.execute(
-            select(
-                func.coalesce(func.sum(GoesFrame.file_size), 0),
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (GoesFrame.capture_time >= cutoff_24h, GoesFrame.file_size),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                ),
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (GoesFrame.capture_time >= cutoff_7d, GoesFrame.file_size),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                ),
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (GoesFrame.capture_time >= cutoff_30d, GoesFrame.file_size),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                ),
-            )
-        )
-    ).one()
-
-    total_storage, val_24h, val_7d, val_30d = age_row
+    # By age bucket (exclusive ranges)
+    total_storage = sum(by_satellite.values())
+    val_24h = await _size_since(db, now - timedelta(hours=24))
+    val_7d = await _size_since(db, now - timedelta(days=7))
+    val_30d = await _size_since(db, now - timedelta(days=30))
 
     by_age: dict[str, int] = {
         "last_24h": val_24h,
@@ -0,0 +1,252 @@
+"""Band-math recipes for RGB composites.
+
+Each of a recipe's red, green and blue channels is one line::
+
+    EXPR [| LO, HI] [| GAMMA]
+
+* ``EXPR`` is arithmetic over band names (``C13``, ``B03``…) and numbers:
+  ``+ - * /``, unary minus and parentheses.
+* ``LO, HI`` map linearly onto 0–255, clipping outside; ``LO > HI`` inverts
+  the channel. ``auto`` (the default) stretches the channel over its own
+  minimum and maximum, which is what plain band stacks always did.
+* ``GAMMA`` is applied to the 0–1 value as ``v ** (1 / GAMMA)``.
+
+Lines are parsed with :mod:`ast` (never ``eval``) and compiled into
+closures over NumPy ufuncs that write into ``out=`` buffers. Evaluation
+runs over row tiles. Every intermediate is a float32 buffer one tile in
+size, taken from a pool and reused for every tile, so memory stays at
+about :data:`TILE_BYTES` per live intermediate whatever the image size.
+Band inputs may be uint8 or float32; each tile is converted on load.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+#: Size of one float32 tile buffer.
+TILE_BYTES = 8 * 1024 * 1024
+
+_BINOPS: dict[type[ast.operator], np.ufunc] = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+}
+
+
+class RecipeError(ValueError):
+    """A recipe line that does not parse."""
+
+
+class _BufferPool:
+    """Tile-sized float32 buffers, reused across expression nodes and tiles."""
+
+    def __init__(self, rows: int, width: int) -> None:
+        self._shape = (rows, width)
+        self._free: list[np.ndarray] = []
+
+    def take(self, rows: int) -> np.ndarray:
+        buf = self._free.pop() if self._free else np.empty(self._shape, dtype=np.float32)
+        return buf[:rows]
+
+    def release(self, view: np.ndarray) -> None:
+        self._free.append(view.base if view.base is not None else view)
+
+
+@dataclass(frozen=True)
+class _Tile:
+    rows: slice
+    height: int
+    bands: Mapping[str, np.ndarray]
+    pool: _BufferPool
+
+
+#: A compiled expression: a tile function returning a pool buffer, or a folded constant.
+_Node = Callable[[_Tile], np.ndarray] | float
+
+
+def _compile_node(node: ast.AST, bands: set[str]) -> _Node:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return float(node.value)
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        bands.add(name)
+
+        def load(tile: _Tile) -> np.ndarray:
+            buf = tile.pool.take(tile.height)
+            np.copyto(buf, tile.bands[name][tile.rows], casting="unsafe")
+            return buf
+
+        return load
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd | ast.USub):
+        operand = _compile_node(node.operand, bands)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if isinstance(operand, float):
+            return -operand
+
+        def negate(tile: _Tile) -> np.ndarray:
+            value = operand(tile)
+            return np.negative(value, out=value)
+
+        return negate
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        ufunc = _BINOPS[type(node.op)]
+        left, right = _compile_node(node.left, bands), _compile_node(node.right, bands)
+        if isinstance(left, float) and isinstance(right, float):
+            with np.errstate(all="ignore"):
+                return float(ufunc(np.float32(left), np.float32(right)))
+
+        def binop(tile: _Tile) -> np.ndarray:
+            a = left if isinstance(left, float) else left(tile)
+            b = right if isinstance(right, float) else right(tile)
+            out = b if isinstance(a, float) else a
+            ufunc(a, b, out=out)
+            if not isinstance(b, float) and b is not out:
+                tile.pool.release(b)
+            return out
+
+        return binop
+
+    raise RecipeError(f"Unsupported syntax in band expression: {ast.unparse(node)!r}")
+
+
+@dataclass(frozen=True)
+class Channel:
+    """One compiled channel: expression, value range (None for ``auto``) and gamma."""
+
+    source: str
+    node: _Node
+    bands: frozenset[str]
+    value_range: tuple[float, float] | None
+    gamma: float
+
+
+def _parse_number(text: str, line: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        raise RecipeError(f"Expected a number, got {text.strip()!r} in {line!r}") from None
+
+
+def compile_channel(line: str) -> Channel:
+    """Compile one ``EXPR [| LO, HI] [| GAMMA]`` recipe line."""
+    expr, *options = (part.strip() for part in line.split("|"))
+    if len(options) > 2:
+        raise RecipeError(f"Too many '|' sections in {line!r}")
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise RecipeError(f"Invalid band expression {expr!r}: {e.msg}") from None
+    bands: set[str] = set()
+    node = _compile_node(tree.body, bands)
+
+    value_range = None
+    if options and options[0] and options[0] != "auto":
+        bounds = options[0].split(",")
+        if len(bounds) != 2:
+            raise RecipeError(f"Range must be 'LO, HI' or 'auto' in {line!r}")
+        value_range = (_parse_number(bounds[0], line), _parse_number(bounds[1], line))
+        if value_range[0] == value_range[1]:
+            raise RecipeError(f"Empty range in {line!r}")
+    gamma = _parse_number(options[1], line) if len(options) > 1 else 1.0
+    if gamma <= 0:
+        raise RecipeError(f"Gamma must be positive in {line!r}")
+    return Channel(line, node, frozenset(bands), value_range, gamma)
+
+
+@dataclass(frozen=True)
+class Recipe:
+    """Three compiled channels; see the module docstring for the line syntax."""
+
+    channels: tuple[Channel, Channel, Channel]
+
+    @property
+    def bands(self) -> frozenset[str]:
+        return frozenset().union(*(c.bands for c in self.channels))
+
+    def evaluate(self, bands: Mapping[str, np.ndarray | None], tile_bytes: int = TILE_BYTES) -> np.ndarray:
+        """Render an ``(H, W, 3)`` uint8 RGB image from same-shaped 2-D *bands*.
+
+        A channel that references a missing (absent or None) band is black.
+        """
+        present = {name: arr for name, arr in bands.items() if arr is not None}
+        shapes = {arr.shape for arr in present.values()}
+        if len(shapes) != 1:
+            raise ValueError(f"Bands must be present and share one 2-D shape, got {sorted(shapes)}")
+        height, width = shapes.pop()
+        tile_rows = max(1, tile_bytes // (width * 4))
+        pool = _BufferPool(min(tile_rows, height), width)
+        out = np.zeros((height, width, 3), dtype=np.uint8)
+
+        with np.errstate(all="ignore"):
+            for index, channel in enumerate(self.channels):
+                if not channel.bands <= present.keys():
+                    continue
+                value_range = channel.value_range or _extent(channel, present, pool, height, tile_rows)
+                if value_range is None:
+                    continue  # constant or all-NaN: black, like a flat band always was
+                for tile in _tiles(present, pool, height, tile_rows):
+                    values = _evaluate(channel, tile)
+                    _scale(values, value_range, channel.gamma)
+                    np.copyto(out[tile.rows, :, index], values, casting="unsafe")
+                    pool.release(values)
+        return out
+
+
+def _tiles(bands: Mapping[str, np.ndarray], pool: _BufferPool, height: int, tile_rows: int):
+    for start in range(0, height, tile_rows):
+        stop = min(height, start + tile_rows)
+        yield _Tile(slice(start, stop), stop - start, bands, pool)
+
+
+def _evaluate(channel: Channel, tile: _Tile) -> np.ndarray:
+    if isinstance(channel.node, float):
+        values = tile.pool.take(tile.height)
+        values.fill(channel.node)
+        return values
+    return channel.node(tile)
+
+
+def _extent(
+    channel: Channel, bands: Mapping[str, np.ndarray], pool: _BufferPool, height: int, tile_rows: int
+) -> tuple[float, float] | None:
+    """Finite minimum and maximum of the channel over the whole image (a first pass over the tiles)."""
+    lo, hi = np.inf, -np.inf
+    for tile in _tiles(bands, pool, height, tile_rows):
+        values = _evaluate(channel, tile)
+        np.nan_to_num(values, copy=False, nan=np.nan, posinf=np.nan, neginf=np.nan)
+        # fmin/fmax skip NaN, and return NaN only for an all-NaN tile.
+        tile_lo, tile_hi = np.fmin.reduce(values, axis=None), np.fmax.reduce(values, axis=None)
+        if not np.isnan(tile_lo):
+            lo, hi = min(lo, float(tile_lo)), max(hi, float(tile_hi))
+        pool.release(values)
+    return (lo, hi) if hi > lo else None
+
+
+def _scale(values: np.ndarray, value_range: tuple[float, float], gamma: float) -> None:
+    """Map *values* in place from *value_range* onto 0–255 (NaN becomes 0)."""
+    lo, hi = value_range
+    values -= lo
+    values /= hi - lo
+    np.nan_to_num(values, copy=False, nan=0.0)
+    np.clip(values, 0.0, 1.0, out=values)
+    if gamma != 1.0:
+        np.power(values, 1.0 / gamma, out=values)
+    values *= 255.0
+
+
+@functools.lru_cache(maxsize=64)
+def compile_recipe(lines: Sequence[str]) -> Recipe:
+    """Compile three channel lines (red, green, blue); cached per distinct recipe."""
+    if len(lines) != 3:
+        raise RecipeError(f"A recipe needs exactly 3 channels, got {len(lines)}")
+    return Recipe(tuple(compile_channel(line) for line in lines))  # type: ignore[arg-type]
@@ -6,7 +6,7 @@ import hashlib
 import inspect
 import json
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
 import redis.exceptions
@@ -16,6 +16,22 @@ from ..utils import sanitize_log
 
 logger = logging.getLogger(__name__)
 
+#: Cache tags — the data domains a cached value can depend on. Mutations of
+#: that domain call :func:`invalidate_tags` instead of scanning the keyspace.
+TAG_FRAMES = "frames"
+TAG_JOBS = "jobs"
+TAG_COLLECTIONS = "collections"
+
+#: Lifetime of a tag's tracked key set. Longer than any cache entry TTL so a
+#: live entry is never orphaned; stale members of the set are harmless
+#: because ``DEL`` on an expired key is a no-op.
+TAG_SET_TTL_SECONDS = 86_400
+
+
+def _tag_key(tag: str) -> str:
+    """Return the Redis set that tracks cache keys registered under *tag*."""
+    return f"cache:tag:{tag}"
+
 
 def make_cache_key(prefix: str, params: dict[str, Any] | None = None) -> str:
     """Build a cache key from prefix and optional params."""
@@ -26,12 +42,26 @@ def make_cache_key(prefix: str, params: dict[str, Any] | None = None) -> str:
     return f"cache:{prefix}:{h}"
 
 
+async def _register_tag(redis_client: Any, tag: str, key: str) -> None:
+    """Track *key* under *tag* so it can be invalidated without SCAN."""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.sadd(_tag_key(tag), key)
+        pipe.expire(_tag_key(tag), TAG_SET_TTL_SECONDS)
+        await pipe.execute()
+
+
 async def get_cached(
     key: str,
     ttl: int,
     fetch_fn: Callable[[], Any] | Callable[[], Awaitable[Any]],
+    tags: Iterable[str] = (),
 ) -> Any:
-    """Return cached value or call fetch_fn, cache result, and return it."""
+    """Return cached value or call fetch_fn, cache result, and return it.
+
+    ``tags`` names the data domains the value depends on (see ``TAG_*``).
+    The key is added to each tag's tracked set so :func:`invalidate_tags`
+    can drop it without a keyspace scan.
+    """
     try:
         redis_client = get_redis_client()
         cached = await redis_client.get(key)
@@ -47,6 +77,8 @@ async def get_cached(
     if redis_client is not None:
         try:
             await redis_client.set(key, json.dumps(result, default=str), ex=ttl)
+            for tag in tags:
+                await _register_tag(redis_client, tag, key)
         except (redis.exceptions.RedisError, OSError, RuntimeError, ValueError):
             logger.warning("Redis cache write failed for %s", sanitize_log(key), exc_info=True)
 
@@ -54,7 +86,11 @@ async def get_cached(
 
 
 async def invalidate(pattern: str) -> int:
-    """Delete keys matching a glob pattern. Returns count deleted."""
+    """Delete keys matching a glob pattern. Returns count deleted.
+
+    This walks the whole keyspace with ``SCAN``; request paths should tag
+    their entries and use :func:`invalidate_tags` instead.
+    """
     try:
         redis_client = get_redis_client()
         keys: list[str] = [key async for key in redis_client.scan_iter(match=pattern, count=100)]
@@ -64,3 +100,45 @@ async def invalidate(pattern: str) -> int:
     except (redis.exceptions.RedisError, OSError, RuntimeError, ValueError):
         logger.warning("Redis cache invalidate failed for %s", pattern, exc_info=True)
     return 0
+
+
+async def invalidate_tags(*tags: str) -> int:
+    """Delete every cache entry registered under any of *tags*.
+
+    Cost is proportional to the number of keys tracked for those tags,
+    not to the size of the keyspace. Returns the count of entries deleted.
+    """
+    try:
+        redis_client = get_redis_client()
+        tag_keys = [_tag_key(tag) for tag in tags]
+        keys: set[str] = set()
+        for tag_key in tag_keys:
+            keys.update(await redis_client.smembers(tag_key))
+        deleted: int = await redis_client.delete(*keys) if keys else 0
+        if tag_keys:
+            await redis_client.delete(*tag_keys)
+        return deleted
+    except (redis.exceptions.RedisError, OSError, RuntimeError, ValueError):
+        logger.warning("Redis cache tag invalidate failed for %s", ", ".join(tags), exc_info=True)
+    return 0
+
+
+def invalidate_tags_sync(redis_client: Any, *tags: str) -> int:
+    """Synchronous :func:`invalidate_tags` for Celery workers.
+
+    Takes the worker's sync Redis client explicitly, mirroring
+    ``log_job_sync``. Failures are logged and swallowed — the entries still
+    expire on their own TTL.
+    """
+    try:
+        tag_keys = [_tag_key(tag) for tag in tags]
+        keys: set[Any] = set()
+        for tag_key in tag_keys:
+            keys.update(redis_client.smembers(tag_key))
+        deleted: int = redis_client.delete(*keys) if keys else 0
+        if tag_keys:
+            redis_client.delete(*tag_keys)
+        return deleted
+    except (redis.exceptions.RedisError, OSError):
+        logger.debug("Redis cache tag invalidate failed for %s", ", ".join(tags), exc_info=True)
+    return 0
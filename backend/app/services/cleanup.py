@@ -0,0 +1,195 @@
+"""Set-based cleanup engine for cleanup rules.
+
+Shared by the hourly ``run_cleanup`` Celery task and the
+``/satellite/cleanup/*`` endpoints.
+
+* Candidate selection is one SQL statement per rule. Age rules are a
+  ``created_at`` cutoff. Storage rules walk the oldest frames with a running
+  ``SUM(file_size) OVER (ORDER BY created_at, id)`` and keep every frame
+  whose preceding total is still short of the excess over the budget.
+  Protected collections are excluded with ``NOT EXISTS``, not a Python set
+  of every collected frame id.
+* Deletes run in batches of :data:`CLEANUP_BATCH_SIZE` with a commit after
+  each, so no single transaction holds the table for the whole run and an
+  interrupted run keeps what it already did. Each batch is subtracted from
+  ``frame_stats`` in the same transaction.
+* Files (image, thumbnail, CMI sidecar and any tile pyramid) are unlinked on a thread
+  pool after their rows are committed. At most one batch of unlinks is in
+  flight while the next batch is deleted.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from sqlalchemy import Select, delete, exists, func, select
+
+from ..db.frame_stats import FrameRow, record_frames_removed
+from ..db.models import CollectionFrame, FrameTag, GoesFrame
+from ..utils import batched, safe_remove, utcnow
+from .cmi_store import remove_cmi
+from .tiles import remove_frame_tiles
+
+logger = logging.getLogger(__name__)
+
+#: Frames deleted (and committed) per batch.
+CLEANUP_BATCH_SIZE = 500
+
+#: Threads unlinking frame/thumbnail files.
+_UNLINK_WORKERS = 8
+
+_GIB = 1024 * 1024 * 1024
+
+
+class CleanupCandidate(NamedTuple):
+    """The columns of a frame that deleting it needs."""
+
+    id: str
+    file_path: str | None
+    thumbnail_path: str | None
+    satellite: str
+    sector: str
+    band: str
+    capture_time: datetime
+    file_size: int | None
+
+
+class CleanupResult(NamedTuple):
+    deleted: int
+    freed_bytes: int
+
+
+_CANDIDATE_COLUMNS = (
+    GoesFrame.id,
+    GoesFrame.file_path,
+    GoesFrame.thumbnail_path,
+    GoesFrame.satellite,
+    GoesFrame.sector,
+    GoesFrame.band,
+    GoesFrame.capture_time,
+    GoesFrame.file_size,
+)
+
+
+def _rule_filters(rule: Any) -> list[Any]:
+    filters: list[Any] = []
+    if rule.satellite:
+        filters.append(GoesFrame.satellite == rule.satellite)
+    if rule.protect_collections:
+        filters.append(~exists().where(CollectionFrame.frame_id == GoesFrame.id))
+    return filters
+
+
+def candidates_query(rule: Any, now: datetime | None = None) -> Select | None:
+    """Select the frames *rule* would delete, oldest first.
+
+    Returns ``None`` for an unknown ``rule_type``.
+    """
+    if rule.rule_type == "max_age_days":
+        cutoff = (now or utcnow()) - timedelta(days=rule.value)
+        return (
+            select(*_CANDIDATE_COLUMNS)
+            .where(GoesFrame.created_at < cutoff, *_rule_filters(rule))
+            .order_by(GoesFrame.created_at, GoesFrame.id)
+        )
+
+    if rule.rule_type == "max_storage_gb":
+        # Storage used counts protected frames too; only unprotected ones are freed.
+        used = select(func.coalesce(func.sum(GoesFrame.file_size), 0))
+        if rule.satellite:
+            used = used.where(GoesFrame.satellite == rule.satellite)
+        excess = used.scalar_subquery() - rule.value * _GIB
+
+        size = func.coalesce(GoesFrame.file_size, 0)
+        running = func.sum(size).over(order_by=(GoesFrame.created_at, GoesFrame.id), rows=(None, 0))
+        ranked = (
+            select(*_CANDIDATE_COLUMNS, GoesFrame.created_at, (running - size).label("freed_before"))
+            .where(*_rule_filters(rule))
+            .subquery("ranked")
+        )
+        return (
+            select(*(ranked.c[col.key] for col in _CANDIDATE_COLUMNS))
+            .where(ranked.c.freed_before < excess)
+            .order_by(ranked.c.created_at, ranked.c.id)
+        )
+
+    return None
+
+
+def delete_frame_files(frame: Any) -> None:
+    """Remove a frame's image, thumbnail and CMI sidecar from disk."""
+    for path in [frame.file_path, frame.thumbnail_path]:
+        if path:
+            safe_remove(path)
+    if frame.file_path:
+        remove_cmi(frame.file_path)
+
+
+def _delete_frame_artifacts(frame: CleanupCandidate) -> None:
+    delete_frame_files(frame)
+    remove_frame_tiles(frame.id)
+
+
+def delete_frames(
+    session: Any,
+    candidates: Sequence[CleanupCandidate],
+    *,
+    pool: ThreadPoolExecutor,
+    batch_size: int = CLEANUP_BATCH_SIZE,
+    on_batch: Callable[[int], None] | None = None,
+) -> CleanupResult:
+    """Delete *candidates* in committed batches and unlink their files on *pool*."""
+    deleted = freed = 0
+    in_flight: list[Future] = []
+    for batch in batched(candidates, batch_size):
+        ids = [c.id for c in batch]
+        # Bug #17: Delete FK references before deleting frames
+        session.execute(delete(CollectionFrame).where(CollectionFrame.frame_id.in_(ids)))
+        session.execute(delete(FrameTag).where(FrameTag.frame_id.in_(ids)))
+        session.execute(delete(GoesFrame).where(GoesFrame.id.in_(ids)))
+        record_frames_removed(
+            session.connection(),
+            [FrameRow(c.satellite, c.sector, c.band, c.capture_time, c.file_size) for c in batch],
+        )
+        session.commit()
+
+        # Backpressure: let the previous batch's unlinks finish before queueing more.
+        wait(in_flight)
+        in_flight = [pool.submit(_delete_frame_artifacts, c) for c in batch]
+        deleted += len(batch)
+        freed += sum(c.file_size or 0 for c in batch)
+        if on_batch:
+            on_batch(len(batch))
+    wait(in_flight)
+    return CleanupResult(deleted, freed)
+
+
+def run_cleanup_rules(
+    session: Any,
+    rules: Iterable[Any],
+    *,
+    now: datetime | None = None,
+    batch_size: int = CLEANUP_BATCH_SIZE,
+    on_batch: Callable[[int], None] | None = None,
+) -> CleanupResult:
+    """Apply each rule in turn on a sync *session*.
+
+    Rules run one after another, so a later rule only sees the frames that
+    earlier rules left behind.
+    """
+    deleted = freed = 0
+    with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+        for rule in rules:
+            query = candidates_query(rule, now)
+            if query is None:
+                logger.warning("Unknown cleanup rule_type: %s", rule.rule_type)
+                continue
+            candidates = [CleanupCandidate(*row) for row in session.execute(query).all()]
+            result = delete_frames(session, candidates, pool=pool, batch_size=batch_size, on_batch=on_batch)
+            deleted += result.deleted
+            freed += result.freed_bytes
+    return CleanupResult(deleted, freed)
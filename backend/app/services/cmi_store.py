@@ -0,0 +1,75 @@
+"""Float32 CMI sidecars for fetched GOES frames.
+
+The frame PNG holds CMI that has been percentile-stretched to 8 bits,
+which is enough for viewing but not for band arithmetic. When
+``settings.goes_cmi_store`` is on, the fetcher also saves the calibrated,
+downsampled CMI array (reflectance, or brightness temperature in K) as
+``<frame stem>.cmi.npy`` next to the PNG. The PNG name already encodes
+satellite, sector, band and scan time.
+
+* Readers open the sidecar with ``mmap_mode="r"``. A composite or
+  statistics job touches only the pages it reads, and concurrent readers
+  share the page cache. The arrays are read-only.
+* Writes are atomic (temp file + rename), so a reader never maps a
+  partial file.
+* A sidecar lives and dies with its frame. Anything that deletes a
+  frame's image calls :func:`remove_cmi`, so cleanup rules, bulk deletes
+  and job deletion evict it too. Removing a job's output directory
+  removes it along with the PNG.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from ..config import settings
+from ..utils import safe_remove
+
+logger = logging.getLogger(__name__)
+
+CMI_SUFFIX = ".cmi.npy"
+
+
+def enabled() -> bool:
+    return settings.goes_cmi_store
+
+
+def cmi_path(image_path: str | os.PathLike[str]) -> Path:
+    """Sidecar path for the frame image at *image_path*."""
+    path = Path(image_path)
+    return path.with_name(path.stem + CMI_SUFFIX)
+
+
+def save_cmi(image_path: str | os.PathLike[str], cmi: np.ndarray) -> Path:
+    """Atomically write *cmi* as float32 next to *image_path*."""
+    dest = cmi_path(image_path)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(cmi, dtype=np.float32))
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return dest
+
+
+def load_cmi(image_path: str | os.PathLike[str]) -> np.ndarray | None:
+    """Read-only memory map of the frame's CMI, or None if it has no (readable) sidecar."""
+    path = cmi_path(image_path)
+    try:
+        return np.load(path, mmap_mode="r")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Unreadable CMI sidecar %s", path, exc_info=True)
+        return None
+
+
+def remove_cmi(image_path: str | os.PathLike[str]) -> int:
+    """Delete the frame's sidecar, returning bytes freed (0 if it had none)."""
+    return safe_remove(cmi_path(image_path))
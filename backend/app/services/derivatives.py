@@ -0,0 +1,218 @@
+"""On-the-fly resized / cropped / re-encoded copies of frame and composite images.
+
+Consumers that need a smaller or differently encoded image (share pages,
+previews, mobile views) ask for a *derivative* instead of re-serving the
+4096² original or resizing it themselves. A derivative is rendered with
+OpenCV (``INTER_AREA``, the right filter for downscaling) and stored in a
+content-keyed disk cache:
+
+* The key hashes the source path, size and mtime together with the
+  requested geometry and format. A replaced source therefore never serves
+  a stale derivative, and the key doubles as a strong ETag.
+* The cache is capped at :data:`DERIVATIVE_CACHE_MAX_BYTES`. A hit bumps the
+  file's mtime; once the cap is exceeded the least recently used files are
+  evicted down to :data:`_EVICT_TO_FRACTION` of the cap.
+* Concurrent requests for the same key in one process share a single
+  render. Across processes, writes are atomic (temp file + rename), so a
+  duplicate render only costs CPU and never exposes a partial file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+#: ``format`` query value → (file extension, media type).
+DERIVATIVE_FORMATS: dict[str, tuple[str, str]] = {
+    "png": ("png", "image/png"),
+    "jpeg": ("jpg", "image/jpeg"),
+    "webp": ("webp", "image/webp"),
+}
+
+#: Largest width/height a derivative may be requested at.
+MAX_DERIVATIVE_SIZE = 4096
+
+#: Total size of cached derivatives before LRU eviction kicks in.
+DERIVATIVE_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+#: Eviction frees space down to this fraction of the cap so it doesn't run
+#: on every write once the cache is full.
+_EVICT_TO_FRACTION = 0.9
+
+_JPEG_QUALITY = 85
+_WEBP_QUALITY = 85
+
+
+class DerivativeSpec(NamedTuple):
+    """Requested geometry and encoding. ``crop`` is ``(x, y, w, h)`` in source pixels."""
+
+    width: int | None
+    height: int | None
+    crop: tuple[int, int, int, int] | None
+    fmt: str
+
+
+def parse_crop(value: str | None) -> tuple[int, int, int, int] | None:
+    """Parse ``"x,y,w,h"``; raises ``ValueError`` on anything else."""
+    if not value:
+        return None
+    parts = [int(p) for p in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError("crop must be x,y,w,h")
+    x, y, w, h = parts
+    if x < 0 or y < 0 or w <= 0 or h <= 0:
+        raise ValueError("crop offsets must be >= 0 and sizes > 0")
+    return x, y, w, h
+
+
+def target_size(src_w: int, src_h: int, width: int | None, height: int | None) -> tuple[int, int]:
+    """Fit ``src_w × src_h`` inside the requested box, keeping aspect, never upscaling."""
+    scale = 1.0
+    if width:
+        scale = min(scale, width / src_w)
+    if height:
+        scale = min(scale, height / src_h)
+    return max(1, round(src_w * scale)), max(1, round(src_h * scale))
+
+
+def derivative_key(source: Path, spec: DerivativeSpec) -> str:
+    st = source.stat()
+    raw = f"{source}:{st.st_size}:{st.st_mtime_ns}:{spec.width}:{spec.height}:{spec.crop}:{spec.fmt}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def render_derivative(source: Path, spec: DerivativeSpec, dest: Path) -> int:
+    """Render *spec* of *source* to *dest* atomically. Returns the bytes written."""
+    import cv2
+
+    img = cv2.imread(str(source), cv2.IMREAD_UNCHANGED)
+    if img is None:
+        raise ValueError(f"Cannot decode image: {source.name}")
+    if spec.crop:
+        x, y, w, h = spec.crop
+        img = img[y : y + h, x : x + w]
+        if img.size == 0:
+            raise ValueError("crop lies outside the image")
+
+    src_h, src_w = img.shape[:2]
+    size = target_size(src_w, src_h, spec.width, spec.height)
+    if size != (src_w, src_h):
+        img = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+
+    ext, _ = DERIVATIVE_FORMATS[spec.fmt]
+    params: list[int] = []
+    if spec.fmt == "jpeg":
+        if img.ndim == 3 and img.shape[2] == 4:
+            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        params = [cv2.IMWRITE_JPEG_QUALITY, _JPEG_QUALITY]
+    elif spec.fmt == "webp":
+        params = [cv2.IMWRITE_WEBP_QUALITY, _WEBP_QUALITY]
+    ok, buf = cv2.imencode(f".{ext}", img, params)
+    if not ok:
+        raise ValueError(f"Cannot encode {spec.fmt}")
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f"{dest.name}.tmp-{uuid.uuid4().hex[:8]}")
+    try:
+        tmp.write_bytes(buf.tobytes())
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return len(buf)
+
+
+def evict_lru(files: Iterable[Path], max_bytes: int) -> tuple[int, int]:
+    """Delete the oldest-mtime *files* until their total is under the cap.
+
+    Nothing is deleted while the total is within *max_bytes*; past it,
+    files go until :data:`_EVICT_TO_FRACTION` of the cap remains. Returns
+    ``(bytes kept, files evicted)``.
+    """
+    entries = []
+    total = 0
+    for path in files:
+        if ".tmp-" in path.name:
+            continue
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, path))
+        total += st.st_size
+    if total <= max_bytes:
+        return total, 0
+    target = max_bytes * _EVICT_TO_FRACTION
+    entries.sort()
+    evicted = 0
+    for _mtime, size, path in entries:
+        if total <= target:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        evicted += 1
+    return total, evicted
+
+
+class DerivativeCache:
+    """Size-capped, content-keyed LRU disk cache of rendered derivatives."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DERIVATIVE_CACHE_MAX_BYTES) -> None:
+        self._root = root
+        self.max_bytes = max_bytes
+        self._inflight: dict[str, asyncio.Task[None]] = {}
+        #: Approximate bytes on disk; ``None`` until the first eviction scan.
+        self._size: int | None = None
+
+    @property
+    def root(self) -> Path:
+        return self._root or Path(settings.storage_path) / "derivatives"
+
+    def path_for(self, key: str, fmt: str) -> Path:
+        ext, _ = DERIVATIVE_FORMATS[fmt]
+        return self.root / key[:2] / f"{key}.{ext}"
+
+    async def get(self, source: Path, spec: DerivativeSpec) -> tuple[Path, str]:
+        """Return ``(path, key)`` of the derivative, rendering it on a miss."""
+        key = await asyncio.to_thread(derivative_key, source, spec)
+        path = self.path_for(key, spec.fmt)
+        try:
+            os.utime(path)  # LRU bump; raises if not cached yet
+            return path, key
+        except FileNotFoundError:
+            pass
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(source, spec, path))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        await asyncio.shield(task)
+        return path, key
+
+    async def _render(self, source: Path, spec: DerivativeSpec, path: Path) -> None:
+        written = await asyncio.to_thread(render_derivative, source, spec, path)
+        if self._size is not None:
+            self._size += written
+        if self._size is None or self._size > self.max_bytes:
+            self._size = await asyncio.to_thread(self.evict)
+
+    def evict(self) -> int:
+        """Drop least recently used files until under the cap. Returns bytes kept."""
+        total, evicted = evict_lru(self.root.glob("*/*"), self.max_bytes)
+        if evicted:
+            logger.info("Derivative cache evicted %d files (%d bytes kept)", evicted, total)
+        return total
+
+
+derivative_cache = DerivativeCache()
@@ -1,36 +1,220 @@
-"""Gap detection service for satellite image coverage analysis."""
+"""Gap detection service for satellite image coverage analysis.
+
+Intervals between consecutive captures are computed in SQL with a ``LAG()``
+window partitioned by ``(satellite, sector, band)`` — supported by both
+SQLite (3.25+) and PostgreSQL — so only the gaps themselves, or a compact
+histogram of interval lengths, ever leave the database. The partition and
+ordering columns match ``ix_goes_frames_sat_sector_band_capture``.
+"""
 
 from __future__ import annotations
 
 import logging
-import statistics
-from collections import Counter
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import DateTime, Float, Numeric, Select, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 
-from ..db.models import GoesFrame
+from ..db.frame_stats import sum_as_int
+from ..db.models import FrameStat, GoesFrame
 
 logger = logging.getLogger(__name__)
 
+#: Intervals longer than this are outages, not cadence, and are left out of
+#: the capture-pattern statistics.
+PATTERN_MAX_INTERVAL_MINUTES = 120.0
+
+#: Interval lengths are bucketed to this many decimals of a minute for the
+#: histogram the median is computed from.
+_INTERVAL_PRECISION = 1
+
+
+class minutes_between(FunctionElement):  # noqa: N801 — SQL function naming
+    """``minutes_between(later, earlier)`` as a float, per dialect."""
+
+    type = Float()
+    name = "minutes_between"
+    inherit_cache = True
+
+
+@compiles(minutes_between)
+def _minutes_between_default(element: minutes_between, compiler: Any, **kw: Any) -> str:
+    later, earlier = (compiler.process(c, **kw) for c in element.clauses)
+    return f"(EXTRACT(EPOCH FROM ({later} - {earlier})) / 60.0)"
+
+
+@compiles(minutes_between, "sqlite")
+def _minutes_between_sqlite(element: minutes_between, compiler: Any, **kw: Any) -> str:
+    later, earlier = (compiler.process(c, **kw) for c in element.clauses)
+    return f"((julianday({later}) - julianday({earlier})) * 1440.0)"
+
+
+def _frame_filters(
+    satellite: str | None,
+    band: str | None,
+    sector: str | None,
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+) -> list[Any]:
+    filters: list[Any] = []
+    if satellite:
+        filters.append(GoesFrame.satellite == satellite)
+    if band:
+        filters.append(GoesFrame.band == band)
+    if sector:
+        filters.append(GoesFrame.sector == sector)
+    if start_time is not None:
+        filters.append(GoesFrame.capture_time >= start_time)
+    if end_time is not None:
+        filters.append(GoesFrame.capture_time <= end_time)
+    return filters
+
+
+def _intervals(filters: Sequence[Any]) -> Any:
+    """Subquery of ``(satellite, sector, band, start, end, minutes)`` per consecutive pair."""
+    product = (GoesFrame.satellite, GoesFrame.sector, GoesFrame.band)
+    previous = func.lag(GoesFrame.capture_time, type_=DateTime).over(
+        partition_by=product, order_by=GoesFrame.capture_time
+    )
+    return (
+        select(
+            *product,
+            previous.label("start"),
+            GoesFrame.capture_time.label("end"),
+            minutes_between(GoesFrame.capture_time, previous).label("minutes"),
+        )
+        .where(*filters)
+        .subquery("intervals")
+    )
+
+
+def gaps_query(
+    threshold_minutes: float,
+    satellite: str | None = None,
+    band: str | None = None,
+    sector: str | None = None,
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+) -> Select:
+    """Select the intervals longer than *threshold_minutes*, oldest first.
+
+    Rows are ``(satellite, sector, band, start, end, minutes)``; feed them
+    to :func:`gap_rows_to_dicts`. Shared by the API and the Celery
+    backfill task (which runs it on a sync session).
+    """
+    iv = _intervals(_frame_filters(satellite, band, sector, start_time, end_time))
+    return (
+        select(iv.c.satellite, iv.c.sector, iv.c.band, iv.c.start, iv.c.end, iv.c.minutes)
+        .where(iv.c.start.isnot(None), iv.c.minutes > threshold_minutes)
+        .order_by(iv.c.end, iv.c.satellite, iv.c.sector, iv.c.band)
+    )
+
+
+def gap_rows_to_dicts(rows: Sequence[Any], expected_interval: float) -> list[dict[str, Any]]:
+    """Turn :func:`gaps_query` rows into the gap dicts the API returns."""
+    gaps: list[dict[str, Any]] = []
+    for satellite, sector, band, start, end, minutes in rows:
+        # julianday() arithmetic is float; round away the sub-millisecond noise
+        delta_minutes = round(float(minutes), 6)
+        gaps.append(
+            {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "duration_minutes": round(delta_minutes, 1),
+                "expected_frames": max(int(delta_minutes / expected_interval) - 1, 1),
+                "satellite": satellite,
+                "sector": sector,
+                "band": band,
+            }
+        )
+    return gaps
+
+
+def _weighted_median(histogram: Sequence[tuple[float, int]]) -> float | None:
+    """Median of a ``[(value, count), ...]`` histogram sorted by value."""
+    total = sum(count for _, count in histogram)
+    if total == 0:
+        return None
+    lower_rank, upper_rank = (total - 1) // 2, total // 2
+    lower = upper = None
+    seen = 0
+    for value, count in histogram:
+        if lower is None and lower_rank < seen + count:
+            lower = value
+        if upper_rank < seen + count:
+            upper = value
+            break
+        seen += count
+    return (lower + upper) / 2
+
+
+async def interval_stats(
+    db: AsyncSession,
+    satellite: str | None = None,
+    band: str | None = None,
+    sector: str | None = None,
+) -> list[dict[str, Any]]:
+    """Capture-interval statistics per ``(satellite, sector, band)``.
+
+    The database returns one row per product and distinct (rounded)
+    interval length, which is all the median needs. Intervals of zero or
+    longer than :data:`PATTERN_MAX_INTERVAL_MINUTES` are ignored.
+    """
+    iv = _intervals(_frame_filters(satellite, band, sector))
+    # PostgreSQL only has round(numeric, int)
+    bucket = func.round(cast(iv.c.minutes, Numeric), _INTERVAL_PRECISION).label("bucket")
+    result = await db.execute(
+        select(iv.c.satellite, iv.c.sector, iv.c.band, bucket, func.count().label("n"))
+        .where(iv.c.minutes > 0, iv.c.minutes < PATTERN_MAX_INTERVAL_MINUTES)
+        .group_by(iv.c.satellite, iv.c.sector, iv.c.band, bucket)
+        .order_by(iv.c.satellite, iv.c.sector, iv.c.band, bucket)
+    )
+    histograms: dict[tuple[str, str, str], list[tuple[float, int]]] = {}
+    for sat, sec, bnd, value, count in result.all():
+        histograms.setdefault((sat, sec, bnd), []).append((float(value), count))
+
+    return [
+        {
+            "satellite": sat,
+            "sector": sec,
+            "band": bnd,
+            "interval_count": sum(count for _, count in hist),
+            "median_interval_minutes": _weighted_median(hist),
+            "min_interval_minutes": hist[0][0],
+            "max_interval_minutes": hist[-1][0],
+        }
+        for (sat, sec, bnd), hist in histograms.items()
+    ]
+
 
 async def detect_capture_pattern(db: AsyncSession) -> dict[str, Any]:
     """Analyze existing images to determine the dominant capture pattern.
 
+    The dominant product is the ``(satellite, sector, band)`` with the most
+    frames, read from the ``frame_stats`` aggregates; its median capture
+    interval comes from :func:`interval_stats`.
+
     Returns dict with 'satellite', 'band', 'sector', 'expected_interval_minutes',
     'total_images', and 'time_range'.
     """
     result = await db.execute(
-        select(GoesFrame.satellite, GoesFrame.band, GoesFrame.sector, GoesFrame.capture_time)
-        .where(GoesFrame.capture_time.isnot(None))
-        .order_by(GoesFrame.capture_time.asc())
+        select(
+            FrameStat.satellite,
+            FrameStat.sector,
+            FrameStat.band,
+            sum_as_int(FrameStat.frame_count),
+            func.min(FrameStat.oldest_capture),
+            func.max(FrameStat.newest_capture),
+        ).group_by(FrameStat.satellite, FrameStat.sector, FrameStat.band)
     )
-    rows = result.all()
-    logger.debug("Analyzing capture pattern: %d rows found", len(rows))
+    products = result.all()
+    logger.debug("Analyzing capture pattern: %d products found", len(products))
 
-    if not rows:
+    if not products:
         logger.info("No capture data found for pattern detection")
         return {
             "satellite": None,
@@ -41,38 +225,19 @@ async def detect_capture_pattern(db: AsyncSession) -> dict[str, Any]:
             "time_range": None,
         }
 
-    # Find dominant satellite and band
-    satellites = Counter(r[0] for r in rows if r[0])
-    bands = Counter(r[1] for r in rows if r[1])
-
-    dominant_satellite = satellites.most_common(1)[0][0] if satellites else None
-    dominant_band = bands.most_common(1)[0][0] if bands else None
-
-    sectors = Counter(r[2] for r in rows if r[2])
-    dominant_sector = sectors.most_common(1)[0][0] if sectors else None
-
-    # Calculate intervals between consecutive captures
-    timestamps = sorted(r[3] for r in rows if r[3] is not None)
-    intervals: list[float] = []
-    for i in range(1, len(timestamps)):
-        delta = (timestamps[i] - timestamps[i - 1]).total_seconds() / 60.0
-        if 0 < delta < 120:  # Ignore gaps > 2 hours for pattern detection
-            intervals.append(delta)
-
-    expected_interval = None
-    if intervals:
-        # Use median interval as expected
-        expected_interval = statistics.median(intervals)
+    satellite, sector, band, _, _, _ = max(products, key=lambda p: p[3])
+    stats = await interval_stats(db, satellite=satellite, band=band, sector=sector)
+    expected_interval = stats[0]["median_interval_minutes"] if stats else None
 
     return {
-        "satellite": dominant_satellite,
-        "band": dominant_band,
-        "sector": dominant_sector,
+        "satellite": satellite,
+        "band": band,
+        "sector": sector,
         "expected_interval_minutes": expected_interval,
-        "total_images": len(rows),
+        "total_images": int(sum(p[3] for p in products)),
         "time_range": {
-            "start": timestamps[0].isoformat() if timestamps else None,
-            "end": timestamps[-1].isoformat() if timestamps else None,
+            "start": min(p[4] for p in products).isoformat(),
+            "end": max(p[5] for p in products).isoformat(),
         },
     }
 
@@ -89,6 +254,9 @@ async def find_gaps(
 ) -> list[dict[str, Any]]:
     """Find gaps in satellite image coverage.
 
+    Gaps are detected within each ``(satellite, sector, band)``; pass all
+    three to analyse a single product.
+
     Args:
         db: Database session
         satellite: Filter by satellite name
@@ -99,45 +267,23 @@ async def find_gaps(
         start_time: Only consider captures at or after this time
         end_time: Only consider captures at or before this time
 
-    Returns list of dicts with 'start', 'end', 'duration_minutes', 'expected_frames'.
+    Returns list of dicts with 'start', 'end', 'duration_minutes',
+    'expected_frames', 'satellite', 'sector' and 'band'.
     """
-    query = (
-        select(GoesFrame.capture_time).where(GoesFrame.capture_time.isnot(None)).order_by(GoesFrame.capture_time.asc())
-    )
-    if satellite:
-        query = query.where(GoesFrame.satellite == satellite)
-    if band:
-        query = query.where(GoesFrame.band == band)
-    if sector:
-        query = query.where(GoesFrame.sector == sector)
-    if start_time is not None:
-        query = query.where(GoesFrame.capture_time >= start_time)
-    if end_time is not None:
-        query = query.where(GoesFrame.capture_time <= end_time)
-
-    result = await db.execute(query)
-    timestamps = [r[0] for r in result.all()]
-
-    if len(timestamps) < 2:
-        logger.info("Not enough timestamps for gap detection: count=%d", len(timestamps))
-        return []
-
     threshold = expected_interval * tolerance
-    gaps: list[dict[str, Any]] = []
-    logger.debug("Finding gaps: threshold=%.1f min, timestamps=%d", threshold, len(timestamps))
-
-    for i in range(1, len(timestamps)):
-        delta_minutes = (timestamps[i] - timestamps[i - 1]).total_seconds() / 60.0
-        if delta_minutes > threshold:
-            expected_frames = int(delta_minutes / expected_interval) - 1
-            gaps.append(
-                {
-                    "start": timestamps[i - 1].isoformat(),
-                    "end": timestamps[i].isoformat(),
-                    "duration_minutes": round(delta_minutes, 1),
-                    "expected_frames": max(expected_frames, 1),
-                }
-            )
+    logger.debug("Finding gaps: threshold=%.1f min", threshold)
+    result = await db.execute(gaps_query(threshold, satellite, band, sector, start_time, end_time))
+    gaps = gap_rows_to_dicts(result.all(), expected_interval)
+
+    if not gaps:
+        # Two rows are enough to tell "no gaps" from "nothing to compare".
+        probe = await db.execute(
+            select(GoesFrame.id).where(*_frame_filters(satellite, band, sector, start_time, end_time)).limit(2)
+        )
+        count = len(probe.all())
+        if count < 2:
+            logger.info("Not enough timestamps for gap detection: count=%d", count)
+            return []
 
     logger.info("Gap detection complete: %d gaps found", len(gaps))
     return gaps
@@ -181,28 +327,23 @@ async def get_coverage_stats(
         end_time=end_time,
     )
 
-    # Get time range
-    query = select(
-        func.min(GoesFrame.capture_time),
-        func.max(GoesFrame.capture_time),
-        func.count(GoesFrame.id),
-    ).where(GoesFrame.capture_time.isnot(None))
-    if satellite:
-        query = query.where(GoesFrame.satellite == satellite)
-    if band:
-        query = query.where(GoesFrame.band == band)
-    if sector:
-        query = query.where(GoesFrame.sector == sector)
-    if start_time is not None:
-        query = query.where(GoesFrame.capture_time >= start_time)
-    if end_time is not None:
-        query = query.where(GoesFrame.capture_time <= end_time)
-
-    result = await db.execute(query)
-    row = result.one()
-    min_time, max_time, total_frames = row
+    # Time span and frame count per product: gaps are per product, so
+    # coverage is too, summed over products rather than one merged span.
+    query = (
+        select(
+            GoesFrame.satellite,
+            GoesFrame.sector,
+            GoesFrame.band,
+            func.min(GoesFrame.capture_time),
+            func.max(GoesFrame.capture_time),
+            func.count(GoesFrame.id),
+        )
+        .where(*_frame_filters(satellite, band, sector, start_time, end_time))
+        .group_by(GoesFrame.satellite, GoesFrame.sector, GoesFrame.band)
+    )
+    products = (await db.execute(query)).all()
 
-    if not min_time or not max_time or total_frames == 0:
+    if not products:
         return {
             "coverage_percent": 0.0,
             "gap_count": 0,
@@ -212,12 +353,23 @@ async def get_coverage_stats(
             "gaps": [],
         }
 
-    total_minutes = (max_time - min_time).total_seconds() / 60.0
+    gap_minutes: dict[tuple[str, str, str], float] = {}
+    for g in gaps:
+        key = (g["satellite"], g["sector"], g["band"])
+        gap_minutes[key] = gap_minutes.get(key, 0.0) + g["duration_minutes"]
+
+    total_frames = expected_frames = 0
+    total_minutes = covered_minutes = 0.0
+    for sat, sec, bnd, first, last, count in products:
+        span = (last - first).total_seconds() / 60.0
+        total_frames += count
+        expected_frames += int(span / expected_interval) + 1 if expected_interval > 0 else count
+        total_minutes += span
+        # Subtract gap durations from the covered time to get actual coverage
+        covered_minutes += max(0.0, span - gap_minutes.get((sat, sec, bnd), 0.0))
+    min_time = min(row[3] for row in products)
+    max_time = max(row[4] for row in products)
 
-    # Subtract gap durations from the covered time to get actual coverage
-    gap_minutes = sum(g["duration_minutes"] for g in gaps)
-    covered_minutes = total_minutes - gap_minutes
-    expected_frames = int(total_minutes / expected_interval) + 1 if expected_interval > 0 else total_frames
     coverage = (covered_minutes / total_minutes * 100.0) if total_minutes > 0 else 100.0
     coverage = max(0.0, min(100.0, coverage))
 
@@ -375,20 +375,34 @@ def _normalize_cmi_to_image(cmi: np.ndarray) -> PILImage.Image:
     return PILImage.fromarray(cmi.astype(np.uint8))
 
 
-def _netcdf_to_png_from_file(nc_path: Path, output_path: Path, sector: str = "FullDisk") -> Path:
+def _netcdf_to_png_from_file(
+    nc_path: Path,
+    output_path: Path,
+    sector: str = "FullDisk",
+    info: dict[str, Any] | None = None,
+    store_cmi: bool = False,
+) -> Path:
     """Convert a NetCDF file on disk to PNG (memory-efficient).
 
     For large arrays (e.g. FullDisk 21696x21696), uses strided slicing to
     downsample during load, keeping peak memory well under 500MB.
+
+    If *info* is given it is updated with the PNG's ``width``, ``height``
+    and ``file_size`` so callers can skip re-reading the file. With
+    *store_cmi* the float32 CMI is also saved as the PNG's
+    :mod:`~app.services.cmi_store` sidecar.
     """
-    cmi = _read_cmi_data(nc_path, sector)
-    if cmi is None:
-        img = PILImage.new("L", (100, 100), 128)
-        img.save(str(output_path))
-        return output_path
+    from . import cmi_store
+    from .thumbnail import save_image
 
-    img = _normalize_cmi_to_image(cmi)
-    img.save(str(output_path))
+    cmi = _read_cmi_data(nc_path, sector)
+    if store_cmi and cmi is not None:
+        # Before normalizing, which stretches cmi in place.
+        cmi_store.save_cmi(output_path, cmi)
+    img = PILImage.new("L", (100, 100), 128) if cmi is None else _normalize_cmi_to_image(cmi)
+    written = save_image(img, output_path)
+    if info is not None:
+        info.update(written)
     return output_path
 
 
@@ -441,7 +455,14 @@ def _download_nc_and_convert(
     png_path: Path,
     sector: str,
 ) -> dict[str, Any]:
-    """Download a NetCDF from S3 and convert to PNG. Returns on success, raises on error."""
+    """Download a NetCDF from S3 and convert to PNG (plus its CMI sidecar when enabled).
+
+    Returns the PNG's ``width``/``height``/``file_size`` (empty if the
+    converter did not report them); raises on error.
+    """
+    from . import cmi_store
+
+    info: dict[str, Any] = {}
     tmp_nc_path = None
     try:
         with tempfile.NamedTemporaryFile(suffix=".nc", delete=False) as tmp_nc:
@@ -454,10 +475,11 @@ def _download_nc_and_convert(
             )
             for chunk in response["Body"].iter_chunks(chunk_size=1024 * 1024):
                 tmp_nc.write(chunk)
-        _netcdf_to_png_from_file(tmp_nc_path, png_path, sector=sector)
+        _netcdf_to_png_from_file(tmp_nc_path, png_path, sector=sector, info=info, store_cmi=cmi_store.enabled())
     finally:
         if tmp_nc_path:
             tmp_nc_path.unlink(missing_ok=True)
+    return info
 
 
 def _download_and_convert_frame(
@@ -485,13 +507,14 @@ def _download_and_convert_frame(
     last_exc = None
     for attempt in range(1, _FRAME_RETRY_ATTEMPTS + 1):
         try:
-            _download_nc_and_convert(s3, bucket, item["key"], png_path, sector)
+            info = _download_nc_and_convert(s3, bucket, item["key"], png_path, sector)
             return {
                 "path": str(png_path),
                 "scan_time": scan_time,
                 "satellite": satellite,
                 "band": band,
                 "sector": sector,
+                **info,
             }
         except _FRAME_TRANSIENT_ERRORS as exc:
             last_exc = exc
@@ -573,6 +596,7 @@ def fetch_frames(
 
     Returns a dict with:
         - frames: list of dicts with 'path', 'scan_time', 'satellite', 'band', 'sector'
+          (plus 'width', 'height', 'file_size' as written by the converter)
         - total_available: number of frames found on S3
         - capped: whether the frame limit was hit
         - attempted: number of frames attempted for download
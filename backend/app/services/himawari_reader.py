@@ -30,6 +30,8 @@ from pathlib import Path
 import numpy as np
 from PIL import Image as PILImage
 
+from .thumbnail import save_image
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -475,6 +477,7 @@ def hsd_to_png(
     *,
     percentile_low: float = 2.0,
     percentile_high: float = 98.0,
+    info: dict | None = None,
 ) -> Path:
     """Full pipeline: bz2-compressed HSD segments → single PNG image.
 
@@ -489,6 +492,8 @@ def hsd_to_png(
     percentile_low, percentile_high : float
         Percentile stretch for 8-bit normalisation (same approach as
         ``_normalize_cmi_to_image`` in ``goes_fetcher.py``).
+    info : dict, optional
+        Updated with the PNG's ``width``, ``height`` and ``file_size``.
 
     Returns
     -------
@@ -514,7 +519,9 @@ def hsd_to_png(
     full_disk = assemble_segments(parsed, expected_columns=expected_cols)
     img = _normalize_to_image(full_disk, percentile_low, percentile_high)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(str(output_path))
+    written = save_image(img, output_path)
+    if info is not None:
+        info.update(written)
     return output_path
 
 
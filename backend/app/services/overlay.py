@@ -0,0 +1,100 @@
+"""Text overlays burned into animation frames.
+
+Drawing text through PIL used to convert the whole frame BGR→RGB, reload
+the TTF font, draw, and convert back, so the overlay cost grew with frame
+size. Now:
+
+* The font is loaded once per process.
+* Each distinct string is rasterised once into a small premultiplied BGR
+  sprite plus an inverse-alpha mask. Labels are constant for a job and
+  timestamps are short, so the LRU stays small.
+* :func:`draw_text` alpha-blends the sprite into just its region of the
+  frame, in place.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FONT_SIZE = 20
+_STROKE_WIDTH = 2
+
+#: Distinct strings kept rasterised (one label per job plus recent timestamps).
+_SPRITE_CACHE_SIZE = 2048
+
+# FreeType rendering through one shared font object is not guaranteed to be
+# thread-safe, and animation frames render on a thread pool.
+_raster_lock = threading.Lock()
+
+
+class TextSprite(NamedTuple):
+    """A rasterised string: ``premultiplied`` BGR and ``inverse_alpha``, both float32."""
+
+    premultiplied: np.ndarray
+    inverse_alpha: np.ndarray
+    #: Offset of the inked box from the text origin (PIL ``getbbox`` left/top).
+    dx: int
+    dy: int
+
+
+@functools.cache
+def _font() -> Any:
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(FONT_PATH, FONT_SIZE)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=_SPRITE_CACHE_SIZE)
+def text_sprite(text: str) -> TextSprite:
+    """White text with a black stroke, rasterised once per distinct *text*."""
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    with _raster_lock:
+        font = _font()
+        left, top, right, bottom = font.getbbox(text, stroke_width=_STROKE_WIDTH)
+        canvas = Image.new("RGBA", (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        ImageDraw.Draw(canvas).text(
+            (-left, -top),
+            text,
+            fill=(255, 255, 255, 255),
+            font=font,
+            stroke_width=_STROKE_WIDTH,
+            stroke_fill=(0, 0, 0, 255),
+        )
+        rgba = np.asarray(canvas, dtype=np.float32)
+
+    alpha = rgba[:, :, 3:4] / 255.0
+    premultiplied = rgba[:, :, 2::-1] * alpha  # RGB -> BGR
+    return TextSprite(premultiplied, 1.0 - alpha, left, top)
+
+
+def draw_text(img: np.ndarray, text: str, x: int, y: int) -> None:
+    """Blend *text* into *img* (BGR, uint8) in place with its origin at ``(x, y)``.
+
+    Only the sprite's footprint is touched; it is clipped to the frame.
+    """
+    sprite = text_sprite(text)
+    h, w = sprite.inverse_alpha.shape[:2]
+    x0, y0 = x + sprite.dx, y + sprite.dy
+    # Clip to the frame, tracking which part of the sprite remains.
+    fx0, fy0 = max(x0, 0), max(y0, 0)
+    fx1, fy1 = min(x0 + w, img.shape[1]), min(y0 + h, img.shape[0])
+    if fx0 >= fx1 or fy0 >= fy1:
+        return
+    sx, sy = fx0 - x0, fy0 - y0
+    sw, sh = fx1 - fx0, fy1 - fy0
+
+    roi = img[fy0:fy1, fx0:fx1]
+    blended = roi * sprite.inverse_alpha[sy : sy + sh, sx : sx + sw]
+    blended += sprite.premultiplied[sy : sy + sh, sx : sx + sw]
+    roi[...] = blended + 0.5  # round; float -> uint8 assignment truncates
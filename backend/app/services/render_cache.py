@@ -0,0 +1,167 @@
+"""Rendered animation frames shared across animation jobs.
+
+Regenerating an animation with a different fps, quality or format used to
+decode and transform every source frame again. Rendered frames (after crop,
+preview downscale, scale and overlay) are now cached on disk, so a
+re-encode reads small, already-transformed images and goes straight to
+FFmpeg:
+
+* The key hashes the frame id, the source path and mtime, and every
+  setting that affects the pixels (crop box, resolution, scale, overlay and
+  label text). A replaced source or a changed setting is a different key,
+  so entries are never invalidated in place.
+* Entries are raw ``.npy`` arrays. Even at its fastest level, PNG encoding
+  a 2500×1500 frame took 150–600 ms, on the render path of every cache
+  miss; ``np.save`` takes ~15 ms and a load ~3 ms. The price is size
+  (1.5× to many times the PNG), which the cap below bounds.
+* The cache is capped at ``settings.render_cache_max_bytes``. A hit bumps
+  the file's mtime, and eviction uses the same LRU sweep as the derivative
+  cache (:func:`~app.services.derivatives.evict_lru`). A job whose frames
+  would not fit under the cap on their own stops writing (see
+  :meth:`RenderCache.admits`): they would only evict each other, and
+  everyone else's, before any reuse.
+* Eviction also sweeps ``*.npy.tmp-*`` files left by a worker killed
+  mid-write, and ``*.png`` entries from the earlier format; neither is an
+  entry and would otherwise never be removed.
+
+The cache is used from animation render threads, so :meth:`RenderCache.get`
+and :meth:`RenderCache.put` are synchronous and thread-safe. Writes are
+atomic (temp file + rename).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..config import settings
+from .derivatives import evict_lru
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+#: Temp files older than this are orphans of a killed writer, not writes in progress.
+_ORPHAN_TMP_AGE_S = 3600
+
+
+def render_key(
+    frame_id: str,
+    source: Path,
+    crop: tuple[int, int, int, int] | None,
+    resolution: str,
+    scale: str,
+    overlay: dict[str, Any] | None,
+    label_text: str,
+) -> str | None:
+    """Cache key for one rendered frame; ``None`` if *source* does not exist."""
+    try:
+        mtime_ns = source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    overlay_json = json.dumps(overlay or {}, sort_keys=True)
+    raw = f"{frame_id}:{source}:{mtime_ns}:{crop}:{resolution}:{scale}:{overlay_json}:{label_text}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class RenderCache:
+    """Size-capped, content-keyed LRU disk cache of rendered BGR frames."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        #: Approximate bytes on disk; ``None`` until the first eviction scan.
+        self._size: int | None = None
+
+    @property
+    def root(self) -> Path:
+        return self._root or Path(settings.storage_path) / "render_cache"
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes if self._max_bytes is not None else settings.render_cache_max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = value
+
+    def admits(self, entry_bytes: int, entries: int) -> bool:
+        """Whether *entries* frames of about *entry_bytes* each fit under the cap together."""
+        return entry_bytes * entries <= self.max_bytes
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.npy"
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the cached frame for *key*, or ``None`` on a miss."""
+        import numpy as np
+
+        path = self.path_for(key)
+        try:
+            os.utime(path)  # LRU bump; raises if not cached yet
+            return np.load(path)
+        except FileNotFoundError:  # not cached, or evicted between the bump and the read
+            return None
+        except (OSError, ValueError):
+            logger.warning("Render cache entry %s is unreadable", key, exc_info=True)
+            return None
+
+    def put(self, key: str, img: np.ndarray) -> int:
+        """Store *img* under *key*, evicting old entries past the cap. Returns the bytes written.
+
+        Failures are logged and swallowed (returning 0): the cache is an
+        optimisation and must never fail a render.
+        """
+        import numpy as np
+
+        path = self.path_for(key)
+        tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex[:8]}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as fh:  # a file object, so np.save adds no suffix
+                np.save(fh, img, allow_pickle=False)
+                written = fh.tell()
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            logger.warning("Render cache write failed for %s", key, exc_info=True)
+            return 0
+
+        with self._lock:
+            if self._size is not None:
+                self._size += written
+            if self._size is None or self._size > self.max_bytes:
+                self._size = self.evict()
+        return written
+
+    def evict(self) -> int:
+        """Drop least recently used frames until under the cap, and stale files. Returns bytes kept."""
+        self._remove_stale_files()
+        total, evicted = evict_lru(self.root.glob("*/*.npy"), self.max_bytes)
+        if evicted:
+            logger.info("Render cache evicted %d frames (%d bytes kept)", evicted, total)
+        return total
+
+    def _remove_stale_files(self) -> None:
+        """Delete orphaned temp files and entries in the earlier PNG format."""
+        for path in self.root.glob("*/*.png"):
+            path.unlink(missing_ok=True)
+        cutoff = time.time() - _ORPHAN_TMP_AGE_S
+        for path in self.root.glob("*/*.npy.tmp-*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue  # renamed into place or removed concurrently
+
+
+render_cache = RenderCache()
@@ -0,0 +1,236 @@
+"""Segment bookkeeping and HLS playlists for rolling animations.
+
+A rolling animation is a "last N hours" loop that is refreshed as new
+frames arrive. Re-encoding the whole window on every refresh made the
+cost grow with the window. Instead, each refresh encodes only the new
+frames, as one *chunk*:
+
+* A chunk is one FFmpeg run with the HLS muxer. It produces an fMP4 init
+  segment (``init_{seq}.mp4``) and a few ``.m4s`` media segments, with
+  keyframes forced at segment boundaries so each segment decodes on its
+  own.
+* ``index.m3u8`` lists the chunks in order. Each chunk after the first
+  starts with ``EXT-X-DISCONTINUITY`` and its own ``EXT-X-MAP``, because
+  timestamps and codec headers restart with every FFmpeg run.
+* When the window slides, chunks whose newest frame has left it are
+  dropped from the playlist. Their files are deleted one refresh later,
+  so a client still playing the previous playlist can finish its loop.
+  ``EXT-X-MEDIA-SEQUENCE`` and
+  ``EXT-X-DISCONTINUITY-SEQUENCE`` advance so that players which reload
+  the playlist stay in step. A chunk that is only partly outside the
+  window is kept whole, so the loop may start up to one refresh early.
+
+A refresh that finds only a frame or two would make a chunk a fraction of
+a second long, and the loop would stutter on a discontinuity every few
+frames. New frames are therefore held back (see :func:`chunk_due`) until
+they fill one media segment, or until the oldest has waited a quarter of
+the window. They are not lost meanwhile: the next refresh resumes after
+the last chunk, so it picks them up again.
+
+The playlist ends with ``EXT-X-ENDLIST``. Every version is a complete loop
+that players can start from the beginning; clients re-fetch it to pick up
+a refresh. State lives in ``state.json`` beside the playlist. Both files
+are replaced atomically. The state, not the database row, says where the
+next refresh resumes: the newest capture in the last chunk.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..config import settings
+
+#: Target media segment length; keyframes are forced on this grid.
+ROLLING_SEGMENT_SECONDS = 2
+
+#: Longest new frames are held back for a fuller chunk, as a fraction of the window.
+ROLLING_MAX_PENDING_FRACTION = 0.25
+
+PLAYLIST_NAME = "index.m3u8"
+_STATE_NAME = "state.json"
+
+#: Files a client may request from a rolling animation directory.
+SEGMENT_FILE_RE = re.compile(r"^(init_\d{6}\.mp4|seg_\d{6}_\d{3}\.m4s)$")
+
+
+def rolling_dir(rolling_id: str) -> Path:
+    return Path(settings.output_dir) / "rolling" / rolling_id
+
+
+def _empty_state() -> dict[str, Any]:
+    return {"next_seq": 0, "media_sequence": 0, "discontinuity_sequence": 0, "chunks": [], "retired": []}
+
+
+def load_state(directory: Path) -> dict[str, Any]:
+    try:
+        return json.loads((directory / _STATE_NAME).read_text())
+    except FileNotFoundError:
+        return _empty_state()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex[:8]}")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def save_state(directory: Path, state: dict[str, Any]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_atomic(directory / _STATE_NAME, json.dumps(state))
+
+
+def chunk_hls_args(directory: Path, seq: int) -> list[str]:
+    """FFmpeg output options that write chunk *seq* as fMP4 HLS into *directory*.
+
+    The chunk's own playlist (``chunk_{seq}.m3u8``) is the output path; it
+    is only read back by :func:`parse_chunk_playlist`.
+    """
+    return [
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{ROLLING_SEGMENT_SECONDS})",
+        "-f",
+        "hls",
+        "-hls_time",
+        str(ROLLING_SEGMENT_SECONDS),
+        "-hls_playlist_type",
+        "vod",
+        "-hls_segment_type",
+        "fmp4",
+        "-hls_fmp4_init_filename",
+        f"init_{seq:06d}.mp4",
+        "-hls_segment_filename",
+        str(directory / f"seg_{seq:06d}_%03d.m4s"),
+    ]
+
+
+def chunk_playlist_path(directory: Path, seq: int) -> Path:
+    return directory / f"chunk_{seq:06d}.m3u8"
+
+
+def parse_chunk_playlist(path: Path) -> list[tuple[str, float]]:
+    """``(segment file name, duration)`` pairs from an FFmpeg-written media playlist."""
+    segments: list[tuple[str, float]] = []
+    duration: float | None = None
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line.startswith("#EXTINF:"):
+            duration = float(line[len("#EXTINF:") :].split(",", 1)[0])
+        elif line and not line.startswith("#") and duration is not None:
+            segments.append((Path(line).name, duration))
+            duration = None
+    return segments
+
+
+def chunk_due(
+    state: dict[str, Any], pending: int, oldest_pending: datetime, fps: int, cutoff: datetime, now: datetime
+) -> bool:
+    """Whether *pending* new frames should be encoded as a chunk now.
+
+    They are once they fill a media segment, once the oldest has waited
+    ``ROLLING_MAX_PENDING_FRACTION`` of the window (``cutoff`` to ``now``),
+    or straight away while the playlist has no chunks at all.
+    """
+    if not state["chunks"] or pending >= ROLLING_SEGMENT_SECONDS * fps:
+        return True
+    return oldest_pending <= now - (now - cutoff) * ROLLING_MAX_PENDING_FRACTION
+
+
+def add_chunk(
+    state: dict[str, Any],
+    seq: int,
+    segments: list[tuple[str, float]],
+    first_capture: datetime,
+    last_capture: datetime,
+) -> None:
+    state["chunks"].append(
+        {
+            "seq": seq,
+            "init": f"init_{seq:06d}.mp4",
+            "segments": [[name, duration] for name, duration in segments],
+            "first_capture": first_capture.isoformat(),
+            "last_capture": last_capture.isoformat(),
+        }
+    )
+    state["next_seq"] = seq + 1
+
+
+def slide_window(state: dict[str, Any], cutoff: datetime) -> list[dict[str, Any]]:
+    """Drop chunks whose newest frame is older than *cutoff*; return them."""
+    kept, dropped = [], []
+    for chunk in state["chunks"]:
+        (dropped if datetime.fromisoformat(chunk["last_capture"]) < cutoff else kept).append(chunk)
+    state["chunks"] = kept
+    state["media_sequence"] += sum(len(c["segments"]) for c in dropped)
+    # Each dropped chunk takes one discontinuity boundary with it.
+    state["discontinuity_sequence"] += len(dropped)
+    return dropped
+
+
+def last_capture(state: dict[str, Any]) -> datetime | None:
+    """Newest capture time already encoded, from the last chunk; ``None`` if there are none."""
+    if not state["chunks"]:
+        return None
+    return datetime.fromisoformat(state["chunks"][-1]["last_capture"])
+
+
+def retire_chunks(state: dict[str, Any], dropped: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep *dropped* chunks for one more refresh; return the ones retired last time, now due for deletion."""
+    expired = state.get("retired", [])
+    state["retired"] = dropped
+    return expired
+
+
+def chunk_files(chunk: dict[str, Any]) -> list[str]:
+    seq = chunk["seq"]
+    return [chunk["init"], f"chunk_{seq:06d}.m3u8", *(name for name, _ in chunk["segments"])]
+
+
+def delete_chunks(directory: Path, chunks: list[dict[str, Any]]) -> None:
+    for chunk in chunks:
+        for name in chunk_files(chunk):
+            (directory / name).unlink(missing_ok=True)
+
+
+def total_duration(state: dict[str, Any]) -> float:
+    return sum(duration for chunk in state["chunks"] for _, duration in chunk["segments"])
+
+
+def segment_count(state: dict[str, Any]) -> int:
+    return sum(len(chunk["segments"]) for chunk in state["chunks"])
+
+
+def render_playlist(state: dict[str, Any]) -> str:
+    durations = [duration for chunk in state["chunks"] for _, duration in chunk["segments"]]
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:7",
+        f"#EXT-X-TARGETDURATION:{max(1, math.ceil(max(durations, default=ROLLING_SEGMENT_SECONDS)))}",
+        f"#EXT-X-MEDIA-SEQUENCE:{state['media_sequence']}",
+        f"#EXT-X-DISCONTINUITY-SEQUENCE:{state['discontinuity_sequence']}",
+        "#EXT-X-INDEPENDENT-SEGMENTS",
+    ]
+    for i, chunk in enumerate(state["chunks"]):
+        if i:
+            lines.append("#EXT-X-DISCONTINUITY")
+        lines.append(f'#EXT-X-MAP:URI="{chunk["init"]}"')
+        for name, duration in chunk["segments"]:
+            lines.extend((f"#EXTINF:{duration:.3f},", name))
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def write_playlist(directory: Path, state: dict[str, Any]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    _write_atomic(directory / PLAYLIST_NAME, render_playlist(state))
+
+
+def remove_rolling_dir(rolling_id: str) -> None:
+    shutil.rmtree(rolling_dir(rolling_id), ignore_errors=True)
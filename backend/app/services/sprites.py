@@ -0,0 +1,184 @@
+"""Thumbnail sprite sheets for timeline scrubbing.
+
+A timeline used to request ``/frames/{id}/thumbnail`` once per frame: one
+DB lookup and one response per thumbnail. A sprite sheet packs up to
+:data:`SPRITE_COLUMNS` × :data:`SPRITE_ROWS` thumbnails into a single WebP
+atlas, with a JSON index mapping each frame to its sheet and cell.
+
+* The index is built from the frame query alone (no image I/O). The API
+  caches it under the ``frames`` / ``collections`` tags, so adding or
+  deleting frames invalidates it.
+* ``sprite_id`` hashes the ordered frame ids and thumbnail paths. Any change
+  in membership therefore yields a new id, and sheets never need to be
+  invalidated in place. A sheet is rendered on first request, stored under
+  ``{storage_path}/sprites/{sprite_id}/``, and served as immutable.
+* Sprite directories that have not been touched for
+  :data:`SPRITE_RETENTION_SECONDS` are swept whenever a new manifest is
+  written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ..config import settings
+
+#: Pixel size of one (square) cell; thumbnails are letterboxed into it.
+SPRITE_CELL = 128
+SPRITE_COLUMNS = 10
+SPRITE_ROWS = 10
+SPRITE_FRAMES_PER_SHEET = SPRITE_COLUMNS * SPRITE_ROWS
+
+#: Most frames one sprite index may cover.
+MAX_SPRITE_FRAMES = 2000
+
+#: Sprite directories idle for longer than this are removed.
+SPRITE_RETENTION_SECONDS = 86_400
+
+_SPRITE_QUALITY = 80
+
+_MANIFEST = "manifest.json"
+
+
+class SpriteFrame(NamedTuple):
+    id: str
+    capture_time: datetime
+    thumbnail_path: str | None
+    file_path: str
+
+
+def sprites_root() -> Path:
+    return Path(settings.storage_path) / "sprites"
+
+
+def sprite_dir(sprite_id: str) -> Path:
+    return sprites_root() / sprite_id
+
+
+def sheet_path(sprite_id: str, sheet: int) -> Path:
+    return sprite_dir(sprite_id) / f"{sheet}.webp"
+
+
+def _source(frame: SpriteFrame) -> str:
+    return frame.thumbnail_path or frame.file_path
+
+
+def compute_sprite_id(frames: Sequence[SpriteFrame]) -> str:
+    h = hashlib.sha256()
+    for f in frames:
+        h.update(f"{f.id}:{_source(f)}\n".encode())
+    return h.hexdigest()[:24]
+
+
+def build_index(frames: Sequence[SpriteFrame]) -> dict[str, Any]:
+    """Return the public JSON index (cell coordinates per frame) and write its manifest."""
+    sprite_id = compute_sprite_id(frames)
+    entries = []
+    for i, f in enumerate(frames):
+        sheet, pos = divmod(i, SPRITE_FRAMES_PER_SHEET)
+        row, col = divmod(pos, SPRITE_COLUMNS)
+        entries.append(
+            {
+                "id": f.id,
+                "capture_time": f.capture_time.isoformat(),
+                "sheet": sheet,
+                "x": col * SPRITE_CELL,
+                "y": row * SPRITE_CELL,
+            }
+        )
+    _write_manifest(sprite_id, [_source(f) for f in frames])
+    return {
+        "sprite_id": sprite_id,
+        "cell_size": SPRITE_CELL,
+        "columns": SPRITE_COLUMNS,
+        "frames_per_sheet": SPRITE_FRAMES_PER_SHEET,
+        "sheet_count": -(-len(frames) // SPRITE_FRAMES_PER_SHEET),
+        "frames": entries,
+    }
+
+
+def _write_manifest(sprite_id: str, sources: list[str]) -> None:
+    path = sprite_dir(sprite_id) / _MANIFEST
+    if path.exists():
+        os.utime(path)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{_MANIFEST}.tmp-{uuid.uuid4().hex[:8]}")
+    tmp.write_text(json.dumps(sources))
+    os.replace(tmp, path)
+    sweep_stale_sprites()
+
+
+def sweep_stale_sprites(max_age: float = SPRITE_RETENTION_SECONDS) -> int:
+    """Remove sprite directories whose manifest is older than *max_age*. Returns the count.
+
+    A directory without a manifest may be mid-build (the manifest is
+    written last), so it is judged by its own mtime instead.
+    """
+    root = sprites_root()
+    if not root.is_dir():
+        return 0
+    cutoff = time.time() - max_age
+    removed = 0
+    for child in root.iterdir():
+        try:
+            try:
+                mtime = (child / _MANIFEST).stat().st_mtime
+            except FileNotFoundError:
+                mtime = child.stat().st_mtime
+        except FileNotFoundError:
+            continue  # removed by a concurrent sweep
+        if mtime >= cutoff:
+            continue
+        shutil.rmtree(child, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+def render_sheet(sprite_id: str, sheet: int) -> Path | None:
+    """Render (or return the cached) sheet *sheet*; ``None`` if unknown."""
+    from PIL import Image
+
+    if sheet < 0:
+        return None
+    out = sheet_path(sprite_id, sheet)
+    if out.exists():
+        return out
+    try:
+        sources = json.loads((sprite_dir(sprite_id) / _MANIFEST).read_text())
+    except FileNotFoundError:
+        return None
+    chunk = sources[sheet * SPRITE_FRAMES_PER_SHEET : (sheet + 1) * SPRITE_FRAMES_PER_SHEET]
+    if not chunk:
+        return None
+
+    rows = -(-len(chunk) // SPRITE_COLUMNS)
+    columns = min(len(chunk), SPRITE_COLUMNS)
+    atlas = Image.new("RGB", (columns * SPRITE_CELL, rows * SPRITE_CELL))
+    for i, src in enumerate(chunk):
+        row, col = divmod(i, SPRITE_COLUMNS)
+        try:
+            with Image.open(src) as img:
+                img.draft("RGB", (SPRITE_CELL, SPRITE_CELL))
+                img.thumbnail((SPRITE_CELL, SPRITE_CELL))
+                cell = img.convert("RGB")
+        except (OSError, ValueError):
+            continue  # missing/corrupt thumbnail → blank cell
+        atlas.paste(
+            cell,
+            (col * SPRITE_CELL + (SPRITE_CELL - cell.width) // 2, row * SPRITE_CELL + (SPRITE_CELL - cell.height) // 2),
+        )
+
+    tmp = out.with_name(f"{out.name}.tmp-{uuid.uuid4().hex[:8]}")
+    atlas.save(tmp, "WEBP", quality=_SPRITE_QUALITY)
+    os.replace(tmp, out)
+    return out
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -46,3 +47,19 @@ def get_image_dimensions(path: str) -> tuple[int | None, int | None]:
             return img.size
     except (OSError, ValueError):
         return None, None
+
+
+def save_image(img: Any, output_path: Path) -> dict[str, int]:
+    """Write a PIL image and return its ``width``, ``height`` and ``file_size``.
+
+    Conversion steps hand this dict on with the frame so ingest does not
+    have to re-open and stat every file it just wrote.
+    """
+    from PIL import Image
+
+    fmt = Image.registered_extensions().get(output_path.suffix.lower(), "PNG")
+    with open(output_path, "wb") as fh:
+        img.save(fh, format=fmt)
+        file_size = fh.tell()
+    width, height = img.size
+    return {"width": width, "height": height, "file_size": file_size}
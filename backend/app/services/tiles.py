@@ -0,0 +1,160 @@
+"""Multi-resolution tile pyramids for full-size frames.
+
+Zoomed-out or panned viewers only need a few 256-px tiles, not the whole
+4096² PNG. A pyramid is built lazily on first access by the
+``generate_frame_tiles`` task on the process queue. Zoom ``max_zoom`` is
+native resolution and each level below halves both dimensions, down to
+a single tile at zoom 0.
+
+Layout: ``{storage_path}/tiles/{frame_id}/{version}/{z}/{x}_{y}.webp``.
+``version`` is derived from the source file's path, size and mtime. A
+replaced source gets a fresh pyramid, and the version doubles as the
+tile's strong ETag. A pyramid is built in a temp directory and renamed
+into place, so readers never see a half-written level.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import shutil
+import uuid
+from pathlib import Path
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+TILE_FORMAT = "WEBP"
+TILE_EXTENSION = "webp"
+TILE_MEDIA_TYPE = "image/webp"
+
+#: WebP quality for tiles; tiles are re-derivable so lossy is fine.
+_TILE_QUALITY = 85
+
+
+def tiles_root() -> Path:
+    return Path(settings.storage_path) / "tiles"
+
+
+def tile_version(source: Path) -> str:
+    """Content key for *source*: changes whenever the file is replaced."""
+    st = source.stat()
+    raw = f"{source}:{st.st_size}:{st.st_mtime_ns}".encode()
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def max_zoom(width: int, height: int) -> int:
+    """Highest zoom level — the one at native resolution."""
+    longest = max(width, height, 1)
+    return math.ceil(math.log2(longest / TILE_SIZE)) if longest > TILE_SIZE else 0
+
+
+def level_size(width: int, height: int, z: int) -> tuple[int, int]:
+    """Pixel size of zoom level *z* (halving per level below ``max_zoom``)."""
+    scale = 2 ** (max_zoom(width, height) - z)
+    return max(1, math.ceil(width / scale)), max(1, math.ceil(height / scale))
+
+
+def tile_grid(width: int, height: int, z: int) -> tuple[int, int]:
+    """Number of tile columns and rows at zoom level *z*."""
+    w, h = level_size(width, height, z)
+    return math.ceil(w / TILE_SIZE), math.ceil(h / TILE_SIZE)
+
+
+def pyramid_dir(frame_id: str, version: str) -> Path:
+    return tiles_root() / frame_id / version
+
+
+def tile_path(frame_id: str, version: str, z: int, x: int, y: int) -> Path:
+    return pyramid_dir(frame_id, version) / str(z) / f"{x}_{y}.{TILE_EXTENSION}"
+
+
+def build_tile_pyramid(source: Path, out_dir: Path) -> int:
+    """Render every zoom level of *source* into *out_dir*. Returns the tile count.
+
+    Works top-down from native resolution, halving with ``Image.reduce(2)``
+    (a box filter), so at most two levels are in memory at once: about
+    1.25× the decoded source.
+    """
+    from PIL import Image
+
+    tmp_dir = out_dir.with_name(f"{out_dir.name}.tmp-{uuid.uuid4().hex[:8]}")
+    count = 0
+    try:
+        with Image.open(source) as src:
+            level = src if src.mode in ("L", "RGB", "RGBA") else src.convert("RGB")
+            level.load()
+            width, height = level.size
+            for z in range(max_zoom(width, height), -1, -1):
+                expected = level_size(width, height, z)
+                if level.size != expected:
+                    level = level.resize(expected, Image.Resampling.BOX)
+                z_dir = tmp_dir / str(z)
+                z_dir.mkdir(parents=True, exist_ok=True)
+                cols, rows = tile_grid(width, height, z)
+                for ty in range(rows):
+                    for tx in range(cols):
+                        box = (
+                            tx * TILE_SIZE,
+                            ty * TILE_SIZE,
+                            min((tx + 1) * TILE_SIZE, level.width),
+                            min((ty + 1) * TILE_SIZE, level.height),
+                        )
+                        level.crop(box).save(z_dir / f"{tx}_{ty}.{TILE_EXTENSION}", TILE_FORMAT, quality=_TILE_QUALITY)
+                        count += 1
+                if z:
+                    level = level.reduce(2)
+        out_dir.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(tmp_dir, out_dir)
+        except OSError:
+            # Another worker finished the same version first.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return count
+
+
+def prune_old_versions(frame_id: str, keep: str) -> None:
+    """Drop pyramids of *frame_id* built from earlier versions of its source."""
+    frame_dir = tiles_root() / frame_id
+    if not frame_dir.is_dir():
+        return
+    for child in frame_dir.iterdir():
+        if child.name != keep and ".tmp-" not in child.name:
+            shutil.rmtree(child, ignore_errors=True)
+
+
+def remove_frame_tiles(frame_id: str) -> None:
+    """Delete every pyramid of a frame (called when the frame is deleted)."""
+    shutil.rmtree(tiles_root() / frame_id, ignore_errors=True)
+
+
+#: How long a queued build suppresses further enqueues for the same version.
+_PENDING_TTL_SECONDS = 600
+
+
+async def claim_tile_build(frame_id: str, version: str) -> bool:
+    """Return True if the caller should enqueue the build for this version.
+
+    Concurrent tile requests for an unbuilt pyramid all land here; a Redis
+    ``SET NX`` lets only the first enqueue ``generate_frame_tiles``. If
+    Redis is unavailable every caller enqueues — the task itself is
+    idempotent.
+    """
+    import redis.exceptions
+
+    from ..redis_pool import get_redis_client
+
+    try:
+        return bool(
+            await get_redis_client().set(f"tiles:pending:{frame_id}:{version}", 1, nx=True, ex=_PENDING_TTL_SECONDS)
+        )
+    except (redis.exceptions.RedisError, OSError, RuntimeError):
+        logger.warning("Tile build claim failed for %s", frame_id, exc_info=True)
+        return True
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import itertools
 import logging
 import math
+import os
+import queue
 import shutil
 import subprocess
+import tempfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 if TYPE_CHECKING:
     import numpy as np
@@ -19,52 +28,81 @@ from sqlalchemy.exc import SQLAlchemyError
 from ..celery_app import celery_app
 from ..config import settings
 from ..utils import utcnow
-from .helpers import _get_sync_db, _publish_progress, _update_job_db
+from .helpers import _get_sync_db, _publish_progress, _update_job_db, with_idempotency
 
 logger = logging.getLogger(__name__)
 
 QUALITY_CRF = {"low": "28", "medium": "23", "high": "18"}
 PREVIEW_MAX_WIDTH = 1024
 
+#: Threads decoding/transforming frames. OpenCV releases the GIL in
+#: imread/resize, so threads scale across cores inside a prefork worker
+#: (whose daemonic children may not start a process pool).
+_RENDER_WORKERS = min(8, os.cpu_count() or 1)
 
-def _apply_overlay(img: np.ndarray, frame: GoesFrame, overlay: dict[str, Any], label_text: str) -> np.ndarray:
-    """Burn text overlay onto a frame image using PIL."""
-    import numpy as np
-    from PIL import Image, ImageDraw, ImageFont
+#: Frames rendered ahead of the consumer, usually an encoder pipe.
+_RENDER_READ_AHEAD = _RENDER_WORKERS * 2
 
-    pil_img = Image.fromarray(img[:, :, ::-1])  # BGR -> RGB
-    draw = ImageDraw.Draw(pil_img)
+#: Rendered frames a pingpong replay keeps in memory before spilling to disk.
+_SPILL_MEMORY_BYTES = 128 * 1024 * 1024
 
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-    except OSError:
-        font = ImageFont.load_default()
+#: Concurrent FFmpeg processes in a chunked encode.
+_ENCODE_WORKERS = min(4, os.cpu_count() or 1)
+
+#: Rendered frames queued for the live chunk encoders, across all of them.
+_CHUNK_QUEUE_BYTES = 128 * 1024 * 1024
+
+#: MP4s at least this many frames long are encoded as parallel chunks.
+_CHUNKED_ENCODE_MIN_FRAMES = 1000
+
+#: Frames per chunk. Matches libx264's default keyframe interval, so
+#: starting every chunk on a keyframe adds almost none.
+_CHUNK_FRAMES = 250
+
+#: Animations at least this many output frames long get a draft preview first.
+_DRAFT_MIN_FRAMES = 120
+
+#: Frames sampled, evenly across the sequence, for a draft preview.
+_DRAFT_MAX_FRAMES = 60
+
+#: About this many frames feed a GIF's palette statistics.
+_GIF_PALETTE_SAMPLE_FRAMES = 100
+
+#: Frame bytes a single-pass GIF encode may queue in FFmpeg before it is scaled down.
+_GIF_MAX_QUEUED_BYTES = 1024 * 1024 * 1024
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _apply_overlay(
+    img: np.ndarray, frame: GoesFrame | _FrameRef, overlay: dict[str, Any], label_text: str
+) -> np.ndarray:
+    """Burn the text overlay onto a frame image, in place, and return it."""
+    from ..services.overlay import draw_text
 
     y_pos = 10
 
     if overlay.get("label") and label_text:
-        draw.text((10, y_pos), label_text, fill=(255, 255, 255), font=font, stroke_width=2, stroke_fill=(0, 0, 0))
+        draw_text(img, label_text, 10, y_pos)
         y_pos += 30
 
     if overlay.get("timestamp") and frame.capture_time:
-        ts_text = frame.capture_time.strftime("%Y-%m-%d %H:%M UTC")
-        draw.text((10, y_pos), ts_text, fill=(255, 255, 255), font=font, stroke_width=2, stroke_fill=(0, 0, 0))
+        draw_text(img, frame.capture_time.strftime("%Y-%m-%d %H:%M UTC"), 10, y_pos)
 
-    return np.array(pil_img)[:, :, ::-1]  # RGB -> BGR
+    return img
 
 
-def _apply_loop_style(frames: list[GoesFrame], loop_style: str, fps: int) -> list[GoesFrame]:
-    """Apply loop style (pingpong/hold) to the frame list."""
-    if not frames:
-        return frames
+def _loop_tail(count: int, loop_style: str, fps: int) -> list[int]:
+    """Indices into a *count*-frame forward pass that *loop_style* appends after it."""
+    if count == 0:
+        return []
     if loop_style == "pingpong":
-        if len(frames) > 2:
-            return list(frames) + list(reversed(frames[1:-1]))
-        return list(frames) + list(reversed(frames[:-1]))
+        # Reverse without repeating the turning frames (both ends when there are >2).
+        return list(range(count - 2, 0, -1)) if count > 2 else list(range(count - 2, -1, -1))
     if loop_style == "hold":
-        hold_count = fps * 2
-        return list(frames) + [frames[-1]] * hold_count
-    return list(frames)
+        return [count - 1] * (fps * 2)
+    return []
 
 
 def _build_overlay_label(overlay: dict[str, Any] | None, frames: list[GoesFrame]) -> str:
@@ -75,7 +113,9 @@ def _build_overlay_label(overlay: dict[str, Any] | None, frames: list[GoesFrame]
     return f"{f0.satellite} {f0.sector} Band {f0.band.replace('C', '')}"
 
 
-def _process_single_frame(img: np.ndarray, crop: CropPreset | None, resolution: str, scale: str) -> np.ndarray:
+def _process_single_frame(
+    img: np.ndarray, crop: CropPreset | _CropBox | None, resolution: str, scale: str
+) -> np.ndarray:
     """Apply crop, resolution, and scale transforms to a single frame image."""
     import cv2
 
@@ -99,92 +139,556 @@ def _process_single_frame(img: np.ndarray, crop: CropPreset | None, resolution:
     return img
 
 
-def _render_frames_to_dir(
-    frames: list[GoesFrame],
-    work_dir: Path,
-    job_id: str,
-    crop: CropPreset | None,
+class _FrameRef(NamedTuple):
+    """The frame fields rendering needs, detached from the ORM session."""
+
+    id: str
+    file_path: str
+    capture_time: datetime | None
+
+
+class _CropBox(NamedTuple):
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class _CacheWrites:
+    """Whether one job's rendered frames are still stored in the render cache.
+
+    Decided from the first stored frame's size: a job too large for the
+    cap stops writing. Workers race on the flag, so a few extra frames may
+    be stored before it drops, which is harmless.
+    """
+
+    def __init__(self, frame_count: int) -> None:
+        self.frame_count = frame_count
+        self.enabled = True
+
+
+def _render_frame(
+    frame: _FrameRef,
+    crop: _CropBox | None,
     resolution: str,
     scale: str,
     overlay: dict[str, Any] | None,
     label_text: str,
-) -> int:
-    """Read, transform, and write all frames to the working directory."""
+) -> np.ndarray | None:
+    """Decode and transform one frame; ``None`` if its file is missing or unreadable."""
     import cv2
 
-    output_idx = 0
-    for i, frame in enumerate(frames):
-        src = Path(frame.file_path)
-        if not src.exists():
-            logger.warning("Frame file missing: %s", src)
-            continue
+    src = Path(frame.file_path)
+    if not src.exists():
+        logger.warning("Frame file missing: %s", src)
+        return None
 
-        img = cv2.imread(str(src))
-        if img is None:
-            continue
+    img = cv2.imread(str(src))
+    if img is None:
+        return None
 
-        img = _process_single_frame(img, crop, resolution, scale)
+    img = _process_single_frame(img, crop, resolution, scale)
 
-        if overlay and (overlay.get("timestamp") or overlay.get("label")):
-            img = _apply_overlay(img, frame, overlay, label_text)
+    if overlay and (overlay.get("timestamp") or overlay.get("label")):
+        img = _apply_overlay(img, frame, overlay, label_text)
+    return img
 
-        dest = work_dir / f"frame{output_idx:06d}.png"
-        cv2.imwrite(str(dest), img)
-        output_idx += 1
+
+def _render_frame_cached(
+    frame: _FrameRef,
+    crop: _CropBox | None,
+    resolution: str,
+    scale: str,
+    overlay: dict[str, Any] | None,
+    label_text: str,
+    writes: _CacheWrites,
+) -> tuple[np.ndarray | None, bool]:
+    """:func:`_render_frame` through the cross-job render cache; also returns whether it hit."""
+    from ..services.render_cache import render_cache, render_key
+
+    key = render_key(
+        frame.id, Path(frame.file_path), tuple(crop) if crop else None, resolution, scale, overlay, label_text
+    )
+    if key is not None:
+        img = render_cache.get(key)
+        if img is not None:
+            return img, True
+    img = _render_frame(frame, crop, resolution, scale, overlay, label_text)
+    if writes.enabled and key is not None and img is not None:
+        stored = render_cache.put(key, img)
+        if stored and not render_cache.admits(stored, writes.frame_count):
+            writes.enabled = False
+    return img, False
+
+
+def _imap_ordered(fn: Callable[[T], R], items: Iterable[T], *, workers: int, read_ahead: int) -> Iterator[R]:
+    """Map *fn* over *items* on a thread pool, yielding results in input order.
+
+    At most *read_ahead* items are in flight or finished-but-unconsumed at
+    any time, so a slow consumer bounds memory rather than letting the pool
+    materialize every result.
+    """
+    it = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[R]] = deque(pool.submit(fn, item) for item in itertools.islice(it, read_ahead))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in itertools.islice(it, 1):
+                    pending.append(pool.submit(fn, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _iter_rendered_frames(
+    frames: list[GoesFrame],
+    job_id: str | None,
+    crop: CropPreset | None,
+    resolution: str,
+    scale: str,
+    overlay: dict[str, Any] | None,
+    label_text: str,
+) -> Iterator[np.ndarray]:
+    """Render frames on a thread pool, yielding BGR arrays in capture order.
+
+    Missing or unreadable sources are skipped. Progress (10–70%) is
+    published as frames are consumed, so it tracks the encoder too when
+    the consumer is an FFmpeg pipe. Frames come from the render cache when
+    an earlier job rendered them with the same settings, and are stored
+    there unless the job alone would overflow the cache; the hit count is
+    written to the job log once all frames have been consumed. Without a
+    *job_id* (rolling refreshes) nothing is reported.
+    """
+    crop_box = _CropBox(crop.x, crop.y, crop.width, crop.height) if crop else None
+    # Plain tuples only cross into the workers: ORM attribute access could
+    # lazy-load on the task's session from another thread.
+    refs = (_FrameRef(str(getattr(f, "id", "")), f.file_path, getattr(f, "capture_time", None)) for f in frames)
+    writes = _CacheWrites(len(frames))
+    rendered = _imap_ordered(
+        lambda ref: _render_frame_cached(ref, crop_box, resolution, scale, overlay, label_text, writes),
+        refs,
+        workers=_RENDER_WORKERS,
+        read_ahead=_RENDER_READ_AHEAD,
+    )
+
+    cache_hits = 0
+    for i, (img, hit) in enumerate(rendered):
+        cache_hits += hit
+        if img is not None:
+            yield img
 
         pct_done = 10 + int((i + 1) / len(frames) * 60)
-        if (i + 1) % max(1, len(frames) // 20) == 0:
+        if job_id and (i + 1) % max(1, len(frames) // 20) == 0:
             _publish_progress(job_id, pct_done, f"Processed frame {i + 1}/{len(frames)}", "processing")
             _update_job_db(job_id, progress=pct_done, status_message=f"Processed frame {i + 1}/{len(frames)}")
 
-    return output_idx
+    if not job_id:
+        return
+    from .fetch_task import _make_job_logger
+
+    _make_job_logger(job_id)(f"Render cache: {cache_hits}/{len(frames)} frames reused from earlier jobs")
+
+
+class _FrameSpill:
+    """Rendered frames kept for replay: in memory up to a byte budget, then as PNG files.
+
+    Spilled frames use the fastest PNG compression level. That is about
+    the cost of a raw write but a fraction of the disk, and still skips
+    the decode and transform work a re-render would repeat.
+    """
+
+    def __init__(self, spill_dir: Path, memory_budget: int) -> None:
+        self._dir = spill_dir
+        self._budget = memory_budget
+        self._in_memory = 0
+        self._frames: list[np.ndarray | Path] = []
+
+    def append(self, img: np.ndarray) -> None:
+        if self._in_memory + img.nbytes <= self._budget:
+            self._frames.append(img)
+            self._in_memory += img.nbytes
+            return
+        import cv2
+
+        ok, buf = cv2.imencode(".png", img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise RuntimeError(f"Could not encode frame {len(self._frames)} for the loop tail")
+        self._dir.mkdir(parents=True, exist_ok=True)
+        path = self._dir / f"spill{len(self._frames):06d}.png"
+        path.write_bytes(buf.tobytes())
+        self._frames.append(path)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        item = self._frames[index]
+        if isinstance(item, Path):
+            import cv2
+
+            img = cv2.imread(str(item), cv2.IMREAD_COLOR)
+            if img is None:
+                raise RuntimeError(f"Spilled frame {item.name} could not be read")
+            return img
+        return item
+
+
+def _with_loop_tail(frames: Iterable[np.ndarray], loop_style: str, fps: int, spill_dir: Path) -> Iterator[np.ndarray]:
+    """Yield *frames*, then replay the loop tail from kept buffers instead of re-rendering.
+
+    Hold only needs the last frame. Pingpong keeps every frame in a
+    :class:`_FrameSpill`.
+    """
+    spill = _FrameSpill(spill_dir, _SPILL_MEMORY_BYTES) if loop_style == "pingpong" else None
+    last = None
+    count = 0
+    for img in frames:
+        if spill is not None:
+            spill.append(img)
+        last = img
+        count += 1
+        yield img
+    for index in _loop_tail(count, loop_style, fps):
+        yield last if index == count - 1 or spill is None else spill[index]
+
+
+def _rawvideo_input_args(width: int, height: int, fps: int) -> list[str]:
+    """FFmpeg input options for BGR rawvideo frames on stdin."""
+    return ["-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-framerate", str(fps), "-i", "-"]
+
+
+def _gif_filter_graph(palette_every: int = 1) -> str:
+    """Single-pass GIF filter graph: ``split`` feeds both ``palettegen`` and ``paletteuse``.
+
+    ``paletteuse`` cannot start until ``palettegen`` has seen all of its
+    input, so FFmpeg queues the frames in between; they are decoded once
+    instead of once per pass. With *palette_every* > 1 the palette
+    statistics come from every n-th frame only.
+    """
+    sample = f"select='not(mod(n\\,{palette_every}))'," if palette_every > 1 else ""
+    return f"split[a][b];[a]{sample}palettegen[p];[b][p]paletteuse"
+
+
+def _rawvideo_mp4_cmd(
+    ffmpeg: str,
+    fps: int,
+    quality: str,
+    width: int,
+    height: int,
+    output_path: Path,
+    container_args: list[str] | None = None,
+    preset: str = "medium",
+) -> list[str]:
+    """H.264 encode of BGR rawvideo on stdin; *container_args* replace the MP4 muxer options."""
+    crf = QUALITY_CRF.get(quality, "23")
+    return [
+        ffmpeg,
+        "-y",
+        *_rawvideo_input_args(width, height, fps),
+        "-c:v",
+        "libx264",
+        "-crf",
+        crf,
+        "-preset",
+        preset,
+        "-pix_fmt",
+        "yuv420p",
+        *(container_args if container_args is not None else ["-movflags", "+faststart"]),
+        str(output_path),
+    ]
+
+
+class _FFmpegPipe:
+    """One FFmpeg process reading BGR rawvideo frames of a fixed size on stdin.
+
+    stdin is buffered, so each :meth:`write` either delivers the whole
+    frame or raises; a short write can never shift the rawvideo stream.
+    stderr goes to a temporary file: a PIPE nobody drains could fill and
+    stall FFmpeg.
+    """
+
+    def __init__(self, cmd: list[str], size: tuple[int, int]) -> None:
+        self.cmd = cmd
+        self.size = size
+        self.count = 0
+        self._stderr = tempfile.TemporaryFile()  # noqa: SIM115 — closed by wait() or abort()
+        try:
+            self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._stderr)
+        except BaseException:
+            self._stderr.close()
+            raise
+
+    def write(self, img: np.ndarray) -> bool:
+        """Send one frame, scaled to :attr:`size` if needed. ``False`` once FFmpeg has stopped reading."""
+        import cv2
+        import numpy as np
+
+        width, height = self.size
+        if img.shape[:2] != (height, width):
+            img = cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)
+        try:
+            self._proc.stdin.write(np.ascontiguousarray(img).data)
+        except BrokenPipeError:
+            return False  # FFmpeg exited early; wait() reports why
+        self.count += 1
+        return True
+
+    def wait(self) -> int:
+        """Close stdin and wait for FFmpeg. Returns the frames written; raises if FFmpeg failed."""
+        with contextlib.suppress(BrokenPipeError):
+            self._proc.stdin.close()  # flushing may hit a pipe FFmpeg already closed
+        returncode = self._proc.wait()
+        with self._stderr:
+            if returncode != 0:
+                self._stderr.seek(0)
+                stderr = self._stderr.read()
+                logger.error("FFmpeg failed (rc=%d): %s", returncode, stderr.decode("utf-8", errors="replace"))
+                raise subprocess.CalledProcessError(returncode, self.cmd, stderr=stderr)
+        return self.count
+
+    def kill(self) -> None:
+        """Stop FFmpeg now; a writer blocked on it gets ``False`` and :meth:`wait` raises."""
+        self._proc.kill()
+
+    def abort(self) -> None:
+        """Kill FFmpeg without waiting for the rest of its input, and release the pipe."""
+        self._proc.kill()
+        with contextlib.suppress(BrokenPipeError):
+            self._proc.stdin.close()
+        self._proc.wait()
+        self._stderr.close()
+
+
+def _pipe_frames(
+    frames: Iterable[np.ndarray],
+    build_cmd: Callable[[int, int], list[str]],
+    size: tuple[int, int] | None = None,
+) -> int:
+    """Write BGR frames to the stdin of FFmpeg command ``build_cmd(width, height)``. Returns the frame count.
+
+    No PNGs are written or decoded. Each frame is written straight to
+    FFmpeg's stdin (see :class:`_FFmpegPipe`); when the encoder falls
+    behind, the pipe fills and the write blocks, so rendering never runs
+    more than a pipe buffer ahead. All frames take *size*
+    ``(width, height)``, by default the first frame's size (OpenCV decodes
+    are 3-channel BGR, matching ``-pix_fmt bgr24``).
+    """
+    it = iter(frames)
+    first = next(it, None)
+    if first is None:
+        raise RuntimeError("No frames could be rendered")
+    size = size or (first.shape[1], first.shape[0])
+    pipe = _FFmpegPipe(build_cmd(*size), size)
+    try:
+        for img in itertools.chain([first], it):
+            if not pipe.write(img):
+                break
+    except BaseException:
+        pipe.abort()
+        raise
+    return pipe.wait()
+
 
+def _encode_stream(
+    frames: Iterable[np.ndarray],
+    fps: int,
+    quality: str,
+    output_path: Path,
+    container_args: list[str] | None = None,
+    size: tuple[int, int] | None = None,
+    preset: str = "medium",
+) -> int:
+    """Pipe BGR frames to FFmpeg as rawvideo and encode them as H.264. Returns the frame count.
 
-def _encode_output(fmt: str, fps: int, quality: str, work_dir: Path, output_path: Path) -> None:
-    """Encode frames into GIF or MP4 using FFmpeg."""
+    The output is an MP4 unless *container_args* select another muxer
+    (rolling animations write fMP4 HLS segments). See :func:`_pipe_frames`.
+    """
     ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
-    input_pattern = str(work_dir / "frame%06d.png")
+    return _pipe_frames(
+        frames,
+        lambda width, height: _rawvideo_mp4_cmd(
+            ffmpeg, fps, quality, width, height, output_path, container_args, preset
+        ),
+        size,
+    )
+
 
-    if fmt == "gif":
-        palette = str(work_dir / "palette.png")
-        cmd1 = [ffmpeg, "-y", "-framerate", str(fps), "-i", input_pattern, "-vf", "palettegen", palette]
-        _run_ffmpeg(cmd1)
-        cmd2 = [
+def _encode_gif_stream(
+    frames: Iterable[np.ndarray], fps: int, output_path: Path, frame_count: int, palette_every: int = 1
+) -> int:
+    """Pipe BGR frames to a single FFmpeg run that builds the palette and encodes the GIF.
+
+    See :func:`_gif_filter_graph` and :func:`_pipe_frames`. FFmpeg queues
+    every frame until the palette is ready, so when *frame_count* frames
+    at the first frame's size would exceed :data:`_GIF_MAX_QUEUED_BYTES`,
+    all frames are scaled down to fit. Returns the frame count.
+    """
+    it = iter(frames)
+    first = next(it, None)
+    if first is None:
+        raise RuntimeError("No frames could be rendered")
+    size = (first.shape[1], first.shape[0])
+    queued = frame_count * first.nbytes
+    if queued > _GIF_MAX_QUEUED_BYTES:
+        factor = math.sqrt(_GIF_MAX_QUEUED_BYTES / queued)
+        size = (max(1, int(size[0] * factor)), max(1, int(size[1] * factor)))
+        logger.info(
+            "GIF of %d frames at %dx%d would queue %d MiB in FFmpeg; encoding at %dx%d",
+            frame_count,
+            first.shape[1],
+            first.shape[0],
+            queued >> 20,
+            *size,
+        )
+    ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
+    return _pipe_frames(
+        itertools.chain([first], it),
+        lambda width, height: [
             ffmpeg,
             "-y",
-            "-framerate",
-            str(fps),
-            "-i",
-            input_pattern,
-            "-i",
-            palette,
+            *_rawvideo_input_args(width, height, fps),
             "-lavfi",
-            "paletteuse",
-            str(output_path),
-        ]
-        _run_ffmpeg(cmd2)
-    else:
-        crf = QUALITY_CRF.get(quality, "23")
-        cmd = [
-            ffmpeg,
-            "-y",
-            "-framerate",
-            str(fps),
-            "-i",
-            input_pattern,
-            "-c:v",
-            "libx264",
-            "-crf",
-            crf,
-            "-preset",
-            "medium",
-            "-pix_fmt",
-            "yuv420p",
-            "-movflags",
-            "+faststart",
+            _gif_filter_graph(palette_every),
             str(output_path),
-        ]
-        _run_ffmpeg(cmd)
+        ],
+        size,
+    )
+
+
+def _feed_chunk(pipe: _FFmpegPipe, frames: queue.Queue[np.ndarray | None]) -> int:
+    """Write queued frames to *pipe* until the ``None`` sentinel, then wait for FFmpeg.
+
+    The queue is always drained to the sentinel, even once FFmpeg has
+    exited, so the producer can never block on it.
+    """
+    alive = True
+    try:
+        while (img := frames.get()) is not None:
+            alive = alive and pipe.write(img)
+    except BaseException:
+        pipe.abort()
+        while frames.get() is not None:
+            pass
+        raise
+    return pipe.wait()
+
+
+def _encode_chunked(
+    frames: Iterable[np.ndarray],
+    fps: int,
+    quality: str,
+    output_path: Path,
+    work_dir: Path,
+    *,
+    workers: int = _ENCODE_WORKERS,
+    chunk_frames: int = _CHUNK_FRAMES,
+) -> int:
+    """Encode *frames* as H.264 chunks in parallel, then join them. Returns the frame count.
+
+    Each run of *chunk_frames* frames goes to its own FFmpeg process,
+    started when the chunk's first frame arrives. Frames reach it through
+    a bounded queue and a writer thread, so when one encoder falls behind
+    the next chunk is already rendering into the next process. At most
+    *workers* processes run at once, and together their queues hold at
+    most :data:`_CHUNK_QUEUE_BYTES` of frames; nothing is staged on disk
+    but the encoded chunks. Every chunk is a separate encode with the same
+    settings and so starts on a keyframe; the concat demuxer joins them
+    with ``-c copy``, without re-encoding. All chunks take the first
+    frame's size.
+    """
+    it = iter(frames)
+    first = next(it, None)
+    if first is None:
+        raise RuntimeError("No frames could be rendered")
+    size = (first.shape[1], first.shape[0])
+    it = itertools.chain([first], it)
+    queue_frames = max(1, _CHUNK_QUEUE_BYTES // (first.nbytes * workers))
+    chunk_dir = work_dir / "chunks"
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
+    # Split the cores between the encoders instead of each libx264 taking all of them.
+    chunk_args = ["-threads", str(max(1, (os.cpu_count() or 1) // workers))]
+
+    chunk_paths: list[Path] = []
+    count = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            live: deque[tuple[Future[int], _FFmpegPipe, queue.Queue[np.ndarray | None]]] = deque()
+            try:
+                while (img := next(it, None)) is not None:
+                    while len(live) >= workers:
+                        count += live.popleft()[0].result()
+                    chunk_paths.append(chunk_dir / f"chunk{len(chunk_paths):04d}.mp4")
+                    pipe = _FFmpegPipe(
+                        _rawvideo_mp4_cmd(ffmpeg, fps, quality, *size, chunk_paths[-1], chunk_args), size
+                    )
+                    chunk_queue: queue.Queue[np.ndarray | None] = queue.Queue(maxsize=queue_frames)
+                    live.append((pool.submit(_feed_chunk, pipe, chunk_queue), pipe, chunk_queue))
+                    for frame in itertools.chain([img], itertools.islice(it, chunk_frames - 1)):
+                        chunk_queue.put(frame)
+                    chunk_queue.put(None)
+                while live:
+                    count += live.popleft()[0].result()
+            except BaseException:
+                # Kill the live encoders; their writers then drain to the sentinel.
+                for _future, pipe, chunk_queue in live:
+                    pipe.kill()
+                    chunk_queue.put(None)
+                raise
+
+        list_file = chunk_dir / "chunks.txt"
+        list_file.write_text("".join(f"file '{path.name}'\n" for path in chunk_paths), encoding="utf-8")
+        _run_ffmpeg(
+            [
+                ffmpeg,
+                "-y",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(list_file),
+                "-c",
+                "copy",
+                "-movflags",
+                "+faststart",
+                str(output_path),
+            ]
+        )
+    finally:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+    logger.info("Encoded %d frames as %d parallel chunks", count, len(chunk_paths))
+    return count
+
+
+def _encode_draft(
+    frames: list[GoesFrame],
+    output_path: Path,
+    fps: int,
+    crop: CropPreset | None,
+    scale: str,
+    overlay: dict[str, Any] | None,
+    label_text: str,
+) -> bool:
+    """Encode a quick low-resolution preview from an even subsample of *frames*.
+
+    At most :data:`_DRAFT_MAX_FRAMES` frames are rendered at preview
+    resolution (capped at :data:`PREVIEW_MAX_WIDTH`) and encoded with the
+    ``ultrafast`` preset, so the draft is ready within seconds. The full
+    encode does not depend on it: a failure is logged and ``False``
+    returned.
+    """
+    sample = frames[:: math.ceil(len(frames) / _DRAFT_MAX_FRAMES)]
+    try:
+        rendered = _iter_rendered_frames(sample, None, crop, "preview", scale, overlay, label_text)
+        _encode_stream(rendered, fps, "low", output_path, preset="ultrafast")
+    except (subprocess.CalledProcessError, OSError, RuntimeError):
+        logger.warning("Draft preview %s failed; continuing with the full encode", output_path, exc_info=True)
+        output_path.unlink(missing_ok=True)
+        return False
+    return True
 
 
 def _run_ffmpeg(cmd: list[str]) -> None:
@@ -206,12 +710,27 @@ def _mark_animation_failed(session: Any, animation_id: str, error: str) -> None:
         if anim:
             anim.status = "failed"
             anim.error = error
+            anim.preview_path = None
             anim.completed_at = utcnow()
             session.commit()
     except SQLAlchemyError:
         logger.exception("Failed to mark animation %s as failed", animation_id)
 
 
+def _update_attached_animations(session: Any, job_id: str, animation_id: str, **fields: Any) -> None:
+    """Copy *fields* onto animations from identical requests that were attached to this job."""
+    from ..db.models import Animation
+
+    try:
+        session.query(Animation).filter(Animation.job_id == job_id, Animation.id != animation_id).update(
+            fields, synchronize_session=False
+        )
+        session.commit()
+    except SQLAlchemyError:
+        session.rollback()
+        logger.exception("Failed to update animations attached to job %s", job_id)
+
+
 @celery_app.task(
     bind=True,
     name="generate_animation",
@@ -231,6 +750,7 @@ def generate_animation(self: Any, job_id: str, animation_id: str) -> None:
 
     session = _get_sync_db()
     work_dir: Path | None = None
+    draft_path: Path | None = None
     try:
         anim = session.query(Animation).filter(Animation.id == animation_id).first()
         if not anim:
@@ -255,11 +775,13 @@ def generate_animation(self: Any, job_id: str, animation_id: str) -> None:
         if not frames:
             raise RuntimeError("No frames found")
 
-        frames = _apply_loop_style(frames, loop_style, fps)
+        # Each unique frame is rendered once; the loop tail is replayed at encode time.
+        output_frame_count = len(frames) + len(_loop_tail(len(frames), loop_style, fps))
 
         anim.status = "processing"
-        anim.frame_count = len(frames)
+        anim.frame_count = output_frame_count
         session.commit()
+        _update_attached_animations(session, job_id, animation_id, status="processing", frame_count=output_frame_count)
 
         crop = None
         if crop_preset_id:
@@ -267,27 +789,52 @@ def generate_animation(self: Any, job_id: str, animation_id: str) -> None:
 
         label_text = _build_overlay_label(overlay, frames)
 
+        ext = "gif" if fmt == "gif" else "mp4"
+        output_path = Path(settings.output_dir) / f"animation_{animation_id}.{ext}"
+
         work_dir = Path(settings.output_dir) / f"anim_{animation_id}"
-        work_dir.mkdir(parents=True, exist_ok=True)
+        if output_frame_count >= _DRAFT_MIN_FRAMES:
+            _publish_progress(job_id, 5, "Encoding draft preview...", "processing")
+            draft_path = Path(settings.output_dir) / f"animation_{animation_id}_draft.mp4"
+            if _encode_draft(frames, draft_path, fps, crop, scale, overlay, label_text):
+                anim.preview_path = str(draft_path)
+                session.commit()
+                _update_attached_animations(session, job_id, animation_id, preview_path=anim.preview_path)
+                _publish_progress(job_id, 8, "Draft preview ready", "processing")
 
         _publish_progress(job_id, 10, "Processing frames...", "processing")
-        _render_frames_to_dir(frames, work_dir, job_id, crop, resolution, scale, overlay, label_text)
-
-        _publish_progress(job_id, 75, "Encoding video...", "processing")
-
-        ext = "gif" if fmt == "gif" else "mp4"
-        output_path = Path(settings.output_dir) / f"animation_{animation_id}.{ext}"
-        _encode_output(fmt, fps, quality, work_dir, output_path)
+        rendered = _iter_rendered_frames(frames, job_id, crop, resolution, scale, overlay, label_text)
+        rendered = _with_loop_tail(rendered, loop_style, fps, work_dir)
+        if fmt == "gif":
+            palette_every = max(1, output_frame_count // _GIF_PALETTE_SAMPLE_FRAMES)
+            _encode_gif_stream(rendered, fps, output_path, output_frame_count, palette_every)
+        elif output_frame_count >= _CHUNKED_ENCODE_MIN_FRAMES and _ENCODE_WORKERS > 1:
+            _encode_chunked(rendered, fps, quality, output_path, work_dir)
+        else:
+            _encode_stream(rendered, fps, quality, output_path)
+        _publish_progress(job_id, 75, "Finalizing video...", "processing")
 
         file_size = output_path.stat().st_size if output_path.exists() else 0
-        duration_seconds = len(frames) / fps if fps > 0 else 0
+        duration_seconds = output_frame_count / fps if fps > 0 else 0
 
         anim.status = "completed"
         anim.output_path = str(output_path)
+        anim.preview_path = None
         anim.file_size = file_size
         anim.duration_seconds = round(duration_seconds, 1)
         anim.completed_at = utcnow()
         session.commit()
+        _update_attached_animations(
+            session,
+            job_id,
+            animation_id,
+            status="completed",
+            output_path=anim.output_path,
+            preview_path=None,
+            file_size=anim.file_size,
+            duration_seconds=anim.duration_seconds,
+            completed_at=anim.completed_at,
+        )
 
         _update_job_db(
             job_id,
@@ -295,14 +842,17 @@ def generate_animation(self: Any, job_id: str, animation_id: str) -> None:
             progress=100,
             output_path=str(output_path),
             completed_at=utcnow(),
-            status_message=f"Animation complete: {len(frames)} frames, {duration_seconds:.1f}s",
+            status_message=f"Animation complete: {output_frame_count} frames, {duration_seconds:.1f}s",
         )
-        _publish_progress(job_id, 100, f"Animation complete: {len(frames)} frames", "completed")
+        _publish_progress(job_id, 100, f"Animation complete: {output_frame_count} frames", "completed")
 
     except Exception as e:  # Task boundary: log failure, update job status, then re-raise for Celery retry
         logger.exception("Animation job %s failed", job_id)
         session.rollback()
         _mark_animation_failed(session, animation_id, str(e))
+        _update_attached_animations(
+            session, job_id, animation_id, status="failed", error=str(e), preview_path=None, completed_at=utcnow()
+        )
         _update_job_db(
             job_id,
             status="failed",
@@ -316,3 +866,118 @@ def generate_animation(self: Any, job_id: str, animation_id: str) -> None:
         session.close()
         if work_dir and work_dir.exists():
             shutil.rmtree(work_dir, ignore_errors=True)
+        if draft_path:
+            draft_path.unlink(missing_ok=True)
+
+
+def enqueue_rolling_refreshes(session: Any, streams: Iterable[tuple[str, str, str]]) -> int:
+    """Queue a refresh of every active rolling animation fed by *streams*.
+
+    *streams* are the ``(satellite, sector, band)`` triples that just
+    received frames. Returns the number of refreshes queued.
+    """
+    from sqlalchemy import and_, or_
+
+    from ..db.models import RollingAnimation
+
+    conditions = [
+        and_(RollingAnimation.satellite == sat, RollingAnimation.sector == sector, RollingAnimation.band == band)
+        for sat, sector, band in streams
+    ]
+    if not conditions:
+        return 0
+    try:
+        rows = session.query(RollingAnimation.id).filter(RollingAnimation.is_active.is_(True), or_(*conditions))
+        ids = [r.id for r in rows]
+    except SQLAlchemyError:
+        logger.exception("Failed to look up rolling animations to refresh")
+        session.rollback()
+        return 0
+    for rolling_id in ids:
+        update_rolling_animation.delay(rolling_id)
+    return len(ids)
+
+
+@celery_app.task(bind=True, name="update_rolling_animation", soft_time_limit=600, time_limit=660)
+def update_rolling_animation(self: Any, rolling_id: str) -> int:
+    """Encode frames newer than the rolling animation's last segment and slide its window.
+
+    Only new frames are rendered and encoded; see :mod:`app.services.rolling`.
+    Returns the number of frames encoded.
+    """
+    from datetime import timedelta
+
+    from ..db.models import CropPreset, GoesFrame, RollingAnimation
+    from ..services import rolling
+
+    # A failed refresh releases the lock so the next frames to arrive retry it.
+    with with_idempotency(f"rolling:{rolling_id}", release_on_error=True) as acquired:
+        if not acquired:
+            logger.info("Rolling animation %s refresh already running", rolling_id)
+            return 0
+
+        session = _get_sync_db()
+        try:
+            anim = session.get(RollingAnimation, rolling_id)
+            if not anim or not anim.is_active:
+                return 0
+
+            now = utcnow()
+            cutoff = now - timedelta(hours=anim.window_hours)
+            directory = rolling.rolling_dir(rolling_id)
+            directory.mkdir(parents=True, exist_ok=True)
+            state = rolling.load_state(directory)
+            # Resume from what the segments on disk hold; the row may disagree after a failed refresh.
+            resume_after = rolling.last_capture(state)
+            dropped = rolling.slide_window(state, cutoff)
+
+            query = session.query(GoesFrame).filter(
+                GoesFrame.satellite == anim.satellite,
+                GoesFrame.sector == anim.sector,
+                GoesFrame.band == anim.band,
+                GoesFrame.capture_time >= cutoff,
+            )
+            if resume_after:
+                query = query.filter(GoesFrame.capture_time > resume_after)
+            frames = query.order_by(GoesFrame.capture_time.asc()).all()
+
+            encoded = 0
+            if frames and rolling.chunk_due(state, len(frames), frames[0].capture_time, anim.fps, cutoff, now):
+                crop = session.get(CropPreset, anim.crop_preset_id) if anim.crop_preset_id else None
+                label_text = _build_overlay_label(anim.overlay, frames)
+                seq = state["next_seq"]
+                chunk_playlist = rolling.chunk_playlist_path(directory, seq)
+                rendered = _iter_rendered_frames(
+                    frames, None, crop, anim.resolution, anim.scale, anim.overlay, label_text
+                )
+                encoded = _encode_stream(
+                    rendered, anim.fps, anim.quality, chunk_playlist, rolling.chunk_hls_args(directory, seq)
+                )
+                segments = rolling.parse_chunk_playlist(chunk_playlist)
+                rolling.add_chunk(state, seq, segments, frames[0].capture_time, frames[-1].capture_time)
+                anim.last_capture_time = frames[-1].capture_time
+
+            expired = rolling.retire_chunks(state, dropped)
+            rolling.write_playlist(directory, state)
+            rolling.save_state(directory, state)
+            rolling.delete_chunks(directory, expired)
+
+            anim.segment_count = rolling.segment_count(state)
+            anim.duration_seconds = round(rolling.total_duration(state), 1)
+            anim.error = ""
+            anim.updated_at = now
+            session.commit()
+            logger.info(
+                "Rolling animation %s: encoded %d new frames, dropped %d chunks", rolling_id, encoded, len(dropped)
+            )
+            return encoded
+        except Exception as e:  # Task boundary: record the error on the rolling animation, then re-raise
+            logger.exception("Rolling animation %s refresh failed", rolling_id)
+            session.rollback()
+            anim = session.get(RollingAnimation, rolling_id)
+            if anim:
+                anim.error = str(e)
+                session.commit()
+            raise
+        finally:
+            session.close()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
+import os
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -21,24 +25,29 @@ from .helpers import _get_sync_db, _publish_progress, _update_job_db
 
 logger = logging.getLogger(__name__)
 
+#: Threads rendering a batch of composites. Decoding, resizing and PNG
+#: encoding release the GIL.
+_COMPOSITE_WORKERS = min(4, os.cpu_count() or 1)
 
-def _load_band_images(
+#: A band frame further than this from a composite's capture time counts as missing.
+_COMPOSITE_MATCH_TOLERANCE = timedelta(minutes=15)
+
+
+def _nearest_band_paths(
     session: Any,
     bands: list[str],
     satellite: str,
     sector: str,
     capture_time: datetime,
-) -> list[np.ndarray | None]:
-    """Load grayscale band images from the database, returning a list of arrays or None."""
-    import numpy as np
-    from PIL import Image as PILImage
+) -> list[str | None]:
+    """Image path of the frame nearest *capture_time* for each band in *bands* (None if it has no file)."""
     from sqlalchemy import func as sa_func
     from sqlalchemy import select as sa_select
 
     from ..db.models import GoesFrame
 
-    band_images = []
-    for band_name in bands[:3]:
+    paths: list[str | None] = []
+    for band_name in bands:
         query = (
             sa_select(GoesFrame)
             .where(
@@ -52,46 +61,72 @@ def _load_band_images(
             .limit(1)
         )
         frame = session.execute(query).scalars().first()
-        if frame and Path(frame.file_path).exists():
-            with PILImage.open(frame.file_path) as img:
-                band_images.append(np.array(img.convert("L"), dtype=np.float32))
-        else:
-            band_images.append(None)
-    return band_images
+        paths.append(frame.file_path if frame and Path(frame.file_path).exists() else None)
+    return paths
 
 
-def _normalize_band(band_array: np.ndarray, ref_shape: tuple[int, ...]) -> np.ndarray:
-    """Normalize a single band array to uint8, resizing if needed."""
+def _load_band_images(
+    session: Any,
+    bands: list[str],
+    satellite: str,
+    sector: str,
+    capture_time: datetime,
+) -> list[np.ndarray | None]:
+    """Load grayscale band images from the database, one array (or None) per band in *bands*."""
     import numpy as np
     from PIL import Image as PILImage
 
-    if band_array.shape != ref_shape:
-        bmin, bmax = band_array.min(), band_array.max()
-        normalized = (band_array - bmin) / (bmax - bmin) * 255 if bmax > bmin else np.zeros_like(band_array)
-        img_resized = PILImage.fromarray(normalized.astype(np.uint8)).resize(
-            (ref_shape[1], ref_shape[0]), PILImage.BILINEAR
-        )
-        band_array = np.array(img_resized, dtype=np.float32)
-    bmin, bmax = band_array.min(), band_array.max()
-    if bmax > bmin:
-        return ((band_array - bmin) / (bmax - bmin) * 255).astype(np.uint8)
-    return np.zeros_like(band_array, dtype=np.uint8)
+    band_images: list[np.ndarray | None] = []
+    for path in _nearest_band_paths(session, bands, satellite, sector, capture_time):
+        if path is None:
+            band_images.append(None)
+            continue
+        with PILImage.open(path) as img:
+            band_images.append(np.array(img.convert("L"), dtype=np.float32))
+    return band_images
 
 
-def _compose_rgb(band_images: list[np.ndarray | None]) -> Any:
-    """Stack band images into an RGB PIL image."""
-    import numpy as np
+def _load_cmi_images(recipe: str | None, bands: list[str], paths: list[str | None]) -> list[np.ndarray | None] | None:
+    """Memory-mapped CMI sidecars for *paths* (one per band), if *recipe* can use them.
+
+    Returns None, meaning use the 8-bit images, unless *recipe* has an
+    ``rgb_cmi`` variant and every band it references has a sidecar.
+    """
+    from ..routers._goes_shared import COMPOSITE_RECIPES
+    from ..services.band_math import compile_recipe
+    from ..services.cmi_store import load_cmi
+
+    lines = COMPOSITE_RECIPES.get(recipe or "", {}).get("rgb_cmi")
+    if not lines:
+        return None
+    images = [load_cmi(path) if path else None for path in paths]
+    loaded = {band for band, img in zip(bands, images, strict=True) if img is not None}
+    return images if compile_recipe(tuple(lines)).bands <= loaded else None
+
+
+def _compose_recipe(
+    recipe: str | None, bands: list[str], band_images: list[np.ndarray | None], *, cmi: bool = False
+) -> Any:
+    """Render *band_images* (one per name in *bands*) through *recipe*'s band-math as an RGB PIL image.
+
+    *cmi* selects the recipe's ``rgb_cmi`` lines, for images from
+    :func:`_load_cmi_images`. Recipes without an ``rgb`` entry stack their
+    first three bands, each stretched over its own range. Bands are resized
+    to the first loaded band's shape before evaluation.
+    """
+    import cv2
     from PIL import Image as PILImage
 
-    ref_shape = next(b.shape for b in band_images if b is not None)
-    channels = []
-    for b in band_images:
-        if b is None:
-            channels.append(np.zeros(ref_shape, dtype=np.uint8))
-        else:
-            channels.append(_normalize_band(b, ref_shape))
-    rgb = np.stack(channels, axis=-1)
-    return PILImage.fromarray(rgb, "RGB")
+    from ..routers._goes_shared import COMPOSITE_RECIPES
+    from ..services.band_math import compile_recipe
+
+    lines = COMPOSITE_RECIPES.get(recipe or "", {}).get("rgb_cmi" if cmi else "rgb") or tuple(bands[:3])
+    height, width = next(b.shape for b in band_images if b is not None)
+    inputs = {
+        name: img if img is None or img.shape == (height, width) else cv2.resize(img, (width, height))
+        for name, img in zip(bands, band_images, strict=True)
+    }
+    return PILImage.fromarray(compile_recipe(tuple(lines)).evaluate(inputs), "RGB")
 
 
 def _mark_composite_failed(composite_id: str, error: str) -> None:
@@ -121,6 +156,7 @@ def _mark_composite_failed(composite_id: str, error: str) -> None:
 def generate_composite(self: Any, composite_id: str, job_id: str, params: dict[str, Any]) -> None:
     """Generate a band composite image from multiple GOES bands."""
     from ..db.models import Composite
+    from ..routers._goes_shared import COMPOSITE_RECIPES
 
     logger.info("Starting composite generation %s", composite_id)
     _update_job_db(
@@ -136,17 +172,18 @@ def generate_composite(self: Any, composite_id: str, job_id: str, params: dict[s
         capture_time = datetime.fromisoformat(params["capture_time"])
         session = _get_sync_db()
         try:
-            band_images = _load_band_images(
-                session,
-                params["bands"],
-                params["satellite"],
-                params["sector"],
-                capture_time,
-            )
+            recipe, bands = params.get("recipe"), params["bands"]
+            band_images = None
+            if recipe and "rgb_cmi" in COMPOSITE_RECIPES.get(recipe, {}):
+                paths = _nearest_band_paths(session, bands, params["satellite"], params["sector"], capture_time)
+                band_images = _load_cmi_images(recipe, bands, paths)
+            cmi = band_images is not None
+            if band_images is None:
+                band_images = _load_band_images(session, bands, params["satellite"], params["sector"], capture_time)
             if not any(b is not None for b in band_images):
                 raise ValueError("No band images found for composite")
 
-            composite_img = _compose_rgb(band_images)
+            composite_img = _compose_recipe(recipe, bands, band_images, cmi=cmi)
 
             output_dir = Path(settings.output_dir) / "composites"
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -179,6 +216,157 @@ def generate_composite(self: Any, composite_id: str, job_id: str, params: dict[s
         raise
 
 
+def _query_band_frames(
+    session: Any,
+    bands: list[str],
+    satellite: str,
+    sector: str,
+    start: datetime,
+    end: datetime,
+) -> dict[str, list[tuple[datetime, str]]]:
+    """``(capture_time, file_path)`` of every frame of *bands* in ``[start, end]``, per band in time order.
+
+    One query with a bounded ``capture_time`` range, which can use
+    ``ix_goes_frames_sat_sector_band_capture``; ordering by distance to a
+    timestamp, as :func:`_load_band_images` does, cannot.
+    """
+    from sqlalchemy import select as sa_select
+
+    from ..db.models import GoesFrame
+
+    rows = session.execute(
+        sa_select(GoesFrame.band, GoesFrame.capture_time, GoesFrame.file_path)
+        .where(
+            GoesFrame.satellite == satellite,
+            GoesFrame.sector == sector,
+            GoesFrame.band.in_(bands),
+            GoesFrame.capture_time >= start,
+            GoesFrame.capture_time <= end,
+        )
+        .order_by(GoesFrame.capture_time.asc())
+    ).all()
+    by_band: dict[str, list[tuple[datetime, str]]] = {band: [] for band in bands}
+    for band, capture_time, file_path in rows:
+        by_band[band].append((capture_time, file_path))
+    return by_band
+
+
+def _nearest_frame(frames: list[tuple[datetime, str]], capture_time: datetime, tolerance: timedelta) -> str | None:
+    """Path of the frame in time-sorted *frames* closest to *capture_time*, if within *tolerance*."""
+    i = bisect.bisect_left(frames, capture_time, key=lambda f: f[0])
+    candidates = frames[max(0, i - 1) : i + 1]
+    if not candidates:
+        return None
+    nearest_time, path = min(candidates, key=lambda f: abs(f[0] - capture_time))
+    return path if abs(nearest_time - capture_time) <= tolerance else None
+
+
+def _decode_band(path: str) -> np.ndarray | None:
+    """Grayscale uint8 pixels of a band PNG, or None if it is missing or unreadable."""
+    import cv2
+
+    return cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+
+
+@celery_app.task(
+    bind=True,
+    name="generate_composites_batch",
+    autoretry_for=(ConnectionError, TimeoutError),
+    max_retries=3,
+    retry_backoff=True,
+    retry_backoff_max=300,
+    retry_jitter=True,
+)
+def generate_composites_batch(self: Any, items: list[dict[str, str]], params: dict[str, Any]) -> int:
+    """Generate the composites in *items* (``composite_id``, ``job_id``, ``capture_time``) in one task.
+
+    Band frames for the whole time span are loaded with one range query
+    and paired with each capture time in Python (nearest frame within
+    :data:`_COMPOSITE_MATCH_TOLERANCE`). Composites render on a thread
+    pool; a band frame shared by several composites is decoded once, and
+    CMI sidecars are memory-mapped instead where the recipe can use them.
+    Each composite and its job are updated as it finishes, and one
+    failure does not stop the rest. Returns the number completed.
+    """
+    from ..db.models import Composite
+
+    if not items:
+        return 0
+    recipe, bands = params.get("recipe"), params["bands"]
+    times = [datetime.fromisoformat(item["capture_time"]) for item in items]
+    output_dir = Path(settings.output_dir) / "composites"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    session = _get_sync_db()
+    try:
+        band_frames = _query_band_frames(
+            session,
+            bands,
+            params["satellite"],
+            params["sector"],
+            min(times) - _COMPOSITE_MATCH_TOLERANCE,
+            max(times) + _COMPOSITE_MATCH_TOLERANCE,
+        )
+    finally:
+        session.close()
+
+    # Decoded buffers are shared between composites and never modified.
+    decode = functools.lru_cache(maxsize=len(bands) * (_COMPOSITE_WORKERS + 1))(_decode_band)
+
+    def render(item: dict[str, str], capture_time: datetime) -> Path:
+        _update_job_db(
+            item["job_id"],
+            status="processing",
+            started_at=utcnow(),
+            status_message="Generating composite...",
+        )
+        paths = [_nearest_frame(band_frames[band], capture_time, _COMPOSITE_MATCH_TOLERANCE) for band in bands]
+        band_images = _load_cmi_images(recipe, bands, paths)
+        cmi = band_images is not None
+        if band_images is None:
+            band_images = [decode(path) if path else None for path in paths]
+        if not any(b is not None for b in band_images):
+            raise ValueError("No band images found for composite")
+        output_path = output_dir / f"{item['composite_id']}.png"
+        _compose_recipe(recipe, bands, band_images, cmi=cmi).save(str(output_path), "PNG")
+        return output_path
+
+    completed = 0
+    with ThreadPoolExecutor(max_workers=_COMPOSITE_WORKERS) as pool:
+        futures = [pool.submit(render, item, t) for item, t in zip(items, times, strict=True)]
+        for item, future in zip(items, futures, strict=True):
+            composite_id, job_id = item["composite_id"], item["job_id"]
+            try:
+                output_path = future.result()
+                session = _get_sync_db()
+                try:
+                    comp = session.query(Composite).filter(Composite.id == composite_id).first()
+                    if comp:
+                        comp.file_path = str(output_path)
+                        comp.file_size = output_path.stat().st_size
+                        comp.status = "completed"
+                    session.commit()
+                finally:
+                    session.close()
+            except Exception as e:  # Per-composite boundary: record the failure, keep going
+                logger.exception("Composite generation %s failed", composite_id)
+                _mark_composite_failed(composite_id, str(e))
+                _update_job_db(job_id, status="failed", error=str(e), completed_at=utcnow())
+                _publish_progress(job_id, 0, f"Error: {e}", "failed")
+                continue
+            completed += 1
+            _update_job_db(
+                job_id,
+                status="completed",
+                progress=100,
+                completed_at=utcnow(),
+                status_message="Composite generated",
+            )
+            _publish_progress(job_id, 100, "Composite generated", "completed")
+    logger.info("Generated %d/%d composites", completed, len(items))
+    return completed
+
+
 @celery_app.task(
     bind=True,
     name="fetch_composite_data",
@@ -272,18 +460,13 @@ def fetch_composite_data(self: Any, job_id: str, params: dict[str, Any]) -> None
             finally:
                 session.close()
 
-            for composite_id, comp_job_id, capture_time in composite_tasks:
-                generate_composite.delay(
-                    composite_id,
-                    comp_job_id,
-                    {
-                        "recipe": recipe,
-                        "satellite": satellite,
-                        "sector": sector,
-                        "capture_time": capture_time,
-                        "bands": bands,
-                    },
-                )
+            generate_composites_batch.delay(
+                [
+                    {"composite_id": composite_id, "job_id": comp_job_id, "capture_time": capture_time}
+                    for composite_id, comp_job_id, capture_time in composite_tasks
+                ],
+                {"recipe": recipe, "satellite": satellite, "sector": sector, "bands": bands},
+            )
 
         _update_job_db(
             job_id,
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import uuid
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +14,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from ..celery_app import celery_app
 from ..config import DEFAULT_SATELLITE, settings
+from ..services.cache import TAG_COLLECTIONS, TAG_FRAMES
 from ..services.job_logger import log_job_sync
 from ..utils import utcnow
 from .helpers import (
@@ -52,71 +52,32 @@ def _create_fetch_records(
     output_dir: str,
     results: list[dict],
 ) -> None:
-    """Create Image, GoesFrame, Collection, and CollectionFrame DB records."""
-    from ..db.models import Collection, CollectionFrame, GoesFrame, Image
-    from ..services.thumbnail import generate_thumbnail, get_image_dimensions
+    """Create Image, GoesFrame, Collection, and CollectionFrame DB records.
+
+    Frames are written in committed batches (see ``frame_ingest``), so they
+    become visible to the API while the rest of the job is still ingesting.
+    """
+    from .frame_ingest import get_or_create_collection, ingest_frames
 
     session = _get_sync_db()
     try:
         sat = results[0]["satellite"] if results else ""
         band = results[0]["band"] if results else ""
-        collection_name = f"GOES Fetch {sat} {sector} {band}"
-        existing_coll = session.query(Collection).filter(Collection.name == collection_name).first()
-        if existing_coll:
-            collection_id = existing_coll.id
-        else:
-            collection_id = str(uuid.uuid4())
-            collection = Collection(
-                id=collection_id,
-                name=collection_name,
-                description=f"Auto-created from fetch job {job_id}",
-            )
-            session.add(collection)
-
-        frame_ids = []
-        for frame in results:
-            path = Path(frame["path"])
-            file_size = path.stat().st_size if path.exists() else 0
-            width, height = get_image_dimensions(str(path))
-            thumb_path = generate_thumbnail(str(path), output_dir)
-
-            img_record = Image(
-                id=str(uuid.uuid4()),
-                filename=path.name,
-                original_name=path.name,
-                file_path=str(path),
-                file_size=file_size,
-                satellite=frame["satellite"],
-                channel=frame["band"],
-                captured_at=frame["scan_time"],
-                source="goes_fetch",
-                width=width,
-                height=height,
-            )
-            session.add(img_record)
-
-            gf_id = str(uuid.uuid4())
-            goes_frame = GoesFrame(
-                id=gf_id,
-                satellite=frame["satellite"],
-                sector=sector,
-                band=frame["band"],
-                capture_time=frame["scan_time"],
-                file_path=str(path),
-                file_size=file_size,
-                width=width,
-                height=height,
-                thumbnail_path=thumb_path,
-                source_job_id=job_id,
-            )
-            session.add(goes_frame)
-            frame_ids.append(gf_id)
-
-        session.flush()
-        for gf_id in frame_ids:
-            session.add(CollectionFrame(collection_id=collection_id, frame_id=gf_id))
-
-        session.commit()
+        collection_id = get_or_create_collection(
+            session,
+            f"GOES Fetch {sat} {sector} {band}",
+            f"Auto-created from fetch job {job_id}",
+        )
+        ingest_frames(
+            session,
+            results,
+            source="goes_fetch",
+            sector=sector,
+            job_id=job_id,
+            thumb_dir=output_dir,
+            collection_id=collection_id,
+            cache_tags=(TAG_FRAMES, TAG_COLLECTIONS),
+        )
     finally:
         session.close()
 
@@ -384,87 +345,24 @@ def _detect_gaps(
     sector: str | None,
     expected_interval: float,
 ) -> list[dict]:
-    """Query GoesFrame timestamps and return a list of gap dicts."""
-    from ..db.models import GoesFrame
+    """Return the coverage gaps (computed in SQL) as a list of gap dicts."""
+    from ..services.gap_detector import gap_rows_to_dicts, gaps_query
 
     session = _get_sync_db()
     try:
-        from sqlalchemy import select as sa_select
-
-        query = (
-            sa_select(GoesFrame.capture_time)
-            .where(GoesFrame.capture_time.isnot(None))
-            .order_by(GoesFrame.capture_time.asc())
-        )
-        if satellite:
-            query = query.where(GoesFrame.satellite == satellite)
-        if band:
-            query = query.where(GoesFrame.band == band)
-        if sector:
-            query = query.where(GoesFrame.sector == sector)
-        timestamps = [r[0] for r in session.execute(query).all()]
+        rows = session.execute(gaps_query(expected_interval * 1.5, satellite, band, sector)).all()
     finally:
         session.close()
-
-    threshold = expected_interval * 1.5
-    gaps: list[dict] = []
-    for i in range(1, len(timestamps)):
-        delta_minutes = (timestamps[i] - timestamps[i - 1]).total_seconds() / 60.0
-        if delta_minutes > threshold:
-            expected_frames = max(int(delta_minutes / expected_interval) - 1, 1)
-            gaps.append(
-                {
-                    "start": timestamps[i - 1].isoformat(),
-                    "end": timestamps[i].isoformat(),
-                    "duration_minutes": round(delta_minutes, 1),
-                    "expected_frames": expected_frames,
-                }
-            )
-    return gaps
+    return gap_rows_to_dicts(rows, expected_interval)
 
 
 def _create_backfill_image_records(results: list[dict]) -> None:
     """Create Image and GoesFrame records for backfilled frames."""
-    from ..db.models import GoesFrame, Image
-    from ..services.thumbnail import generate_thumbnail, get_image_dimensions
+    from .frame_ingest import ingest_frames
 
     session = _get_sync_db()
     try:
-        for frame in results:
-            path = Path(frame["path"])
-            file_size = path.stat().st_size if path.exists() else 0
-            width, height = get_image_dimensions(str(path))
-            thumb_path = generate_thumbnail(str(path), str(path.parent))
-
-            img_record = Image(
-                id=str(uuid.uuid4()),
-                filename=path.name,
-                original_name=path.name,
-                file_path=str(path),
-                file_size=file_size,
-                satellite=frame["satellite"],
-                channel=frame["band"],
-                captured_at=frame["scan_time"],
-                source="goes_fetch",
-                width=width,
-                height=height,
-            )
-            session.add(img_record)
-
-            goes_frame = GoesFrame(
-                id=str(uuid.uuid4()),
-                satellite=frame["satellite"],
-                sector=frame.get("sector", ""),
-                band=frame["band"],
-                capture_time=frame["scan_time"],
-                file_path=str(path),
-                file_size=file_size,
-                width=width,
-                height=height,
-                thumbnail_path=thumb_path,
-            )
-            session.add(goes_frame)
-        session.commit()
+        ingest_frames(session, results, source="goes_fetch", cache_tags=(TAG_FRAMES,))
     finally:
         session.close()
 
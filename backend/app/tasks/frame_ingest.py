@@ -0,0 +1,166 @@
+"""Bulk ingest of fetched frames into ``images`` / ``goes_frames``.
+
+The fetch tasks used to stat every PNG, re-open it for its dimensions,
+render its thumbnail and ``session.add`` two ORM objects per frame, all
+serially, with one commit at the very end — so nothing was visible to the
+API until the whole job had been written.
+
+:func:`ingest_frames` instead:
+
+* takes ``width``/``height``/``file_size`` from the frame dicts when the
+  conversion step supplied them (see ``thumbnail.save_image``), falling back
+  to reading the file only for frames that lack them;
+* renders thumbnails on a small thread pool (Pillow releases the GIL while
+  decoding/resampling), ahead of the batch currently being written;
+* writes each batch with one executemany ``INSERT`` per table, records the
+  batch in ``frame_stats`` (bulk inserts bypass the ORM flush listener) and
+  commits it — frames show up in listings batch by batch, and the API cache
+  tags are invalidated as each batch lands;
+* queues a refresh of the rolling animations fed by each ingested
+  satellite/sector/band once every batch has landed.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import insert
+
+from ..utils import batched
+from .helpers import _invalidate_cache_tags
+
+logger = logging.getLogger(__name__)
+
+#: Frames written (and committed) per batch.
+INGEST_BATCH_SIZE = 50
+
+#: Threads rendering thumbnails / reading missing metadata.
+_THUMBNAIL_WORKERS = 4
+
+
+def _prepare_frame(frame: dict, thumb_dir: str | None) -> tuple[int, int | None, int | None, str | None]:
+    """Return ``(file_size, width, height, thumbnail_path)`` for one frame."""
+    from ..services.thumbnail import generate_thumbnail, get_image_dimensions
+
+    path = Path(frame["path"])
+    file_size = frame.get("file_size")
+    if file_size is None:
+        file_size = path.stat().st_size if path.exists() else 0
+    width, height = frame.get("width"), frame.get("height")
+    if width is None or height is None:
+        width, height = get_image_dimensions(str(path))
+    thumb_path = generate_thumbnail(str(path), thumb_dir if thumb_dir is not None else str(path.parent))
+    return file_size, width, height, thumb_path
+
+
+def get_or_create_collection(session: Any, name: str, description: str) -> str:
+    """Return the id of the collection called *name*, creating it if needed.
+
+    Commits the new collection straight away so per-batch
+    ``collection_frames`` inserts can reference it.
+    """
+    from ..db.models import Collection
+
+    existing = session.query(Collection).filter(Collection.name == name).first()
+    if existing:
+        return existing.id
+    collection_id = str(uuid.uuid4())
+    session.add(Collection(id=collection_id, name=name, description=description))
+    session.commit()
+    return collection_id
+
+
+def ingest_frames(
+    session: Any,
+    frames: Sequence[dict],
+    *,
+    source: str,
+    sector: str | None = None,
+    job_id: str | None = None,
+    thumb_dir: str | None = None,
+    collection_id: str | None = None,
+    cache_tags: Sequence[str] = (),
+    batch_size: int = INGEST_BATCH_SIZE,
+) -> list[str]:
+    """Insert ``Image`` + ``GoesFrame`` rows for *frames* in committed batches.
+
+    *sector* overrides each frame's own ``"sector"`` key; *thumb_dir* defaults
+    to each PNG's directory. When *collection_id* is given every frame is
+    also added to that collection. Returns the new ``goes_frames`` ids.
+    """
+    from ..db.frame_stats import FrameRow, record_frames_added
+    from ..db.models import CollectionFrame, GoesFrame, Image
+
+    frame_ids: list[str] = []
+    if not frames:
+        return frame_ids
+    streams: set[tuple[str, str, str]] = set()
+
+    with ThreadPoolExecutor(max_workers=min(_THUMBNAIL_WORKERS, len(frames))) as pool:
+        prepared = pool.map(lambda f: _prepare_frame(f, thumb_dir), frames)
+        for batch in batched(zip(frames, prepared, strict=True), batch_size):
+            image_rows: list[dict] = []
+            frame_rows: list[dict] = []
+            for frame, (file_size, width, height, thumb_path) in batch:
+                path = Path(frame["path"])
+                image_rows.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "filename": path.name,
+                        "original_name": path.name,
+                        "file_path": str(path),
+                        "file_size": file_size,
+                        "satellite": frame["satellite"],
+                        "channel": frame["band"],
+                        "captured_at": frame["scan_time"],
+                        "source": source,
+                        "width": width,
+                        "height": height,
+                    }
+                )
+                frame_rows.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "satellite": frame["satellite"],
+                        "sector": sector if sector is not None else frame.get("sector", ""),
+                        "band": frame["band"],
+                        "capture_time": frame["scan_time"],
+                        "file_path": str(path),
+                        "file_size": file_size,
+                        "width": width,
+                        "height": height,
+                        "thumbnail_path": thumb_path,
+                        "source_job_id": job_id,
+                    }
+                )
+
+            session.execute(insert(Image), image_rows)
+            session.execute(insert(GoesFrame), frame_rows)
+            if collection_id is not None:
+                session.execute(
+                    insert(CollectionFrame),
+                    [{"collection_id": collection_id, "frame_id": row["id"]} for row in frame_rows],
+                )
+            record_frames_added(
+                session.connection(),
+                [
+                    FrameRow(r["satellite"], r["sector"], r["band"], r["capture_time"], r["file_size"])
+                    for r in frame_rows
+                ],
+            )
+            session.commit()
+            frame_ids.extend(row["id"] for row in frame_rows)
+            streams.update((r["satellite"], r["sector"], r["band"]) for r in frame_rows)
+            if cache_tags:
+                _invalidate_cache_tags(*cache_tags)
+            logger.debug("Ingested %d/%d frames", len(frame_ids), len(frames))
+
+    from .animation_tasks import enqueue_rolling_refreshes
+
+    enqueue_rolling_refreshes(session, streams)
+    return frame_ids
@@ -23,20 +23,16 @@ __all__ = [
     "_make_progress_callback",
     "_no_frames_message",
     "_read_max_frames_setting",
-    "_compose_rgb",
     "_load_band_images",
     "_mark_composite_failed",
-    "_normalize_band",
     "_publish_progress",
     "_update_job_db",
 ]
 
 # Re-export all public and private symbols used by tests and other modules
 from .composite_task import (  # noqa: F401
-    _compose_rgb,
     _load_band_images,
     _mark_composite_failed,
-    _normalize_band,
     fetch_composite_data,
     generate_composite,
 )
@@ -35,6 +35,13 @@ def _get_redis() -> Any:
     return _redis
 
 
+def _invalidate_cache_tags(*tags: str) -> None:
+    """Drop API cache entries tagged with *tags* after a worker-side mutation."""
+    from ..services.cache import invalidate_tags_sync
+
+    invalidate_tags_sync(_get_redis(), *tags)
+
+
 _sync_engine: Any = None
 _SessionFactory: Any = None
 
@@ -124,7 +131,9 @@ def _build_task_lock_key(key: str) -> str:
 
 
 @contextmanager
-def with_idempotency(key: str, ttl_seconds: int = TASK_IDEMPOTENCY_TTL_SECONDS) -> Iterator[bool]:
+def with_idempotency(
+    key: str, ttl_seconds: int = TASK_IDEMPOTENCY_TTL_SECONDS, *, release_on_error: bool = False
+) -> Iterator[bool]:
     """Distributed-lock context manager for Celery task idempotency (JTN-398).
 
     Wraps a block of worker-side work with a Redis ``SET key value NX EX``
@@ -144,7 +153,9 @@ def with_idempotency(key: str, ttl_seconds: int = TASK_IDEMPOTENCY_TTL_SECONDS)
     The lock is released on successful exit so that an eventually-run
     manual retry can proceed; on failure the lock is left in place until
     it expires, which prevents a flapping upstream error (e.g. S3 503s)
-    from hammering the service with duplicate retries.
+    from hammering the service with duplicate retries. Pass
+    ``release_on_error=True`` for work that is only re-triggered by a new
+    event (not retried), where a held lock would block it for the TTL.
 
     When Redis is unreachable the helper fails open: ``acquired`` is
     ``True`` so the task still runs. Losing dedup during an outage is a
@@ -168,9 +179,9 @@ def with_idempotency(key: str, ttl_seconds: int = TASK_IDEMPOTENCY_TTL_SECONDS)
         exc_raised = True
         raise
     finally:
-        if acquired and not exc_raised:
-            # Release the lock only on successful exit so repeated
-            # failures don't hammer the backend.
+        if acquired and (release_on_error or not exc_raised):
+            # By default release the lock only on successful exit so
+            # repeated failures don't hammer the backend.
             try:
                 client = _get_redis()
                 client.delete(redis_key)
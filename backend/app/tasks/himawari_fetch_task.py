@@ -8,7 +8,6 @@ records identical to the GOES pipeline.
 from __future__ import annotations
 
 import logging
-import uuid
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
@@ -20,6 +19,7 @@ from botocore.exceptions import ClientError
 
 from ..celery_app import celery_app
 from ..config import settings
+from ..services.cache import TAG_COLLECTIONS, TAG_FRAMES
 from ..services.goes_fetcher import _get_s3_client, _retry_s3_operation
 from ..services.himawari_catalog import (
     _build_himawari_prefix,
@@ -125,70 +125,27 @@ def _create_himawari_fetch_records(
     results: list[dict],
 ) -> None:
     """Create Image, GoesFrame, Collection, and CollectionFrame DB records."""
-    from ..db.models import Collection, CollectionFrame, GoesFrame, Image
-    from ..services.thumbnail import generate_thumbnail, get_image_dimensions
+    from .frame_ingest import get_or_create_collection, ingest_frames
 
     session = _get_sync_db()
     try:
         sat = results[0]["satellite"] if results else "Himawari-9"
         band = results[0]["band"] if results else ""
-        collection_name = f"Himawari Fetch {sat} {sector} {band}"
-        existing_coll = session.query(Collection).filter(Collection.name == collection_name).first()
-        if existing_coll:
-            collection_id = existing_coll.id
-        else:
-            collection_id = str(uuid.uuid4())
-            collection = Collection(
-                id=collection_id,
-                name=collection_name,
-                description=f"Auto-created from Himawari fetch job {job_id}",
-            )
-            session.add(collection)
-
-        frame_ids: list[str] = []
-        for frame in results:
-            path = Path(frame["path"])
-            file_size = path.stat().st_size if path.exists() else 0
-            width, height = get_image_dimensions(str(path))
-            thumb_path = generate_thumbnail(str(path), output_dir)
-
-            img_record = Image(
-                id=str(uuid.uuid4()),
-                filename=path.name,
-                original_name=path.name,
-                file_path=str(path),
-                file_size=file_size,
-                satellite=frame["satellite"],
-                channel=frame["band"],
-                captured_at=frame["scan_time"],
-                source="himawari_fetch",
-                width=width,
-                height=height,
-            )
-            session.add(img_record)
-
-            gf_id = str(uuid.uuid4())
-            goes_frame = GoesFrame(
-                id=gf_id,
-                satellite=frame["satellite"],
-                sector=sector,
-                band=frame["band"],
-                capture_time=frame["scan_time"],
-                file_path=str(path),
-                file_size=file_size,
-                width=width,
-                height=height,
-                thumbnail_path=thumb_path,
-                source_job_id=job_id,
-            )
-            session.add(goes_frame)
-            frame_ids.append(gf_id)
-
-        session.flush()
-        for gf_id in frame_ids:
-            session.add(CollectionFrame(collection_id=collection_id, frame_id=gf_id))
-
-        session.commit()
+        collection_id = get_or_create_collection(
+            session,
+            f"Himawari Fetch {sat} {sector} {band}",
+            f"Auto-created from Himawari fetch job {job_id}",
+        )
+        ingest_frames(
+            session,
+            results,
+            source="himawari_fetch",
+            sector=sector,
+            job_id=job_id,
+            thumb_dir=output_dir,
+            collection_id=collection_id,
+            cache_tags=(TAG_FRAMES, TAG_COLLECTIONS),
+        )
     finally:
         session.close()
 
@@ -338,7 +295,8 @@ def _process_single_band_frame(
 
     time_str = scan_time.strftime("%Y%m%d_%H%M")
     output_path = Path(output_dir) / f"{satellite}_{sector}_{band}_{time_str}.png"
-    hsd_to_png(segment_data, output_path)
+    info: dict = {}
+    hsd_to_png(segment_data, output_path, info=info)
 
     return {
         "satellite": satellite,
@@ -346,6 +304,7 @@ def _process_single_band_frame(
         "band": band,
         "scan_time": scan_time,
         "path": str(output_path),
+        **info,
     }
 
 
@@ -527,6 +486,7 @@ def _normalize_channel_percentile(
 def _composite_true_color(
     bands: list[np.ndarray],
     output_path: Path,
+    info: dict | None = None,
 ) -> Path:
     """Composite three band arrays (R, G, B) into an RGB PNG.
 
@@ -540,6 +500,8 @@ def _composite_true_color(
         Three float32 arrays [Red, Green, Blue].
     output_path : Path
         Where to write the PNG.
+    info : dict, optional
+        Updated with the PNG's ``width``, ``height`` and ``file_size``.
 
     Returns
     -------
@@ -548,6 +510,8 @@ def _composite_true_color(
     """
     from PIL import Image as PILImage
 
+    from ..services.thumbnail import save_image
+
     # Find the largest dimensions (B03/B02/B01 are all VIS so same res, but be safe)
     max_h = max(b.shape[0] for b in bands)
     max_w = max(b.shape[1] for b in bands)
@@ -563,7 +527,9 @@ def _composite_true_color(
     rgb = np.stack(channels, axis=-1)
     img = PILImage.fromarray(rgb, "RGB")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(str(output_path))
+    written = save_image(img, output_path)
+    if info is not None:
+        info.update(written)
     return output_path
 
 
@@ -590,7 +556,8 @@ def _process_true_color_frame(
 
     time_str = scan_time.strftime("%Y%m%d_%H%M")
     output_path = Path(output_dir) / f"{satellite}_{sector}_TrueColor_{time_str}.png"
-    _composite_true_color(band_arrays, output_path)
+    info: dict = {}
+    _composite_true_color(band_arrays, output_path, info=info)
 
     return {
         "satellite": satellite,
@@ -598,6 +565,7 @@ def _process_true_color_frame(
         "band": "TrueColor",
         "scan_time": scan_time,
         "path": str(output_path),
+        **info,
     }
 
 
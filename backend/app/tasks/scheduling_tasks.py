@@ -11,11 +11,12 @@ from celery.exceptions import SoftTimeLimitExceeded
 from sqlalchemy.exc import SQLAlchemyError
 
 if TYPE_CHECKING:
-    from ..db.models import CleanupRule, FetchPreset, FetchSchedule, GoesFrame
+    from ..db.models import FetchPreset, FetchSchedule
 
 from ..celery_app import celery_app
-from ..utils import safe_remove, utcnow
-from .helpers import _get_sync_db
+from ..services.cache import TAG_FRAMES
+from ..utils import utcnow
+from .helpers import _get_sync_db, _invalidate_cache_tags
 
 logger = logging.getLogger(__name__)
 
@@ -104,85 +105,16 @@ def check_schedules(self: Any) -> None:
         session.close()
 
 
-def _get_protected_frame_ids(session: Any, protect_collections: bool) -> set[str]:
-    """Return IDs of frames in collections if protection is enabled."""
-    from sqlalchemy import select as sa_select
-
-    from ..db.models import CollectionFrame
-
-    if not protect_collections:
-        return set()
-    rows = session.execute(sa_select(CollectionFrame.frame_id)).all()
-    return {r[0] for r in rows}
-
-
-def _collect_age_based_deletions(session: Any, rule: CleanupRule, protected_ids: set[str]) -> list[GoesFrame]:
-    """Find frames older than the rule's max age that are not protected."""
-    from ..db.models import GoesFrame
-
-    cutoff = utcnow() - timedelta(days=rule.value)
-    query = session.query(GoesFrame).filter(GoesFrame.created_at < cutoff)
-    if rule.satellite:
-        query = query.filter(GoesFrame.satellite == rule.satellite)
-    frames = query.all()
-    return [f for f in frames if f.id not in protected_ids]
-
-
-def _collect_storage_based_deletions(session: Any, rule: CleanupRule, protected_ids: set[str]) -> list[GoesFrame]:
-    """Find oldest frames to delete to bring storage under the limit."""
-    from sqlalchemy import func as sa_func
-    from sqlalchemy import select as sa_select
-
-    from ..db.models import GoesFrame
-
-    size_query = sa_select(sa_func.coalesce(sa_func.sum(GoesFrame.file_size), 0))
-    if rule.satellite:
-        size_query = size_query.where(GoesFrame.satellite == rule.satellite)
-    total_bytes = session.execute(size_query).scalar() or 0
-    max_bytes = rule.value * 1024 * 1024 * 1024
-
-    if total_bytes <= max_bytes:
-        return []
-
-    return _pick_frames_for_deletion(session, rule, protected_ids, total_bytes - max_bytes)
-
-
-def _pick_frames_for_deletion(session: Any, rule: CleanupRule, protected_ids: set[str], excess: int) -> list[GoesFrame]:
-    """Select oldest unprotected frames to free enough storage."""
-    from ..db.models import GoesFrame
-
-    freed = 0
-    result = []
-    batch_size = 500
-    offset = 0
-    while freed < excess:
-        query = session.query(GoesFrame).order_by(GoesFrame.created_at.asc())
-        if rule.satellite:
-            query = query.filter(GoesFrame.satellite == rule.satellite)
-        batch = query.offset(offset).limit(batch_size).all()
-        if not batch:
-            break
-        for f in batch:
-            if freed >= excess:
-                break
-            if f.id not in protected_ids:
-                result.append(f)
-                freed += f.file_size or 0
-        offset += batch_size
-    return result
-
-
-def _delete_frame_files(frame: GoesFrame) -> None:
-    """Remove a frame's files from disk."""
-    for path in [frame.file_path, frame.thumbnail_path]:
-        if path:
-            safe_remove(path)
-
-
 @celery_app.task(bind=True, name="run_cleanup", soft_time_limit=600, time_limit=660)
 def run_cleanup(self: Any) -> None:
-    """Run cleanup based on active rules."""
+    """Run cleanup based on active rules.
+
+    Uses the set-based engine in :mod:`app.services.cleanup`: candidates are
+    chosen in SQL and deleted in committed batches, so a run cut short by
+    the soft time limit keeps every batch it finished.
+    """
     from ..db.models import CleanupRule
+    from ..services.cleanup import run_cleanup_rules
 
     session = _get_sync_db()
     try:
@@ -191,28 +123,8 @@ def run_cleanup(self: Any) -> None:
             logger.info("No active cleanup rules")
             return
 
-        total_deleted = 0
-        total_freed = 0
-
-        for rule in rules:
-            protected_ids = _get_protected_frame_ids(session, rule.protect_collections)
-
-            if rule.rule_type == "max_age_days":
-                frames_to_delete = _collect_age_based_deletions(session, rule, protected_ids)
-            elif rule.rule_type == "max_storage_gb":
-                frames_to_delete = _collect_storage_based_deletions(session, rule, protected_ids)
-            else:
-                logger.warning("Unknown cleanup rule_type: %s", rule.rule_type)
-                frames_to_delete = []
-
-            for frame in frames_to_delete:
-                _delete_frame_files(frame)
-                total_freed += frame.file_size or 0
-                session.delete(frame)
-                total_deleted += 1
-
-        session.commit()
-        logger.info("Cleanup complete: deleted %d frames, freed %d bytes", total_deleted, total_freed)
+        result = run_cleanup_rules(session, rules, on_batch=lambda _n: _invalidate_cache_tags(TAG_FRAMES))
+        logger.info("Cleanup complete: deleted %d frames, freed %d bytes", result.deleted, result.freed_bytes)
 
     except SoftTimeLimitExceeded:
         session.rollback()
@@ -223,3 +135,27 @@ def run_cleanup(self: Any) -> None:
         logger.exception("Error running cleanup")
     finally:
         session.close()
+
+
+@celery_app.task(bind=True, name="rebuild_frame_stats", soft_time_limit=600, time_limit=660)
+def rebuild_frame_stats(self: Any) -> int:
+    """Recompute the ``frame_stats`` aggregates from ``goes_frames``.
+
+    Inserts and deletes keep the aggregates current on their own; this is
+    the repair path after out-of-band DB edits. Run it with
+    ``celery -A app.celery_app call rebuild_frame_stats``.
+    """
+    from ..db.frame_stats import rebuild_frame_stats as _rebuild
+
+    session = _get_sync_db()
+    try:
+        buckets = _rebuild(session.connection())
+        session.commit()
+        logger.info("Rebuilt frame_stats: %d buckets", buckets)
+        return buckets
+    except SQLAlchemyError:
+        session.rollback()
+        logger.exception("Error rebuilding frame_stats")
+        raise
+    finally:
+        session.close()
@@ -0,0 +1,50 @@
+"""Celery task building a frame's tile pyramid (see ``services.tiles``)."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from ..celery_app import celery_app
+from ..config import settings
+from .helpers import _get_sync_db
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name="generate_frame_tiles", soft_time_limit=300, time_limit=360)
+def generate_frame_tiles(self: Any, frame_id: str) -> int:
+    """Build the pyramid for the frame's current source file. Returns the tile count.
+
+    A no-op when the current version already exists, so duplicate
+    enqueues are cheap.
+    """
+    from ..db.models import GoesFrame
+    from ..services.tiles import build_tile_pyramid, prune_old_versions, pyramid_dir, tile_version
+
+    session = _get_sync_db()
+    try:
+        frame = session.get(GoesFrame, frame_id)
+        file_path = frame.file_path if frame else None
+    finally:
+        session.close()
+    if not file_path:
+        logger.warning("Tile build skipped, frame not found: %s", frame_id)
+        return 0
+
+    source = Path(file_path)
+    if not source.is_absolute():
+        source = Path(settings.storage_path) / source
+    if not source.exists():
+        logger.warning("Tile build skipped, source missing: %s", source)
+        return 0
+
+    version = tile_version(source)
+    out_dir = pyramid_dir(frame_id, version)
+    if out_dir.is_dir():
+        return 0
+    count = build_tile_pyramid(source, out_dir)
+    prune_old_versions(frame_id, version)
+    logger.info("Built %d tiles for frame %s", count, frame_id)
+    return count
@@ -5,7 +5,10 @@ from __future__ import annotations
 import logging
 import os
 import re
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,13 @@ def safe_remove(path: str | os.PathLike[str]) -> int:
         return 0
 
 
+def batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to *size* consecutive items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 _CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f-\x9f]")
 
 
@@ -0,0 +1,72 @@
+"""
+Band-Math Recipe Throughput
+---------------------------
+Renders the Dust/Ash and Airmass recipes over synthetic full-disk-sized
+uint8 bands with the tiled band-math engine and with the equivalent
+whole-array NumPy expressions, reporting recipes/sec and peak traced
+memory for each.
+
+Run standalone:
+    cd backend && python -m benchmarks.band_math [size] [repeats]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from app.routers._goes_shared import COMPOSITE_RECIPES
+from app.services.band_math import compile_recipe
+
+DEFAULT_SIZE = 4096
+DEFAULT_REPEATS = 3
+
+
+def _stretch(values: np.ndarray, lo: float | None = None, hi: float | None = None, gamma: float = 1.0) -> np.ndarray:
+    lo = float(values.min()) if lo is None else lo
+    hi = float(values.max()) if hi is None else hi
+    scaled = np.clip((values - lo) / (hi - lo), 0, 1) ** (1 / gamma)
+    return (scaled * 255).astype(np.uint8)
+
+
+def naive_dust_ash(b: dict[str, np.ndarray]) -> np.ndarray:
+    f = {k: v.astype(np.float32) for k, v in b.items()}
+    return np.dstack([_stretch(f["C15"] - f["C13"]), _stretch(f["C14"] - f["C11"], gamma=2.5), _stretch(f["C13"])])
+
+
+def naive_airmass(b: dict[str, np.ndarray]) -> np.ndarray:
+    f = {k: v.astype(np.float32) for k, v in b.items()}
+    return np.dstack([_stretch(f["C08"] - f["C10"]), _stretch(f["C12"] - f["C13"]), _stretch(f["C08"], 255, 0)])
+
+
+def synthetic_bands(names: list[str], size: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    return {name: rng.integers(0, 256, (size, size), dtype=np.uint8) for name in names}
+
+
+def _measure(label: str, fn, repeats: int) -> None:
+    fn()  # warm-up (recipe compile, page faults)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {repeats / elapsed:>10.2f} {peak / 2**20:>14.1f}")
+
+
+def run_benchmarks(size: int, repeats: int) -> None:
+    print(f"{size}x{size} uint8 bands, {repeats} renders each\n")
+    print(f"{'recipe':<24} {'recipes/sec':>10} {'peak mem MiB':>14}")
+    for recipe_id, naive in (("dust_ash", naive_dust_ash), ("airmass", naive_airmass)):
+        recipe = COMPOSITE_RECIPES[recipe_id]
+        bands = synthetic_bands(recipe["bands"], size)
+        compiled = compile_recipe(recipe["rgb"])
+        _measure(f"{recipe_id} (naive)", lambda b=bands, n=naive: n(b), repeats)
+        _measure(f"{recipe_id} (tiled)", lambda b=bands, c=compiled: c.evaluate(b), repeats)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run_benchmarks(args[0] if args else DEFAULT_SIZE, args[1] if len(args) > 1 else DEFAULT_REPEATS)
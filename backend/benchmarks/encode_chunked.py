@@ -0,0 +1,71 @@
+"""
+Chunked vs Single-Process Encode
+--------------------------------
+Compares wall-clock time of the single FFmpeg pipe (``_encode_stream``)
+against the parallel chunked encode (``_encode_chunked``) on a synthetic
+loop. Requires ``ffmpeg`` on PATH.
+
+Run standalone:
+    cd backend && python -m benchmarks.encode_chunked [frames] [width] [height]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from app.tasks.animation_tasks import _ENCODE_WORKERS, _encode_chunked, _encode_stream
+
+DEFAULT_FRAMES = 1200
+DEFAULT_SIZE = (1920, 1080)
+
+
+def synthetic_frames(count: int, width: int, height: int):
+    """Yield drifting gradient + noise frames, so the encoder has motion to code."""
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    grad = np.linspace(0, 255, width, dtype=np.uint8)
+    for i in range(count):
+        frame = np.roll(base, i * 4, axis=1)
+        frame[:, :, 1] = (frame[:, :, 1].astype(np.uint16) + np.roll(grad, i)) // 2
+        yield frame
+
+
+def _time(label: str, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:>8.2f} s")
+    return elapsed
+
+
+def run_benchmarks(count: int, width: int, height: int) -> None:
+    if not shutil.which("ffmpeg"):
+        sys.exit("ffmpeg not found on PATH")
+    tmp_dir = Path(tempfile.mkdtemp(prefix="encode_bench_"))
+    print(f"{count} frames at {width}x{height}, {_ENCODE_WORKERS} encode workers\n")
+    try:
+        single = _time(
+            "single process",
+            lambda: _encode_stream(synthetic_frames(count, width, height), 30, "medium", tmp_dir / "single.mp4"),
+        )
+        chunked = _time(
+            "chunked",
+            lambda: _encode_chunked(
+                synthetic_frames(count, width, height), 30, "medium", tmp_dir / "chunked.mp4", tmp_dir
+            ),
+        )
+        print(f"\nspeedup: {single / chunked:.2f}x")
+        for name in ("single.mp4", "chunked.mp4"):
+            print(f"{name:<28} {(tmp_dir / name).stat().st_size / 1e6:>8.2f} MB")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:4]]
+    frames = args[0] if args else DEFAULT_FRAMES
+    width, height = args[1:3] if len(args) == 3 else DEFAULT_SIZE
+    run_benchmarks(frames, width, height)
@@ -1,5 +1,6 @@
 """Shared test fixtures for backend API tests."""
 
+import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -79,6 +80,42 @@ async def setup_db():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest_asyncio.fixture
+async def shared_db(monkeypatch):
+    """DB session for endpoints that hand work to sync sessions (opt-in, use instead of ``db``).
+
+    The default in-memory database is private to the async engine. This one
+    is a named shared-cache in-memory database, and both the app and the
+    task helpers' sync session factory are bound to it, so work that runs
+    on ``_get_sync_db()`` in a thread sees what the test wrote.
+    """
+    from app.tasks import helpers as task_helpers
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    url = f"sqlite+aiosqlite:///file:test_{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true"
+    async_engine = create_async_engine(url, poolclass=StaticPool)
+    sync_engine = create_engine(
+        url.replace("+aiosqlite", ""), poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override():
+        async with session_factory() as session:
+            yield session
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, override)
+    monkeypatch.setattr(task_helpers, "_sync_engine", sync_engine)
+    monkeypatch.setattr(task_helpers, "_SessionFactory", sessionmaker(bind=sync_engine))
+    async with session_factory() as session:
+        yield session
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
 @pytest_asyncio.fixture
 async def client():
     """Async HTTP client for testing."""
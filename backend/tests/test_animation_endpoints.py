@@ -283,3 +283,165 @@ async def test_create_animation_with_frames(client, db):
     data = resp.json()
     assert data["status"] == "pending"
     assert data["frame_count"] == 3
+
+
+# ── Whole-output reuse ───────────────────────────────────
+
+
+async def _make_source_frames(tmp_path, count=3):
+    from tests.conftest import TestSessionLocal
+
+    frame_ids = []
+    async with TestSessionLocal() as session:
+        for i in range(count):
+            src = tmp_path / f"src_{i}.png"
+            src.write_bytes(b"png")
+            frame = GoesFrame(
+                satellite="GOES-16",
+                sector="CONUS",
+                band="C02",
+                capture_time=datetime.now(UTC) - timedelta(minutes=i * 10),
+                file_path=str(src),
+                file_size=3,
+            )
+            session.add(frame)
+            await session.flush()
+            frame_ids.append(str(frame.id))
+        await session.commit()
+    return frame_ids
+
+
+async def _post_animation(client, frame_ids, **overrides):
+    with patch("app.tasks.animation_tasks.generate_animation") as mock_task:
+        resp = await client.post(
+            "/api/satellite/animations", json={"frame_ids": frame_ids, "fps": 10, "format": "mp4", **overrides}
+        )
+    assert resp.status_code == 200
+    return resp.json(), mock_task.delay.call_count
+
+
+async def _complete_animation(animation_id, output_path):
+    from app.db.models import Animation
+    from app.utils import utcnow
+    from sqlalchemy import update
+
+    from tests.conftest import TestSessionLocal
+
+    async with TestSessionLocal() as session:
+        await session.execute(
+            update(Animation)
+            .where(Animation.id == animation_id)
+            .values(status="completed", output_path=str(output_path), file_size=6, completed_at=utcnow())
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_identical_request_attaches_to_in_progress_job(client, db, tmp_path):
+    frame_ids = await _make_source_frames(tmp_path)
+
+    first, queued_first = await _post_animation(client, frame_ids)
+    second, queued_second = await _post_animation(client, list(reversed(frame_ids)), name="Second")
+    different, queued_different = await _post_animation(client, frame_ids, fps=24)
+
+    assert (queued_first, queued_second, queued_different) == (1, 0, 1)
+    assert second["id"] != first["id"]
+    assert second["job_id"] == first["job_id"]
+    assert second["status"] == "pending"
+    assert different["job_id"] != first["job_id"]
+
+
+@pytest.mark.asyncio
+async def test_identical_request_links_completed_output(client, db, tmp_path):
+    import os
+
+    frame_ids = await _make_source_frames(tmp_path)
+    for i in range(3):
+        os.utime(tmp_path / f"src_{i}.png", (1_000_000, 1_000_000))
+    first, _ = await _post_animation(client, frame_ids)
+    output = tmp_path / "animation_first.mp4"
+    output.write_bytes(b"video!")
+    await _complete_animation(first["id"], output)
+
+    linked, queued = await _post_animation(client, frame_ids)
+    assert queued == 0
+    assert linked["status"] == "completed"
+    assert linked["output_path"] == str(output)
+    assert linked["file_size"] == 6
+
+    # A source file rewritten after the render invalidates the output.
+    later = datetime.now(UTC).timestamp() + 60
+    os.utime(tmp_path / "src_1.png", (later, later))
+    rerendered, queued = await _post_animation(client, frame_ids)
+    assert queued == 1
+    assert rerendered["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_attached_animation_catches_up_with_job_finished_meanwhile(client, db, tmp_path):
+    from app.routers import animations
+
+    frame_ids = await _make_source_frames(tmp_path)
+    first, _ = await _post_animation(client, frame_ids)
+    output = tmp_path / "animation_race.mp4"
+    output.write_bytes(b"video!")
+    find = animations._find_reusable_animation
+
+    async def find_then_finish(*args):
+        # The worker completes the job before the attached row is committed.
+        source = await find(*args)
+        await _complete_animation(first["id"], output)
+        return source
+
+    with patch.object(animations, "_find_reusable_animation", find_then_finish):
+        attached, queued = await _post_animation(client, frame_ids)
+
+    assert queued == 0
+    assert attached["job_id"] == first["job_id"]
+    assert attached["status"] == "completed"
+    assert attached["output_path"] == str(output)
+    assert attached["file_size"] == 6
+
+
+@pytest.mark.asyncio
+async def test_delete_keeps_shared_output_until_last_animation(client, db, tmp_path):
+    frame_ids = await _make_source_frames(tmp_path)
+    first, _ = await _post_animation(client, frame_ids)
+    output = tmp_path / "animation_shared.mp4"
+    output.write_bytes(b"video!")
+    await _complete_animation(first["id"], output)
+    linked, _ = await _post_animation(client, frame_ids)
+    assert linked["output_path"] == str(output)
+
+    assert (await client.delete(f"/api/satellite/animations/{first['id']}")).status_code == 200
+    assert output.exists()
+    assert (await client.delete(f"/api/satellite/animations/{linked['id']}")).status_code == 200
+    assert not output.exists()
+
+
+@pytest.mark.asyncio
+async def test_animation_preview_served_while_rendering(client, db, tmp_path):
+    from app.db.models import Animation
+
+    from tests.conftest import TestSessionLocal
+
+    draft = tmp_path / "animation_draft.mp4"
+    async with TestSessionLocal() as session:
+        anim = Animation(name="Draft", status="processing")
+        session.add(anim)
+        await session.commit()
+        anim_id = anim.id
+
+    resp = await client.get(f"/api/satellite/animations/{anim_id}/preview")
+    assert resp.status_code == 404
+
+    draft.write_bytes(b"draft")
+    async with TestSessionLocal() as session:
+        (await session.get(Animation, anim_id)).preview_path = str(draft)
+        await session.commit()
+
+    resp = await client.get(f"/api/satellite/animations/{anim_id}/preview")
+    assert resp.status_code == 200
+    assert resp.content == b"draft"
+    assert resp.headers["cache-control"] == "no-cache"
+    assert (await client.get(f"/api/satellite/animations/{anim_id}")).json()["preview_path"] == str(draft)
@@ -9,16 +9,23 @@ import pytest
 from app.tasks.animation_tasks import (
     PREVIEW_MAX_WIDTH,
     QUALITY_CRF,
-    _apply_loop_style,
     _apply_overlay,
     _build_overlay_label,
-    _encode_output,
     _mark_animation_failed,
     _process_single_frame,
-    _render_frames_to_dir,
     _run_ffmpeg,
 )
 
+
+@pytest.fixture(autouse=True)
+def _isolated_render_cache(tmp_path):
+    from app.services.render_cache import RenderCache
+
+    cache = RenderCache(root=tmp_path / "render_cache")
+    with patch("app.services.render_cache.render_cache", cache):
+        yield cache
+
+
 # ── Constants ────────────────────────────────────────────
 
 
@@ -30,38 +37,6 @@ def test_preview_max_width():
     assert PREVIEW_MAX_WIDTH == 1024
 
 
-# ── _apply_loop_style ───────────────────────────────────
-
-
-class TestApplyLoopStyle:
-    def test_forward(self):
-        frames = [1, 2, 3]
-        assert _apply_loop_style(frames, "forward", 10) == [1, 2, 3]
-
-    def test_pingpong(self):
-        frames = [1, 2, 3, 4]
-        result = _apply_loop_style(frames, "pingpong", 10)
-        assert result == [1, 2, 3, 4, 3, 2]
-
-    def test_pingpong_two_frames(self):
-        # 2-frame pingpong should bounce: [A, B, A]
-        assert _apply_loop_style([1, 2], "pingpong", 10) == [1, 2, 1]
-
-    def test_hold(self):
-        frames = [1, 2, 3]
-        result = _apply_loop_style(frames, "hold", 5)
-        assert result == [1, 2, 3] + [3] * 10  # fps*2 = 10
-
-    def test_empty_frames(self):
-        assert _apply_loop_style([], "hold", 10) == []
-
-    def test_empty_frames_pingpong(self):
-        assert _apply_loop_style([], "pingpong", 10) == []
-
-    def test_unknown_style(self):
-        assert _apply_loop_style([1, 2], "unknown", 10) == [1, 2]
-
-
 # ── _build_overlay_label ────────────────────────────────
 
 
@@ -129,67 +104,31 @@ class TestProcessSingleFrame:
         assert result.shape == (300, 500, 3)
 
 
-# ── _render_frames_to_dir ───────────────────────────────
+# ── _iter_rendered_frames: missing and overlaid sources ─
 
 
-class TestRenderFramesToDir:
+class TestRenderFrames:
     @patch("app.tasks.animation_tasks._update_job_db")
     @patch("app.tasks.animation_tasks._publish_progress")
-    def test_skips_missing_file(self, mock_pub, mock_upd, tmp_path):
+    def test_skips_missing_file(self, mock_pub, mock_upd):
+        from app.tasks.animation_tasks import _iter_rendered_frames
+
         frame = SimpleNamespace(file_path="/nonexistent/img.png")
-        count = _render_frames_to_dir([frame], tmp_path, "j1", None, "full", "100%", None, "")
-        assert count == 0
-        assert list(tmp_path.glob("frame*.png")) == []
+        assert list(_iter_rendered_frames([frame], None, None, "full", "100%", None, "")) == []
 
     @patch("app.tasks.animation_tasks._update_job_db")
     @patch("app.tasks.animation_tasks._publish_progress")
     def test_processes_existing_frame(self, mock_pub, mock_upd, tmp_path):
         import cv2
         import numpy as np
+        from app.tasks.animation_tasks import _iter_rendered_frames
 
         src = tmp_path / "src.png"
-        img = np.zeros((100, 100, 3), dtype=np.uint8)
-        cv2.imwrite(str(src), img)
+        cv2.imwrite(str(src), np.zeros((100, 100, 3), dtype=np.uint8))
 
         frame = SimpleNamespace(file_path=str(src))
-        work = tmp_path / "work"
-        work.mkdir()
-        _render_frames_to_dir([frame], work, "j1", None, "full", "100%", None, "")
-        assert (work / "frame000000.png").exists()
-
-
-# ── _encode_output ──────────────────────────────────────
-
-
-class TestEncodeOutput:
-    @patch("app.tasks.animation_tasks.subprocess.run")
-    @patch("app.tasks.animation_tasks.shutil.which", return_value="/usr/bin/ffmpeg")
-    def test_gif_encoding(self, mock_which, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0)
-        out = tmp_path / "out.gif"
-        _encode_output("gif", 10, "medium", tmp_path, out)
-        assert mock_run.call_count == 2  # palette + encode
-
-    @patch("app.tasks.animation_tasks.subprocess.run")
-    @patch("app.tasks.animation_tasks.shutil.which", return_value=None)
-    def test_mp4_encoding(self, mock_which, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0)
-        out = tmp_path / "out.mp4"
-        _encode_output("mp4", 10, "high", tmp_path, out)
-        assert mock_run.call_count == 1
-        cmd = mock_run.call_args[0][0]
-        assert "-crf" in cmd
-        idx = cmd.index("-crf")
-        assert cmd[idx + 1] == "18"
-
-    @patch("app.tasks.animation_tasks.subprocess.run")
-    @patch("app.tasks.animation_tasks.shutil.which", return_value=None)
-    def test_mp4_unknown_quality_defaults(self, mock_which, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0)
-        _encode_output("mp4", 10, "ultra", tmp_path, tmp_path / "o.mp4")
-        cmd = mock_run.call_args[0][0]
-        idx = cmd.index("-crf")
-        assert cmd[idx + 1] == "23"
+        [img] = _iter_rendered_frames([frame], None, None, "full", "100%", None, "")
+        assert img.shape == (100, 100, 3)
 
 
 # ── _mark_animation_failed ─────────────────────────────
@@ -293,7 +232,7 @@ class TestRunFfmpeg:
             _run_ffmpeg(["ffmpeg", "-invalid"])
 
 
-# ── _render_frames_to_dir with overlay ──────────────────
+# ── _iter_rendered_frames with overlay ──────────────────
 
 
 class TestRenderFramesWithOverlay:
@@ -304,6 +243,7 @@ class TestRenderFramesWithOverlay:
 
         import cv2
         import numpy as np
+        from app.tasks.animation_tasks import _iter_rendered_frames
 
         src = tmp_path / "src.png"
         img = np.zeros((100, 100, 3), dtype=np.uint8)
@@ -312,9 +252,535 @@ class TestRenderFramesWithOverlay:
         frame = SimpleNamespace(
             file_path=str(src), capture_time=datetime(2024, 1, 1, 12, 0, 0), satellite="G16", sector="CONUS", band="C02"
         )
-        work = tmp_path / "work"
-        work.mkdir()
         overlay = {"label": True, "timestamp": True}
-        count = _render_frames_to_dir([frame], work, "j1", None, "full", "100%", overlay, "G16 CONUS Band 02")
-        assert count == 1
-        assert (work / "frame000000.png").exists()
+        rendered = list(_iter_rendered_frames([frame], None, None, "full", "100%", overlay, "G16 CONUS Band 02"))
+        assert len(rendered) == 1
+        assert rendered[0].any()  # text was drawn on the black frame
+
+
+# ── _encode_stream (rawvideo over stdin) ────────────────
+
+_FAKE_FFMPEG = """#!{python}
+import sys
+if "early" in sys.argv[-1]:
+    sys.exit(3)
+data = sys.stdin.buffer.read()
+if "fail" in sys.argv[-1]:
+    sys.stderr.write("boom")
+    sys.exit(1)
+with open(sys.argv[-1], "wb") as fh:
+    fh.write(" ".join(sys.argv[1:]).encode() + b"\\n" + str(len(data)).encode())
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path):
+    """A stand-in ffmpeg that drains stdin and records argv + byte count in the output."""
+    import sys
+
+    script = tmp_path / "ffmpeg"
+    script.write_text(_FAKE_FFMPEG.format(python=sys.executable))
+    script.chmod(0o755)
+    with patch("app.tasks.animation_tasks.shutil.which", return_value=str(script)):
+        yield script
+
+
+class TestEncodeStream:
+    def test_pipes_raw_bgr_frames(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_stream
+
+        frames = [np.zeros((40, 60, 3), dtype=np.uint8), np.zeros((80, 120, 3), dtype=np.uint8)]
+        out = tmp_path / "out.mp4"
+
+        assert _encode_stream(iter(frames), 10, "high", out) == 2
+        args, nbytes = out.read_text().rsplit("\n", 1)
+        assert "-f rawvideo -pix_fmt bgr24 -s 60x40" in args
+        assert "-crf 18" in args
+        assert int(nbytes) == 2 * 40 * 60 * 3  # second frame resized to the first
+
+    def test_ffmpeg_failure_raises(self, fake_ffmpeg, tmp_path):
+        import subprocess
+
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_stream
+
+        with pytest.raises(subprocess.CalledProcessError) as exc:
+            _encode_stream([np.zeros((4, 4, 3), dtype=np.uint8)], 10, "medium", tmp_path / "fail.mp4")
+        assert exc.value.stderr == b"boom"
+
+    def test_ffmpeg_exiting_before_reading_raises(self, fake_ffmpeg, tmp_path):
+        import subprocess
+
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_stream
+
+        frames = [np.zeros((400, 600, 3), dtype=np.uint8)] * 4  # more than a pipe buffer
+        with pytest.raises(subprocess.CalledProcessError) as exc:
+            _encode_stream(frames, 10, "medium", tmp_path / "early.mp4")
+        assert exc.value.returncode == 3
+
+    def test_no_frames(self, tmp_path):
+        from app.tasks.animation_tasks import _encode_stream
+
+        with pytest.raises(RuntimeError):
+            _encode_stream([], 10, "medium", tmp_path / "o.mp4")
+
+
+class TestEncodeGifStream:
+    def test_single_run_over_piped_frames(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_gif_stream
+
+        frames = [np.zeros((40, 60, 3), dtype=np.uint8)] * 3
+        out = tmp_path / "out.gif"
+
+        assert _encode_gif_stream(iter(frames), 10, out, 3, palette_every=5) == 3
+        args, nbytes = out.read_text().rsplit("\n", 1)
+        assert "-f rawvideo -pix_fmt bgr24 -s 60x40" in args
+        assert "split[a][b];[a]select='not(mod(n\\,5))',palettegen[p];[b][p]paletteuse" in args
+        assert int(nbytes) == 3 * 40 * 60 * 3
+
+    def test_scales_down_when_ffmpeg_would_queue_too_much(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks import animation_tasks
+        from app.tasks.animation_tasks import _encode_gif_stream
+
+        frames = [np.zeros((40, 60, 3), dtype=np.uint8)] * 4
+        out = tmp_path / "out.gif"
+
+        # Four 60x40 frames queue 28800 bytes; a quarter of that halves each side.
+        with patch.object(animation_tasks, "_GIF_MAX_QUEUED_BYTES", 4 * 40 * 60 * 3 // 4):
+            assert _encode_gif_stream(iter(frames), 10, out, 4) == 4
+        args, nbytes = out.read_text().rsplit("\n", 1)
+        assert "-s 30x20" in args
+        assert int(nbytes) == 4 * 20 * 30 * 3
+
+    def test_full_palette_sample_has_no_select(self):
+        from app.tasks.animation_tasks import _gif_filter_graph
+
+        assert "select" not in _gif_filter_graph(1)
+
+
+class TestEncodeChunked:
+    def test_encodes_chunks_and_joins_without_reencoding(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks import animation_tasks
+        from app.tasks.animation_tasks import _encode_chunked
+
+        # The third chunk starts with a different size; it is scaled to the first frame's.
+        frames = [np.zeros((40, 60, 3), dtype=np.uint8)] * 4 + [np.zeros((80, 120, 3), dtype=np.uint8)]
+        out = tmp_path / "out.mp4"
+        work_dir = tmp_path / "work"
+
+        with patch.object(animation_tasks, "_FFmpegPipe", wraps=animation_tasks._FFmpegPipe) as spy:
+            assert _encode_chunked(iter(frames), 10, "high", out, work_dir, workers=2, chunk_frames=2) == 5
+
+        assert spy.call_count == 3
+        assert {c.args[1] for c in spy.call_args_list} == {(60, 40)}
+        assert "-f concat -safe 0" in out.read_text()
+        assert "-c copy" in out.read_text()
+        assert not (work_dir / "chunks").exists()
+
+    def test_streams_each_chunk_as_it_renders(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks import animation_tasks
+        from app.tasks.animation_tasks import _encode_chunked
+
+        started_before = []
+
+        def render(spy):
+            for _ in range(6):
+                started_before.append(spy.call_count)
+                yield np.zeros((4, 4, 3), dtype=np.uint8)
+
+        with patch.object(animation_tasks, "_FFmpegPipe", wraps=animation_tasks._FFmpegPipe) as spy:
+            _encode_chunked(render(spy), 10, "high", tmp_path / "o.mp4", tmp_path / "w", workers=2, chunk_frames=3)
+
+        # A chunk's encoder is running before its second frame is even rendered.
+        assert started_before == [0, 1, 1, 1, 2, 2]
+
+    def test_chunk_failure_raises(self, fake_ffmpeg, tmp_path):
+        import subprocess
+
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_chunked
+
+        frames = [np.zeros((4, 4, 3), dtype=np.uint8)] * 3
+        with pytest.raises(subprocess.CalledProcessError):
+            _encode_chunked(frames, 10, "medium", tmp_path / "o.mp4", tmp_path / "fail", workers=2, chunk_frames=1)
+        assert not (tmp_path / "fail" / "chunks").exists()
+
+    def test_render_error_stops_encoders(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_chunked
+
+        def render():
+            yield from [np.zeros((4, 4, 3), dtype=np.uint8)] * 4
+            raise ValueError("bad frame")
+
+        with pytest.raises(ValueError, match="bad frame"):
+            _encode_chunked(render(), 10, "medium", tmp_path / "o.mp4", tmp_path / "w", workers=2, chunk_frames=3)
+        assert not (tmp_path / "w" / "chunks").exists()
+        assert not (tmp_path / "o.mp4").exists()
+
+    def test_no_frames(self, tmp_path):
+        from app.tasks.animation_tasks import _encode_chunked
+
+        with pytest.raises(RuntimeError):
+            _encode_chunked([], 10, "medium", tmp_path / "o.mp4", tmp_path)
+
+
+# ── Parallel ordered rendering ──────────────────────────
+
+
+class TestImapOrdered:
+    def test_preserves_order_and_bounds_read_ahead(self):
+        import random
+        import threading
+        import time
+
+        from app.tasks.animation_tasks import _imap_ordered
+
+        lock = threading.Lock()
+        started: list[int] = []
+
+        def work(n: int) -> int:
+            with lock:
+                started.append(n)
+            time.sleep(random.uniform(0, 0.005))  # noqa: S311
+            return n * n
+
+        consumed = []
+        for result in _imap_ordered(work, range(30), workers=4, read_ahead=5):
+            # The result being yielded plus at most read_ahead more in flight.
+            assert len(started) <= len(consumed) + 1 + 5
+            consumed.append(result)
+        assert consumed == [n * n for n in range(30)]
+
+    def test_propagates_worker_error(self):
+        from app.tasks.animation_tasks import _imap_ordered
+
+        def work(n: int) -> int:
+            if n == 3:
+                raise ValueError("bad frame")
+            return n
+
+        with pytest.raises(ValueError, match="bad frame"):
+            list(_imap_ordered(work, range(10), workers=2, read_ahead=4))
+
+
+class TestIterRenderedFrames:
+    @pytest.fixture(autouse=True)
+    def _job_log(self):
+        with patch("app.tasks.fetch_task._make_job_logger") as make_logger:
+            yield make_logger.return_value
+
+    @patch("app.tasks.animation_tasks._update_job_db")
+    @patch("app.tasks.animation_tasks._publish_progress")
+    def test_yields_in_capture_order_with_progress(self, mock_pub, mock_upd, tmp_path):
+        import cv2
+        import numpy as np
+        from app.tasks.animation_tasks import _iter_rendered_frames
+
+        frames = []
+        for i in range(20):
+            src = tmp_path / f"f{i}.png"
+            cv2.imwrite(str(src), np.full((8, 8, 3), i, dtype=np.uint8))
+            frames.append(SimpleNamespace(file_path=str(src)))
+        frames.insert(5, SimpleNamespace(file_path=str(tmp_path / "missing.png")))
+
+        values = [int(img[0, 0, 0]) for img in _iter_rendered_frames(frames, "j1", None, "full", "100%", None, "")]
+
+        assert values == list(range(20))
+        assert mock_pub.call_args[0][1] == 70
+        assert mock_pub.call_args[0][2] == "Processed frame 21/21"
+
+    @patch("app.tasks.animation_tasks._update_job_db")
+    @patch("app.tasks.animation_tasks._publish_progress")
+    def test_reuses_renders_across_jobs(self, mock_pub, mock_upd, tmp_path, _job_log):
+        import cv2
+        import numpy as np
+        from app.tasks.animation_tasks import _iter_rendered_frames
+
+        frames = []
+        for i in range(4):
+            src = tmp_path / f"f{i}.png"
+            cv2.imwrite(str(src), np.full((8, 8, 3), i * 10, dtype=np.uint8))
+            frames.append(SimpleNamespace(id=f"id{i}", file_path=str(src)))
+
+        first = list(_iter_rendered_frames(frames, "j1", None, "full", "50%", None, ""))
+        with patch("app.tasks.animation_tasks._render_frame") as render:
+            second = list(_iter_rendered_frames(frames, "j2", None, "full", "50%", None, ""))
+        render.assert_not_called()
+        assert [img.tolist() for img in second] == [img.tolist() for img in first]
+        assert _job_log.call_args_list[-1].args[0] == "Render cache: 4/4 frames reused from earlier jobs"
+
+        # Different settings miss.
+        list(_iter_rendered_frames(frames, "j3", None, "full", "100%", None, ""))
+        assert _job_log.call_args.args[0] == "Render cache: 0/4 frames reused from earlier jobs"
+
+    @patch("app.tasks.animation_tasks._update_job_db")
+    @patch("app.tasks.animation_tasks._publish_progress")
+    def test_job_larger_than_cap_stops_storing(self, mock_pub, mock_upd, tmp_path, _isolated_render_cache, _job_log):
+        import cv2
+        import numpy as np
+        from app.tasks import animation_tasks
+        from app.tasks.animation_tasks import _iter_rendered_frames
+
+        frames = []
+        for i in range(6):
+            src = tmp_path / f"f{i}.png"
+            cv2.imwrite(str(src), np.full((8, 8, 3), i, dtype=np.uint8))
+            frames.append(SimpleNamespace(id=f"id{i}", file_path=str(src)))
+        _isolated_render_cache.max_bytes = 1000  # three of these tiny frames, not six
+
+        with patch.object(animation_tasks, "_RENDER_WORKERS", 1):
+            assert len(list(_iter_rendered_frames(frames, "j1", None, "full", "100%", None, ""))) == 6
+        assert len(list(_isolated_render_cache.root.glob("*/*.npy"))) == 1
+
+
+class TestRenderCache:
+    def _img(self, value: int = 7):
+        import numpy as np
+
+        return np.full((16, 16, 3), value, dtype=np.uint8)
+
+    def test_key_tracks_source_mtime_and_settings(self, tmp_path):
+        import os
+
+        from app.services.render_cache import render_key
+
+        src = tmp_path / "f.png"
+        src.write_bytes(b"x")
+        key = render_key("a", src, None, "full", "100%", {"label": True}, "GOES")
+        assert key == render_key("a", src, None, "full", "100%", {"label": True}, "GOES")
+        assert key != render_key("a", src, (0, 0, 4, 4), "full", "100%", {"label": True}, "GOES")
+        assert key != render_key("a", src, None, "full", "100%", {"timestamp": True}, "GOES")
+        os.utime(src, ns=(1, 1))
+        assert key != render_key("a", src, None, "full", "100%", {"label": True}, "GOES")
+        assert render_key("a", tmp_path / "missing.png", None, "full", "100%", None, "") is None
+
+    def test_round_trip_and_lru_eviction(self, tmp_path):
+        import os
+
+        from app.services.render_cache import RenderCache
+
+        cache = RenderCache(root=tmp_path / "rc")
+        assert cache.get("k" * 32) is None
+        cache.put("a" * 32, self._img(1))
+        assert cache.get("a" * 32).tolist() == self._img(1).tolist()
+
+        cache.put("b" * 32, self._img(2))
+        size = cache.path_for("a" * 32).stat().st_size
+        os.utime(cache.path_for("a" * 32), ns=(1, 1))  # oldest
+        cache.max_bytes = 2 * size + 1
+        cache.put("c" * 32, self._img(3))
+        assert not cache.path_for("a" * 32).exists()
+        assert cache.path_for("c" * 32).exists()
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        from app.services.render_cache import RenderCache
+
+        cache = RenderCache(root=tmp_path / "rc")
+        cache.put("a" * 32, self._img())
+        cache.path_for("a" * 32).write_bytes(b"truncated")
+        assert cache.get("a" * 32) is None
+
+    def test_cap_defaults_to_setting(self, tmp_path):
+        from app.config import settings
+        from app.services.render_cache import RenderCache
+
+        with patch.object(settings, "render_cache_max_bytes", 1234):
+            assert RenderCache(root=tmp_path).max_bytes == 1234
+        assert RenderCache(root=tmp_path, max_bytes=5).max_bytes == 5
+
+    def test_evict_sweeps_orphaned_temp_files(self, tmp_path):
+        import os
+
+        from app.services.render_cache import RenderCache
+
+        cache = RenderCache(root=tmp_path / "rc")
+        cache.put("a" * 32, self._img())
+        shard = cache.path_for("a" * 32).parent
+        orphan = shard / f"{'b' * 32}.npy.tmp-deadbeef"
+        orphan.write_bytes(b"partial")
+        os.utime(orphan, ns=(1, 1))
+        in_progress = shard / f"{'c' * 32}.npy.tmp-cafef00d"
+        in_progress.write_bytes(b"partial")
+        legacy = shard / f"{'d' * 32}.png"
+        legacy.write_bytes(b"png")
+
+        cache.evict()
+        assert not orphan.exists()
+        assert not legacy.exists()
+        assert in_progress.exists()
+        assert cache.path_for("a" * 32).exists()
+
+
+# ── Loop tail replay ────────────────────────────────────
+
+
+class TestLoopTail:
+    def test_pingpong_skips_turning_frames(self):
+        from app.tasks.animation_tasks import _loop_tail
+
+        assert _loop_tail(4, "pingpong", 10) == [2, 1]
+        assert _loop_tail(2, "pingpong", 10) == [0]
+        assert _loop_tail(1, "pingpong", 10) == []
+
+    def test_hold_and_forward(self):
+        from app.tasks.animation_tasks import _loop_tail
+
+        assert _loop_tail(3, "hold", 5) == [2] * 10
+        assert _loop_tail(3, "forward", 5) == []
+        assert _loop_tail(0, "hold", 5) == []
+
+
+class TestWithLoopTail:
+    def _frames(self, n: int):
+        import numpy as np
+
+        return [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(n)]
+
+    def test_pingpong_replays_without_rerendering(self, tmp_path):
+        from app.tasks.animation_tasks import _with_loop_tail
+
+        rendered = []
+
+        def source():
+            for img in self._frames(4):
+                rendered.append(int(img[0, 0, 0]))
+                yield img
+
+        values = [int(img[0, 0, 0]) for img in _with_loop_tail(source(), "pingpong", 10, tmp_path / "w")]
+        assert values == [0, 1, 2, 3, 2, 1]
+        assert rendered == [0, 1, 2, 3]
+
+    def test_hold_repeats_last_frame(self, tmp_path):
+        from app.tasks.animation_tasks import _with_loop_tail
+
+        values = [int(img[0, 0, 0]) for img in _with_loop_tail(iter(self._frames(2)), "hold", 2, tmp_path)]
+        assert values == [0, 1, 1, 1, 1, 1]
+
+    def test_pingpong_spills_past_memory_budget(self, tmp_path):
+        from app.tasks import animation_tasks
+        from app.tasks.animation_tasks import _with_loop_tail
+
+        spill_dir = tmp_path / "w"
+        with patch.object(animation_tasks, "_SPILL_MEMORY_BYTES", 2 * 4 * 4 * 3):
+            stream = _with_loop_tail(iter(self._frames(5)), "pingpong", 10, spill_dir)
+            values = [int(img[0, 0, 0]) for img in stream]
+        assert values == [0, 1, 2, 3, 4, 3, 2, 1]
+        assert sorted(p.name for p in spill_dir.iterdir()) == [f"spill{i:06d}.png" for i in (2, 3, 4)]
+
+    def test_spilled_frames_round_trip_losslessly(self, tmp_path):
+        import numpy as np
+        from app.tasks.animation_tasks import _FrameSpill
+
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (6, 5, 3), dtype=np.uint8) for _ in range(3)]
+        spill = _FrameSpill(tmp_path, memory_budget=0)
+        for img in frames:
+            spill.append(img)
+        assert len(spill) == 3
+        for index, img in enumerate(frames):
+            np.testing.assert_array_equal(spill[index], img)
+
+
+# ── Draft preview ───────────────────────────────────────
+
+
+class TestDraftPreview:
+    def test_encodes_subsample_at_preview_resolution(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks.animation_tasks import _DRAFT_MAX_FRAMES, _encode_draft
+
+        calls = []
+
+        def fake_render(frames, job_id, crop, resolution, *args):
+            calls.append((len(frames), job_id, resolution))
+            return iter([np.zeros((8, 8, 3), dtype=np.uint8)] * len(frames))
+
+        out = tmp_path / "draft.mp4"
+        with patch("app.tasks.animation_tasks._iter_rendered_frames", side_effect=fake_render):
+            assert _encode_draft(list(range(500)), out, 10, None, "100%", None, "") is True
+
+        sampled, job_id, resolution = calls[0]
+        assert sampled <= _DRAFT_MAX_FRAMES
+        assert (job_id, resolution) == (None, "preview")
+        assert "-preset ultrafast" in out.read_text()
+
+    def test_failure_is_not_fatal(self, fake_ffmpeg, tmp_path):
+        import numpy as np
+        from app.tasks.animation_tasks import _encode_draft
+
+        frames = iter([np.zeros((8, 8, 3), dtype=np.uint8)])
+        out = tmp_path / "fail_draft.mp4"
+        with patch("app.tasks.animation_tasks._iter_rendered_frames", return_value=frames):
+            assert _encode_draft([object()], out, 10, None, "100%", None, "") is False
+        assert not out.exists()
+
+    def test_generate_animation_publishes_then_removes_draft(self, fake_ffmpeg, tmp_path, monkeypatch):
+        from datetime import timedelta
+        from pathlib import Path
+
+        import numpy as np
+        from app.db.models import Animation, Base, GoesFrame, Job
+        from app.tasks import animation_tasks
+        from app.utils import utcnow
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        t0 = utcnow()
+        with Session() as session:
+            frame_ids = []
+            for i in range(animation_tasks._DRAFT_MIN_FRAMES):
+                frame = GoesFrame(
+                    satellite="GOES-19",
+                    sector="CONUS",
+                    band="C02",
+                    capture_time=t0 + timedelta(minutes=i),
+                    file_path="x",
+                )
+                session.add(frame)
+                session.flush()
+                frame_ids.append(frame.id)
+            session.add(Job(id="job-1", status="pending", job_type="animation", params={"frame_ids": frame_ids}))
+            session.add(Animation(id="anim-1", name="a", job_id="job-1"))
+            session.commit()
+
+        monkeypatch.setattr(animation_tasks.settings, "output_dir", str(tmp_path / "out"))
+        (tmp_path / "out").mkdir()
+        seen_during_full_encode = []
+        real_encode = animation_tasks._encode_stream
+
+        def encode(frames, fps, quality, output_path, *args, preset="medium", **kwargs):
+            if preset != "ultrafast":
+                with Session() as s:
+                    preview = s.get(Animation, "anim-1").preview_path
+                seen_during_full_encode.append((preview, preview and Path(preview).exists()))
+            return real_encode(frames, fps, quality, output_path, *args, preset=preset, **kwargs)
+
+        def render(frames, *args):
+            return iter([np.zeros((8, 8, 3), dtype=np.uint8)] * len(frames))
+
+        with (
+            patch("app.tasks.animation_tasks._get_sync_db", side_effect=Session),
+            patch("app.tasks.animation_tasks._update_job_db"),
+            patch("app.tasks.animation_tasks._publish_progress"),
+            patch("app.tasks.animation_tasks._iter_rendered_frames", side_effect=render),
+            patch("app.tasks.animation_tasks._encode_stream", side_effect=encode),
+        ):
+            animation_tasks.generate_animation.run("job-1", "anim-1")
+
+        draft = tmp_path / "out" / "animation_anim-1_draft.mp4"
+        assert seen_during_full_encode == [(str(draft), True)]
+        assert not draft.exists()
+        with Session() as s:
+            anim = s.get(Animation, "anim-1")
+            assert anim.status == "completed"
+            assert anim.preview_path is None
@@ -71,6 +71,7 @@ class TestCeleryRetryConfig:
             "fetch_goes_data",
             "backfill_gaps",
             "generate_composite",
+            "generate_composites_batch",
             "fetch_composite_data",
             "generate_animation",
             "process_images",
@@ -0,0 +1,129 @@
+"""Tests for the band-math recipe compiler."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from app.routers._goes_shared import COMPOSITE_RECIPES
+from app.services.band_math import RecipeError, compile_channel, compile_recipe
+from app.tasks.composite_task import _compose_recipe
+
+RNG = np.random.default_rng(0)
+
+
+def _band(shape=(6, 5)) -> np.ndarray:
+    return RNG.integers(0, 256, shape, dtype=np.uint8)
+
+
+def _stretch(band: np.ndarray) -> np.ndarray:
+    """The legacy per-band min/max stretch to uint8."""
+    lo, hi = float(band.min()), float(band.max())
+    return ((band.astype(np.float32) - lo) * 255.0 / (hi - lo)).astype(np.uint8)
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "C13 ** 2",
+            "__import__('os')",
+            "C13.real",
+            "C13 if C13 else 0",
+            "C13 -",
+            "C13 | 1, 2, 3",
+            "C13 | 0, x",
+            "C13 | 5, 5",
+            "C13 | auto | 0",
+            "C13 | auto | 1 | 2",
+            "'C13'",
+        ],
+    )
+    def test_rejects(self, line):
+        with pytest.raises(RecipeError):
+            compile_channel(line)
+
+    def test_options(self):
+        channel = compile_channel("(C15 - C13) * 2 | -10, 10 | 2.5")
+        assert channel.bands == {"C15", "C13"}
+        assert channel.value_range == (-10.0, 10.0)
+        assert channel.gamma == 2.5
+        assert compile_channel("C13 | auto").value_range is None
+
+    def test_recipe_needs_three_channels(self):
+        with pytest.raises(RecipeError, match="exactly 3"):
+            compile_recipe(("C01", "C02"))
+
+    @pytest.mark.parametrize("recipe", [r for r in COMPOSITE_RECIPES.values() if "rgb" in r])
+    def test_shipped_recipes_compile(self, recipe):
+        assert compile_recipe(recipe["rgb"]).bands <= set(recipe["bands"])
+
+
+class TestEvaluate:
+    def test_auto_matches_legacy_stretch(self):
+        bands = {"A": _band(), "B": _band(), "C": _band()}
+        out = compile_recipe(("A", "B", "C")).evaluate(bands)
+        assert out.dtype == np.uint8
+        assert out.shape == (6, 5, 3)
+        for index, name in enumerate("ABC"):
+            np.testing.assert_allclose(out[..., index], _stretch(bands[name]), atol=1)
+
+    def test_fixed_range_arithmetic_and_inversion(self):
+        a = np.array([[0, 10], [20, 30]], dtype=np.float32)
+        b = np.array([[5, 5], [5, 5]], dtype=np.float32)
+        out = compile_recipe(("A - B | 0, 20", "-(A / 2) + 15 | 0, 15", "A | 30, 0")).evaluate({"A": a, "B": b})
+        assert out[..., 0].tolist() == [[0, 63], [191, 255]]
+        assert out[..., 1].tolist() == [[255, 170], [85, 0]]
+        assert out[..., 2].tolist() == [[255, 170], [85, 0]]
+
+    def test_gamma(self):
+        a = np.array([[0.25]], dtype=np.float32)
+        out = compile_recipe(("A | 0, 1 | 2", "A | 0, 1", "1 + 1 | 0, 4")).evaluate({"A": a})
+        assert out[0, 0].tolist() == [127, 63, 127]
+
+    def test_tiling_matches_single_tile(self):
+        bands = {"C15": _band((37, 11)), "C14": _band((37, 11)), "C13": _band((37, 11)), "C11": _band((37, 11))}
+        recipe = compile_recipe(COMPOSITE_RECIPES["dust_ash"]["rgb"])
+        whole = recipe.evaluate(bands)
+        tiled = recipe.evaluate(bands, tile_bytes=3 * 11 * 4)
+        np.testing.assert_array_equal(whole, tiled)
+
+    def test_missing_band_and_constant_channel_are_black(self):
+        a = _band()
+        out = compile_recipe(("A", "A - Z", "A * 0")).evaluate({"A": a, "Z": None})
+        assert out[..., 0].any()
+        assert not out[..., 1].any()
+        assert not out[..., 2].any()
+
+    def test_non_finite_values(self):
+        a = np.array([[0, 1], [2, 4]], dtype=np.float32)
+        b = np.array([[0, 0], [1, 4]], dtype=np.float32)
+        out = compile_recipe(("A / B", "A", "A")).evaluate({"A": a, "B": b})
+        # 0/0 is NaN -> 0; 1/0 is inf -> left out of the auto range (1..2), then clipped to 255.
+        assert out[..., 0].tolist() == [[0, 255], [255, 0]]
+
+    def test_inputs_not_modified(self):
+        a = _band()
+        before = a.copy()
+        compile_recipe(("A", "-A", "A + A")).evaluate({"A": a})
+        np.testing.assert_array_equal(a, before)
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError, match="shape"):
+            compile_recipe(("A", "B", "A")).evaluate({"A": _band((2, 2)), "B": _band((3, 3))})
+
+
+class TestComposeRecipe:
+    def test_uses_all_recipe_bands(self):
+        bands = COMPOSITE_RECIPES["airmass"]["bands"]
+        images = [_band((8, 8)) for _ in bands]
+        images[3] = _band((16, 16))  # resized to the first band's shape
+        img = _compose_recipe("airmass", bands, images)
+        assert img.mode == "RGB"
+        assert img.size == (8, 8)
+        assert np.array(img)[..., 1].any()  # C12 - C13 needs the fourth band
+
+    def test_plain_recipe_stacks_first_three_bands(self):
+        images = [_band(), None, _band()]
+        img = np.array(_compose_recipe("true_color", ["C02", "C03", "C01"], images))
+        assert not img[..., 1].any()
+        np.testing.assert_allclose(img[..., 0], _stretch(images[0]), atol=1)
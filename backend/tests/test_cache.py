@@ -6,7 +6,15 @@ import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from app.services.cache import get_cached, invalidate, make_cache_key
+from app.services.cache import (
+    TAG_FRAMES,
+    TAG_JOBS,
+    get_cached,
+    invalidate,
+    invalidate_tags,
+    invalidate_tags_sync,
+    make_cache_key,
+)
 
 
 class TestMakeCacheKey:
@@ -122,3 +130,67 @@ class TestInvalidate:
         with patch.object(mock_redis, "scan_iter", side_effect=redis.exceptions.ConnectionError):
             deleted = await invalidate("cache:*")
             assert deleted == 0
+
+
+class TestInvalidateTags:
+    @pytest.mark.asyncio
+    async def test_deletes_only_tagged_keys(self, mock_redis):
+        await get_cached("cache:a", ttl=60, fetch_fn=lambda: 1, tags=(TAG_FRAMES,))
+        await get_cached("cache:b", ttl=60, fetch_fn=lambda: 2, tags=(TAG_JOBS,))
+        await get_cached("cache:c", ttl=60, fetch_fn=lambda: 3)
+
+        deleted = await invalidate_tags(TAG_FRAMES)
+
+        assert deleted == 1
+        assert await mock_redis.get("cache:a") is None
+        assert await mock_redis.get("cache:b") is not None
+        assert await mock_redis.get("cache:c") is not None
+
+    @pytest.mark.asyncio
+    async def test_key_with_multiple_tags(self, mock_redis):
+        await get_cached("cache:dash", ttl=60, fetch_fn=lambda: {}, tags=(TAG_FRAMES, TAG_JOBS))
+
+        assert await invalidate_tags(TAG_JOBS) == 1
+        assert await mock_redis.get("cache:dash") is None
+        # The other tag's set still lists the key; deleting it again is a no-op.
+        assert await invalidate_tags(TAG_FRAMES) == 0
+
+    @pytest.mark.asyncio
+    async def test_does_not_scan(self, mock_redis):
+        await get_cached("cache:a", ttl=60, fetch_fn=lambda: 1, tags=(TAG_FRAMES,))
+
+        with patch.object(mock_redis, "scan_iter", side_effect=AssertionError("SCAN used")):
+            assert await invalidate_tags(TAG_FRAMES) == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_tag(self, mock_redis):
+        assert await invalidate_tags("nothing") == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_returns_zero(self, mock_redis):
+        import redis.exceptions
+
+        with patch.object(mock_redis, "smembers", side_effect=redis.exceptions.ConnectionError):
+            assert await invalidate_tags(TAG_FRAMES) == 0
+
+
+class TestInvalidateTagsSync:
+    def test_deletes_tracked_keys(self):
+        from fakeredis import FakeRedis
+
+        client = FakeRedis()
+        client.set("cache:a", "1")
+        client.sadd("cache:tag:frames", "cache:a")
+
+        assert invalidate_tags_sync(client, TAG_FRAMES) == 1
+        assert client.get("cache:a") is None
+        assert not client.exists("cache:tag:frames")
+
+    def test_redis_failure_returns_zero(self):
+        from unittest.mock import MagicMock
+
+        import redis.exceptions
+
+        client = MagicMock()
+        client.smembers.side_effect = redis.exceptions.ConnectionError
+        assert invalidate_tags_sync(client, TAG_FRAMES) == 0
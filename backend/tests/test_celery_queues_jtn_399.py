@@ -46,10 +46,13 @@ PROCESS_TASKS = {
     "process_images",
     "create_video",
     "generate_composite",
+    "generate_composites_batch",
     "generate_animation",
+    "update_rolling_animation",
+    "generate_frame_tiles",
 }
 
-CLEANUP_TASKS = {"run_cleanup"}
+CLEANUP_TASKS = {"run_cleanup", "rebuild_frame_stats"}
 DEFAULT_TASKS = {"check_schedules"}
 
 
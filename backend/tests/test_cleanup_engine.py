@@ -0,0 +1,127 @@
+"""Tests for the set-based cleanup engine (app.services.cleanup)."""
+
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from app.db.database import Base
+from app.db.models import Collection, CollectionFrame, FrameStat, FrameTag, GoesFrame, Tag
+from app.services.cleanup import candidates_query, run_cleanup_rules
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+NOW = datetime(2026, 6, 1, 12, 0)
+GIB = 1024 * 1024 * 1024
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as s:
+        yield s
+    engine.dispose()
+
+
+def _rule(rule_type: str, value: float, *, satellite: str | None = None, protect: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(rule_type=rule_type, value=value, satellite=satellite, protect_collections=protect)
+
+
+def _seed(session, tmp_path, sizes: list[int], *, satellite: str = "GOES-19") -> list[GoesFrame]:
+    """One frame per size, created a day apart (oldest first), each with a file on disk."""
+    frames = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"{satellite}_{i}.png"
+        path.write_bytes(b"x")
+        frames.append(
+            GoesFrame(
+                id=f"{satellite}-{i}",
+                satellite=satellite,
+                sector="CONUS",
+                band="C02",
+                capture_time=datetime(2026, 5, 1, i),
+                file_path=str(path),
+                file_size=size,
+                created_at=NOW - timedelta(days=len(sizes) - i),
+            )
+        )
+    session.add_all(frames)
+    session.commit()
+    return frames
+
+
+def _ids(session, rule) -> list[str]:
+    return [row[0] for row in session.execute(candidates_query(rule, NOW)).all()]
+
+
+class TestCandidatesQuery:
+    def test_age_rule_selects_older_than_cutoff(self, session, tmp_path):
+        _seed(session, tmp_path, [1, 1, 1, 1])  # created 4, 3, 2, 1 days ago
+        assert _ids(session, _rule("max_age_days", 2.5)) == ["GOES-19-0", "GOES-19-1"]
+
+    def test_storage_rule_uses_running_sum(self, session, tmp_path):
+        _seed(session, tmp_path, [GIB // 2, GIB // 2, GIB // 2, GIB // 2])  # 2 GiB used
+        # 0.75 GiB over a 1.25 GiB budget: the two oldest halves cover it
+        assert _ids(session, _rule("max_storage_gb", 1.25)) == ["GOES-19-0", "GOES-19-1"]
+        assert _ids(session, _rule("max_storage_gb", 2)) == []
+
+    def test_protected_frames_skipped_but_counted(self, session, tmp_path):
+        _seed(session, tmp_path, [GIB // 2, GIB // 2, GIB // 2, GIB // 2])
+        session.add(Collection(id="c1", name="keep"))
+        session.add(CollectionFrame(collection_id="c1", frame_id="GOES-19-0"))
+        session.commit()
+
+        assert _ids(session, _rule("max_storage_gb", 1.25)) == ["GOES-19-1", "GOES-19-2"]
+        assert _ids(session, _rule("max_storage_gb", 1.25, protect=False)) == ["GOES-19-0", "GOES-19-1"]
+
+    def test_satellite_scoping(self, session, tmp_path):
+        _seed(session, tmp_path, [GIB, GIB])
+        _seed(session, tmp_path, [GIB], satellite="GOES-18")
+        assert _ids(session, _rule("max_storage_gb", 1, satellite="GOES-19")) == ["GOES-19-0"]
+        assert _ids(session, _rule("max_storage_gb", 1, satellite="GOES-18")) == []
+
+    def test_unknown_rule_type(self):
+        assert candidates_query(_rule("bogus", 1)) is None
+
+
+class TestRunCleanupRules:
+    def test_batched_delete_updates_stats_and_unlinks(self, session, tmp_path):
+        frames = _seed(session, tmp_path, [10] * 5)
+        paths = [f.file_path for f in frames]
+        session.add(Tag(id="t1", name="t"))
+        session.add(FrameTag(frame_id="GOES-19-0", tag_id="t1"))
+        session.commit()
+        batches: list[int] = []
+
+        with patch.object(session, "commit", wraps=session.commit) as commit:
+            result = run_cleanup_rules(
+                session, [_rule("max_age_days", 1.5)], now=NOW, batch_size=2, on_batch=batches.append
+            )
+
+        assert (result.deleted, result.freed_bytes) == (4, 40)
+        assert batches == [2, 2]
+        assert commit.call_count == 2
+        assert session.scalar(select(func.count()).select_from(GoesFrame)) == 1
+        assert session.scalar(select(func.count()).select_from(FrameTag)) == 0
+        stat = session.get(FrameStat, ("GOES-19", "CONUS", "C02", date(2026, 5, 1)))
+        assert (stat.frame_count, stat.total_size) == (1, 10)
+        assert [p for p in paths if not os.path.exists(p)] == paths[:4]
+
+    def test_rules_apply_in_sequence(self, session, tmp_path):
+        _seed(session, tmp_path, [GIB // 2] * 4)
+        rules = [_rule("max_age_days", 3.5), _rule("max_storage_gb", 1)]
+
+        result = run_cleanup_rules(session, rules, now=NOW)
+
+        # Age removes the oldest; storage then trims 1.5 GiB down to 1 GiB.
+        assert result.deleted == 2
+        assert sorted(session.scalars(select(GoesFrame.id)).all()) == ["GOES-19-2", "GOES-19-3"]
+
+    def test_unknown_rule_is_skipped(self, session, tmp_path):
+        _seed(session, tmp_path, [1])
+        assert run_cleanup_rules(session, [_rule("bogus", 1)], now=NOW) == (0, 0)
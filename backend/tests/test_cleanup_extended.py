@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 import uuid
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
 from app.db.models import CleanupRule, Collection, CollectionFrame, GoesFrame
+from app.services.cleanup import CleanupResult
 
 
 def _make_frame(db, **overrides):
@@ -185,12 +188,33 @@ class TestCleanupPreview:
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("shared_db")
 class TestCleanupRun:
+    @pytest.fixture
+    def db(self, shared_db):
+        """Cleanup runs on a sync session in a worker thread; see ``shared_db``."""
+        return shared_db
+
     async def test_run_no_rules(self, client):
         resp = await client.post("/api/satellite/cleanup/run")
         assert resp.status_code == 200
         assert resp.json()["deleted_frames"] == 0
 
+    async def test_run_off_event_loop_thread(self, client, db):
+        _make_rule(db, rule_type="max_age_days", value=7)
+        await db.commit()
+        threads = []
+
+        def fake_run(session, rules):
+            threads.append(threading.get_ident())
+            return CleanupResult(0, 0)
+
+        with patch("app.routers.scheduling.run_cleanup_rules", side_effect=fake_run):
+            resp = await client.post("/api/satellite/cleanup/run")
+        assert resp.status_code == 200
+        assert threads
+        assert threads[0] != threading.get_ident()
+
     async def test_run_deletes_old_frames(self, client, db):
         _make_rule(db, rule_type="max_age_days", value=7)
         _make_frame(db, created_at=datetime(2020, 1, 1, tzinfo=UTC), file_path="/tmp/nonexistent.nc")
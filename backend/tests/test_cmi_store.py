@@ -0,0 +1,100 @@
+"""Tests for float32 CMI sidecars and their use by composites."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from app.services import cmi_store
+from app.services.cleanup import delete_frame_files
+from app.services.goes_fetcher import _netcdf_to_png_from_file
+from app.tasks.composite_task import _compose_recipe, _load_cmi_images
+
+
+def _cmi(shape=(4, 6), lo=200.0, hi=300.0) -> np.ndarray:
+    return np.linspace(lo, hi, shape[0] * shape[1], dtype=np.float32).reshape(shape)
+
+
+class TestStore:
+    def test_round_trip_is_read_only_memmap(self, tmp_path):
+        image = tmp_path / "GOES-19_CONUS_C13_20260301T120000.png"
+        cmi = _cmi()
+        assert cmi_store.save_cmi(image, cmi) == tmp_path / "GOES-19_CONUS_C13_20260301T120000.cmi.npy"
+
+        loaded = cmi_store.load_cmi(image)
+        assert isinstance(loaded, np.memmap)
+        assert loaded.dtype == np.float32
+        np.testing.assert_array_equal(loaded, cmi)
+        with pytest.raises(ValueError):
+            loaded[0, 0] = 0
+        assert [p.name for p in tmp_path.iterdir()] == [cmi_store.cmi_path(image).name]
+
+    def test_missing_or_corrupt_sidecar(self, tmp_path):
+        image = tmp_path / "frame.png"
+        assert cmi_store.load_cmi(image) is None
+        cmi_store.cmi_path(image).write_bytes(b"not an npy file")
+        assert cmi_store.load_cmi(image) is None
+
+    def test_remove(self, tmp_path):
+        image = tmp_path / "frame.png"
+        cmi_store.save_cmi(image, _cmi())
+        assert cmi_store.remove_cmi(image) > 0
+        assert not cmi_store.cmi_path(image).exists()
+        assert cmi_store.remove_cmi(image) == 0
+
+    def test_evicted_with_frame_files(self, tmp_path):
+        image = tmp_path / "frame.png"
+        image.write_bytes(b"png")
+        cmi_store.save_cmi(image, _cmi())
+        delete_frame_files(SimpleNamespace(file_path=str(image), thumbnail_path=None))
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFetcherWritesSidecar:
+    @pytest.mark.parametrize("store", [True, False])
+    def test_saves_unstretched_cmi(self, tmp_path, store):
+        cmi = _cmi()
+        png = tmp_path / "frame.png"
+        with patch("app.services.goes_fetcher._read_cmi_data", return_value=cmi.copy()):
+            _netcdf_to_png_from_file(Path("unused.nc"), png, sector="CONUS", store_cmi=store)
+
+        assert png.exists()
+        sidecar = cmi_store.load_cmi(png)
+        if store:
+            np.testing.assert_array_equal(sidecar, cmi)
+        else:
+            assert sidecar is None
+
+
+class TestCompositeFromCmi:
+    BANDS = ["C08", "C10", "C12", "C13"]
+
+    def _paths(self, tmp_path, bands, values):
+        paths = []
+        for band in bands:
+            image = tmp_path / f"{band}.png"
+            if band in values:
+                cmi_store.save_cmi(image, np.full((4, 4), values[band], dtype=np.float32))
+            paths.append(str(image))
+        return paths
+
+    def test_airmass_in_kelvin(self, tmp_path):
+        values = {"C08": 230.0, "C10": 243.1, "C12": 250.0, "C13": 268.45}
+        images = _load_cmi_images("airmass", self.BANDS, self._paths(tmp_path, self.BANDS, values))
+        assert images is not None
+
+        rgb = np.array(_compose_recipe("airmass", self.BANDS, images, cmi=True))
+        # Each channel is the band (difference) placed within its quick-guide range.
+        assert rgb[0, 0].tolist() == [124, 126, 100]
+
+    def test_needs_every_recipe_band(self, tmp_path):
+        paths = self._paths(tmp_path, self.BANDS, {"C08": 230.0, "C10": 240.0, "C12": 250.0})
+        assert _load_cmi_images("airmass", self.BANDS, paths) is None
+
+    def test_recipe_without_cmi_variant(self, tmp_path):
+        bands = ["C02", "C03", "C01"]
+        paths = self._paths(tmp_path, bands, dict.fromkeys(bands, 0.5))
+        assert _load_cmi_images("true_color", bands, paths) is None
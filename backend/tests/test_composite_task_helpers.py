@@ -2,55 +2,98 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
 import numpy as np
-from app.tasks.composite_task import _compose_rgb, _normalize_band
-from PIL import Image as PILImage
-
-
-class TestNormalizeBand:
-    def test_normalizes_to_uint8(self):
-        arr = np.array([[0.0, 50.0], [100.0, 200.0]], dtype=np.float32)
-        result = _normalize_band(arr, (2, 2))
-        assert result.dtype == np.uint8
-        assert result.min() == 0
-        assert result.max() == 255
-
-    def test_constant_array_returns_zeros(self):
-        arr = np.full((3, 3), 42.0, dtype=np.float32)
-        result = _normalize_band(arr, (3, 3))
-        assert np.all(result == 0)
-
-    def test_resizes_if_shape_mismatch(self):
-        arr = np.random.rand(4, 4).astype(np.float32) * 255
-        result = _normalize_band(arr, (2, 2))
-        assert result.shape == (2, 2)
-        assert result.dtype == np.uint8
-
-
-class TestComposeRgb:
-    def test_three_bands(self):
-        r = np.random.rand(10, 10).astype(np.float32) * 255
-        g = np.random.rand(10, 10).astype(np.float32) * 255
-        b = np.random.rand(10, 10).astype(np.float32) * 255
-        result = _compose_rgb([r, g, b])
-        assert isinstance(result, PILImage.Image)
-        assert result.mode == "RGB"
-        assert result.size == (10, 10)
-
-    def test_missing_band_replaced_with_zeros(self):
-        r = np.random.rand(10, 10).astype(np.float32) * 255
-        result = _compose_rgb([r, None, r])
-        assert isinstance(result, PILImage.Image)
-        assert result.mode == "RGB"
-        arr = np.array(result)
-        # Green channel should be 0 (the None band)
-        assert arr[:, :, 1].max() == 0
-
-    def test_different_sizes_resized(self):
-        r = np.random.rand(10, 10).astype(np.float32) * 255
-        g = np.random.rand(20, 20).astype(np.float32) * 255
-        b = np.random.rand(10, 10).astype(np.float32) * 255
-        result = _compose_rgb([r, g, b])
-        assert isinstance(result, PILImage.Image)
-        # Result should match the first non-None band's shape
-        assert result.size == (10, 10)
+import pytest
+from app.tasks.composite_task import _nearest_frame
+
+T0 = datetime(2026, 3, 1, 12, 0)
+
+
+class TestNearestFrame:
+    FRAMES = [(T0, "a"), (T0 + timedelta(minutes=10), "b"), (T0 + timedelta(minutes=20), "c")]
+
+    @pytest.mark.parametrize(
+        ("offset", "expected"),
+        [(-5, "a"), (4, "a"), (6, "b"), (10, "b"), (19, "c"), (34, "c"), (36, None), (-16, None)],
+    )
+    def test_pairs_nearest_within_tolerance(self, offset, expected):
+        t = T0 + timedelta(minutes=offset)
+        assert _nearest_frame(self.FRAMES, t, timedelta(minutes=15)) == expected
+
+    def test_empty(self):
+        assert _nearest_frame([], T0, timedelta(minutes=15)) is None
+
+
+class TestGenerateCompositesBatch:
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        import cv2
+        from app.db.models import Base, Composite, GoesFrame
+        from app.tasks import composite_task
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        monkeypatch.setattr(composite_task.settings, "output_dir", str(tmp_path / "out"))
+
+        with Session() as session:
+            # C02 every 10 min; C03 only once, so both composites share its decode.
+            for band, minutes in (("C02", (0, 10)), ("C03", (5,)), ("C01", (0, 10))):
+                for m in minutes:
+                    path = tmp_path / f"{band}_{m}.png"
+                    cv2.imwrite(str(path), np.full((4, 4), m * 10 + 1, dtype=np.uint8) + np.eye(4, dtype=np.uint8))
+                    session.add(
+                        GoesFrame(
+                            satellite="GOES-19",
+                            sector="CONUS",
+                            band=band,
+                            capture_time=T0 + timedelta(minutes=m),
+                            file_path=str(path),
+                        )
+                    )
+            for cid in ("c1", "c2", "c3"):
+                session.add(
+                    Composite(
+                        id=cid, name=cid, recipe="true_color", satellite="GOES-19", sector="CONUS", capture_time=T0
+                    )
+                )
+            session.commit()
+
+        with (
+            patch("app.tasks.composite_task._get_sync_db", side_effect=Session),
+            patch("app.tasks.composite_task._update_job_db") as update_job,
+            patch("app.tasks.composite_task._publish_progress"),
+        ):
+            yield Session, update_job
+
+    def test_one_range_query_and_shared_decodes(self, env):
+        from app.db.models import Composite
+        from app.tasks import composite_task
+
+        Session, update_job = env
+        items = [
+            {"composite_id": "c1", "job_id": "j1", "capture_time": T0.isoformat()},
+            {"composite_id": "c2", "job_id": "j2", "capture_time": (T0 + timedelta(minutes=10)).isoformat()},
+            # No band frame within the tolerance: fails without stopping the batch.
+            {"composite_id": "c3", "job_id": "j3", "capture_time": (T0 + timedelta(hours=3)).isoformat()},
+        ]
+        params = {"recipe": "true_color", "satellite": "GOES-19", "sector": "CONUS", "bands": ["C02", "C03", "C01"]}
+
+        with (
+            patch.object(composite_task, "_query_band_frames", wraps=composite_task._query_band_frames) as query,
+            patch.object(composite_task, "_decode_band", wraps=composite_task._decode_band) as decode,
+        ):
+            assert composite_task.generate_composites_batch.run(items, params) == 2
+
+        assert query.call_count == 1
+        assert decode.call_count == 5  # C03 decoded once for both composites
+        with Session() as session:
+            statuses = {c.id: c.status for c in session.query(Composite)}
+        assert statuses == {"c1": "completed", "c2": "completed", "c3": "failed"}
+        final = {c.args[0]: c.kwargs["status"] for c in update_job.call_args_list if "completed_at" in c.kwargs}
+        assert final == {"j1": "completed", "j2": "completed", "j3": "failed"}
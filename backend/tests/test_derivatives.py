@@ -0,0 +1,141 @@
+"""Tests for image derivatives (app.services.derivatives and the /derivative endpoints)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from app.config import settings
+from app.db.models import Composite, GoesFrame
+from app.services.derivatives import (
+    DerivativeCache,
+    DerivativeSpec,
+    parse_crop,
+    render_derivative,
+    target_size,
+)
+from PIL import Image
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def source(storage):
+    path = storage / "src.png"
+    Image.new("RGB", (400, 200), (200, 100, 50)).save(path)
+    return path
+
+
+class TestHelpers:
+    def test_target_size_fits_box_without_upscaling(self):
+        assert target_size(400, 200, 100, None) == (100, 50)
+        assert target_size(400, 200, 100, 20) == (40, 20)
+        assert target_size(400, 200, 800, None) == (400, 200)
+        assert target_size(400, 200, None, None) == (400, 200)
+
+    @pytest.mark.parametrize("value", ["1,2,3", "a,b,c,d", "0,0,0,5", "-1,0,5,5"])
+    def test_parse_crop_rejects(self, value):
+        with pytest.raises(ValueError):
+            parse_crop(value)
+
+    def test_render_crops_then_resizes(self, source, tmp_path):
+        dest = tmp_path / "out" / "d.jpg"
+        render_derivative(source, DerivativeSpec(50, None, (0, 0, 200, 100), "jpeg"), dest)
+        with Image.open(dest) as img:
+            assert (img.format, img.size) == ("JPEG", (50, 25))
+
+
+class TestDerivativeCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_render_once(self, source, tmp_path):
+        cache = DerivativeCache(tmp_path / "cache")
+        spec = DerivativeSpec(100, None, None, "png")
+        with patch("app.services.derivatives.render_derivative", wraps=render_derivative) as render:
+            results = await asyncio.gather(*(cache.get(source, spec) for _ in range(5)))
+            await cache.get(source, spec)
+        assert render.call_count == 1
+        assert len({key for _, key in results}) == 1
+        assert results[0][0].exists()
+
+    @pytest.mark.asyncio
+    async def test_source_change_changes_key(self, source, tmp_path):
+        cache = DerivativeCache(tmp_path / "cache")
+        spec = DerivativeSpec(100, None, None, "png")
+        _, before = await cache.get(source, spec)
+        Image.new("RGB", (400, 200), (0, 0, 0)).save(source)
+        os.utime(source, ns=(1, 1))
+        _, after = await cache.get(source, spec)
+        assert before != after
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = DerivativeCache(tmp_path / "cache", max_bytes=250)
+        for i in range(3):
+            path = cache.path_for(f"{i:02d}{'0' * 30}", "png")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * 100)
+            os.utime(path, ns=(i, i))
+
+        assert cache.evict() == 200
+        assert sorted(p.name[:2] for p in cache.root.glob("*/*")) == ["01", "02"]
+
+
+class TestDerivativeEndpoints:
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, storage):
+        with patch("app.routers._derivatives.derivative_cache", DerivativeCache(storage / "derivatives")):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_frame_derivative(self, client, db, source):
+        frame_id = str(uuid.uuid4())
+        db.add(
+            GoesFrame(
+                id=frame_id,
+                satellite="GOES-19",
+                sector="CONUS",
+                band="C02",
+                capture_time=datetime(2026, 5, 1),
+                file_path=str(source),
+            )
+        )
+        await db.commit()
+
+        url = f"/api/satellite/frames/{frame_id}/derivative?width=100&format=jpeg"
+        resp = await client.get(url)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/jpeg"
+        etag = resp.headers["etag"]
+        assert (await client.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+        bad = await client.get(f"/api/satellite/frames/{frame_id}/derivative?crop=1,2")
+        assert bad.status_code == 400
+        assert (await client.get(f"{url}&format=gif")).status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_composite_derivative(self, client, db, source):
+        composite_id = str(uuid.uuid4())
+        db.add(
+            Composite(
+                id=composite_id,
+                name="c",
+                recipe="true_color",
+                satellite="GOES-19",
+                sector="CONUS",
+                capture_time=datetime(2026, 5, 1),
+                file_path=str(source),
+                status="completed",
+            )
+        )
+        await db.commit()
+
+        resp = await client.get(f"/api/satellite/composites/{composite_id}/derivative?height=50")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/webp"
@@ -0,0 +1,105 @@
+"""Tests for batched frame ingest (app.tasks.frame_ingest)."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from app.db.database import Base
+from app.db.models import Collection, CollectionFrame, FrameStat, GoesFrame, Image
+from app.services.thumbnail import save_image
+from app.tasks.frame_ingest import get_or_create_collection, ingest_frames
+from PIL import Image as PILImage
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as s:
+        yield s
+    engine.dispose()
+
+
+def _frames(tmp_path, n: int) -> list[dict]:
+    frames = []
+    for i in range(n):
+        path = tmp_path / f"GOES-19_CONUS_C02_{i}.png"
+        info = save_image(PILImage.new("L", (40, 30), 128), path)
+        frames.append(
+            {
+                "path": str(path),
+                "satellite": "GOES-19",
+                "sector": "CONUS",
+                "band": "C02",
+                "scan_time": datetime(2026, 5, 1, i),
+                **info,
+            }
+        )
+    return frames
+
+
+class TestSaveImage:
+    def test_reports_dimensions_and_size(self, tmp_path):
+        path = tmp_path / "x.png"
+        info = save_image(PILImage.new("RGB", (12, 7)), path)
+        assert info == {"width": 12, "height": 7, "file_size": path.stat().st_size}
+
+
+class TestIngestFrames:
+    def test_batches_commit_and_update_stats(self, session, tmp_path):
+        frames = _frames(tmp_path, 5)
+        collection_id = get_or_create_collection(session, "c", "d")
+
+        with (
+            patch.object(session, "commit", wraps=session.commit) as commit,
+            patch("app.tasks.frame_ingest._invalidate_cache_tags") as invalidate,
+        ):
+            ids = ingest_frames(
+                session,
+                frames,
+                source="goes_fetch",
+                job_id=None,
+                thumb_dir=str(tmp_path),
+                collection_id=collection_id,
+                cache_tags=("frames",),
+                batch_size=2,
+            )
+
+        assert len(ids) == 5
+        assert commit.call_count == 3
+        assert invalidate.call_count == 3
+        assert session.scalar(select(func.count()).select_from(GoesFrame)) == 5
+        assert session.scalar(select(func.count()).select_from(Image)) == 5
+        assert session.scalar(select(func.count()).select_from(CollectionFrame)) == 5
+        stat = session.get(FrameStat, ("GOES-19", "CONUS", "C02", date(2026, 5, 1)))
+        assert (stat.frame_count, stat.total_size) == (5, sum(f["file_size"] for f in frames))
+
+        frame = session.get(GoesFrame, ids[0])
+        assert (frame.width, frame.height) == (40, 30)
+        assert frame.thumbnail_path and frame.thumbnail_path.startswith(str(tmp_path / "thumbnails"))
+
+    def test_uses_passed_dimensions_without_reopening(self, session, tmp_path):
+        frames = _frames(tmp_path, 2)
+        with patch("app.services.thumbnail.get_image_dimensions") as dims:
+            ingest_frames(session, frames, source="goes_fetch")
+        dims.assert_not_called()
+
+    def test_falls_back_to_reading_file(self, session, tmp_path):
+        frame = _frames(tmp_path, 1)[0]
+        for key in ("width", "height", "file_size"):
+            del frame[key]
+        (frame_id,) = ingest_frames(session, [frame], source="goes_fetch", sector="FullDisk")
+
+        row = session.get(GoesFrame, frame_id)
+        assert (row.width, row.height, row.sector) == (40, 30, "FullDisk")
+        assert row.file_size == tmp_path.joinpath("GOES-19_CONUS_C02_0.png").stat().st_size
+
+    def test_existing_collection_is_reused(self, session):
+        session.add(Collection(id="coll-1", name="GOES Fetch", description=""))
+        session.commit()
+        assert get_or_create_collection(session, "GOES Fetch", "ignored") == "coll-1"
@@ -0,0 +1,131 @@
+"""Tests for the incrementally maintained frame_stats aggregates."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+
+import pytest
+from app.db.database import Base
+from app.db.frame_stats import FrameRow, rebuild_frame_stats, record_frames_added, record_frames_removed
+from app.db.models import FrameStat, GoesFrame
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as s:
+        yield s
+    engine.dispose()
+
+
+def _frame(capture_time: datetime, file_size: int = 100, **overrides) -> GoesFrame:
+    defaults = dict(
+        id=str(uuid.uuid4()),
+        satellite="GOES-19",
+        sector="CONUS",
+        band="C02",
+        capture_time=capture_time,
+        file_path="/data/x.png",
+        file_size=file_size,
+    )
+    defaults.update(overrides)
+    return GoesFrame(**defaults)
+
+
+def _stats(session) -> dict[tuple, tuple]:
+    rows = session.execute(select(FrameStat)).scalars().all()
+    return {
+        (r.satellite, r.sector, r.band, r.day): (r.frame_count, r.total_size, r.oldest_capture, r.newest_capture)
+        for r in rows
+    }
+
+
+class TestOrmListener:
+    def test_insert_creates_and_increments_buckets(self, session):
+        session.add_all(
+            [
+                _frame(datetime(2026, 1, 1, 10), 100),
+                _frame(datetime(2026, 1, 1, 12), 50),
+                _frame(datetime(2026, 1, 2, 0, 5), 10),
+            ]
+        )
+        session.commit()
+        session.add(_frame(datetime(2026, 1, 1, 8), 1))
+        session.commit()
+
+        stats = _stats(session)
+        assert stats[("GOES-19", "CONUS", "C02", date(2026, 1, 1))] == (
+            3,
+            151,
+            datetime(2026, 1, 1, 8),
+            datetime(2026, 1, 1, 12),
+        )
+        assert stats[("GOES-19", "CONUS", "C02", date(2026, 1, 2))][0] == 1
+
+    def test_delete_decrements_and_recomputes_bounds(self, session):
+        oldest = _frame(datetime(2026, 1, 1, 1), 10)
+        session.add_all([oldest, _frame(datetime(2026, 1, 1, 5), 20), _frame(datetime(2026, 1, 1, 9), 30)])
+        session.commit()
+
+        session.delete(oldest)
+        session.commit()
+
+        count, size, first, last = _stats(session)[("GOES-19", "CONUS", "C02", date(2026, 1, 1))]
+        assert (count, size) == (2, 50)
+        assert first == datetime(2026, 1, 1, 5)
+        assert last == datetime(2026, 1, 1, 9)
+
+    def test_empty_bucket_is_dropped(self, session):
+        frame = _frame(datetime(2026, 1, 1, 1))
+        session.add(frame)
+        session.commit()
+        session.delete(frame)
+        session.commit()
+
+        assert _stats(session) == {}
+
+
+class TestBulkPaths:
+    def test_core_delete_with_explicit_record(self, session):
+        frames = [_frame(datetime(2026, 3, 1, h), 10) for h in range(4)]
+        session.add_all(frames)
+        session.commit()
+
+        doomed = frames[:3]
+        session.execute(delete(GoesFrame).where(GoesFrame.id.in_([f.id for f in doomed])))
+        record_frames_removed(
+            session.connection(),
+            [FrameRow(f.satellite, f.sector, f.band, f.capture_time, f.file_size) for f in doomed],
+        )
+        session.commit()
+
+        assert _stats(session)[("GOES-19", "CONUS", "C02", date(2026, 3, 1))][:2] == (1, 10)
+
+    def test_record_added_without_rows_is_noop(self, session):
+        record_frames_added(session.connection(), [])
+        assert _stats(session) == {}
+
+
+class TestRebuild:
+    def test_rebuild_matches_incremental(self, session):
+        session.add_all(
+            [
+                _frame(datetime(2026, 2, 1, 1), 5),
+                _frame(datetime(2026, 2, 1, 2), 7, band="C13"),
+                _frame(datetime(2026, 2, 3, 4), 9, satellite="GOES-18"),
+            ]
+        )
+        session.commit()
+        incremental = _stats(session)
+
+        session.execute(delete(FrameStat))
+        buckets = rebuild_frame_stats(session.connection())
+        session.commit()
+
+        assert buckets == 3
+        assert _stats(session) == incremental
@@ -7,7 +7,15 @@ from datetime import datetime, timedelta
 import pytest
 import pytest_asyncio
 from app.db.models import GoesFrame
-from app.services.gap_detector import detect_capture_pattern, find_gaps, get_coverage_stats
+from app.services.gap_detector import (
+    detect_capture_pattern,
+    find_gaps,
+    get_coverage_stats,
+    interval_stats,
+    minutes_between,
+)
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql, sqlite
 
 
 def _frame(id_: str, satellite: str, band: str, sector: str, capture_time: datetime) -> GoesFrame:
@@ -59,6 +67,34 @@ class TestDetectCapturePattern:
         assert pattern["satellite"] is None
 
 
+class TestIntervalStats:
+    @pytest.mark.asyncio
+    async def test_per_product_histogram_median(self, db_with_images):
+        base = datetime(2024, 3, 15, 12, 0, 0)
+        for i in range(4):
+            db_with_images.add(_frame(f"g18-{i}", "GOES-18", "C13", "FullDisk", base + timedelta(minutes=15 * i)))
+        await db_with_images.commit()
+
+        stats = {s["satellite"]: s for s in await interval_stats(db_with_images)}
+        assert stats["GOES-16"]["interval_count"] == 14
+        assert stats["GOES-16"]["median_interval_minutes"] == pytest.approx(10.0)
+        assert stats["GOES-16"]["max_interval_minutes"] == pytest.approx(50.0)
+        assert stats["GOES-18"]["median_interval_minutes"] == pytest.approx(15.0)
+
+    @pytest.mark.asyncio
+    async def test_pattern_ignores_other_products(self, db_with_images):
+        pattern = await detect_capture_pattern(db_with_images)
+        assert (pattern["satellite"], pattern["sector"], pattern["band"]) == ("GOES-16", "CONUS", "C02")
+        assert pattern["time_range"]["start"] == "2024-03-15T12:00:00"
+
+
+class TestMinutesBetween:
+    def test_compiles_per_dialect(self):
+        expr = minutes_between(column("b"), column("a"))
+        assert "julianday" in str(expr.compile(dialect=sqlite.dialect()))
+        assert "EXTRACT(EPOCH FROM" in str(expr.compile(dialect=postgresql.dialect()))
+
+
 class TestFindGaps:
     @pytest.mark.asyncio
     async def test_finds_gap(self, db_with_images):
@@ -66,6 +102,8 @@ class TestFindGaps:
         assert len(gaps) == 1
         assert gaps[0]["duration_minutes"] == pytest.approx(50.0)
         assert gaps[0]["expected_frames"] == 4
+        assert gaps[0]["start"] == "2024-03-15T13:30:00"
+        assert (gaps[0]["satellite"], gaps[0]["sector"], gaps[0]["band"]) == ("GOES-16", "CONUS", "C02")
 
     @pytest.mark.asyncio
     async def test_no_gaps_with_high_tolerance(self, db_with_images):
@@ -98,3 +136,24 @@ class TestGetCoverageStats:
         assert stats["total_frames"] == 0
         assert stats["coverage_percent"] == pytest.approx(0.0)
         assert stats["gaps"] == []
+
+    @pytest.mark.asyncio
+    async def test_aggregates_per_product(self, db):
+        base = datetime(2024, 3, 15, 12, 0, 0)
+        # C02: 0..90 min with one 30-min gap (40 -> 70); C13: 0..60 min, no gap.
+        c02 = [0, 10, 20, 30, 40, 70, 80, 90]
+        c13 = [0, 10, 20, 30, 40, 50, 60]
+        for band, minutes in (("C02", c02), ("C13", c13)):
+            for m in minutes:
+                db.add(_frame(f"{band}-{m}", "GOES-16", band, "CONUS", base + timedelta(minutes=m)))
+        await db.commit()
+
+        stats = await get_coverage_stats(db, expected_interval=10.0)
+
+        assert stats["total_frames"] == 15
+        assert stats["gap_count"] == 1
+        assert [g["band"] for g in stats["gaps"]] == ["C02"]
+        assert stats["expected_frames"] == 10 + 7
+        # (90 - 30 + 60) covered of 90 + 60 minutes
+        assert stats["coverage_percent"] == pytest.approx(80.0)
+        assert stats["time_range"] == {"start": base.isoformat(), "end": (base + timedelta(minutes=90)).isoformat()}
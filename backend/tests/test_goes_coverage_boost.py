@@ -422,69 +422,6 @@ class TestLoadBandImages:
         assert result == [None]
 
 
-# ===========================================================================
-# goes_tasks.py — _normalize_band (lines 456-467)
-# ===========================================================================
-
-
-class TestNormalizeBand:
-    def test_same_shape_normalizes(self):
-        from app.tasks.goes_tasks import _normalize_band
-
-        arr = np.array([[0, 50], [100, 200]], dtype=np.float32)
-        result = _normalize_band(arr, (2, 2))
-        assert result.dtype == np.uint8
-        assert result.max() == 255
-        assert result.min() == 0
-
-    def test_different_shape_resizes(self):
-        from app.tasks.goes_tasks import _normalize_band
-
-        arr = np.array([[0, 128, 255, 100]], dtype=np.float32)
-        result = _normalize_band(arr, (2, 2))
-        assert result.shape == (2, 2)
-        assert result.dtype == np.uint8
-
-    def test_uniform_values_returns_zeros(self):
-        from app.tasks.goes_tasks import _normalize_band
-
-        arr = np.full((3, 3), 42.0, dtype=np.float32)
-        result = _normalize_band(arr, (3, 3))
-        assert result.dtype == np.uint8
-        assert np.all(result == 0)
-
-
-# ===========================================================================
-# goes_tasks.py — _compose_rgb (lines 472-483)
-# ===========================================================================
-
-
-class TestComposeRgb:
-    def test_three_bands(self):
-        from app.tasks.goes_tasks import _compose_rgb
-
-        bands = [
-            np.full((5, 5), 100, dtype=np.float32),
-            np.full((5, 5), 150, dtype=np.float32),
-            np.full((5, 5), 200, dtype=np.float32),
-        ]
-        img = _compose_rgb(bands)
-        assert img.mode == "RGB"
-        assert img.size == (5, 5)
-
-    def test_with_none_band(self):
-        from app.tasks.goes_tasks import _compose_rgb
-
-        bands = [
-            np.full((5, 5), 100, dtype=np.float32),
-            None,
-            np.full((5, 5), 200, dtype=np.float32),
-        ]
-        img = _compose_rgb(bands)
-        assert img.mode == "RGB"
-        assert img.size == (5, 5)
-
-
 # ===========================================================================
 # goes_tasks.py — _mark_composite_failed (lines 488-498)
 # ===========================================================================
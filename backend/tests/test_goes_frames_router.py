@@ -44,6 +44,29 @@ class TestDashboardStats:
         data = resp.json()
         assert data["total_frames"] == 0
 
+    @pytest.mark.asyncio
+    async def test_cached_totals_are_integers(self, client, db):
+        db.add(_frame(satellite="GOES-16", band="C02"))
+        db.add(_frame(satellite="GOES-16", band="C13"))
+        await db.commit()
+
+        first = (await client.get("/api/satellite/dashboard-stats")).json()
+        cached = (await client.get("/api/satellite/dashboard-stats")).json()
+        assert cached == first
+        assert isinstance(cached["total_frames"], int)
+        assert isinstance(cached["frames_by_satellite"]["GOES-16"], int)
+        assert isinstance(cached["storage_by_satellite"]["GOES-16"], int)
+        assert all(isinstance(v, int) for v in cached["storage_by_band"].values())
+
+    def test_sums_cast_to_bigint_on_postgres(self):
+        from app.db.frame_stats import sum_as_int
+        from app.db.models import FrameStat
+        from sqlalchemy.dialects import postgresql
+
+        sql = str(sum_as_int(FrameStat.total_size).compile(dialect=postgresql.dialect()))
+        assert sql.startswith("CAST(sum(")
+        assert sql.endswith("AS BIGINT)")
+
 
 class TestListFrames:
     @pytest.mark.asyncio
@@ -187,6 +210,98 @@ class TestBulkDeleteFrames:
         assert resp.json()["deleted"] == 0
 
 
+class TestListFramesCursor:
+    @pytest.mark.asyncio
+    async def test_walks_all_pages_without_repeats(self, client, db):
+        # Two frames share each capture_time so the id tie-breaker matters.
+        for i in range(7):
+            db.add(_frame(capture_time=datetime(2025, 1, 15, i // 2, 0, 0)))
+        await db.commit()
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 3, "include_total": "false"}
+            if cursor:
+                params["cursor"] = cursor
+            resp = await client.get("/api/satellite/frames", params=params)
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["total"] is None
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert len(set(seen)) == 7
+
+    @pytest.mark.asyncio
+    async def test_cursor_respects_sort_order(self, client, db):
+        for i in range(4):
+            db.add(_frame(file_size=100 * (i + 1)))
+        await db.commit()
+
+        first = (await client.get("/api/satellite/frames?limit=2&sort=file_size&order=asc")).json()
+        second = (
+            await client.get(
+                "/api/satellite/frames",
+                params={"limit": 2, "sort": "file_size", "order": "asc", "cursor": first["next_cursor"]},
+            )
+        ).json()
+        sizes = [f["file_size"] for f in first["items"] + second["items"]]
+        assert sizes == [100, 200, 300, 400]
+        assert second["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    async def test_created_at_ties_on_page_boundary(self, client, db, order):
+        for hour in (1, 1, 1, 2, 3):
+            db.add(_frame(created_at=datetime(2025, 1, 15, hour)))
+        await db.commit()
+
+        seen: list[str] = []
+        params = {"limit": 2, "sort": "created_at", "order": order}
+        while True:
+            data = (await client.get("/api/satellite/frames", params=params)).json()
+            seen.extend(item["id"] for item in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        assert len(seen) == len(set(seen)) == 5
+
+    def test_keyset_seeks_on_raw_column(self):
+        from app.routers._pagination import apply_keyset, encode_cursor
+        from sqlalchemy import select
+
+        cursor = encode_cursor(datetime(2025, 1, 15), "frame-id")
+        sql = str(apply_keyset(select(GoesFrame), GoesFrame.created_at, GoesFrame.id, "desc", cursor))
+        assert "coalesce" not in sql.lower()
+        assert "goes_frames.created_at < " in sql
+
+    def test_keyset_rejects_nullable_column(self):
+        from app.routers._pagination import apply_keyset
+        from sqlalchemy import select
+
+        with pytest.raises(TypeError):
+            apply_keyset(select(GoesFrame), GoesFrame.source_job_id, GoesFrame.id, "asc", None)
+
+    @pytest.mark.asyncio
+    async def test_null_cursor_value_rejected(self, client, db):
+        from app.routers._pagination import encode_cursor
+
+        resp = await client.get("/api/satellite/frames", params={"cursor": encode_cursor(None, "frame-id")})
+        assert resp.status_code == 400
+        assert resp.json()["error"] == "invalid_cursor"
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, client, db):
+        resp = await client.get("/api/satellite/frames?cursor=not-a-cursor")
+        assert resp.status_code == 400
+        assert resp.json()["error"] == "invalid_cursor"
+
+
 class TestExportFrames:
     @pytest.mark.asyncio
     async def test_export_json(self, client, db):
@@ -200,3 +315,120 @@ class TestExportFrames:
     async def test_export_empty(self, client, db):
         resp = await client.get("/api/satellite/frames/export?format=json")
         assert resp.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_export_streams_all_matching_rows(self, client, db):
+        for i in range(12):
+            db.add(_frame(satellite="GOES-16" if i % 2 else "GOES-18", capture_time=datetime(2025, 1, 15, i, 0, 0)))
+        await db.commit()
+
+        resp = await client.get("/api/satellite/frames/export?format=json&satellite=GOES-16")
+        assert resp.status_code == 200
+        rows = resp.json()
+        assert len(rows) == 6
+        assert {r["satellite"] for r in rows} == {"GOES-16"}
+
+    @pytest.mark.asyncio
+    async def test_export_csv_has_single_header(self, client, db):
+        for i in range(3):
+            db.add(_frame(capture_time=datetime(2025, 1, 15, i, 0, 0)))
+        await db.commit()
+
+        resp = await client.get("/api/satellite/frames/export?format=csv")
+        lines = resp.text.strip().splitlines()
+        assert lines[0].startswith("id,satellite")
+        assert len(lines) == 4
+
+
+class TestFrameTiles:
+    @pytest.fixture
+    def storage(self, tmp_path, monkeypatch):
+        from app.routers import goes_frames
+        from app.services import tiles
+        from app.utils import path_validation
+
+        # test_config reloads app.config, so modules may hold different
+        # settings instances; patch each one in play.
+        for module in (goes_frames, tiles, path_validation):
+            monkeypatch.setattr(module.settings, "storage_path", str(tmp_path))
+        return tmp_path
+
+    async def _add_frame(self, db, storage) -> GoesFrame:
+        from PIL import Image
+
+        Image.new("RGB", (600, 300)).save(storage / "tile_src.png")
+        frame = _frame(file_path=str(storage / "tile_src.png"), width=600, height=300)
+        db.add(frame)
+        await db.commit()
+        return frame
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_redis")
+    async def test_missing_pyramid_queues_build_once(self, client, db, storage):
+        from unittest.mock import patch
+
+        frame = await self._add_frame(db, storage)
+        with patch("app.tasks.tile_tasks.generate_frame_tiles.delay") as delay:
+            first = await client.get(f"/api/satellite/frames/{frame.id}/tiles/0/0/0")
+            second = await client.get(f"/api/satellite/frames/{frame.id}/tiles/0/0/0")
+        assert first.status_code == second.status_code == 202
+        assert first.headers["retry-after"] == "2"
+        delay.assert_called_once_with(frame.id)
+
+    @pytest.mark.asyncio
+    async def test_serves_tile_with_strong_etag(self, client, db, storage):
+        from app.services.tiles import build_tile_pyramid, pyramid_dir, tile_version
+
+        frame = await self._add_frame(db, storage)
+        version = tile_version(storage / "tile_src.png")
+        build_tile_pyramid(storage / "tile_src.png", pyramid_dir(frame.id, version))
+
+        resp = await client.get(f"/api/satellite/frames/{frame.id}/tiles/2/1/0?v={version}")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/webp"
+        assert resp.headers["etag"] == f'"{version}-2-1-0"'
+        assert "immutable" in resp.headers["cache-control"]
+
+        cached = await client.get(
+            f"/api/satellite/frames/{frame.id}/tiles/2/1/0", headers={"If-None-Match": resp.headers["etag"]}
+        )
+        assert cached.status_code == 304
+
+        info = (await client.get(f"/api/satellite/frames/{frame.id}/tiles")).json()
+        assert (info["ready"], info["max_zoom"], info["tile_size"]) == (True, 2, 256)
+        assert info["url_template"].endswith(f"/tiles/{{z}}/{{x}}/{{y}}?v={version}")
+
+    @pytest.mark.asyncio
+    async def test_unversioned_tile_url_revalidates(self, client, db, storage):
+        from app.services.tiles import build_tile_pyramid, pyramid_dir, tile_version
+
+        frame = await self._add_frame(db, storage)
+        version = tile_version(storage / "tile_src.png")
+        build_tile_pyramid(storage / "tile_src.png", pyramid_dir(frame.id, version))
+
+        for url in (
+            f"/api/satellite/frames/{frame.id}/tiles/0/0/0",
+            f"/api/satellite/frames/{frame.id}/tiles/0/0/0?v=stale",
+        ):
+            resp = await client.get(url)
+            assert resp.status_code == 200
+            assert resp.headers["cache-control"] == "no-cache"
+            assert resp.headers["etag"] == f'"{version}-0-0-0"'
+
+    @pytest.mark.asyncio
+    async def test_unreadable_source_without_dimensions(self, client, db, storage):
+        (storage / "broken.png").write_bytes(b"not an image")
+        frame = _frame(file_path=str(storage / "broken.png"), width=None, height=None)
+        db.add(frame)
+        await db.commit()
+
+        for url in (f"/api/satellite/frames/{frame.id}/tiles", f"/api/satellite/frames/{frame.id}/tiles/0/0/0"):
+            resp = await client.get(url)
+            assert resp.status_code == 422
+            assert resp.json()["error"] == "unreadable_image"
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_tile(self, client, db, storage):
+        frame = await self._add_frame(db, storage)
+        assert (await client.get(f"/api/satellite/frames/{frame.id}/tiles/3/0/0")).status_code == 404
+        assert (await client.get(f"/api/satellite/frames/{frame.id}/tiles/2/3/0")).status_code == 404
@@ -194,40 +194,59 @@ def test_build_status_historical_satellite():
 # ---------------------------------------------------------------------------
 
 
+def _gap_session(timestamps: list[datetime], satellite: str = "GOES-16"):
+    """A real in-memory SQLite session seeded with C02/FullDisk frames."""
+    from app.db.database import Base
+    from app.db.models import GoesFrame
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add_all(
+            GoesFrame(
+                satellite=satellite,
+                sector="FullDisk",
+                band="C02",
+                capture_time=ts,
+                file_path=f"/data/{i}.png",
+            )
+            for i, ts in enumerate(timestamps)
+        )
+        session.commit()
+    return factory
+
+
 @patch("app.tasks.fetch_task._get_sync_db")
 def test_detect_gaps_finds_gaps(mock_db):
     from app.tasks.goes_tasks import _detect_gaps
 
-    session = MagicMock()
-    mock_db.return_value = session
-
-    # Simulate timestamps with a 30-min gap (expected interval 10 min)
-    timestamps = [
-        (datetime(2026, 1, 1, 0, 0, tzinfo=UTC),),
-        (datetime(2026, 1, 1, 0, 10, tzinfo=UTC),),
-        (datetime(2026, 1, 1, 0, 40, tzinfo=UTC),),  # 30 min gap
-        (datetime(2026, 1, 1, 0, 50, tzinfo=UTC),),
-    ]
-    session.execute.return_value.all.return_value = timestamps
+    # 30-min gap (expected interval 10 min)
+    mock_db.side_effect = _gap_session(
+        [
+            datetime(2026, 1, 1, 0, 0),
+            datetime(2026, 1, 1, 0, 10),
+            datetime(2026, 1, 1, 0, 40),
+            datetime(2026, 1, 1, 0, 50),
+        ]
+    )
 
     gaps = _detect_gaps("GOES-16", "C02", "FullDisk", 10.0)
     assert len(gaps) == 1
     assert gaps[0]["duration_minutes"] == 30.0
+    assert gaps[0]["start"] == "2026-01-01T00:10:00"
+    assert gaps[0]["expected_frames"] == 2
 
 
 @patch("app.tasks.fetch_task._get_sync_db")
 def test_detect_gaps_no_gaps(mock_db):
     from app.tasks.goes_tasks import _detect_gaps
 
-    session = MagicMock()
-    mock_db.return_value = session
-
-    timestamps = [
-        (datetime(2026, 1, 1, 0, 0, tzinfo=UTC),),
-        (datetime(2026, 1, 1, 0, 10, tzinfo=UTC),),
-        (datetime(2026, 1, 1, 0, 20, tzinfo=UTC),),
-    ]
-    session.execute.return_value.all.return_value = timestamps
+    mock_db.side_effect = _gap_session(
+        [datetime(2026, 1, 1, 0, 0), datetime(2026, 1, 1, 0, 10), datetime(2026, 1, 1, 0, 20)]
+    )
 
     gaps = _detect_gaps("GOES-16", "C02", "FullDisk", 10.0)
     assert len(gaps) == 0
@@ -374,9 +393,7 @@ def test_process_single_frame_unexpected_error(mock_dl, tmp_path):
 def test_detect_gaps_empty_timestamps(mock_db):
     from app.tasks.goes_tasks import _detect_gaps
 
-    session = MagicMock()
-    mock_db.return_value = session
-    session.execute.return_value.all.return_value = []
+    mock_db.side_effect = _gap_session([])
 
     gaps = _detect_gaps("GOES-16", "C02", "FullDisk", 10.0)
     assert gaps == []
@@ -386,11 +403,7 @@ def test_detect_gaps_empty_timestamps(mock_db):
 def test_detect_gaps_single_timestamp(mock_db):
     from app.tasks.goes_tasks import _detect_gaps
 
-    session = MagicMock()
-    mock_db.return_value = session
-    session.execute.return_value.all.return_value = [
-        (datetime(2026, 1, 1, 0, 0, tzinfo=UTC),),
-    ]
+    mock_db.side_effect = _gap_session([datetime(2026, 1, 1, 0, 0)])
 
     gaps = _detect_gaps("GOES-16", "C02", "FullDisk", 10.0)
     assert gaps == []
@@ -401,18 +414,32 @@ def test_detect_gaps_no_filter(mock_db):
     """Test _detect_gaps with None satellite/band/sector (no WHERE filters)."""
     from app.tasks.goes_tasks import _detect_gaps
 
-    session = MagicMock()
-    mock_db.return_value = session
-    session.execute.return_value.all.return_value = [
-        (datetime(2026, 1, 1, 0, 0, tzinfo=UTC),),
-        (datetime(2026, 1, 1, 1, 0, tzinfo=UTC),),  # 60 min gap
-    ]
+    mock_db.side_effect = _gap_session([datetime(2026, 1, 1, 0, 0), datetime(2026, 1, 1, 1, 0)])  # 60 min gap
 
     gaps = _detect_gaps(None, None, None, 10.0)
     assert len(gaps) == 1
     assert gaps[0]["duration_minutes"] == 60.0
 
 
+@patch("app.tasks.fetch_task._get_sync_db")
+def test_detect_gaps_partitions_by_product(mock_db):
+    """Interleaved satellites are gap-checked independently."""
+    from app.db.models import GoesFrame
+    from app.tasks.goes_tasks import _detect_gaps
+
+    factory = _gap_session([datetime(2026, 1, 1, 0, m) for m in (0, 10, 20, 30)])
+    with factory() as session:
+        session.add_all(
+            GoesFrame(satellite="GOES-18", sector="FullDisk", band="C02", capture_time=ts, file_path="/x.png")
+            for ts in (datetime(2026, 1, 1, 0, 5), datetime(2026, 1, 1, 0, 45))
+        )
+        session.commit()
+    mock_db.side_effect = factory
+
+    gaps = _detect_gaps(None, "C02", "FullDisk", 10.0)
+    assert [(g["satellite"], g["duration_minutes"]) for g in gaps] == [("GOES-18", 40.0)]
+
+
 # ---------------------------------------------------------------------------
 # _create_backfill_image_records
 # ---------------------------------------------------------------------------
@@ -439,7 +466,7 @@ def test_create_backfill_image_records(mock_db, tmp_path):
             }
         ]
     )
-    assert session.add.call_count == 2  # Image + GoesFrame
+    assert session.execute.call_count == 2  # bulk INSERT Image + GoesFrame
     session.commit.assert_called_once()
     session.close.assert_called_once()
 
@@ -478,7 +505,8 @@ def test_create_fetch_records(mock_db, mock_dims, mock_thumb, tmp_path):
             }
         ],
     )
-    assert session.add.call_count >= 3  # Collection + Image + GoesFrame + CollectionFrame
+    # Existing collection (MagicMock query result), one batch: Image + GoesFrame + CollectionFrame
+    assert session.execute.call_count == 3
     session.commit.assert_called_once()
     session.close.assert_called_once()
 
@@ -492,8 +520,12 @@ def test_create_fetch_records_empty(mock_db, mock_dims, mock_thumb):
     session = MagicMock()
     mock_db.return_value = session
 
+    session.query.return_value.filter.return_value.first.return_value = None
+
     _create_fetch_records("job-1", "FullDisk", "/tmp", [])
+    session.add.assert_called_once()  # the collection
     session.commit.assert_called_once()
+    session.execute.assert_not_called()
     session.close.assert_called_once()
 
 
@@ -162,13 +162,12 @@ class TestCreateHimawariFetchRecords:
                 ],
             )
 
-        # Should commit with Collection + Image + GoesFrame + CollectionFrame
-        session.add.assert_called()
-        session.flush.assert_called_once()
-        session.commit.assert_called_once()
+        # Collection is added and committed first, then one batch of bulk inserts
+        session.add.assert_called_once()
+        assert session.commit.call_count == 2
 
-        # Check we added the right number of records (Collection + Image + GoesFrame + CollectionFrame)
-        assert session.add.call_count == 4
+        # Image + GoesFrame + CollectionFrame
+        assert session.execute.call_count == 3
 
 
 # ---------------------------------------------------------------------------
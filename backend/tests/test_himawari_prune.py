@@ -199,9 +199,15 @@ class TestHimawariCleanupPreview:
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("shared_db")
 class TestHimawariCleanupRun:
     """Test that cleanup run correctly deletes Himawari frames."""
 
+    @pytest.fixture
+    def db(self, shared_db):
+        """Cleanup runs on a sync session in a worker thread; see ``shared_db``."""
+        return shared_db
+
     async def test_run_deletes_old_himawari_frames(self, client, db):
         _make_rule(db, rule_type="max_age_days", value=7, satellite="Himawari-9")
         _make_frame(db, created_at=datetime(2020, 1, 1, tzinfo=UTC), file_path="/tmp/nonexistent_h9.png")
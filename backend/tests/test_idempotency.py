@@ -270,6 +270,13 @@ class TestWithIdempotency:
             # Lock persists — prevents re-running a flaky task immediately
             assert fake.get("task_idem:err-key") is not None
 
+    def test_release_on_error_drops_lock(self):
+        fake = FakeRedis()
+        with patch("app.tasks.helpers._get_redis", return_value=fake):
+            with pytest.raises(RuntimeError), with_idempotency("err-key", release_on_error=True):
+                raise RuntimeError("boom")
+            assert fake.get("task_idem:err-key") is None
+
     def test_redis_unavailable_fails_open(self):
         broken = MagicMock()
         broken.set.side_effect = ConnectionError("down")
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from app.db.frame_stats import FrameRow
 from app.routers.jobs import _calc_dir_size, _delete_job_files, _get_job_task_id
 
+CAPTURE = datetime(2026, 3, 1, 12)
+
+
+def _frame(frame_id: str, file_path: str | None = None, thumbnail_path: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=frame_id,
+        file_path=file_path,
+        thumbnail_path=thumbnail_path,
+        satellite="GOES-19",
+        sector="CONUS",
+        band="C13",
+        capture_time=CAPTURE,
+        file_size=100,
+    )
+
 
 class TestCalcDirSize:
     def test_existing_dir(self, tmp_path):
@@ -79,8 +96,8 @@ class TestDeleteJobFiles:
     @pytest.mark.asyncio
     async def test_bulk_deletes_frames(self):
         """Verify frames are deleted in bulk, not one at a time."""
-        frame1 = SimpleNamespace(id="f1", file_path="/tmp/f1.nc", thumbnail_path=None)
-        frame2 = SimpleNamespace(id="f2", file_path="/tmp/f2.nc", thumbnail_path="/tmp/f2_thumb.jpg")
+        frame1 = _frame("f1", "/tmp/f1.nc")
+        frame2 = _frame("f2", "/tmp/f2.nc", "/tmp/f2_thumb.jpg")
 
         job = SimpleNamespace(id="test-job-2", output_path=None)
 
@@ -98,18 +115,55 @@ class TestDeleteJobFiles:
         ):
             result = await _delete_job_files(db, job)
 
-        # safe_remove called for each file (f1.nc, f2.nc, f2_thumb.jpg)
-        assert mock_remove.call_count == 3
-        assert result == 300
+        # safe_remove called for each file (f1.nc, f2.nc, f2_thumb.jpg) and each image's CMI sidecar
+        assert mock_remove.call_count == 5
+        assert result == 500
 
         # Check that bulk deletes were executed (CollectionFrame + GoesFrame + JobLog = 3 more)
         # Total db.execute calls: 1 (select frames) + 1 (bulk CF delete) + 1 (bulk GF delete) + 1 (JobLog) = 4
         assert db.execute.call_count == 4
 
+    @pytest.mark.asyncio
+    async def test_removes_frame_tile_pyramids(self):
+        job = SimpleNamespace(id="test-job-tiles", output_path=None)
+        frames_result = MagicMock()
+        frames_result.scalars.return_value.all.return_value = [_frame("f1"), _frame("f2")]
+        db = AsyncMock()
+        db.execute.return_value = frames_result
+
+        with (
+            patch("app.routers.jobs.os.path.isdir", return_value=False),
+            patch("app.routers.jobs.remove_frame_tiles") as mock_tiles,
+        ):
+            await _delete_job_files(db, job)
+
+        assert [c.args for c in mock_tiles.call_args_list] == [("f1",), ("f2",)]
+
+    @pytest.mark.asyncio
+    async def test_deleted_frames_leave_frame_stats(self):
+        """Core deletes bypass the ORM listener, so the rows are passed to record_frames_removed."""
+        job = SimpleNamespace(id="test-job-stats", output_path=None)
+        frames_result = MagicMock()
+        frames_result.scalars.return_value.all.return_value = [_frame("f1"), _frame("f2")]
+        db = AsyncMock()
+        db.execute.return_value = frames_result
+        session = MagicMock()
+        db.run_sync.side_effect = lambda fn: fn(session)
+
+        with (
+            patch("app.routers.jobs.os.path.isdir", return_value=False),
+            patch("app.routers.jobs.record_frames_removed") as mock_record,
+        ):
+            await _delete_job_files(db, job)
+
+        conn, rows = mock_record.call_args.args
+        assert conn is session.connection.return_value
+        assert rows == [FrameRow("GOES-19", "CONUS", "C13", CAPTURE, 100)] * 2
+
     @pytest.mark.asyncio
     async def test_bulk_deletes_chunks_large_frame_sets(self):
         """Verify frames are deleted in chunks when exceeding chunk_size of 500."""
-        frames = [SimpleNamespace(id=f"f{i}", file_path=None, thumbnail_path=None) for i in range(501)]
+        frames = [_frame(f"f{i}") for i in range(501)]
 
         job = SimpleNamespace(id="test-job-chunked", output_path=None)
 
@@ -0,0 +1,57 @@
+"""Tests for the cached-sprite text overlay renderer."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from app.services.overlay import draw_text, text_sprite
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sprites():
+    text_sprite.cache_clear()
+    yield
+    text_sprite.cache_clear()
+
+
+def test_sprites_are_cached_per_string():
+    assert text_sprite("GOES-16 CONUS") is text_sprite("GOES-16 CONUS")
+    assert text_sprite("2024-06-15 12:30 UTC") is not text_sprite("2024-06-15 12:40 UTC")
+    assert text_sprite.cache_info().misses == 3
+
+
+def test_draws_in_place_within_text_region_only():
+    img = np.zeros((400, 600, 3), dtype=np.uint8)
+    before = img.__array_interface__["data"][0]
+
+    draw_text(img, "G16 CONUS Band 02", 10, 10)
+
+    assert img.__array_interface__["data"][0] == before
+    sprite = text_sprite("G16 CONUS Band 02")
+    h, w = sprite.inverse_alpha.shape[:2]
+    y0, x0 = 10 + sprite.dy, 10 + sprite.dx
+    assert img[y0 : y0 + h, x0 : x0 + w].max() == 255  # white fill
+    untouched = img.copy()
+    untouched[y0 : y0 + h, x0 : x0 + w] = 0
+    assert not untouched.any()
+
+
+def test_stroke_keeps_text_legible_on_white():
+    img = np.full((100, 400, 3), 255, dtype=np.uint8)
+    draw_text(img, "12:30 UTC", 10, 10)
+    assert img.min() < 64  # black stroke
+
+
+def test_clips_at_frame_edges():
+    img = np.zeros((20, 30, 3), dtype=np.uint8)
+    draw_text(img, "2024-06-15 12:30 UTC", 10, 10)
+    assert img.any()
+    draw_text(img, "offscreen", 500, 500)  # no-op, no error
+
+
+def test_works_on_cropped_views():
+    base = np.zeros((200, 200, 3), dtype=np.uint8)
+    view = base[50:150, 50:150]
+    draw_text(view, "G16", 10, 10)
+    assert base[50:150, 50:150].any()
+    assert not base[:50].any()
@@ -0,0 +1,350 @@
+"""Tests for rolling (segmented HLS) animations."""
+
+import sys
+from contextlib import nullcontext
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from app.db.models import Base, GoesFrame, RollingAnimation
+from app.services import rolling
+from app.utils import utcnow
+
+T0 = utcnow().replace(microsecond=0) - timedelta(hours=2)
+
+
+def _state_with_chunks(*last_captures):
+    state = rolling.load_state(rolling.Path("/nonexistent"))
+    for seq, last in enumerate(last_captures):
+        rolling.add_chunk(state, seq, [(f"seg_{seq:06d}_000.m4s", 2.0), (f"seg_{seq:06d}_001.m4s", 1.5)], last, last)
+    return state
+
+
+class TestPlaylist:
+    def test_chunks_are_separated_by_discontinuities(self):
+        text = rolling.render_playlist(_state_with_chunks(T0, T0 + timedelta(minutes=10)))
+        lines = text.splitlines()
+
+        assert lines[0] == "#EXTM3U"
+        assert "#EXT-X-TARGETDURATION:2" in lines
+        assert lines.count("#EXT-X-DISCONTINUITY") == 1
+        assert '#EXT-X-MAP:URI="init_000000.mp4"' in lines
+        assert '#EXT-X-MAP:URI="init_000001.mp4"' in lines
+        assert lines.index('#EXT-X-MAP:URI="init_000001.mp4"') == lines.index("#EXT-X-DISCONTINUITY") + 1
+        assert lines[-1] == "#EXT-X-ENDLIST"
+        assert "#EXTINF:1.500," in lines
+
+    def test_slide_window_advances_sequence_numbers(self):
+        state = _state_with_chunks(T0, T0 + timedelta(minutes=10), T0 + timedelta(minutes=20))
+
+        dropped = rolling.slide_window(state, T0 + timedelta(minutes=5))
+
+        assert [c["seq"] for c in dropped] == [0]
+        assert [c["seq"] for c in state["chunks"]] == [1, 2]
+        assert state["media_sequence"] == 2
+        assert state["discontinuity_sequence"] == 1
+        assert rolling.segment_count(state) == 4
+        assert rolling.total_duration(state) == pytest.approx(7.0)
+        text = rolling.render_playlist(state)
+        assert "#EXT-X-MEDIA-SEQUENCE:2" in text
+        assert "#EXT-X-DISCONTINUITY-SEQUENCE:1" in text
+
+    def test_partly_expired_chunk_is_kept(self):
+        state = _state_with_chunks(T0)
+        state["chunks"][0]["first_capture"] = (T0 - timedelta(hours=1)).isoformat()
+
+        assert rolling.slide_window(state, T0 - timedelta(minutes=1)) == []
+        assert len(state["chunks"]) == 1
+
+    def test_parse_chunk_playlist(self, tmp_path):
+        path = tmp_path / "chunk_000003.m3u8"
+        path.write_text(
+            '#EXTM3U\n#EXT-X-MAP:URI="init_000003.mp4"\n#EXTINF:2.000000,\n'
+            f"{tmp_path}/seg_000003_000.m4s\n#EXTINF:0.400000,\nseg_000003_001.m4s\n#EXT-X-ENDLIST\n"
+        )
+        assert rolling.parse_chunk_playlist(path) == [("seg_000003_000.m4s", 2.0), ("seg_000003_001.m4s", 0.4)]
+
+    def test_segment_names(self):
+        assert rolling.SEGMENT_FILE_RE.match("init_000001.mp4")
+        assert rolling.SEGMENT_FILE_RE.match("seg_000001_004.m4s")
+        assert not rolling.SEGMENT_FILE_RE.match("state.json")
+        assert not rolling.SEGMENT_FILE_RE.match("../init_000001.mp4")
+
+
+# Writes two segments, the init segment and a chunk playlist, as FFmpeg's HLS muxer would.
+_FAKE_HLS_FFMPEG = """#!{python}
+import os, sys
+sys.stdin.buffer.read()
+argv = sys.argv
+out = argv[-1]
+directory = os.path.dirname(out)
+pattern = argv[argv.index("-hls_segment_filename") + 1]
+init = argv[argv.index("-hls_fmp4_init_filename") + 1]
+open(os.path.join(directory, init), "wb").close()
+lines = ["#EXTM3U", '#EXT-X-MAP:URI="%s"' % init]
+for i, duration in enumerate((2.0, 1.0)):
+    name = pattern % i
+    open(name, "wb").close()
+    lines += ["#EXTINF:%f," % duration, os.path.basename(name)]
+lines.append("#EXT-X-ENDLIST")
+with open(out, "w") as fh:
+    fh.write("\\n".join(lines))
+"""
+
+
+@pytest.fixture
+def rolling_env(tmp_path, monkeypatch):
+    """Sync DB, output dir, fake ffmpeg and stub rendering for ``update_rolling_animation``."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+    monkeypatch.setattr(rolling.settings, "output_dir", str(tmp_path / "out"))
+    script = tmp_path / "ffmpeg"
+    script.write_text(_FAKE_HLS_FFMPEG.format(python=sys.executable))
+    script.chmod(0o755)
+
+    def fake_render(frames, job_id, *args, **kwargs):
+        assert job_id is None
+        for _ in frames:
+            yield np.zeros((8, 8, 3), dtype=np.uint8)
+
+    with (
+        patch("app.tasks.animation_tasks._get_sync_db", side_effect=Session),
+        patch("app.tasks.animation_tasks.with_idempotency", return_value=nullcontext(True)),
+        patch("app.tasks.animation_tasks.shutil.which", return_value=str(script)),
+        patch("app.tasks.animation_tasks._iter_rendered_frames", side_effect=fake_render),
+    ):
+        yield Session
+
+
+def _add_frames(session, *times):
+    for t in times:
+        session.add(GoesFrame(satellite="GOES-19", sector="CONUS", band="C02", capture_time=t, file_path="/x.png"))
+    session.commit()
+
+
+class TestUpdateRollingAnimation:
+    def _create(self, Session, **kwargs):
+        with Session() as session:
+            anim = RollingAnimation(name="r", satellite="GOES-19", sector="CONUS", band="C02", window_hours=1, **kwargs)
+            session.add(anim)
+            session.commit()
+            return anim.id
+
+    def test_encodes_only_new_frames_and_slides_window(self, rolling_env):
+        from app.tasks.animation_tasks import update_rolling_animation
+
+        Session = rolling_env
+        now = utcnow()
+        rolling_id = self._create(Session)
+        with Session() as session:
+            _add_frames(session, now - timedelta(hours=3), now - timedelta(minutes=50), now - timedelta(minutes=40))
+
+        assert update_rolling_animation.run(rolling_id) == 2  # the 3h-old frame is outside the window
+        assert update_rolling_animation.run(rolling_id) == 0  # nothing new
+
+        with Session() as session:
+            _add_frames(session, now - timedelta(minutes=20))
+        assert update_rolling_animation.run(rolling_id) == 1  # held back for a quarter of the window at most
+
+        directory = rolling.rolling_dir(rolling_id)
+        state = rolling.load_state(directory)
+        assert [c["seq"] for c in state["chunks"]] == [0, 1]
+        playlist = (directory / rolling.PLAYLIST_NAME).read_text()
+        assert playlist.count("#EXT-X-DISCONTINUITY\n") == 1
+        with Session() as session:
+            anim = session.get(RollingAnimation, rolling_id)
+            assert anim.segment_count == 4
+            assert anim.duration_seconds == pytest.approx(6.0)
+            assert anim.last_capture_time == now - timedelta(minutes=20)
+
+    def test_new_frames_wait_for_a_full_segment(self, rolling_env):
+        from app.tasks.animation_tasks import update_rolling_animation
+
+        Session = rolling_env
+        now = utcnow()
+        rolling_id = self._create(Session, fps=10)
+        with Session() as session:
+            _add_frames(session, now - timedelta(minutes=50))
+        assert update_rolling_animation.run(rolling_id) == 1
+
+        with Session() as session:
+            _add_frames(session, now - timedelta(minutes=2))
+        assert update_rolling_animation.run(rolling_id) == 0
+        assert len(rolling.load_state(rolling.rolling_dir(rolling_id))["chunks"]) == 1
+
+        # 2 s at 10 fps: twenty frames fill one segment.
+        with Session() as session:
+            _add_frames(session, *(now - timedelta(seconds=s) for s in range(1, 20)))
+        assert update_rolling_animation.run(rolling_id) == 20
+        assert len(rolling.load_state(rolling.rolling_dir(rolling_id))["chunks"]) == 2
+
+    def test_expired_chunks_are_deleted(self, rolling_env):
+        from app.tasks.animation_tasks import update_rolling_animation
+
+        Session = rolling_env
+        now = utcnow()
+        rolling_id = self._create(Session)
+        with Session() as session:
+            _add_frames(session, now - timedelta(minutes=30))
+        update_rolling_animation.run(rolling_id)
+        directory = rolling.rolling_dir(rolling_id)
+        assert (directory / "init_000000.mp4").exists()
+
+        with Session() as session:
+            _add_frames(session, now + timedelta(minutes=45))
+        with patch("app.tasks.animation_tasks.utcnow", return_value=now + timedelta(minutes=50)):
+            assert update_rolling_animation.run(rolling_id) == 1
+
+        state = rolling.load_state(directory)
+        assert [c["seq"] for c in state["chunks"]] == [1]
+        assert state["media_sequence"] == 2
+        assert "init_000000.mp4" not in (directory / rolling.PLAYLIST_NAME).read_text()
+        # Kept for one refresh, for clients still playing the previous playlist.
+        assert (directory / "seg_000000_000.m4s").exists()
+
+        with patch("app.tasks.animation_tasks.utcnow", return_value=now + timedelta(minutes=55)):
+            assert update_rolling_animation.run(rolling_id) == 0
+        assert not (directory / "init_000000.mp4").exists()
+        assert not (directory / "seg_000000_000.m4s").exists()
+        assert (directory / "seg_000001_000.m4s").exists()
+        assert rolling.load_state(directory)["retired"] == []
+
+    def test_resumes_from_segment_state_not_row(self, rolling_env):
+        from app.tasks.animation_tasks import update_rolling_animation
+
+        Session = rolling_env
+        now = utcnow()
+        rolling_id = self._create(Session)
+        with Session() as session:
+            _add_frames(session, now - timedelta(minutes=40), now - timedelta(minutes=30))
+        assert update_rolling_animation.run(rolling_id) == 2
+
+        with Session() as session:
+            session.get(RollingAnimation, rolling_id).last_capture_time = None  # e.g. the commit was lost
+            session.commit()
+            _add_frames(session, now - timedelta(minutes=20))
+        assert update_rolling_animation.run(rolling_id) == 1
+        assert [c["seq"] for c in rolling.load_state(rolling.rolling_dir(rolling_id))["chunks"]] == [0, 1]
+
+    def test_inactive_is_skipped(self, rolling_env):
+        from app.tasks.animation_tasks import update_rolling_animation
+
+        rolling_id = self._create(rolling_env, is_active=False)
+        assert update_rolling_animation.run(rolling_id) == 0
+        assert not rolling.rolling_dir(rolling_id).exists()
+
+    def test_ffmpeg_failure_is_recorded(self, rolling_env):
+        from app.tasks.animation_tasks import update_rolling_animation
+
+        Session = rolling_env
+        rolling_id = self._create(Session)
+        with Session() as session:
+            _add_frames(session, utcnow() - timedelta(minutes=5))
+        with (
+            patch("app.tasks.animation_tasks.shutil.which", return_value="/nonexistent/ffmpeg"),
+            pytest.raises(FileNotFoundError),
+        ):
+            update_rolling_animation.run(rolling_id)
+        with Session() as session:
+            anim = session.get(RollingAnimation, rolling_id)
+            assert anim.error
+            assert anim.last_capture_time is None
+
+    def test_failed_refresh_releases_lock(self, rolling_env):
+        from app.tasks import helpers
+        from app.tasks.animation_tasks import update_rolling_animation
+        from fakeredis import FakeRedis
+
+        Session = rolling_env
+        rolling_id = self._create(Session)
+        with Session() as session:
+            _add_frames(session, utcnow() - timedelta(minutes=5))
+        fake = FakeRedis()
+        with (
+            patch("app.tasks.animation_tasks.with_idempotency", helpers.with_idempotency),
+            patch("app.tasks.helpers._get_redis", return_value=fake),
+            patch("app.tasks.animation_tasks.shutil.which", return_value="/nonexistent/ffmpeg"),
+            pytest.raises(FileNotFoundError),
+        ):
+            update_rolling_animation.run(rolling_id)
+        assert fake.keys() == []
+
+    def test_enqueue_matches_active_streams(self, rolling_env):
+        from app.tasks.animation_tasks import enqueue_rolling_refreshes
+
+        Session = rolling_env
+        active = self._create(Session)
+        self._create(Session, is_active=False)
+        with Session() as session, patch("app.tasks.animation_tasks.update_rolling_animation.delay") as delay:
+            assert enqueue_rolling_refreshes(session, {("GOES-19", "CONUS", "C02"), ("GOES-18", "CONUS", "C02")}) == 1
+            assert enqueue_rolling_refreshes(session, set()) == 0
+        delay.assert_called_once_with(active)
+
+
+@pytest.fixture
+def rolling_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(rolling.settings, "output_dir", str(tmp_path))
+    return tmp_path
+
+
+_PAYLOAD = {"satellite": "GOES-19", "sector": "CONUS", "band": "C02", "window_hours": 3}
+
+
+@pytest.mark.asyncio
+class TestRollingAnimationEndpoints:
+    async def _create(self, client):
+        with patch("app.tasks.animation_tasks.update_rolling_animation.delay") as delay:
+            resp = await client.post("/api/satellite/rolling-animations", json=_PAYLOAD)
+        assert resp.status_code == 200
+        delay.assert_called_once_with(resp.json()["id"])
+        return resp.json()
+
+    async def test_create_list_get_delete(self, client, db, rolling_output):
+        data = await self._create(client)
+        assert data["window_hours"] == 3
+        assert data["playlist_url"] is None
+
+        listing = (await client.get("/api/satellite/rolling-animations")).json()
+        assert listing["total"] == 1
+
+        directory = rolling.rolling_dir(data["id"])
+        directory.mkdir(parents=True)
+        resp = await client.delete(f"/api/satellite/rolling-animations/{data['id']}")
+        assert resp.status_code == 200
+        assert not directory.exists()
+        resp = await client.get(f"/api/satellite/rolling-animations/{data['id']}")
+        assert resp.status_code == 404
+
+    async def test_rejects_invalid_band(self, client, db):
+        resp = await client.post("/api/satellite/rolling-animations", json={**_PAYLOAD, "band": "C99"})
+        assert resp.status_code == 422
+
+    async def test_serves_playlist_and_segments(self, client, db, rolling_output):
+        data = await self._create(client)
+        rolling_id = data["id"]
+        base = f"/api/satellite/rolling-animations/{rolling_id}"
+        assert (await client.get(f"{base}/index.m3u8")).status_code == 404
+
+        directory = rolling.rolling_dir(rolling_id)
+        state = _state_with_chunks(T0)
+        rolling.write_playlist(directory, state)
+        (directory / "seg_000000_000.m4s").write_bytes(b"seg")
+
+        resp = await client.get(f"{base}/index.m3u8")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/vnd.apple.mpegurl")
+        assert resp.headers["cache-control"] == "no-cache"
+
+        resp = await client.get(f"{base}/seg_000000_000.m4s")
+        assert resp.status_code == 200
+        assert resp.content == b"seg"
+        assert "immutable" in resp.headers["cache-control"]
+
+        assert (await client.get(f"{base}/state.json")).status_code == 404
+        assert (await client.get(f"{base}/seg_000000_009.m4s")).status_code == 404
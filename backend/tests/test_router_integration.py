@@ -6,7 +6,7 @@ Only external services (Redis, Celery, S3, filesystem) are mocked.
 
 import uuid
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from app.db.models import (
@@ -916,6 +916,19 @@ class TestJobs:
         assert resp.status_code == 200
         assert resp.json()["deleted"] is True
 
+    @pytest.mark.asyncio
+    async def test_delete_job_invalidates_frame_and_job_caches(self, client, db):
+        j1, j2, j3 = make_job(db), make_job(db), make_job(db)
+        await db.commit()
+
+        with patch("app.routers.jobs.invalidate_tags", new_callable=AsyncMock) as mock_invalidate:
+            assert (await client.delete(f"/api/jobs/{j1.id}")).status_code == 200
+            resp = await client.request("DELETE", "/api/jobs/bulk", json={"job_ids": [j2.id, j3.id]})
+            assert resp.status_code == 200
+
+        assert mock_invalidate.await_count == 2
+        mock_invalidate.assert_awaited_with("frames", "jobs")
+
     @pytest.mark.asyncio
     async def test_delete_job_not_found(self, client):
         resp = await client.delete(f"/api/jobs/{make_id()}")
@@ -1371,7 +1384,7 @@ class TestCleanupRules:
         assert resp.json()["frame_count"] >= 1
 
     @pytest.mark.asyncio
-    async def test_run_cleanup(self, client, db):
+    async def test_run_cleanup(self, client, shared_db):
         resp = await client.post("/api/satellite/cleanup/run")
         assert resp.status_code == 200
         assert resp.json()["deleted_frames"] == 0
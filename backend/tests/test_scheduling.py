@@ -408,8 +408,9 @@ async def test_cleanup_respects_protect_collections(client, db):
     assert resp.json()["frame_count"] == 0  # Protected!
 
 
-async def test_cleanup_run(client, db):
+async def test_cleanup_run(client, shared_db):
     """Test manual cleanup run."""
+    db = shared_db
     await client.post(
         "/api/satellite/cleanup-rules",
         json={
@@ -398,7 +398,13 @@ class TestCleanupPreview:
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("shared_db")
 class TestCleanupRun:
+    @pytest.fixture
+    def db(self, shared_db):
+        """Cleanup runs on a sync session in a worker thread; see ``shared_db``."""
+        return shared_db
+
     async def test_run_no_rules(self, client):
         resp = await client.post("/api/satellite/cleanup/run")
         assert resp.status_code == 200
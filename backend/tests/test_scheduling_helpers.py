@@ -6,14 +6,8 @@ from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from app.tasks.scheduling_tasks import (
-    _collect_age_based_deletions,
-    _collect_storage_based_deletions,
-    _delete_frame_files,
-    _get_protected_frame_ids,
-    _launch_schedule_job,
-    _pick_frames_for_deletion,
-)
+from app.services.cleanup import CleanupResult, delete_frame_files
+from app.tasks.scheduling_tasks import _launch_schedule_job
 from sqlalchemy.exc import SQLAlchemyError
 
 
@@ -159,74 +153,35 @@ class TestRunCleanup:
 
         from app.tasks.scheduling_tasks import run_cleanup
 
-        run_cleanup()
+        with patch("app.services.cleanup.run_cleanup_rules") as mock_engine:
+            run_cleanup()
 
+        mock_engine.assert_not_called()
         session.close.assert_called_once()
 
-    @patch("app.tasks.scheduling_tasks._delete_frame_files")
-    @patch("app.tasks.scheduling_tasks._collect_age_based_deletions")
-    @patch("app.tasks.scheduling_tasks._get_protected_frame_ids")
+    @patch("app.tasks.scheduling_tasks._invalidate_cache_tags")
     @patch("app.tasks.scheduling_tasks._get_sync_db")
-    def test_age_rule_deletes_frames(self, mock_db, mock_prot, mock_age, mock_del_files):
+    def test_runs_engine_and_invalidates_per_batch(self, mock_db, mock_invalidate):
         session = MagicMock()
         mock_db.return_value = session
-
         rule = SimpleNamespace(rule_type="max_age_days", protect_collections=False, is_active=True)
         session.query.return_value.filter.return_value.all.return_value = [rule]
 
-        mock_prot.return_value = set()
-        frame = SimpleNamespace(id="f1", file_size=1000, file_path="/a.png", thumbnail_path=None)
-        mock_age.return_value = [frame]
+        def engine(sess, rules, on_batch):
+            assert sess is session
+            assert rules == [rule]
+            on_batch(3)
+            on_batch(1)
+            return CleanupResult(4, 4000)
 
         from app.tasks.scheduling_tasks import run_cleanup
 
-        run_cleanup()
+        with patch("app.services.cleanup.run_cleanup_rules", side_effect=engine):
+            run_cleanup()
 
-        mock_del_files.assert_called_once_with(frame)
-        session.delete.assert_called_once_with(frame)
-        session.commit.assert_called_once()
+        assert mock_invalidate.call_count == 2
         session.close.assert_called_once()
 
-    @patch("app.tasks.scheduling_tasks._delete_frame_files")
-    @patch("app.tasks.scheduling_tasks._collect_storage_based_deletions")
-    @patch("app.tasks.scheduling_tasks._get_protected_frame_ids")
-    @patch("app.tasks.scheduling_tasks._get_sync_db")
-    def test_storage_rule_deletes_frames(self, mock_db, mock_prot, mock_storage, mock_del_files):
-        session = MagicMock()
-        mock_db.return_value = session
-
-        rule = SimpleNamespace(rule_type="max_storage_gb", protect_collections=True, is_active=True)
-        session.query.return_value.filter.return_value.all.return_value = [rule]
-
-        mock_prot.return_value = {"protected1"}
-        frame = SimpleNamespace(id="f2", file_size=2000, file_path="/b.png", thumbnail_path="/b_thumb.png")
-        mock_storage.return_value = [frame]
-
-        from app.tasks.scheduling_tasks import run_cleanup
-
-        run_cleanup()
-
-        mock_del_files.assert_called_once_with(frame)
-        session.delete.assert_called_once_with(frame)
-        session.commit.assert_called_once()
-
-    @patch("app.tasks.scheduling_tasks._get_protected_frame_ids")
-    @patch("app.tasks.scheduling_tasks._get_sync_db")
-    def test_unknown_rule_type(self, mock_db, mock_prot):
-        session = MagicMock()
-        mock_db.return_value = session
-
-        rule = SimpleNamespace(rule_type="unknown_type", protect_collections=False, is_active=True)
-        session.query.return_value.filter.return_value.all.return_value = [rule]
-        mock_prot.return_value = set()
-
-        from app.tasks.scheduling_tasks import run_cleanup
-
-        run_cleanup()
-
-        session.delete.assert_not_called()
-        session.commit.assert_called_once()
-
     @patch("app.tasks.scheduling_tasks._get_sync_db")
     def test_rollback_on_error(self, mock_db):
         session = MagicMock()
@@ -240,230 +195,23 @@ class TestRunCleanup:
         session.rollback.assert_called_once()
         session.close.assert_called_once()
 
-    @patch("app.tasks.scheduling_tasks._delete_frame_files")
-    @patch("app.tasks.scheduling_tasks._collect_age_based_deletions")
-    @patch("app.tasks.scheduling_tasks._get_protected_frame_ids")
     @patch("app.tasks.scheduling_tasks._get_sync_db")
-    def test_frame_with_none_file_size(self, mock_db, mock_prot, mock_age, mock_del_files):
+    def test_engine_error_rolls_back_current_batch(self, mock_db):
         session = MagicMock()
         mock_db.return_value = session
-
-        rule = SimpleNamespace(rule_type="max_age_days", protect_collections=False, is_active=True)
+        rule = SimpleNamespace(rule_type="max_storage_gb", protect_collections=True, is_active=True)
         session.query.return_value.filter.return_value.all.return_value = [rule]
-        mock_prot.return_value = set()
-
-        frame = SimpleNamespace(id="f1", file_size=None, file_path="/a.png", thumbnail_path=None)
-        mock_age.return_value = [frame]
 
         from app.tasks.scheduling_tasks import run_cleanup
 
-        run_cleanup()
-
-        session.commit.assert_called_once()
-
-
-# ── _get_protected_frame_ids ────────────────────────────
-
-
-class TestGetProtectedFrameIds:
-    def test_disabled(self):
-        session = MagicMock()
-        assert _get_protected_frame_ids(session, False) == set()
-        session.execute.assert_not_called()
-
-    def test_enabled(self):
-        session = MagicMock()
-        session.execute.return_value.all.return_value = [("f1",), ("f2",)]
-        result = _get_protected_frame_ids(session, True)
-        assert result == {"f1", "f2"}
-
-    def test_enabled_empty(self):
-        session = MagicMock()
-        session.execute.return_value.all.return_value = []
-        result = _get_protected_frame_ids(session, True)
-        assert result == set()
-
-
-# ── _collect_age_based_deletions ────────────────────────
-
-
-class TestCollectAgeBasedDeletions:
-    @patch("app.tasks.scheduling_tasks.utcnow")
-    def test_filters_old_and_unprotected(self, mock_now):
-        now = _utcnow()
-        mock_now.return_value = now
-
-        old_frame = SimpleNamespace(id="f1", created_at=now - timedelta(days=100))
-        protected_frame = SimpleNamespace(id="f3", created_at=now - timedelta(days=100))
-
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [old_frame, protected_frame]
-
-        rule = SimpleNamespace(value=30, satellite=None)
-        result = _collect_age_based_deletions(session, rule, {"f3"})
-        assert result == [old_frame]
-
-    @patch("app.tasks.scheduling_tasks.utcnow")
-    def test_no_old_frames(self, mock_now):
-        mock_now.return_value = _utcnow()
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = []
-
-        result = _collect_age_based_deletions(session, SimpleNamespace(value=30, satellite=None), set())
-        assert result == []
-
-    @patch("app.tasks.scheduling_tasks.utcnow")
-    def test_all_protected(self, mock_now):
-        now = _utcnow()
-        mock_now.return_value = now
-        f1 = SimpleNamespace(id="f1", created_at=now - timedelta(days=100))
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [f1]
-
-        result = _collect_age_based_deletions(session, SimpleNamespace(value=30, satellite=None), {"f1"})
-        assert result == []
-
-
-# ── _collect_storage_based_deletions ────────────────────
-
-
-class TestCollectStorageBasedDeletions:
-    def test_under_limit(self):
-        session = MagicMock()
-        session.execute.return_value.scalar.return_value = 500
-        rule = SimpleNamespace(value=1, satellite=None)  # 1 GB
-        assert _collect_storage_based_deletions(session, rule, set()) == []
-
-    def test_over_limit_deletes_oldest(self):
-        session = MagicMock()
-        session.execute.return_value.scalar.return_value = 2 * 1024 * 1024 * 1024
-
-        f1 = SimpleNamespace(id="f1", file_size=1024 * 1024 * 1024, created_at=_utcnow())
-        f2 = SimpleNamespace(id="f2", file_size=1024 * 1024 * 1024, created_at=_utcnow())
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
-            f1,
-            f2,
-        ]
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = _collect_storage_based_deletions(session, rule, set())
-        assert result == [f1]
-
-    def test_skips_protected(self):
-        session = MagicMock()
-        session.execute.return_value.scalar.return_value = 2 * 1024 * 1024 * 1024
-
-        f1 = SimpleNamespace(id="f1", file_size=1024 * 1024 * 1024, created_at=_utcnow())
-        f2 = SimpleNamespace(id="f2", file_size=1024 * 1024 * 1024, created_at=_utcnow())
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
-            f1,
-            f2,
-        ]
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = _collect_storage_based_deletions(session, rule, {"f1"})
-        assert result == [f2]
-
-    def test_zero_total_bytes(self):
-        session = MagicMock()
-        session.execute.return_value.scalar.return_value = 0
-        rule = SimpleNamespace(value=1, satellite=None)
-        assert _collect_storage_based_deletions(session, rule, set()) == []
-
-    def test_none_file_size(self):
-        session = MagicMock()
-        session.execute.return_value.scalar.return_value = 2 * 1024 * 1024 * 1024
-
-        f1 = SimpleNamespace(id="f1", file_size=None, created_at=_utcnow())
-        f2 = SimpleNamespace(id="f2", file_size=2 * 1024 * 1024 * 1024, created_at=_utcnow())
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
-            f1,
-            f2,
-        ]
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = _collect_storage_based_deletions(session, rule, set())
-        # f1 has None file_size (counted as 0), so f2 should also be included
-        assert f1 in result
-        assert f2 in result
-
-    def test_empty_batch_breaks_loop(self):
-        session = MagicMock()
-        session.execute.return_value.scalar.return_value = 2 * 1024 * 1024 * 1024
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = _collect_storage_based_deletions(session, rule, set())
-        assert result == []
-
+        with patch("app.services.cleanup.run_cleanup_rules", side_effect=SQLAlchemyError("boom")):
+            run_cleanup()
 
-# ── _pick_frames_for_deletion ──────────────────────────
-
-
-class TestPickFramesForDeletion:
-    def test_picks_oldest_until_excess_freed(self):
-        f1 = SimpleNamespace(id="f1", file_size=500, created_at=_utcnow())
-        f2 = SimpleNamespace(id="f2", file_size=500, created_at=_utcnow())
-        f3 = SimpleNamespace(id="f3", file_size=500, created_at=_utcnow())
-        session = MagicMock()
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
-            f1,
-            f2,
-            f3,
-        ]
-
-        rule = SimpleNamespace(satellite=None)
-        result = _pick_frames_for_deletion(session, rule, set(), 800)
-        assert result == [f1, f2]
-
-    def test_skips_protected_ids(self):
-        f1 = SimpleNamespace(id="f1", file_size=500, created_at=_utcnow())
-        f2 = SimpleNamespace(id="f2", file_size=500, created_at=_utcnow())
-        session = MagicMock()
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
-            f1,
-            f2,
-        ]
-
-        rule = SimpleNamespace(satellite=None)
-        result = _pick_frames_for_deletion(session, rule, {"f1"}, 400)
-        assert result == [f2]
-
-    def test_empty_batch_returns_empty(self):
-        session = MagicMock()
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
-
-        rule = SimpleNamespace(satellite=None)
-        assert _pick_frames_for_deletion(session, rule, set(), 1000) == []
-
-    def test_filters_by_satellite(self):
-        f1 = SimpleNamespace(id="f1", file_size=1000, created_at=_utcnow())
-        session = MagicMock()
-        query_mock = session.query.return_value.order_by.return_value
-        query_mock.filter.return_value.offset.return_value.limit.return_value.all.return_value = [f1]
-
-        rule = SimpleNamespace(satellite="GOES-16")
-        result = _pick_frames_for_deletion(session, rule, set(), 500)
-        assert result == [f1]
-        query_mock.filter.assert_called()
-
-    def test_none_file_size_counted_as_zero(self):
-        f1 = SimpleNamespace(id="f1", file_size=None, created_at=_utcnow())
-        f2 = SimpleNamespace(id="f2", file_size=1000, created_at=_utcnow())
-        session = MagicMock()
-        session.query.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
-            f1,
-            f2,
-        ]
-
-        rule = SimpleNamespace(satellite=None)
-        result = _pick_frames_for_deletion(session, rule, set(), 500)
-        # f1 contributes 0 bytes, so both needed to reach 500
-        assert f1 in result
-        assert f2 in result
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
 
 
-# ── _delete_frame_files ─────────────────────────────────
+# ── delete_frame_files ──────────────────────────────────
 
 
 class TestDeleteFrameFiles:
@@ -474,21 +222,21 @@ class TestDeleteFrameFiles:
         tp.write_text("x")
 
         frame = SimpleNamespace(file_path=str(fp), thumbnail_path=str(tp))
-        _delete_frame_files(frame)
+        delete_frame_files(frame)
         assert not fp.exists()
         assert not tp.exists()
 
     def test_handles_missing_files(self):
         frame = SimpleNamespace(file_path="/nonexistent/a.png", thumbnail_path=None)
-        _delete_frame_files(frame)
+        delete_frame_files(frame)
 
     def test_handles_none_paths(self):
         frame = SimpleNamespace(file_path=None, thumbnail_path=None)
-        _delete_frame_files(frame)
+        delete_frame_files(frame)
 
     def test_handles_oserror_gracefully(self):
         frame = SimpleNamespace(file_path="/root/no_perms/file.png", thumbnail_path="/root/no_perms/thumb.png")
-        _delete_frame_files(frame)  # should not raise
+        delete_frame_files(frame)  # should not raise
 
 
 # ── Constants from other modules ────────────────────────
@@ -8,10 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from app.routers.scheduling import (
-    _collect_age_deletions,
-    _collect_storage_deletions,
     _get_frames_to_cleanup,
-    _get_protected_ids,
     _schedule_response,
 )
 
@@ -20,260 +17,59 @@ def _utcnow():
     return datetime.now(tz=UTC)
 
 
-# ── _get_protected_ids ──────────────────────────────────
-
-
-class TestGetProtectedIds:
-    @pytest.mark.asyncio
-    async def test_disabled(self):
-        db = AsyncMock()
-        result = await _get_protected_ids(db, False)
-        assert result == set()
-        db.execute.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_enabled(self):
-        db = AsyncMock()
-        result_obj = MagicMock()
-        result_obj.all.return_value = [("f1",), ("f2",), ("f3",)]
-        db.execute.return_value = result_obj
-
-        result = await _get_protected_ids(db, True)
-        assert result == {"f1", "f2", "f3"}
-
-    @pytest.mark.asyncio
-    async def test_enabled_empty(self):
-        db = AsyncMock()
-        result_obj = MagicMock()
-        result_obj.all.return_value = []
-        db.execute.return_value = result_obj
-
-        result = await _get_protected_ids(db, True)
-        assert result == set()
-
-
-# ── _collect_age_deletions ──────────────────────────────
-
-
-class TestCollectAgeDeletions:
-    @pytest.mark.asyncio
-    @patch("app.routers.scheduling.utcnow")
-    async def test_returns_unprotected_old_frames(self, mock_now):
-        now = datetime.now(tz=UTC)
-        mock_now.return_value = now
-
-        # Function now uses select(GoesFrame.id) and filters protected in query
-        # so the DB result only contains unprotected IDs as raw tuples
-        result_obj = MagicMock()
-        result_obj.all.return_value = [("old1",)]
-
-        db = AsyncMock()
-        db.execute.return_value = result_obj
-
-        rule = SimpleNamespace(value=30, satellite=None)
-        result = await _collect_age_deletions(db, rule, {"protected1"})
-        assert result == {"old1"}
-
-    @pytest.mark.asyncio
-    @patch("app.routers.scheduling.utcnow")
-    async def test_empty_when_no_old_frames(self, mock_now):
-        mock_now.return_value = datetime.now(tz=UTC)
-
-        result_obj = MagicMock()
-        result_obj.all.return_value = []
-
-        db = AsyncMock()
-        db.execute.return_value = result_obj
-
-        result = await _collect_age_deletions(db, SimpleNamespace(value=30, satellite=None), set())
-        assert result == set()
-
-    @pytest.mark.asyncio
-    @patch("app.routers.scheduling.utcnow")
-    async def test_all_protected(self, mock_now):
-        mock_now.return_value = datetime.now(tz=UTC)
-
-        # Protected IDs are filtered in the query, so DB returns empty
-        result_obj = MagicMock()
-        result_obj.all.return_value = []
-
-        db = AsyncMock()
-        db.execute.return_value = result_obj
-
-        result = await _collect_age_deletions(db, SimpleNamespace(value=30, satellite=None), {"f1"})
-        assert result == set()
-
-
-# ── _collect_storage_deletions ──────────────────────────
-
-
-class TestCollectStorageDeletions:
-    @pytest.mark.asyncio
-    async def test_under_limit_returns_empty(self):
-        total_result = MagicMock()
-        total_result.scalar.return_value = 500
-
-        db = AsyncMock()
-        db.execute.return_value = total_result
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = await _collect_storage_deletions(db, rule, set())
-        assert result == set()
-
-    @pytest.mark.asyncio
-    async def test_over_limit_deletes_oldest_unprotected(self):
-        total_result = MagicMock()
-        total_result.scalar.return_value = 2 * 1024 * 1024 * 1024
-
-        frames_result = MagicMock()
-        frames_result.__iter__ = MagicMock(return_value=iter([("f1", 1024 * 1024 * 1024), ("f2", 1024 * 1024 * 1024)]))
-
-        db = AsyncMock()
-        db.execute.side_effect = [total_result, frames_result]
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = await _collect_storage_deletions(db, rule, set())
-        assert result == {"f1"}
-
-    @pytest.mark.asyncio
-    async def test_skips_protected_frames(self):
-        total_result = MagicMock()
-        total_result.scalar.return_value = 2 * 1024 * 1024 * 1024
-
-        # Protected IDs are filtered in the query, so only unprotected returned
-        frames_result = MagicMock()
-        frames_result.__iter__ = MagicMock(return_value=iter([("f2", 1024 * 1024 * 1024)]))
-
-        db = AsyncMock()
-        db.execute.side_effect = [total_result, frames_result]
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = await _collect_storage_deletions(db, rule, {"f1"})
-        assert result == {"f2"}
-
-    @pytest.mark.asyncio
-    async def test_none_file_size(self):
-        total_result = MagicMock()
-        total_result.scalar.return_value = 2 * 1024 * 1024 * 1024
-
-        frames_result = MagicMock()
-        frames_result.__iter__ = MagicMock(return_value=iter([("f1", None), ("f2", 2 * 1024 * 1024 * 1024)]))
-
-        db = AsyncMock()
-        db.execute.side_effect = [total_result, frames_result]
-
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = await _collect_storage_deletions(db, rule, set())
-        assert "f1" in result
-        assert "f2" in result
-
-    @pytest.mark.asyncio
-    async def test_zero_total(self):
-        total_result = MagicMock()
-        total_result.scalar.return_value = 0
+# ── _get_frames_to_cleanup ──────────────────────────────
+# Candidate selection itself is covered by tests/test_cleanup_engine.py.
 
-        db = AsyncMock()
-        db.execute.return_value = total_result
 
-        rule = SimpleNamespace(value=1, satellite=None)
-        result = await _collect_storage_deletions(db, rule, set())
-        assert result == set()
+def _rules_result(rules):
+    rules_result = MagicMock()
+    scalars = MagicMock()
+    scalars.all.return_value = rules
+    rules_result.scalars.return_value = scalars
+    return rules_result
 
 
-# ── _get_frames_to_cleanup ──────────────────────────────
+def _candidate(frame_id):
+    return (frame_id, f"/data/{frame_id}.png", None, "GOES-16", "CONUS", "C02", _utcnow(), 100)
 
 
 class TestGetFramesToCleanup:
     @pytest.mark.asyncio
-    @patch("app.routers.scheduling._collect_storage_deletions")
-    @patch("app.routers.scheduling._collect_age_deletions")
-    @patch("app.routers.scheduling._get_protected_ids")
-    async def test_no_rules(self, mock_prot, mock_age, mock_storage):
-        rules_result = MagicMock()
-        scalars = MagicMock()
-        scalars.all.return_value = []
-        rules_result.scalars.return_value = scalars
-
+    async def test_no_rules(self):
         db = AsyncMock()
-        db.execute.return_value = rules_result
+        db.execute.return_value = _rules_result([])
 
         result = await _get_frames_to_cleanup(db)
         assert result == []
 
     @pytest.mark.asyncio
-    @patch("app.routers.scheduling._collect_age_deletions")
-    @patch("app.routers.scheduling._get_protected_ids")
-    async def test_age_rule(self, mock_prot, mock_age):
-        rule = SimpleNamespace(rule_type="max_age_days", protect_collections=False)
-        rules_result = MagicMock()
-        scalars = MagicMock()
-        scalars.all.return_value = [rule]
-        rules_result.scalars.return_value = scalars
+    @patch("app.routers.scheduling.candidates_query")
+    async def test_merges_rules_without_duplicates(self, mock_query):
+        age = SimpleNamespace(rule_type="max_age_days")
+        storage = SimpleNamespace(rule_type="max_storage_gb")
+        mock_query.side_effect = lambda rule: rule.rule_type
 
-        mock_prot.return_value = set()
-        mock_age.return_value = {"f1", "f2"}
-
-        frame1 = SimpleNamespace(id="f1")
-        frame2 = SimpleNamespace(id="f2")
-        frames_result = MagicMock()
-        frames_scalars = MagicMock()
-        frames_scalars.all.return_value = [frame1, frame2]
-        frames_result.scalars.return_value = frames_scalars
+        age_rows = MagicMock()
+        age_rows.all.return_value = [_candidate("f1"), _candidate("f2")]
+        storage_rows = MagicMock()
+        storage_rows.all.return_value = [_candidate("f2"), _candidate("f3")]
 
         db = AsyncMock()
-        db.execute.side_effect = [rules_result, frames_result]
+        db.execute.side_effect = [_rules_result([age, storage]), age_rows, storage_rows]
 
         result = await _get_frames_to_cleanup(db)
-        assert len(result) == 2
+        assert [c.id for c in result] == ["f1", "f2", "f3"]
+        assert result[0].file_path == "/data/f1.png"
 
     @pytest.mark.asyncio
-    @patch("app.routers.scheduling._collect_storage_deletions")
-    @patch("app.routers.scheduling._get_protected_ids")
-    async def test_storage_rule(self, mock_prot, mock_storage):
-        rule = SimpleNamespace(rule_type="max_storage_gb", protect_collections=False)
-        rules_result = MagicMock()
-        scalars = MagicMock()
-        scalars.all.return_value = [rule]
-        rules_result.scalars.return_value = scalars
-
-        mock_prot.return_value = set()
-        mock_storage.return_value = {"f1"}
-
-        frame1 = SimpleNamespace(id="f1")
-        frames_result = MagicMock()
-        frames_scalars = MagicMock()
-        frames_scalars.all.return_value = [frame1]
-        frames_result.scalars.return_value = frames_scalars
-
+    @patch("app.routers.scheduling.candidates_query", return_value=None)
+    async def test_unknown_rule_type_skipped(self, mock_query):
         db = AsyncMock()
-        db.execute.side_effect = [rules_result, frames_result]
+        db.execute.return_value = _rules_result([SimpleNamespace(rule_type="bogus")])
 
         result = await _get_frames_to_cleanup(db)
-        assert len(result) == 1
-
-    @pytest.mark.asyncio
-    @patch("app.routers.scheduling._get_protected_ids")
-    async def test_no_deletions_returns_empty(self, mock_prot):
-        rule = SimpleNamespace(rule_type="max_age_days", protect_collections=False)
-        rules_result = MagicMock()
-        scalars = MagicMock()
-        scalars.all.return_value = [rule]
-        rules_result.scalars.return_value = scalars
-
-        mock_prot.return_value = set()
-
-        db = AsyncMock()
-
-        # First call returns rules, second returns age query with empty
-        age_result = MagicMock()
-        age_scalars = MagicMock()
-        age_scalars.all.return_value = []
-        age_result.scalars.return_value = age_scalars
-        db.execute.side_effect = [rules_result, age_result]
-
-        with patch("app.routers.scheduling._collect_age_deletions", return_value=set()):
-            result = await _get_frames_to_cleanup(db)
         assert result == []
+        assert db.execute.await_count == 1
 
 
 # ── _schedule_response ──────────────────────────────────
@@ -0,0 +1,138 @@
+"""Tests for thumbnail sprite sheets (app.services.sprites and /frames/sprites)."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from app.config import settings
+from app.db.models import GoesFrame
+from app.services.sprites import (
+    SPRITE_CELL,
+    SPRITE_COLUMNS,
+    SpriteFrame,
+    build_index,
+    render_sheet,
+    sprite_dir,
+    sweep_stale_sprites,
+)
+from PIL import Image
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    return tmp_path
+
+
+def _sprite_frames(storage, n: int) -> list[SpriteFrame]:
+    frames = []
+    for i in range(n):
+        thumb = storage / f"thumb_{i}.jpg"
+        Image.new("RGB", (256, 128), (i, 0, 0)).save(thumb)
+        frames.append(SpriteFrame(f"f{i}", datetime(2026, 5, 1) + timedelta(minutes=i), str(thumb), "unused.png"))
+    return frames
+
+
+class TestSpriteService:
+    def test_index_layout_and_sheet(self, storage):
+        frames = _sprite_frames(storage, 105)
+        index = build_index(frames)
+
+        assert index["sheet_count"] == 2
+        assert index["frames"][11] == {
+            "id": "f11",
+            "capture_time": "2026-05-01T00:11:00",
+            "sheet": 0,
+            "x": SPRITE_CELL,
+            "y": SPRITE_CELL,
+        }
+        assert index["frames"][100]["sheet"] == 1
+
+        first = render_sheet(index["sprite_id"], 0)
+        last = render_sheet(index["sprite_id"], 1)
+        with Image.open(first) as a, Image.open(last) as b:
+            assert a.size == (SPRITE_COLUMNS * SPRITE_CELL, SPRITE_COLUMNS * SPRITE_CELL)
+            assert b.size == (5 * SPRITE_CELL, SPRITE_CELL)
+        assert render_sheet(index["sprite_id"], 2) is None
+        assert render_sheet("0" * 24, 0) is None
+
+    def test_membership_changes_sprite_id(self, storage):
+        frames = _sprite_frames(storage, 3)
+        assert build_index(frames)["sprite_id"] != build_index(frames[:2])["sprite_id"]
+
+    def test_sweeps_idle_sprites(self, storage):
+        old = build_index(_sprite_frames(storage, 1))["sprite_id"]
+        os.utime(sprite_dir(old) / "manifest.json", (0, 0))
+        assert sweep_stale_sprites() == 1
+        assert not sprite_dir(old).exists()
+
+    def test_sweep_spares_directories_being_built(self, storage):
+        building, abandoned = sprite_dir("a" * 24), sprite_dir("b" * 24)
+        building.mkdir(parents=True)
+        abandoned.mkdir(parents=True)
+        os.utime(abandoned, (0, 0))
+        assert sweep_stale_sprites() == 1
+        assert building.exists()
+        assert not abandoned.exists()
+
+
+class TestSpriteEndpoints:
+    async def _add_frames(self, db, storage, n: int) -> list[str]:
+        ids = []
+        for f in _sprite_frames(storage, n):
+            frame_id = str(uuid.uuid4())
+            db.add(
+                GoesFrame(
+                    id=frame_id,
+                    satellite="GOES-19",
+                    sector="CONUS",
+                    band="C02",
+                    capture_time=f.capture_time,
+                    file_path=f.file_path,
+                    thumbnail_path=f.thumbnail_path,
+                )
+            )
+            ids.append(frame_id)
+        await db.commit()
+        return ids
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_redis")
+    async def test_index_then_sheet(self, client, db, storage):
+        ids = await self._add_frames(db, storage, 3)
+        resp = await client.get("/api/satellite/frames/sprites?satellite=GOES-19&sector=CONUS&band=C02")
+        assert resp.status_code == 200
+        index = resp.json()
+        assert [f["id"] for f in index["frames"]] == ids
+
+        url = index["sheet_url_template"].format(sheet=0)
+        sheet = await client.get(url)
+        assert sheet.status_code == 200
+        assert sheet.headers["content-type"] == "image/webp"
+        assert "immutable" in sheet.headers["cache-control"]
+        assert (await client.get(url, headers={"If-None-Match": sheet.headers["etag"]})).status_code == 304
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_redis")
+    async def test_delete_invalidates_index(self, client, db, storage):
+        ids = await self._add_frames(db, storage, 3)
+        url = "/api/satellite/frames/sprites?satellite=GOES-19&sector=CONUS&band=C02"
+        before = (await client.get(url)).json()
+
+        await client.request("DELETE", "/api/satellite/frames", json={"ids": ids[:1]})
+        after = (await client.get(url)).json()
+
+        assert len(after["frames"]) == 2
+        assert after["sprite_id"] != before["sprite_id"]
+
+    @pytest.mark.asyncio
+    async def test_requires_product_or_collection(self, client):
+        resp = await client.get("/api/satellite/frames/sprites?satellite=GOES-19")
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_sprite_id(self, client):
+        assert (await client.get("/api/satellite/frames/sprites/..%2F..%2Fx/0.webp")).status_code == 404
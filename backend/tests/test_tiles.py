@@ -0,0 +1,103 @@
+"""Tests for frame tile pyramids (app.services.tiles, app.tasks.tile_tasks)."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from app.services import tiles
+from app.services.tiles import (
+    TILE_SIZE,
+    build_tile_pyramid,
+    level_size,
+    max_zoom,
+    prune_old_versions,
+    pyramid_dir,
+    remove_frame_tiles,
+    tile_grid,
+    tile_version,
+)
+from PIL import Image
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    from app.services import tiles
+    from app.tasks import tile_tasks
+
+    # test_config reloads app.config, so modules may hold different
+    # settings instances; patch each one in play.
+    for module in (tiles, tile_tasks):
+        monkeypatch.setattr(module.settings, "storage_path", str(tmp_path))
+    return tmp_path
+
+
+class TestGeometry:
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [((100, 50), 0), ((256, 256), 0), ((257, 10), 1), ((1000, 600), 2), ((4096, 4096), 4)],
+    )
+    def test_max_zoom(self, size, expected):
+        assert max_zoom(*size) == expected
+
+    def test_levels_halve_down_to_one_tile(self):
+        assert level_size(1000, 600, 2) == (1000, 600)
+        assert level_size(1000, 600, 1) == (500, 300)
+        assert level_size(1000, 600, 0) == (250, 150)
+        assert tile_grid(1000, 600, 2) == (4, 3)
+        assert tile_grid(1000, 600, 0) == (1, 1)
+
+
+class TestBuildPyramid:
+    def test_builds_every_level(self, storage):
+        source = storage / "frame.png"
+        Image.new("RGB", (600, 300), (10, 20, 30)).save(source)
+        out = pyramid_dir("f1", tile_version(source))
+
+        count = build_tile_pyramid(source, out)
+
+        assert count == 3 * 2 + 2 * 1 + 1
+        with Image.open(out / "2" / "2_1.webp") as edge:
+            assert edge.size == (600 - 2 * TILE_SIZE, 300 - TILE_SIZE)
+        with Image.open(out / "0" / "0_0.webp") as root:
+            assert root.size == (150, 75)
+        assert [p.name for p in out.parent.iterdir()] == [out.name]
+
+    def test_version_changes_with_source(self, storage):
+        source = storage / "frame.png"
+        Image.new("L", (10, 10)).save(source)
+        before = tile_version(source)
+        Image.new("L", (12, 10)).save(source)
+        os.utime(source, ns=(1, 1))
+        assert tile_version(source) != before
+
+    def test_prune_and_remove(self, storage):
+        for version in ("old", "new"):
+            pyramid_dir("f1", version).mkdir(parents=True)
+        prune_old_versions("f1", "new")
+        assert [p.name for p in (tiles.tiles_root() / "f1").iterdir()] == ["new"]
+        remove_frame_tiles("f1")
+        assert not (tiles.tiles_root() / "f1").exists()
+
+
+class TestGenerateFrameTilesTask:
+    def test_builds_once_per_version(self, storage):
+        from app.db.models import GoesFrame
+        from app.tasks.tile_tasks import generate_frame_tiles
+
+        Image.new("RGB", (300, 200)).save(storage / "frame.png")
+        frame = GoesFrame(
+            id="f1",
+            satellite="GOES-19",
+            sector="CONUS",
+            band="C02",
+            capture_time=datetime(2026, 5, 1),
+            file_path="frame.png",
+        )
+        with patch("app.tasks.tile_tasks._get_sync_db") as get_db:
+            get_db.return_value.get.return_value = frame
+            assert generate_frame_tiles.run("f1") == 2 + 1
+            assert generate_frame_tiles.run("f1") == 0
+        assert pyramid_dir("f1", tile_version(storage / "frame.png")).is_dir()
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from app.utils import sanitize_log, utcnow
+from app.utils import batched, sanitize_log, utcnow
 
 
 class TestUtcNow:
@@ -48,3 +48,17 @@ class TestSanitizeLog:
 
     def test_preserves_unicode(self):
         assert sanitize_log("café ☕") == "café ☕"
+
+
+class TestBatched:
+    def test_splits_with_short_tail(self):
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_consumes_iterators_lazily(self):
+        it = iter(range(4))
+        first = next(batched(it, 3))
+        assert first == [0, 1, 2]
+        assert list(it) == [3]
+
+    def test_empty(self):
+        assert list(batched([], 3)) == []
@@ -5,7 +5,7 @@ Exposes key classes and functionality
 
 from .file_manager import FileManager
 from .image_operations import ImageOperations
-from .pipeline import Pipeline, Stage, validate_image
+from .pipeline import Pipeline, Stage, StreamableStage, validate_image
 from .processor import SatelliteImageProcessor
 from .resource_monitor import ResourceMonitor
 from .settings_manager import SettingsManager
@@ -21,6 +21,7 @@ __all__ = [
     "SettingsManager",
     "Pipeline",
     "Stage",
+    "StreamableStage",
     "validate_image",
     "to_core_settings",
     "from_core_settings",
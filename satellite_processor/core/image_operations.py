@@ -126,8 +126,13 @@ class ImageOperations:
             return False
 
     @staticmethod
-    def add_timestamp(img: np.ndarray, source: datetime | Path | str) -> np.ndarray:
-        """Add a timestamp overlay to the image"""
+    def add_timestamp(img: np.ndarray, source: datetime | Path | str, *, inplace: bool = False) -> np.ndarray:
+        """Add a timestamp overlay to the image.
+
+        Only the label's bottom-left region is drawn on. By default the
+        image is copied first; callers that own *img* pass ``inplace=True``
+        to skip the full-frame copy.
+        """
         try:
             logger.debug(f"Starting timestamp addition for: {source}")
 
@@ -155,8 +160,7 @@ class ImageOperations:
             timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
             logger.debug(f"Using timestamp string: {timestamp_str}")
 
-            # Create a copy of the image to avoid modifying original
-            img_copy = img.copy()
+            img_copy = img if inplace else img.copy()
 
             # Setup text parameters
             font = cv2.FONT_HERSHEY_SIMPLEX
@@ -362,7 +366,7 @@ class ImageOperations:
                     return None
 
             if options.get("add_timestamp", True):
-                img = ImageOperations.add_timestamp(img, Path(image_path))
+                img = ImageOperations.add_timestamp(img, Path(image_path), inplace=True)
 
             return img
 
@@ -478,7 +482,7 @@ class ImageOperations:
 
             # 3. Timestamp
             if options.get("add_timestamp", False):
-                img = ImageOperations.add_timestamp(img, Path(image_path))
+                img = ImageOperations.add_timestamp(img, Path(image_path), inplace=True)
 
             # 4. False color
             if options.get("false_color_enabled"):
@@ -3,20 +3,34 @@ Processing Pipeline Abstraction (#13)
 ------------------------------------
 Composable pipeline with pluggable stages for satellite image processing.
 Each stage transforms a list of image paths and returns the (possibly new) list.
+
+In-process stages (crop, timestamp) can also be expressed as a per-image
+function. A ``fused`` pipeline runs consecutive such stages as one
+:class:`FusedStage`, so each image is decoded and encoded once and only
+the last stage's directory is written. False color runs an external tool
+on files, so it always runs as its own stage.
+
+:func:`validate_image` checks inputs from their headers rather than
+decoding them, and caches the result for each unchanged file.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
 import multiprocessing.pool
+import queue
+import struct
 import threading
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import cv2  # type: ignore
+import numpy as np  # type: ignore
 
 from .resource_monitor import ResourceMonitor
 
@@ -24,11 +38,18 @@ logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[str, int], None]
 
+#: Per-image form of an in-process stage: ``(image, source path) -> image``,
+#: or None to drop the frame. Must be picklable (it runs in pool workers).
+ImageTransform = Callable[[np.ndarray, Path], "np.ndarray | None"]
+
 
 class Stage(ABC):
     """Base class for a processing pipeline stage."""
 
     name: str = "stage"
+    #: Whether the stage can process images one at a time in a streaming
+    #: run; true exactly for :class:`StreamableStage` subclasses.
+    streamable: bool = False
 
     @abstractmethod
     def run(
@@ -41,17 +62,75 @@ class Stage(ABC):
         """Execute the stage, returning the (possibly modified) list of paths."""
         ...
 
+    @property
+    def active(self) -> bool:
+        """Whether :meth:`run` would do anything with the current options."""
+        return True
+
+    def image_transform(self) -> ImageTransform | None:
+        """This stage as a per-image function for fused runs, or None if it cannot be fused."""
+        return None
+
+    def prepare(self) -> None:  # noqa: B027 — optional hook
+        """Create whatever the stage writes into, before any image is processed."""
+
+
+class StreamableStage(Stage):
+    """A stage that processes each image through ``worker_fn(worker_args(path))``.
+
+    Streaming runs submit images to the pool one at a time this way.
+    """
+
+    streamable = True
+    #: Picklable per-image worker, run in the pool.
+    worker_fn: Callable[[tuple], Any]
+
+    @abstractmethod
+    def worker_args(self, path: Path) -> tuple:
+        """Arguments for this stage's ``worker_fn`` to process one image."""
+
 
-class CropStage(Stage):
-    """Stage 2: Crop images in parallel."""
+class CropStage(StreamableStage):
+    """Stage 2: Crop images in parallel.
+
+    *transform_fn* ``(image, path, options)`` is the per-image crop used when
+    the stage is fused.
+    """
 
     name = "Cropping"
 
-    def __init__(self, options: dict[str, Any], dirs: dict[str, Path], worker_fn: Any, order_fn: Any) -> None:
+    def __init__(
+        self,
+        options: dict[str, Any],
+        dirs: dict[str, Path],
+        worker_fn: Any,
+        order_fn: Any,
+        transform_fn: Any = None,
+    ) -> None:
         self.options = options
         self.dirs = dirs
         self.worker_fn = worker_fn
         self.order_fn = order_fn
+        self.transform_fn = transform_fn
+
+    @property
+    def active(self) -> bool:
+        return bool(self.options.get("crop_enabled"))
+
+    @property
+    def output_dir(self) -> Path:
+        return self.dirs["crop"]
+
+    def image_transform(self) -> ImageTransform | None:
+        if self.transform_fn is None:
+            return None
+        return functools.partial(self.transform_fn, options=self.options)
+
+    def worker_args(self, path: Path) -> tuple:
+        return (str(path), self.output_dir, self.options)
+
+    def prepare(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def run(
         self,
@@ -60,10 +139,11 @@ class CropStage(Stage):
         progress_callback: ProgressCallback | None = None,
         cancel_event: threading.Event | None = None,
     ) -> list[Path]:
-        if not self.options.get("crop_enabled"):
+        if not self.active:
             return image_paths
 
-        args = [(str(f), self.dirs["crop"], self.options) for f in image_paths]
+        self.prepare()
+        args = [self.worker_args(f) for f in image_paths]
         results: list[Path] = []
         total = len(image_paths)
 
@@ -78,7 +158,7 @@ class CropStage(Stage):
         return self.order_fn(results) if results else image_paths
 
 
-class FalseColorStage(Stage):
+class FalseColorStage(StreamableStage):
     """Stage 1: Apply false color processing."""
 
     name = "False Color"
@@ -89,6 +169,21 @@ class FalseColorStage(Stage):
         self.worker_fn = worker_fn
         self.order_fn = order_fn
 
+    @property
+    def active(self) -> bool:
+        return bool(self.options.get("false_color_enabled"))
+
+    def prepare(self) -> None:
+        self.dirs["sanchez"].mkdir(parents=True, exist_ok=True)
+
+    def worker_args(self, path: Path) -> tuple:
+        return (
+            str(path),
+            self.dirs["sanchez"],
+            self.options.get("sanchez_path"),
+            self.options.get("underlay_path"),
+        )
+
     def run(
         self,
         image_paths: list[Path],
@@ -96,18 +191,11 @@ class FalseColorStage(Stage):
         progress_callback: ProgressCallback | None = None,
         cancel_event: threading.Event | None = None,
     ) -> list[Path]:
-        if not self.options.get("false_color_enabled"):
+        if not self.active:
             return image_paths
 
-        args = [
-            (
-                str(f),
-                self.dirs["sanchez"],
-                self.options.get("sanchez_path"),
-                self.options.get("underlay_path"),
-            )
-            for f in image_paths
-        ]
+        self.prepare()
+        args = [self.worker_args(f) for f in image_paths]
         results: list[Path] = []
         total = len(image_paths)
 
@@ -125,16 +213,45 @@ class FalseColorStage(Stage):
         return image_paths
 
 
-class TimestampStage(Stage):
-    """Stage 3: Add timestamps."""
+class TimestampStage(StreamableStage):
+    """Stage 3: Add timestamps.
+
+    *transform_fn* ``(image, path)`` is the per-image overlay used when the
+    stage is fused.
+    """
 
     name = "Adding Timestamps"
 
-    def __init__(self, options: dict[str, Any], dirs: dict[str, Path], worker_fn: Any, order_fn: Any) -> None:
+    def __init__(
+        self,
+        options: dict[str, Any],
+        dirs: dict[str, Path],
+        worker_fn: Any,
+        order_fn: Any,
+        transform_fn: Any = None,
+    ) -> None:
         self.options = options
         self.dirs = dirs
         self.worker_fn = worker_fn
         self.order_fn = order_fn
+        self.transform_fn = transform_fn
+
+    @property
+    def active(self) -> bool:
+        return bool(self.options.get("add_timestamp", True))
+
+    @property
+    def output_dir(self) -> Path:
+        return self.dirs["timestamp"]
+
+    def image_transform(self) -> ImageTransform | None:
+        return self.transform_fn
+
+    def worker_args(self, path: Path) -> tuple:
+        return (str(path), self.output_dir)
+
+    def prepare(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def run(
         self,
@@ -143,10 +260,11 @@ class TimestampStage(Stage):
         progress_callback: ProgressCallback | None = None,
         cancel_event: threading.Event | None = None,
     ) -> list[Path]:
-        if not self.options.get("add_timestamp", True):
+        if not self.active:
             return image_paths
 
-        args = [(str(f), self.dirs["timestamp"]) for f in image_paths]
+        self.prepare()
+        args = [self.worker_args(f) for f in image_paths]
         results: list[Path] = []
         total = len(image_paths)
 
@@ -166,6 +284,10 @@ class ScaleStage(Stage):
 
     name = "Scaling"
 
+    @property
+    def active(self) -> bool:
+        return False
+
     def run(
         self,
         image_paths: list[Path],
@@ -176,13 +298,145 @@ class ScaleStage(Stage):
         return image_paths
 
 
+def _fused_image(args: tuple[str, str, tuple[ImageTransform, ...]]) -> str | None:
+    """Decode one image, apply every transform, and encode the result once."""
+    input_path, output_dir, transforms = args
+    try:
+        img = cv2.imread(input_path)
+        if img is None:
+            logger.error(f"Failed to read input image: {input_path}")
+            return None
+        source = Path(input_path)
+        for transform in transforms:
+            img = transform(img, source)
+            if img is None:
+                return None
+        output_path = Path(output_dir) / source.name
+        if cv2.imwrite(str(output_path), img):
+            return str(output_path)
+        logger.error(f"Failed to save fused output: {output_path}")
+        return None
+    except Exception as e:
+        logger.error(f"Error in fused processing: {e}", exc_info=True)
+        return None
+
+
+def _fused_worker(args: tuple[int, tuple[str, str, tuple[ImageTransform, ...]]]) -> tuple[int, str | None]:
+    index, image_args = args
+    return index, _fused_image(image_args)
+
+
+class FusedStage(StreamableStage):
+    """Consecutive in-process stages run as one per-image function.
+
+    Each image is read once, passed through every stage's
+    :meth:`~Stage.image_transform`, and written once into the last stage's
+    ``output_dir``. Progress is reported under each fused stage's name.
+    Output keeps input order without a sort, because workers return their
+    input index.
+    """
+
+    worker_fn = staticmethod(_fused_image)
+
+    def __init__(self, stages: list[Stage]) -> None:
+        self.stages = stages
+        self.name = " + ".join(stage.name for stage in stages)
+        self.output_dir: Path = stages[-1].output_dir  # type: ignore[attr-defined]
+        self._transforms = tuple(stage.image_transform() for stage in stages)
+
+    def worker_args(self, path: Path) -> tuple:
+        return (str(path), str(self.output_dir), self._transforms)
+
+    def prepare(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def run(
+        self,
+        image_paths: list[Path],
+        pool: multiprocessing.pool.Pool,
+        progress_callback: ProgressCallback | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> list[Path]:
+        self.prepare()
+        args = [(idx, self.worker_args(f)) for idx, f in enumerate(image_paths)]
+        results: list[Path | None] = [None] * len(image_paths)
+        total = len(image_paths)
+
+        for done, (idx, result) in enumerate(pool.imap_unordered(_fused_worker, args), 1):
+            if cancel_event and cancel_event.is_set():
+                return []
+            if result:
+                results[idx] = Path(result)
+            if progress_callback:
+                for stage in self.stages:
+                    progress_callback(stage.name, int(done / total * 100))
+
+        processed = [r for r in results if r is not None]
+        return processed or image_paths
+
+
+#: Most images a streaming run holds at once: submitted to a stage, or done
+#: with one stage and queued for the next.
+STREAM_WINDOW = 32
+
+#: How long the streaming loop waits for a result before re-checking
+#: cancellation and throttling.
+_STREAM_POLL_SECONDS = 0.5
+
+#: While the system is under pressure, a streaming run admits one new image
+#: per this many seconds instead of filling its window.
+_STREAM_THROTTLE_SECONDS = 0.5
+
+
+class _StreamState:
+    """Bookkeeping for one stage of a streaming run."""
+
+    def __init__(self, stage: StreamableStage) -> None:
+        self.stage = stage
+        self.names = [s.name for s in stage.stages] if isinstance(stage, FusedStage) else [stage.name]
+        self.queue: deque[tuple[int, Path]] = deque()  # done upstream, waiting to be submitted
+        self.in_flight = 0
+        self.finished = 0
+        self.succeeded = 0
+        # Inputs the stage failed on before its first success. If it never
+        # succeeds they pass through unchanged, like a batch stage with no results.
+        self.held: list[tuple[int, Path]] = []
+        self.closed = False
+
+
 class Pipeline:
-    """Composable processing pipeline that runs stages in order."""
+    """Composable processing pipeline that runs stages in order.
+
+    With ``fused=True``, runs of consecutive active stages that provide an
+    :meth:`~Stage.image_transform` execute as one :class:`FusedStage`, and
+    inactive stages are skipped. Without it, every stage makes its own pass
+    and writes its own directory, which is useful for debugging.
+
+    With ``streaming=True`` (and every active stage ``streamable``),
+    :meth:`run` does not wait for a stage to finish the whole batch. An
+    image moves on to the next stage as soon as it is done. Downstream work
+    is submitted first, and at most :data:`STREAM_WINDOW` images are in the
+    pipeline at once. The result is put in *order_fn* order (input order if
+    not given) before it is returned, e.g. for the video stage.
+    :meth:`stream` yields each finished image as it completes.
+    """
 
-    def __init__(self, resource_monitor: ResourceMonitor | None = None) -> None:
+    def __init__(
+        self,
+        resource_monitor: ResourceMonitor | None = None,
+        *,
+        fused: bool = False,
+        streaming: bool = False,
+        order_fn: Callable[[list[Path]], list[Path]] | None = None,
+        window: int = STREAM_WINDOW,
+    ) -> None:
         self._stages: list[Stage] = []
         self._resource_monitor = resource_monitor
         self._cancel_event = threading.Event()
+        self.fused = fused
+        self.streaming = streaming
+        self.order_fn = order_fn
+        self.window = max(1, window)
 
     def add_stage(self, stage: Stage) -> Pipeline:
         """Add a stage to the pipeline. Returns self for chaining."""
@@ -196,24 +450,63 @@ class Pipeline:
     def stages(self) -> list[Stage]:
         return list(self._stages)
 
+    def plan(self) -> list[Stage]:
+        """The stages :meth:`run` will execute, with fusible runs grouped when ``fused``."""
+        if not self.fused:
+            return list(self._stages)
+        planned: list[Stage] = []
+        group: list[Stage] = []
+        for stage in self._stages:
+            if not stage.active:
+                continue
+            if stage.image_transform() is not None:
+                group.append(stage)
+                continue
+            planned.extend(self._flush(group))
+            planned.append(stage)
+        planned.extend(self._flush(group))
+        return planned
+
+    @staticmethod
+    def _flush(group: list[Stage]) -> list[Stage]:
+        stages = [FusedStage(list(group))] if len(group) > 1 else list(group)
+        group.clear()
+        return stages
+
+    def _should_throttle(self) -> bool:
+        return bool(
+            self._resource_monitor
+            and hasattr(self._resource_monitor, "should_throttle")
+            and self._resource_monitor.should_throttle()
+        )
+
+    def _streamable_plan(self) -> list[StreamableStage] | None:
+        stages = [stage for stage in self.plan() if stage.active]
+        return cast("list[StreamableStage]", stages) if all(stage.streamable for stage in stages) else None
+
     def run(
         self,
         image_paths: list[Path],
         pool: multiprocessing.pool.Pool,
         progress_callback: ProgressCallback | None = None,
     ) -> list[Path]:
-        """Run all stages sequentially, passing image_paths through each."""
+        """Run all stages, passing image_paths through each."""
+        if self.streaming and image_paths:
+            if self._streamable_plan() is not None:
+                done = sorted(self.stream(image_paths, pool, progress_callback), key=lambda item: item[0])
+                if self._cancel_event.is_set():
+                    return []
+                paths = [path for _, path in done]
+                return self.order_fn(paths) if self.order_fn and paths else paths
+            logger.info("Pipeline has stages that cannot stream — running stage by stage")
+
         current = image_paths
-        for stage in self._stages:
+        for stage in self.plan():
             if self._cancel_event.is_set() or not current:
                 return []
 
             # Throttle if system is under pressure
-            if (
-                self._resource_monitor
-                and hasattr(self._resource_monitor, "should_throttle")
-                and self._resource_monitor.should_throttle()
-            ):
+            if self._should_throttle():
                 logger.info("System under pressure — throttling pipeline")
                 time.sleep(0.5)
 
@@ -222,18 +515,285 @@ class Pipeline:
 
         return current
 
+    def stream(
+        self,
+        image_paths: list[Path],
+        pool: multiprocessing.pool.Pool,
+        progress_callback: ProgressCallback | None = None,
+    ) -> Iterator[tuple[int, Path]]:
+        """Yield ``(input index, output path)`` for each image as it clears the last stage.
+
+        Images come out in completion order. A cancelled run stops yielding.
+        """
+        stages = self._streamable_plan()
+        if stages is None:
+            raise ValueError("Every active stage must be streamable")
+        if not stages:
+            yield from enumerate(image_paths)
+            return
+        yield from _StreamRun(self, stages, image_paths, pool, progress_callback)
+
+
+class _StreamRun:
+    """One streaming run of a pipeline's stages (see :class:`Pipeline`).
+
+    Results arrive through ``apply_async`` callbacks on one queue, so the
+    pool's result thread never blocks; all bookkeeping happens in the
+    iterating thread.
+    """
 
-def validate_image(path: Path) -> bool:
-    """Validate that *path* is a supported, readable image file (#15).
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        stages: list[StreamableStage],
+        image_paths: list[Path],
+        pool: multiprocessing.pool.Pool,
+        progress_callback: ProgressCallback | None,
+    ) -> None:
+        self.pipeline = pipeline
+        self.states = [_StreamState(stage) for stage in stages]
+        self.pool = pool
+        self.progress_callback = progress_callback
+        self.results: queue.SimpleQueue[tuple[int, int, Path, str | None]] = queue.SimpleQueue()
+        self.source = iter(enumerate(image_paths))
+        self.source_open = True
+        self.live = 0  # images admitted and not yet finished, dropped or held
+        self.total = len(image_paths)
+        self.throttled_since: float | None = None
+
+    def __iter__(self) -> Iterator[tuple[int, Path]]:
+        for state in self.states:
+            state.stage.prepare()
+        while not self.pipeline._cancel_event.is_set():
+            self._submit_ready()
+            yield from self._close_finished_stages()
+            if self.states[-1].closed:
+                return
+            if any(state.queue for state in self.states):
+                continue
+            try:
+                k, index, path, result = self.results.get(timeout=_STREAM_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            done = self._record(k, index, path, result)
+            if done is not None:
+                yield done
+
+    def _submit(self, k: int, index: int, path: Path) -> None:
+        stage = self.states[k].stage
+
+        def on_error(exc: BaseException) -> None:
+            logger.error(f"Error in pipeline stage {stage.name}: {exc}")
+            self.results.put((k, index, path, None))
+
+        self.pool.apply_async(
+            stage.worker_fn,
+            (stage.worker_args(path),),
+            callback=lambda result: self.results.put((k, index, path, result)),
+            error_callback=on_error,
+        )
+        self.states[k].in_flight += 1
+
+    def _submit_ready(self) -> None:
+        # Drain downstream stages first, so finished images leave early.
+        for k in reversed(range(len(self.states))):
+            while self.states[k].queue:
+                self._submit(k, *self.states[k].queue.popleft())
+        while self.source_open and self.live < self.pipeline.window and self._may_admit():
+            item = next(self.source, None)
+            if item is None:
+                self.source_open = False
+            else:
+                self._submit(0, *item)
+                self.live += 1
+
+    def _may_admit(self) -> bool:
+        """Whether to admit another image; throttling slows admission but never stops it.
+
+        An empty pipeline always admits, and under pressure one image is
+        admitted per :data:`_STREAM_THROTTLE_SECONDS`. The pipeline's own
+        workers can keep the machine busy, so waiting for the pressure to
+        clear could wait forever.
+        """
+        if self.live == 0:
+            return True
+        if not self.pipeline._should_throttle():
+            self.throttled_since = None
+            return True
+        now = time.monotonic()
+        if self.throttled_since is None:
+            logger.info("System under pressure — throttling pipeline")
+            self.throttled_since = now
+        elif now - self.throttled_since >= _STREAM_THROTTLE_SECONDS:
+            self.throttled_since = now
+            return True
+        return False
 
-    Returns True if the file has a supported extension and can be read by OpenCV.
+    def _progress(self, state: _StreamState, percent: int) -> None:
+        if self.progress_callback:
+            for name in state.names:
+                self.progress_callback(name, percent)
+
+    def _close_finished_stages(self) -> list[tuple[int, Path]]:
+        """Close stages with no more work coming; return held inputs released past the last stage."""
+        released: list[tuple[int, Path]] = []
+        for k, state in enumerate(self.states):
+            upstream_closed = not self.source_open if k == 0 else self.states[k - 1].closed
+            if state.closed or not upstream_closed or state.in_flight or state.queue:
+                continue
+            state.closed = True
+            self._progress(state, 100)
+            if state.succeeded or not state.held:
+                continue
+            logger.warning(f"Stage {state.stage.name} produced no output — passing its inputs through")
+            if k + 1 < len(self.states):
+                self.states[k + 1].queue.extend(state.held)
+                self.live += len(state.held)
+            else:
+                released.extend(state.held)
+            state.held = []
+        return released
+
+    def _record(self, k: int, index: int, path: Path, result: str | None) -> tuple[int, Path] | None:
+        """Account for one finished task; return the image if it cleared the last stage."""
+        state = self.states[k]
+        state.in_flight -= 1
+        state.finished += 1
+        self._progress(state, min(99, int(state.finished / self.total * 100)))
+        if not result:
+            self.live -= 1
+            if not state.succeeded:
+                state.held.append((index, path))
+            return None
+        state.succeeded += 1
+        state.held.clear()
+        if k + 1 < len(self.states):
+            self.states[k + 1].queue.append((index, Path(result)))
+            return None
+        self.live -= 1
+        return index, Path(result)
+
+
+#: Extensions :func:`validate_image` accepts.
+SUPPORTED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tif", ".tiff"})
+
+#: Validation results kept for unchanged files (keyed by path, size and mtime).
+VALIDATION_CACHE_SIZE = 4096
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}  # by IHDR colour type
+_JPEG_SOI = b"\xff\xd8\xff"
+_JPEG_EOI = b"\xff\xd9"
+# SOF0-SOF15 except DHT (C4), JPG (C8) and DAC (CC)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without a length field: TEM, RST0-7
+_JPEG_STANDALONE = frozenset({0x01, *range(0xD0, 0xD8)})
+_TIFF_MAGIC = (b"II*\x00", b"MM\x00*")
+
+
+def _png_header(f, size: int) -> tuple[int, int, int]:
+    """Read IHDR, then walk the chunk lengths to IEND; data after IEND is ignored."""
+    head = f.read(33)  # signature + IHDR chunk
+    if len(head) < 33 or head[12:16] != b"IHDR":
+        raise ValueError("missing IHDR chunk")
+    width, height, _depth, color_type = struct.unpack(">IIBB", head[16:26])
+    pos = len(_PNG_SIGNATURE)
+    while True:
+        f.seek(pos)
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            raise ValueError("truncated (no IEND chunk)")
+        length, kind = struct.unpack(">I4s", chunk)
+        pos += 12 + length  # length + type + data + CRC
+        if pos > size:
+            raise ValueError(f"truncated ({kind.decode('latin-1')} chunk runs past the end)")
+        if kind == b"IEND":
+            return width, height, _PNG_CHANNELS.get(color_type, 0)
+
+
+def _jpeg_has_eoi(f, size: int, start: int) -> bool:
+    """Whether an EOI marker follows offset *start* (the image data).
+
+    The last KiB is checked first; only a file with data after its EOI, or
+    with no EOI at all, is scanned through.
     """
-    supported_extensions = {".png", ".jpg", ".jpeg", ".tif", ".tiff"}
-    if path.suffix.lower() not in supported_extensions:
-        logger.warning(f"Unsupported image extension: {path}")
-        return False
+    f.seek(max(start, size - 1024))
+    if f.read().rstrip(b"\x00\r\n ").endswith(_JPEG_EOI):
+        return True
+    f.seek(start)
+    prev = b""
+    while block := f.read(1 << 16):
+        # Entropy-coded data stuffs every 0xFF, so the first FFD9 is the EOI.
+        if _JPEG_EOI in prev + block:
+            return True
+        prev = block[-1:]
+    return False
+
+
+def _jpeg_header(f, size: int) -> tuple[int, int, int]:
+    """Walk the marker segments to the frame header and the first scan, then look for EOI."""
+    f.seek(2)
+    frame = None
+    while True:
+        byte = f.read(1)
+        while byte == b"\xff":  # fill bytes before the marker code
+            byte = f.read(1)
+        if not byte or byte == b"\xd9":
+            raise ValueError("no image data")
+        marker = byte[0]
+        if marker in _JPEG_STANDALONE:
+            continue
+        (length,) = struct.unpack(">H", f.read(2))
+        if marker == 0xDA:
+            if frame is None:
+                raise ValueError("no frame header before the image data")
+            break
+        if marker in _JPEG_SOF and frame is None:
+            frame = struct.unpack(">BHHB", f.read(6))
+            length -= 6
+        f.seek(length - 2, 1)
+        if f.read(1) != b"\xff":
+            raise ValueError(f"corrupt segment 0xFF{marker:02X}")
+    if not _jpeg_has_eoi(f, size, f.tell() + length - 2):
+        raise ValueError("truncated (no EOI marker)")
+    _precision, height, width, components = frame
+    return width, height, components
+
+
+def _image_header(path: str, size: int) -> tuple[int, int, int] | None:
+    """``(width, height, channels)`` from a PNG or JPEG header, or None for TIFF.
+
+    Raises ValueError for anything malformed or truncated.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(8)
+        if magic[:4] in _TIFF_MAGIC:
+            return None
+        f.seek(0)
+        if magic == _PNG_SIGNATURE:
+            header = _png_header(f, size)
+        elif magic.startswith(_JPEG_SOI):
+            header = _jpeg_header(f, size)
+        else:
+            raise ValueError("not a PNG, JPEG or TIFF file")
+    width, height, channels = header
+    if width <= 0 or height <= 0 or channels not in (1, 2, 3, 4):
+        raise ValueError(f"bad header ({width}x{height}, {channels} channels)")
+    return header
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_cached(path: str, size: int, mtime_ns: int, decode: bool) -> bool:
+    """Validate *path*; *mtime_ns* only keys the cache."""
+    if not decode:
+        try:
+            if _image_header(path, size) is not None:
+                return True
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Invalid image {path}: {e}")
+            return False
     try:
-        img = cv2.imread(str(path))
+        img = cv2.imread(path)
         if img is None:
             logger.warning(f"cv2.imread returned None for: {path}")
             return False
@@ -241,3 +801,24 @@ def validate_image(path: Path) -> bool:
         logger.warning(f"Failed to read image {path}: {e}")
         return False
     return True
+
+
+def validate_image(path: Path, *, decode: bool = False) -> bool:
+    """Validate that *path* is a supported, readable image file (#15).
+
+    Returns True if the file has a supported extension and a well-formed
+    image. By default PNG and JPEG files are checked from their signature
+    and headers (dimensions, channels, and the end marker that a truncated
+    file lacks) without decoding the pixels; TIFF files, and every file
+    when *decode* is True, are decoded with OpenCV. Results are cached by
+    (path, size, mtime), so a file is only re-read when it changes.
+    """
+    if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+        logger.warning(f"Unsupported image extension: {path}")
+        return False
+    try:
+        stat = path.stat()
+    except OSError as e:
+        logger.warning(f"Failed to read image {path}: {e}")
+        return False
+    return _validate_cached(str(path), stat.st_size, stat.st_mtime_ns, decode)
@@ -310,15 +310,19 @@ class SatelliteImageProcessor:
                 "final": base_output / f"04_final_{timestamp}",
             }
 
-            for dir_path in dirs.values():
-                dir_path.mkdir(parents=True, exist_ok=True)
+            # Stage directories are created by the stages that write them; a
+            # fused run only writes the last in-process stage's directory.
+            dirs["final"].mkdir(parents=True, exist_ok=True)
 
             current_files = self.file_manager.get_input_files(self.input_dir)
             if not current_files:
                 raise ValueError("No valid images found in input directory")
 
-            # Validate images before processing (#15)
-            current_files = [f for f in current_files if validate_image(f)]
+            # Validate images before processing (#15). Header checks are
+            # I/O-bound, so they run on threads.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                valid = list(executor.map(validate_image, current_files))
+            current_files = [f for f, ok in zip(current_files, valid, strict=True) if ok]
             if not current_files:
                 raise ValueError("No valid/readable images found after validation")
 
@@ -328,11 +332,22 @@ class SatelliteImageProcessor:
             pool = multiprocessing.Pool(processes=num_processes)
 
             # Build and run the processing pipeline (#13)
+            # Crop and timestamp run fused (one decode/encode per image) unless
+            # keep_intermediates asks for every stage's directory, for debugging.
+            # Stages stream into each other; the frames are put back in
+            # chronological order for the video.
             order_fn = self.file_manager.keep_file_order
-            pipeline = Pipeline(resource_monitor=self.resource_monitor)
+            pipeline = Pipeline(
+                resource_monitor=self.resource_monitor,
+                fused=not self.options.get("keep_intermediates", False),
+                streaming=True,
+                order_fn=order_fn,
+            )
             pipeline.add_stage(FalseColorStage(self.options, dirs, self._parallel_sanchez, order_fn))
-            pipeline.add_stage(CropStage(self.options, dirs, self._parallel_crop, order_fn))
-            pipeline.add_stage(TimestampStage(self.options, dirs, self._parallel_timestamp, order_fn))
+            pipeline.add_stage(CropStage(self.options, dirs, self._parallel_crop, order_fn, self._crop_image))
+            pipeline.add_stage(
+                TimestampStage(self.options, dirs, self._parallel_timestamp, order_fn, self._timestamp_image)
+            )
             pipeline.add_stage(ScaleStage())
 
             current_files = pipeline.run(current_files, pool, self._emit_progress)
@@ -367,6 +382,22 @@ class SatelliteImageProcessor:
                 pool.join()
             self._is_processing = False
 
+    @staticmethod
+    def _crop_image(img: np.ndarray, _path: Path, options: dict) -> np.ndarray | None:
+        """Crop transform shared by the crop worker and fused runs"""
+        return ImageOperations.crop_image(
+            img,
+            options.get("crop_x", 0),
+            options.get("crop_y", 0),
+            options.get("crop_width", img.shape[1]),
+            options.get("crop_height", img.shape[0]),
+        )
+
+    @staticmethod
+    def _timestamp_image(img: np.ndarray, path: Path) -> np.ndarray:
+        """Timestamp transform shared by the timestamp worker and fused runs; draws on *img*"""
+        return ImageOperations.add_timestamp(img, path, inplace=True)
+
     @staticmethod
     def _parallel_crop(args):
         """Parallel cropping worker"""
@@ -376,13 +407,7 @@ class SatelliteImageProcessor:
             if img is None:
                 return None
 
-            cropped = ImageOperations.crop_image(
-                img,
-                options.get("crop_x", 0),
-                options.get("crop_y", 0),
-                options.get("crop_width", img.shape[1]),
-                options.get("crop_height", img.shape[0]),
-            )
+            cropped = SatelliteImageProcessor._crop_image(img, Path(input_path), options)
 
             output_path = Path(output_dir) / Path(input_path).name
             cv2.imwrite(str(output_path), cropped)
@@ -416,7 +441,7 @@ class SatelliteImageProcessor:
                 logger.error(f"Failed to read input image: {input_path}")
                 return None
 
-            timestamped = ImageOperations.add_timestamp(img, Path(input_path))
+            timestamped = SatelliteImageProcessor._timestamp_image(img, Path(input_path))
             output_path = Path(output_dir) / Path(input_path).name
 
             if cv2.imwrite(str(output_path), timestamped):
@@ -618,7 +643,7 @@ class SatelliteImageProcessor:
                     self.options.get("crop_height", img.shape[0]),
                 )
 
-            return ImageOperations.add_timestamp(img, image_path)
+            return ImageOperations.add_timestamp(img, image_path, inplace=True)
 
         except Exception as e:
             self.logger.error(f"Failed to process {image_path}: {e}", exc_info=True)
@@ -119,6 +119,16 @@ class TestAddTimestamp:
 
         assert np.array_equal(result, img)
 
+    def test_add_timestamp_inplace_draws_on_input(self):
+        """inplace=True skips the copy and modifies only the label region."""
+        img = np.zeros((200, 400, 3), dtype=np.uint8)
+
+        result = ImageOperations.add_timestamp(img, datetime(2024, 1, 15, 12, 30, 45), inplace=True)
+
+        assert result is img
+        assert img[150:].any()
+        assert not img[:100].any()
+
     def test_add_timestamp_none_image_returns_none(self):
         """Test that None image input is handled gracefully."""
         result = ImageOperations.add_timestamp(None, datetime.now())
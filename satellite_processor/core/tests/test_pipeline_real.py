@@ -1,5 +1,6 @@
 """Real tests for pipeline.py — uses real objects, mocks only multiprocessing pool."""
 
+import multiprocessing
 import multiprocessing.pool
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,9 +12,12 @@ import pytest
 from satellite_processor.core.pipeline import (
     CropStage,
     FalseColorStage,
+    FusedStage,
     Pipeline,
     ScaleStage,
+    StreamableStage,
     TimestampStage,
+    _image_header,
     validate_image,
 )
 from satellite_processor.core.resource_monitor import ResourceMonitor
@@ -56,6 +60,59 @@ class TestValidateImage:
     def test_nonexistent(self, tmp_path):
         assert validate_image(tmp_path / "nope.png") is False
 
+    @pytest.mark.parametrize("suffix", [".png", ".jpg"])
+    def test_truncated(self, tmp_path, suffix):
+        path = tmp_path / f"cut{suffix}"
+        cv2.imwrite(str(path), np.random.default_rng(0).integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        data = path.read_bytes()
+        assert validate_image(path) is True
+        path.write_bytes(data[: len(data) // 2])
+        assert validate_image(path) is False
+
+    @pytest.mark.parametrize("suffix", [".png", ".jpg"])
+    def test_trailing_data_after_end_marker(self, tmp_path, suffix):
+        path = tmp_path / f"tail{suffix}"
+        cv2.imwrite(str(path), np.random.default_rng(0).integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        data = path.read_bytes()
+        path.write_bytes(data + b"\x00\x00\x00\x00" + b"trailer" * 500)
+        assert validate_image(path) is True
+        # Cut inside the image data, the same trailer does not hide the truncation.
+        path.write_bytes(data[: len(data) // 2] + b"trailer" * 500)
+        assert validate_image(path) is False
+
+    def test_bad_dimensions(self, tmp_path, real_image_file):
+        data = bytearray(real_image_file.read_bytes())
+        data[16:20] = b"\x00\x00\x00\x00"  # IHDR width
+        path = tmp_path / "empty.png"
+        path.write_bytes(bytes(data))
+        assert validate_image(path) is False
+
+    def test_signature_not_extension_decides(self, tmp_path):
+        path = tmp_path / "really_a_jpeg.png"
+        cv2.imwrite(str(tmp_path / "x.jpg"), np.zeros((8, 8), dtype=np.uint8))
+        path.write_bytes((tmp_path / "x.jpg").read_bytes())
+        assert validate_image(path) is True
+
+    def test_tiff_and_decode_mode_use_opencv(self, tmp_path, real_image_file):
+        tiff = tmp_path / "test.tif"
+        cv2.imwrite(str(tiff), np.zeros((8, 8, 3), dtype=np.uint8))
+        with patch("satellite_processor.core.pipeline.cv2.imread", wraps=cv2.imread) as imread:
+            assert validate_image(tiff) is True
+            assert validate_image(real_image_file) is True
+            assert imread.call_count == 1
+            assert validate_image(real_image_file, decode=True) is True
+            assert imread.call_count == 2
+
+    def test_cached_until_file_changes(self, tmp_path, real_image_file):
+        with patch("satellite_processor.core.pipeline._image_header", wraps=_image_header) as header:
+            assert validate_image(real_image_file) is True
+            assert validate_image(real_image_file) is True
+            assert header.call_count == 1
+
+            real_image_file.write_bytes(real_image_file.read_bytes()[:40])
+            assert validate_image(real_image_file) is False
+            assert header.call_count == 2
+
 
 class TestScaleStage:
     def test_passthrough(self, mock_pool, tmp_path):
@@ -195,3 +252,196 @@ class TestPipeline:
         p.add_stage(ScaleStage())
         result = p.run([Path("a.png")], mock_pool)
         assert result == [Path("a.png")]
+
+
+def _crop_half(img, _path, options):
+    return img[: img.shape[0] // 2] if options.get("crop_enabled") else img
+
+
+def _mark(img, _path):
+    img[0, 0] = 255
+    return img
+
+
+def _drop_b(img, path):
+    return None if path.stem == "b" else img
+
+
+@pytest.fixture
+def frames(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    paths = []
+    for name in ("c", "a", "b"):
+        path = src / f"{name}.png"
+        cv2.imwrite(str(path), np.zeros((8, 4, 3), dtype=np.uint8))
+        paths.append(path)
+    return paths
+
+
+def _fusible_pipeline(tmp_path, fused=True, timestamp_fn=_mark, options=None):
+    options = {"crop_enabled": True, **(options or {})}
+    dirs = {"sanchez": tmp_path / "01", "crop": tmp_path / "02", "timestamp": tmp_path / "03"}
+    p = Pipeline(fused=fused)
+    p.add_stage(FalseColorStage(options, dirs, MagicMock(), lambda x: x))
+    p.add_stage(CropStage(options, dirs, MagicMock(), lambda x: x, _crop_half))
+    p.add_stage(TimestampStage(options, dirs, MagicMock(), lambda x: x, timestamp_fn))
+    p.add_stage(ScaleStage())
+    return p
+
+
+class TestFusedPipeline:
+    def test_plan_groups_in_process_stages(self, tmp_path):
+        plan = _fusible_pipeline(tmp_path).plan()
+        assert len(plan) == 1
+        assert isinstance(plan[0], FusedStage)
+        assert [s.name for s in plan[0].stages] == ["Cropping", "Adding Timestamps"]
+
+        plan = _fusible_pipeline(tmp_path, options={"false_color_enabled": True, "add_timestamp": False}).plan()
+        assert [type(s) for s in plan] == [FalseColorStage, CropStage]
+
+        assert len(_fusible_pipeline(tmp_path, fused=False).plan()) == 4
+
+    def test_one_pass_in_input_order(self, tmp_path, frames):
+        progress = []
+        with multiprocessing.pool.ThreadPool(2) as pool:
+            result = _fusible_pipeline(tmp_path).run(frames, pool, lambda op, pct: progress.append((op, pct)))
+
+        assert [p.name for p in result] == ["c.png", "a.png", "b.png"]
+        assert all(p.parent == tmp_path / "03" for p in result)
+        assert not (tmp_path / "02").exists()  # no intermediate crop directory
+        out = cv2.imread(str(result[0]))
+        assert out.shape == (4, 4, 3)
+        assert out[0, 0].tolist() == [255, 255, 255]
+        assert ("Cropping", 100) in progress
+        assert ("Adding Timestamps", 100) in progress
+
+    def test_dropped_frames_and_process_pool(self, tmp_path, frames):
+        with multiprocessing.Pool(2) as pool:
+            result = _fusible_pipeline(tmp_path, timestamp_fn=_drop_b).run(frames, pool)
+        assert [p.name for p in result] == ["c.png", "a.png"]
+
+    def test_cancel(self, tmp_path, frames):
+        p = _fusible_pipeline(tmp_path)
+        stage = p.plan()[0]
+        cancel = MagicMock()
+        cancel.is_set.return_value = True
+        with multiprocessing.pool.ThreadPool(1) as pool:
+            assert stage.run(frames, pool, cancel_event=cancel) == []
+
+
+def _copy_to(output_dir, tag, path):
+    out = Path(output_dir) / f"{Path(path).stem}_{tag}.png"
+    out.write_bytes(Path(path).read_bytes())
+    return str(out)
+
+
+def _stage_worker(args):
+    path, output_dir = args[0], args[1]
+    return None if "fail" in Path(path).stem else _copy_to(output_dir, Path(output_dir).name, path)
+
+
+def _always_fail(args):
+    return None
+
+
+def _streaming_pipeline(tmp_path, options=None, sanchez_fn=_stage_worker, **kwargs):
+    options = {"false_color_enabled": True, "crop_enabled": True, **(options or {})}
+    dirs = {"sanchez": tmp_path / "01", "crop": tmp_path / "02", "timestamp": tmp_path / "03"}
+    p = Pipeline(streaming=True, **kwargs)
+    p.add_stage(FalseColorStage(options, dirs, sanchez_fn, sorted))
+    p.add_stage(CropStage(options, dirs, _stage_worker, sorted))
+    p.add_stage(TimestampStage(options, dirs, _stage_worker, sorted))
+    return p
+
+
+@pytest.fixture
+def many_frames(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    paths = []
+    for i in range(20):
+        path = src / f"f{i:02d}.png"
+        path.write_bytes(b"x")
+        paths.append(path)
+    return paths
+
+
+class TestStreamingPipeline:
+    def test_matches_stage_by_stage(self, tmp_path, many_frames):
+        with multiprocessing.pool.ThreadPool(3) as pool:
+            streamed = _streaming_pipeline(tmp_path, window=4).run(many_frames, pool)
+            p = _streaming_pipeline(tmp_path)
+            p.streaming = False
+            batch = p.run(many_frames, pool)
+        assert [f.name for f in streamed] == [f.name for f in batch]
+        assert [f.name for f in streamed][:2] == ["f00_01_02_03.png", "f01_01_02_03.png"]
+
+    def test_first_output_before_last_input_finishes(self, tmp_path, many_frames):
+        p = _streaming_pipeline(tmp_path, window=2)
+        with multiprocessing.pool.ThreadPool(2) as pool:
+            stream = p.stream(many_frames, pool)
+            next(stream)
+            # The window keeps the pipeline shallow: most inputs are not started yet.
+            assert len(list((tmp_path / "01").iterdir())) < len(many_frames)
+            assert len(list(stream)) == len(many_frames) - 1
+
+    def test_order_fn_and_dropped_frames(self, tmp_path, many_frames):
+        many_frames[3] = many_frames[3].rename(many_frames[3].with_name("f03_fail.png"))
+        with multiprocessing.pool.ThreadPool(3) as pool:
+            result = _streaming_pipeline(tmp_path, order_fn=lambda paths: paths[::-1]).run(many_frames, pool)
+        assert len(result) == 19
+        assert result[0].name == "f19_01_02_03.png"
+        assert not any("f03" in f.name for f in result)
+
+    def test_stage_with_no_output_passes_inputs_through(self, tmp_path, many_frames):
+        progress = []
+        with multiprocessing.Pool(2) as pool:
+            result = _streaming_pipeline(tmp_path, sanchez_fn=_always_fail).run(
+                many_frames, pool, lambda op, pct: progress.append((op, pct))
+            )
+        assert [f.name for f in result] == [f"f{i:02d}_02_03.png" for i in range(20)]
+        assert {op for op, pct in progress if pct == 100} == {"False Color", "Cropping", "Adding Timestamps"}
+
+    def test_fused_stages_stream(self, tmp_path, frames):
+        p = _fusible_pipeline(tmp_path)
+        p.streaming = True
+        with multiprocessing.pool.ThreadPool(2) as pool:
+            result = p.run(frames, pool)
+        assert [f.name for f in result] == ["c.png", "a.png", "b.png"]
+        assert all(f.parent == tmp_path / "03" for f in result)
+
+    def test_unstreamable_stage_falls_back(self, tmp_path, mock_pool):
+        p = Pipeline(streaming=True)
+        stage = MagicMock(active=True, streamable=False)
+        stage.run.return_value = [Path("out.png")]
+        p.add_stage(stage)
+        assert p.run([Path("a.png")], mock_pool) == [Path("out.png")]
+
+    def test_streamable_stages_must_supply_worker_args(self):
+        class NoArgs(StreamableStage):
+            def run(self, image_paths, pool, progress_callback=None, cancel_event=None):
+                return image_paths
+
+        with pytest.raises(TypeError, match="worker_args"):
+            NoArgs()
+        assert CropStage.streamable and FusedStage.streamable
+        assert not ScaleStage.streamable
+
+    def test_completes_under_constant_throttle(self, tmp_path, many_frames):
+        rm = MagicMock(spec=ResourceMonitor)
+        rm.should_throttle.return_value = True
+        p = _streaming_pipeline(tmp_path, resource_monitor=rm, window=4)
+        with (
+            patch("satellite_processor.core.pipeline._STREAM_THROTTLE_SECONDS", 0.01),
+            multiprocessing.pool.ThreadPool(2) as pool,
+        ):
+            result = p.run(many_frames, pool)
+        assert [f.name[:3] for f in result] == [f.stem for f in many_frames]
+        assert rm.should_throttle.called
+
+    def test_cancel(self, tmp_path, many_frames):
+        p = _streaming_pipeline(tmp_path)
+        p.cancel()
+        with multiprocessing.pool.ThreadPool(2) as pool:
+            assert p.run(many_frames, pool) == []